@@ -38,6 +38,7 @@ from catalog.services.materials import get_materials_by_temperature_service
 from catalog.services.pipe_diameter import get_dn_by_diameter_service
 
 from kernel.api.filter_backends import MappedOrderingFilter
+from kernel.api.pagination import KeysetPagination
 from kernel.api.permissions import ActionPermission, AnyOneCanViewPermission
 from kernel.api.views import CustomModelViewSet
 
@@ -530,6 +531,7 @@ class ActionHistoryViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = LogEntry.objects.all().order_by('-timestamp')
     serializer_class = LogEntrySerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
     filter_backends = [DjangoFilterBackend]
     filterset_class = LogEntryFilter
 
@@ -541,13 +543,14 @@ class UserActionHistoryViewSet(viewsets.ReadOnlyModelViewSet):
     """
     serializer_class = LogEntrySerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
     filter_backends = [DjangoFilterBackend]
     filterset_class = LogEntryFilter
 
     def get_queryset(self):
         user_id = self.kwargs['user_id']
         return LogEntry.objects.select_related('actor', 'content_type') \
-            .filter(actor_id=user_id)
+            .filter(actor_id=user_id).order_by('-timestamp')
 
 
 class SSBCatalogViewSet(ModelViewSet):
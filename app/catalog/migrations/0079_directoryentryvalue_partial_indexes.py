@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-19 12:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Индексы создаются без блокировки записи в горячие таблицы
+    atomic = False
+
+    dependencies = [
+        ('catalog', '0078_rename_pipe_mounting_groups_pipemountingrule_pipe_mounting_groups_bottom_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='directoryentryvalue',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['entry', 'directory_field'], name='cat_dev_entry_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='directoryentryvalue',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['directory_field'], name='cat_dev_field_alive_idx'),
+        ),
+    ]
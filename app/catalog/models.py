@@ -12,7 +12,7 @@ from catalog.choices import (
     ComponentGroupType, ClampSelectionEntryResult, SelectionType,
 )
 from catalog.managers import ClampMaterialCoefficientManager, PipeDiameterSoftDeleteManager, PipeDiameterAllObjectsManager
-from kernel.mixins import SoftDeleteModelMixin
+from kernel.mixins import SoftDeleteModelMixin, soft_delete_index
 from ops.marking_compiler import get_jinja2_env
 
 
@@ -145,6 +145,10 @@ class DirectoryEntryValue(SoftDeleteModelMixin, models.Model):
     class Meta:
         verbose_name = _("Значение поля в записи кастомного справочника")
         verbose_name_plural = _("Значения полей в записях кастомного справочника")
+        indexes = [
+            soft_delete_index('entry', 'directory_field', name='cat_dev_entry_alive_idx'),
+            soft_delete_index('directory_field', name='cat_dev_field_alive_idx'),
+        ]
         default_permissions = ()
         permissions = (
             ("add_directoryentryvalue", _("Может добавлять значения полей в записи кастомного справочника")),
@@ -1,8 +1,21 @@
+import datetime
+import json
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
 from collections import OrderedDict
 
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
 from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class DynamicPageNumberPagination(PageNumberPagination):
@@ -60,3 +73,258 @@ class DynamicPageNumberPagination(PageNumberPagination):
                 pass
 
         return super().get_page_size(request)
+
+
+def estimate_count(queryset):
+    """
+    Оценка количества записей без COUNT(*): для запроса без условий берется reltuples из pg_class,
+    иначе оценка планировщика из EXPLAIN. На других СУБД выполняется обычный count().
+    """
+    if isinstance(queryset, (list, tuple)):
+        return len(queryset)
+
+    connection = connections[queryset.db]
+
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+            # reltuples = -1, пока по таблице не было ANALYZE
+            if row and row[0] >= 0:
+                return row[0]
+
+        sql, params = queryset.order_by().query.sql_with_params()
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        return estimate_count(self.object_list)
+
+
+class KeysetCursorEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder обрезает время до миллисекунд, а значение в курсоре должно совпадать со значением
+    в БД точно: иначе записи из той же миллисекунды на границе страницы пропускаются или повторяются.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(DynamicPageNumberPagination):
+    """
+    Пагинация с опциональным курсорным режимом.
+
+    Без параметра cursor работает как DynamicPageNumberPagination. С параметром cursor (пустым для первой
+    страницы) выборка идет по ключу (поле сортировки, id) без OFFSET и без COUNT(*), поэтому время
+    получения страницы не зависит от ее глубины. Выборки, отсортированные по нескольким полям, и в этом
+    случае листаются по номерам страниц. Параметр count=estimate возвращает оценку количества
+    записей из статистики PostgreSQL, count=exact - точное количество.
+    """
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    max_cursor_page_size = 1000
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cursor_mode = False
+        self.keyset_ordering = None
+
+    def is_cursor_mode(self, request):
+        return self.cursor_query_param in request.query_params
+
+    def get_count_mode(self, request):
+        return request.query_params.get(self.count_query_param)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset_ordering = self.get_keyset_ordering(queryset) if self.is_cursor_mode(request) else None
+        # сортировку по нескольким полям курсор (поле, id) не сохраняет, такие выборки листаются по страницам
+        self.cursor_mode = self.keyset_ordering is not None
+
+        if not self.cursor_mode:
+            self.django_paginator_class = (
+                EstimatedCountPaginator if self.get_count_mode(request) == 'estimate' else Paginator
+            )
+            return super().paginate_queryset(queryset, request, view)
+
+        return self.paginate_queryset_by_cursor(queryset, request)
+
+    def get_keyset_ordering(self, queryset):
+        """
+        Возвращает (поле, по убыванию) для ключа сортировки. Вторым ключом всегда идет id в том же направлении.
+        None, если сортировка не сводится к одному полю (и id в том же направлении): курсор ее не сохранит.
+        """
+        ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering or [])
+
+        if not ordering:
+            return 'id', False
+
+        if not all(isinstance(field, str) for field in ordering) or '?' in ordering:
+            return None
+
+        ordering = ['-id' if field == '-pk' else 'id' if field == 'pk' else field for field in ordering]
+
+        # id последним полем в том же направлении уже входит в ключ
+        if len(ordering) == 2 and ordering[1] == ('-id' if ordering[0].startswith('-') else 'id'):
+            ordering = ordering[:1]
+
+        if len(ordering) != 1:
+            return None
+
+        field = ordering[0]
+        descending = field.startswith('-')
+        field = field.lstrip('-')
+
+        # аннотации и обратные связи в курсор не попадают, такие выборки листаются по страницам
+        if not self.is_model_field(queryset.model, field):
+            return None
+
+        return field, descending
+
+    def is_model_field(self, model, field):
+        """
+        True, если field (в том числе через __) указывает на столбец модели.
+        """
+        opts = model._meta
+        parts = field.split('__')
+
+        try:
+            for part in parts[:-1]:
+                related = opts.get_field(part)
+                if not related.concrete or not (related.many_to_one or related.one_to_one):
+                    return False
+                opts = related.related_model._meta
+
+            last = opts.get_field(parts[-1])
+        except FieldDoesNotExist:
+            return False
+
+        return getattr(last, 'concrete', False) and not last.many_to_many
+
+    def get_keyset_value(self, obj, field):
+        parts = field.split('__')
+        value = obj
+
+        for part in parts[:-1]:
+            value = getattr(value, part)
+
+            if value is None:
+                return None
+
+        # для внешнего ключа берем значение столбца (type_id), а не связанный объект
+        return getattr(value, value._meta.get_field(parts[-1]).attname)
+
+    def encode_cursor(self, value, pk, reverse):
+        payload = json.dumps({'v': value, 'id': pk, 'r': reverse}, cls=KeysetCursorEncoder)
+        return b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            payload = json.loads(b64decode(cursor.encode()).decode())
+            return payload['v'], payload['id'], bool(payload.get('r'))
+        except (BinasciiError, UnicodeDecodeError, ValueError, KeyError, TypeError):
+            raise NotFound(_('Некорректный курсор'))
+
+    def get_keyset_condition(self, field, descending, value, pk):
+        """
+        Условие "после (value, pk)" для сортировки по (field, id). NULL в PostgreSQL идут последними
+        при сортировке по возрастанию и первыми при сортировке по убыванию.
+        """
+        if descending:
+            if value is None:
+                return Q(**{f'{field}__isnull': True, 'id__lt': pk}) | Q(**{f'{field}__isnull': False})
+
+            return Q(**{f'{field}__lt': value}) | Q(**{field: value, 'id__lt': pk})
+
+        if value is None:
+            return Q(**{f'{field}__isnull': True, 'id__gt': pk})
+
+        return Q(**{f'{field}__gt': value}) | Q(**{field: value, 'id__gt': pk}) | Q(**{f'{field}__isnull': True})
+
+    def paginate_queryset_by_cursor(self, queryset, request):
+        self.request = request
+
+        page_size = self.get_page_size(request)
+        if page_size in (None, -1):
+            page_size = self.max_cursor_page_size
+
+        field, descending = self.keyset_ordering
+        cursor = request.query_params.get(self.cursor_query_param)
+
+        self.count = None
+        count_mode = self.get_count_mode(request)
+        if count_mode == 'estimate':
+            self.count = estimate_count(queryset)
+        elif count_mode == 'exact':
+            self.count = queryset.count()
+
+        reverse = False
+        if cursor:
+            value, pk, reverse = self.decode_cursor(cursor)
+            # для предыдущей страницы идем в обратном направлении и разворачиваем результат
+            queryset = queryset.filter(self.get_keyset_condition(field, descending != reverse, value, pk))
+
+        direction = '-' if descending != reverse else ''
+        queryset = queryset.order_by(f'{direction}{field}', f'{direction}id')
+
+        results = list(queryset[:page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if reverse:
+            results.reverse()
+
+        self.next_cursor = None
+        self.previous_cursor = None
+
+        if results:
+            first, last = results[0], results[-1]
+
+            if has_more or reverse:
+                self.next_cursor = self.encode_cursor(self.get_keyset_value(last, field), last.pk, False)
+            if cursor and (has_more or not reverse):
+                self.previous_cursor = self.encode_cursor(self.get_keyset_value(first, field), first.pk, True)
+
+        return results
+
+    def get_cursor_link(self, cursor):
+        if cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+
+        return Response(
+            OrderedDict(
+                [
+                    ('count', self.count),
+                    ('size', len(data)),
+                    ('next', self.get_cursor_link(self.next_cursor)),
+                    ('previous', self.get_cursor_link(self.previous_cursor)),
+                    ('results', data),
+                ]
+            )
+        )
@@ -9,6 +9,8 @@ class KernelConfig(AppConfig):
 
     def ready(self):
         from auditlog.registry import auditlog
+
+        from kernel import checks  # noqa: F401
         # Core models
         app_models = apps.get_app_config(self.label).get_models()
         for model in app_models:
@@ -0,0 +1,66 @@
+from django.apps import apps
+from django.core import checks
+
+from kernel.mixins import SoftDeleteModelMixin
+
+
+SOFT_DELETE_INDEX_TAG = 'soft_delete_indexes'
+
+
+def _has_alive_index(model, field_name):
+    """
+    Есть ли у модели частичный индекс WHERE deleted_at IS NULL, начинающийся с поля.
+    """
+    for index in model._meta.indexes:
+        if not index.condition or not index.fields:
+            continue
+
+        if index.fields[0].lstrip('-') != field_name:
+            continue
+
+        if ('deleted_at__isnull', True) in index.condition.children:
+            return True
+
+    return False
+
+
+@checks.register(SOFT_DELETE_INDEX_TAG, deploy=True)
+def check_soft_delete_indexes(app_configs=None, **kwargs):
+    """
+    Находит внешние ключи моделей с мягким удалением, по которым нет частичного индекса.
+    Запуск: manage.py check --deploy или manage.py check --tag soft_delete_indexes.
+    """
+    errors = []
+
+    if app_configs is None:
+        models = apps.get_models()
+    else:
+        models = [model for app_config in app_configs for model in app_config.get_models()]
+
+    for model in models:
+        if not issubclass(model, SoftDeleteModelMixin):
+            continue
+
+        if not model._meta.managed or model._meta.proxy:
+            continue
+
+        for field in model._meta.get_fields():
+            if not field.concrete or not field.many_to_one:
+                continue
+
+            if field.name in model.soft_delete_unindexed_fields or _has_alive_index(model, field.name):
+                continue
+
+            errors.append(
+                checks.Warning(
+                    f'Нет частичного индекса WHERE deleted_at IS NULL по полю "{field.name}".',
+                    hint=(
+                        'Добавьте soft_delete_index(...) в Meta.indexes '
+                        'или поле в soft_delete_unindexed_fields.'
+                    ),
+                    obj=model,
+                    id='kernel.W001',
+                )
+            )
+
+    return errors
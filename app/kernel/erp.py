@@ -3,6 +3,7 @@ import logging
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 from django.utils.translation import gettext_lazy as _
@@ -18,11 +19,48 @@ class ERPException(Exception):
     pass
 
 
+# (подключение, чтение) в секундах
+ERP_TIMEOUT = (10, 60)
+
+# Размер пула соединений к ERP, не меньше количества потоков синхронизации
+ERP_POOL_SIZE = 16
+
+
 class ERPApi:
-    def __init__(self, base_url=None, login=None, password=None):
+    """
+    Клиент ERP. Запросы идут через одну requests.Session с пулом keep-alive соединений,
+    поэтому соединение (и TLS-рукопожатие) не устанавливается заново на каждый запрос.
+    Сессия потокобезопасна для параллельной синхронизации при размере пула не меньше количества потоков.
+    """
+
+    def __init__(self, base_url=None, login=None, password=None, pool_size=ERP_POOL_SIZE):
         self.base_url = base_url or config.ERP_BASE_URL
         self.login = login or config.ERP_LOGIN
         self.password = password or config.ERP_PASSWORD
+        self.pool_size = pool_size
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
+
+        return self._session
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def validate_config(self):
         if not self.base_url:
@@ -41,7 +79,7 @@ class ERPApi:
             'Host': urlparse(self.base_url).hostname
         }
 
-        response = requests.post(url, data=json.dumps(data), auth=auth, headers=headers, timeout=60)
+        response = self.session.post(url, data=json.dumps(data), auth=auth, headers=headers, timeout=ERP_TIMEOUT)
         return response
 
     def sync_product(self, *, idwicad, modelslug, art, name, description=None, weight=None, params, erp_sync):
@@ -57,9 +95,9 @@ class ERPApi:
             'weight': weight,
             'params': params,
         }
-        erp_sync.add_log(ERPSyncLogType.DEBUG, f"Отправляем в {url} данные {data}")
+        erp_sync.add_log(ERPSyncLogType.DEBUG, f"Отправляем в {url} данные {data}", payload=True)
         response = self.post(url, data)
-        erp_sync.add_log(ERPSyncLogType.HTTP_REQUEST, data, response.content.decode('utf-8'))
+        erp_sync.add_log(ERPSyncLogType.HTTP_REQUEST, data, response.content.decode('utf-8'), payload=True)
 
         if response.status_code in (200, 201):
             json_data = response.json()
@@ -82,9 +120,9 @@ class ERPApi:
             'count': count,
             'structure': structure,
         }
-        erp_sync.add_log(ERPSyncLogType.DEBUG, f"Отправляем в {url} данные {data}")
+        erp_sync.add_log(ERPSyncLogType.DEBUG, f"Отправляем в {url} данные {data}", payload=True)
         response = self.post(url, data)
-        erp_sync.add_log(ERPSyncLogType.HTTP_REQUEST, data, response.content.decode('utf-8'))
+        erp_sync.add_log(ERPSyncLogType.HTTP_REQUEST, data, response.content.decode('utf-8'), payload=True)
 
         if response.status_code in (200, 201):
             json_data = response.json()
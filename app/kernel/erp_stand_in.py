@@ -0,0 +1,96 @@
+"""
+Локальная замена ERP для тестов и замеров синхронизации.
+
+Сервер отвечает на /products/id и /specifications/id в формате ERP, выдает последовательные идентификаторы
+и запоминает полученные запросы. latency добавляет задержку к каждому ответу, чтобы оценить,
+насколько синхронизация упирается в сумму задержек.
+
+    with ERPStandInServer(latency=0.05) as server:
+        api = ERPApi(base_url=server.base_url, login='erp', password='erp')
+"""
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+
+class ERPStandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        server = self.server.stand_in
+        length = int(self.headers.get('Content-Length') or 0)
+        data = json.loads(self.rfile.read(length) or b'{}')
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        path = self.path.split('?')[0]
+        server.record(path, data, self.client_address)
+
+        if path == '/products/id':
+            body = {'result': {'error': False}, 'id': server.next_id()}
+        elif path == '/specifications/id':
+            body = {'error': False, 'nomspec': server.next_id()}
+        else:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ERPStandInServer:
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0):
+        self.latency = latency
+        self.requests: List[Dict[str, Any]] = []
+        self.connections = set()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), ERPStandInHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stand_in = self
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def next_id(self) -> int:
+        with self._lock:
+            return next(self._ids)
+
+    def record(self, path: str, data: Dict[str, Any], client_address) -> None:
+        with self._lock:
+            self.requests.append({'path': path, 'data': data})
+            self.connections.add(client_address)
+
+    def requests_to(self, path: str) -> List[Dict[str, Any]]:
+        return [request['data'] for request in self.requests if request['path'] == path]
+
+    def start(self) -> 'ERPStandInServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'ERPStandInServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
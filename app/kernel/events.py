@@ -0,0 +1,203 @@
+"""
+Рассылка событий websocket API через слой каналов.
+
+Событие - channel-сообщение send.eventtoapi, которое WSConsumer отправляет клиенту как {'_type', '_data'}.
+Получатели события - группы каналов:
+- все соединения (GROUP_ALL_CONNECTIONS_NAME) - только для событий, действительно нужных всем;
+- соединения пользователя (GROUP_USER_ID);
+- подписчики темы (GROUP_TOPIC): клиент подписывается командой {'_type': 'subscribe', 'topic': ...}.
+
+Данные события приводятся к нативным типам один раз (to_native) по правилам DjangoJSONEncoder,
+сообщение во все группы отправляется за один проход event loop.
+
+Частые события прогресса одного объекта (coalesce_key, например 'task_updated:5') отправляются не чаще раза в EVENT_COALESCE_INTERVAL:
+клиенту нужно последнее состояние, а не каждый промежуточный шаг. Первое событие окна отправляется сразу, последнее
+из пришедших за окно - по его окончании celery-задачей kernel.tasks.send_coalesced_event, так что последнее
+состояние не теряется. Окно и отложенное событие хранятся в кэше Django: чтобы процессы (воркеры celery, ASGI)
+прореживали события друг друга, нужен общий кэш (CACHES с redis), с LocMemCache каждый процесс считает окно сам.
+"""
+import asyncio
+import datetime
+import decimal
+import uuid
+from typing import Any, Iterable, Optional
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.core.cache import cache
+from django.utils.duration import duration_iso_string
+from django.utils.functional import Promise
+from django.utils.timezone import is_aware
+
+from kernel.consumers import GROUP_ALL_CONNECTIONS_NAME, GROUP_TOPIC, GROUP_USER_ID
+
+# Интервал, в который отправляется не больше одного события прогресса объекта, с
+EVENT_COALESCE_INTERVAL = 1
+
+NATIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def _native_key(key) -> str:
+    # ключи словаря приводятся к строке как в json.dumps
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return 'true'
+    if key is False:
+        return 'false'
+    if key is None:
+        return 'null'
+    if isinstance(key, float):
+        return float.__repr__(key)
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(f'keys must be str, int, float, bool or None, not {type(key).__name__}')
+
+
+def to_native(value: Any) -> Any:
+    """
+    Приводит данные события к типам, которые передаются по слою каналов: результат совпадает
+    с json.loads(json.dumps(value, cls=DjangoJSONEncoder)), но без промежуточного текста.
+    """
+    if type(value) in NATIVE_TYPES:
+        return value
+    # наследники базовых типов (например, значения choices) передаются как сами базовые типы
+    if isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, str):
+        return str.__str__(value)
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return float(value)
+    if isinstance(value, dict):
+        return {_native_key(key): to_native(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_native(item) for item in value]
+    if isinstance(value, datetime.datetime):
+        result = value.isoformat()
+        if value.microsecond:
+            result = result[:23] + result[26:]
+        if result.endswith('+00:00'):
+            result = result.removesuffix('+00:00') + 'Z'
+        return result
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, datetime.time):
+        if is_aware(value):
+            raise ValueError("JSON can't represent timezone-aware times.")
+        result = value.isoformat()
+        if value.microsecond:
+            result = result[:12]
+        return result
+    if isinstance(value, datetime.timedelta):
+        return duration_iso_string(value)
+    if isinstance(value, (decimal.Decimal, uuid.UUID, Promise)):
+        return str(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+# подготовка мессажа для засылания в систему ченнелов, отправляется как сообщение с типом send.eventtoapi
+def make_event_message(command_type, data=None):
+    message = {'type': 'send.eventtoapi', 'command_type': command_type}
+    if data:
+        message['data'] = to_native(data)
+    return message
+
+
+def should_send_event(coalesce_key: Optional[str]) -> bool:
+    """
+    False, если событие с тем же ключом уже отправлялось в последние EVENT_COALESCE_INTERVAL секунд.
+    """
+    if coalesce_key is None:
+        return True
+    return cache.add(f'ws_event:{coalesce_key}', 1, timeout=EVENT_COALESCE_INTERVAL)
+
+
+def defer_event(coalesce_key: str, groups, message) -> None:
+    """
+    Запоминает событие, пришедшее внутри окна, вместо предыдущего отложенного и планирует его отправку
+    в конце окна (одна задача на окно).
+    """
+    from kernel.tasks import send_coalesced_event
+
+    cache.set(f'ws_event:{coalesce_key}:pending', (groups, message), timeout=EVENT_COALESCE_INTERVAL * 10)
+
+    if cache.add(f'ws_event:{coalesce_key}:scheduled', 1, timeout=EVENT_COALESCE_INTERVAL * 10):
+        send_coalesced_event.apply_async((coalesce_key,), countdown=EVENT_COALESCE_INTERVAL)
+
+
+def send_deferred_event(coalesce_key: str) -> None:
+    """
+    Отправляет последнее отложенное событие и открывает следующее окно.
+
+    Отметка о запланированной отправке снимается до чтения события: событие, пришедшее после этого,
+    запланирует новую отправку, поэтому последнее состояние не теряется (в худшем случае уйдет дважды).
+    """
+    cache.delete(f'ws_event:{coalesce_key}:scheduled')
+    pending = cache.get(f'ws_event:{coalesce_key}:pending')
+
+    if pending is None:
+        return
+
+    cache.set(f'ws_event:{coalesce_key}', 1, timeout=EVENT_COALESCE_INTERVAL)
+
+    groups, message = pending
+    async_to_sync(_group_send_many)(groups, message)
+
+
+def discard_deferred_event(coalesce_key: str) -> None:
+    """
+    Отменяет отложенное событие, например когда вслед за прогрессом отправлено итоговое состояние объекта.
+    """
+    cache.delete(f'ws_event:{coalesce_key}:pending')
+
+
+async def _group_send_many(groups, message):
+    channel_layer = get_channel_layer()
+    await asyncio.gather(*(channel_layer.group_send(group, message) for group in groups))
+
+
+def send_event_to_groups(groups: Iterable[str], command_type, data=None, coalesce_key: Optional[str] = None):
+    """
+    Отправляет событие в группы каналов groups (повторы отбрасываются).
+    Событие с coalesce_key внутри окна откладывается до его окончания (см. defer_event).
+    """
+    groups = list(dict.fromkeys(groups))
+    if not groups:
+        return
+
+    message = make_event_message(command_type, data)
+
+    if not should_send_event(coalesce_key):
+        defer_event(coalesce_key, groups, message)
+        return
+
+    async_to_sync(_group_send_many)(groups, message)
+
+
+def get_user_groups(user_id):
+    # user_id - id юзера или list/set of id
+    if isinstance(user_id, int):
+        user_id = [user_id]
+    if not isinstance(user_id, (list, set, tuple)):
+        raise Exception("user_id error type")
+    return [GROUP_USER_ID % u_id for u_id in user_id]
+
+
+# отправляет всем channel-сообщение send.eventtoapi, которое внутри рассылает обычные api-эвенты с доп.датой возможно
+# в общем случае вероятно не должно использоваться, это мастшабная отправка
+# см. send_event_to_users если известны юзеры, send_event_to_topic для подписчиков темы
+def send_event_to_all(command_type, data=None, coalesce_key=None):
+    send_event_to_groups([GROUP_ALL_CONNECTIONS_NAME], command_type, data, coalesce_key)
+
+
+# отправляет сообщение только указанным юзерам
+def send_event_to_users(user_id, command_type, data=None, coalesce_key=None):
+    send_event_to_groups(get_user_groups(user_id), command_type, data, coalesce_key)
+
+
+# отправляет сообщение подписчикам темы и, дополнительно, указанным юзерам
+def send_event_to_topic(topic, command_type, data=None, user_id=(), coalesce_key=None):
+    groups = [GROUP_TOPIC % topic] + get_user_groups(user_id)
+    send_event_to_groups(groups, command_type, data, coalesce_key)
@@ -52,6 +52,13 @@ class AllObjectsManager(models.Manager):
         return self.queryset(self.model, using=self._db)
 
 
+def soft_delete_index(*fields, name):
+    """
+    Частичный индекс только по «живым» записям: SoftDeleteManager добавляет deleted_at IS NULL к каждому запросу.
+    """
+    return models.Index(fields=list(fields), name=name, condition=models.Q(deleted_at__isnull=True))
+
+
 class SoftDeleteModelMixin(models.Model):
     """
     Абстрактная модель для мягкого удаления.
@@ -69,6 +76,9 @@ class SoftDeleteModelMixin(models.Model):
         editable=False,
     )
 
+    # внешние ключи, по которым не нужен частичный индекс (см. kernel.checks)
+    soft_delete_unindexed_fields = ()
+
     # дефолтный менеджер — только «живые» записи
     objects = SoftDeleteManager()
     # менеджер для всех записей
@@ -0,0 +1,11 @@
+from celery import shared_task
+
+from kernel.events import send_deferred_event
+
+
+@shared_task(ignore_result=True)
+def send_coalesced_event(coalesce_key):
+    """
+    Отправляет последнее событие, отложенное за окно EVENT_COALESCE_INTERVAL.
+    """
+    send_deferred_event(coalesce_key)
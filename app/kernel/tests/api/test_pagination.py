@@ -1,8 +1,14 @@
+from datetime import datetime, timedelta, timezone
+
+from django.db.models.functions import Length
 from django.test import TestCase
 from rest_framework.exceptions import NotFound
 from rest_framework.test import APIRequestFactory
 from rest_framework.request import Request
-from kernel.api.pagination import DynamicPageNumberPagination
+from urllib.parse import parse_qs, urlparse
+
+from kernel.api.pagination import DynamicPageNumberPagination, KeysetPagination
+from kernel.models import Organization
 
 
 class DynamicPageNumberPaginationTestCase(TestCase):
@@ -45,3 +51,93 @@ class DynamicPageNumberPaginationTestCase(TestCase):
         request = Request(request)
         page_size = self.pagination.get_page_size(request)
         self.assertEqual(page_size, self.pagination.page_size)  # Проверка дефолтного размера
+
+
+class KeysetPaginationTestCase(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        for name in ['b', 'a', 'c', 'a', 'd']:
+            Organization.objects.create(name=name)
+        self.queryset = Organization.objects.order_by('name')
+        self.expected = list(Organization.objects.order_by('name', 'id').values_list('id', flat=True))
+
+    def paginate(self, params):
+        pagination = KeysetPagination()
+        request = Request(self.factory.get("/", params))
+        page = pagination.paginate_queryset(self.queryset, request)
+        return pagination, page, pagination.get_paginated_response([obj.id for obj in page]).data
+
+    def get_cursor(self, link):
+        return parse_qs(urlparse(link).query)["cursor"][0]
+
+    def test_page_mode_without_cursor(self):
+        pagination, page, data = self.paginate({"size": "2", "page": "1"})
+        self.assertEqual(data["count"], 5)
+        self.assertFalse(pagination.cursor_mode)
+
+    def test_cursor_walks_forward_and_back(self):
+        _, _, data = self.paginate({"size": "2", "cursor": ""})
+        self.assertEqual(data["results"], self.expected[:2])
+        self.assertIsNone(data["count"])
+        self.assertIsNone(data["previous"])
+
+        _, _, data = self.paginate({"size": "2", "cursor": self.get_cursor(data["next"])})
+        self.assertEqual(data["results"], self.expected[2:4])
+
+        _, _, last = self.paginate({"size": "2", "cursor": self.get_cursor(data["next"])})
+        self.assertEqual(last["results"], self.expected[4:])
+        self.assertIsNone(last["next"])
+
+        _, _, data = self.paginate({"size": "2", "cursor": self.get_cursor(data["previous"])})
+        self.assertEqual(data["results"], self.expected[:2])
+
+    def test_cursor_exact_count(self):
+        _, _, data = self.paginate({"size": "2", "cursor": "", "count": "exact"})
+        self.assertEqual(data["count"], 5)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(NotFound):
+            self.paginate({"cursor": "not-a-cursor"})
+
+    def test_multi_field_ordering_falls_back_to_pages(self):
+        self.queryset = Organization.objects.order_by('name', '-id')
+
+        pagination, page, data = self.paginate({"size": "2", "cursor": ""})
+        self.assertFalse(pagination.cursor_mode)
+        self.assertEqual(data["count"], 5)
+        expected = list(Organization.objects.order_by('name', '-id').values_list('id', flat=True))
+        self.assertEqual([obj.id for obj in page], expected[:2])
+
+    def test_trailing_id_keeps_cursor_mode(self):
+        self.queryset = Organization.objects.order_by('name', 'id')
+
+        pagination, _, data = self.paginate({"size": "2", "cursor": ""})
+        self.assertTrue(pagination.cursor_mode)
+        self.assertEqual(data["results"], self.expected[:2])
+
+    def test_annotation_ordering_falls_back_to_pages(self):
+        self.queryset = Organization.objects.annotate(name_length=Length('name')).order_by('name_length')
+
+        pagination, _, data = self.paginate({"size": "2", "cursor": ""})
+        self.assertFalse(pagination.cursor_mode)
+        self.assertEqual(data["count"], 5)
+
+    def test_cursor_keeps_microseconds(self):
+        # записи из одной миллисекунды на границе страницы
+        base = datetime(2026, 1, 1, 12, 0, 0, 123000, tzinfo=timezone.utc)
+        for index, organization in enumerate(Organization.objects.order_by('id')):
+            deleted_at = base + timedelta(microseconds=index * 100)
+            Organization.all_objects.filter(pk=organization.pk).update(deleted_at=deleted_at)
+        self.queryset = Organization.all_objects.order_by('-deleted_at')
+        expected = list(Organization.all_objects.order_by('-deleted_at', '-id').values_list('id', flat=True))
+
+        results = []
+        _, _, data = self.paginate({"size": "2", "cursor": ""})
+        results += data["results"]
+        while data["next"]:
+            _, _, data = self.paginate({"size": "2", "cursor": self.get_cursor(data["next"])})
+            results += data["results"]
+        self.assertEqual(results, expected)
+
+        _, _, data = self.paginate({"size": "2", "cursor": self.get_cursor(data["previous"])})
+        self.assertEqual(data["results"], expected[2:4])
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth.models import AnonymousUser
+from django.test import SimpleTestCase, override_settings
+
+from kernel.consumers import GROUP_USER_ID, WSConsumer
+from kernel.events import send_event_to_topic
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class WSConsumerTestCase(SimpleTestCase):
+    def get_user(self):
+        return SimpleNamespace(
+            id=1, first_name='Иван', last_name='Иванов', middle_name='', email='ivanov@example.com',
+            is_authenticated=True, is_active=True,
+        )
+
+    async def connect(self, user):
+        communicator = WebsocketCommunicator(WSConsumer.as_asgi(), '/api/ws/')
+        communicator.scope['user'] = user
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        return communicator
+
+    async def test_not_authenticated(self):
+        communicator = await self.connect(AnonymousUser())
+
+        self.assertEqual(
+            await communicator.receive_json_from(), {'_type': 'login', '_error': 'not authenticated'},
+        )
+        self.assertEqual(await communicator.receive_output(), {'type': 'websocket.close', 'code': 4401})
+
+    async def test_protocol(self):
+        communicator = await self.connect(self.get_user())
+
+        login = await communicator.receive_json_from()
+        self.assertEqual(login['_type'], 'login')
+        self.assertEqual(login['_data']['email'], 'ivanov@example.com')
+
+        await communicator.send_json_to({'_type': 'ping'})
+        self.assertEqual(await communicator.receive_json_from(), {'_type': 'ping'})
+
+        await get_channel_layer().group_send(GROUP_USER_ID % 1, {
+            'type': 'send.eventtoapi', 'command_type': 'task_updated', 'data': {'id': 5},
+        })
+        self.assertEqual(await communicator.receive_json_from(), {'_type': 'task_updated', '_data': {'id': 5}})
+
+        await communicator.disconnect()
+
+    async def test_subscribe(self):
+        communicator = await self.connect(self.get_user())
+        await communicator.receive_json_from()
+
+        await communicator.send_json_to({'_type': 'subscribe', 'topic': 'sync_erp'})
+        self.assertEqual(
+            await communicator.receive_json_from(), {'_type': 'subscribe', '_data': {'topic': 'sync_erp'}},
+        )
+
+        await sync_to_async(send_event_to_topic)('sync_erp', 'sync_erp', {'id': 5})
+        self.assertEqual(await communicator.receive_json_from(), {'_type': 'sync_erp', '_data': {'id': 5}})
+
+        await communicator.send_json_to({'_type': 'subscribe', 'topic': 'bad topic'})
+        self.assertEqual(
+            await communicator.receive_json_from(), {'_type': 'subscribe', '_error': 'invalid topic'},
+        )
+
+        await communicator.disconnect()
@@ -5,7 +5,8 @@ import requests
 from unittest import TestCase
 from unittest.mock import patch, Mock
 from requests.auth import HTTPBasicAuth
-from kernel.erp import ERPApi, ERPException
+from kernel.erp import ERP_TIMEOUT, ERPApi, ERPException
+from kernel.erp_stand_in import ERPStandInServer
 
 
 class TestERPApi(TestCase):
@@ -19,7 +20,7 @@ class TestERPApi(TestCase):
         """Создаём экземпляр API с тестовыми данными."""
         self.api = ERPApi(base_url="http://test-api.com", login="test_user", password="test_pass")
 
-    @patch("kernel.erp.requests.post")
+    @patch("kernel.erp.requests.Session.post")
     def test_post_successful(self, mock_post):
         """Тест успешного POST-запроса"""
         mock_response = Mock()
@@ -38,7 +39,7 @@ class TestERPApi(TestCase):
             data=json.dumps(data),
             auth=HTTPBasicAuth(username="test_user", password="test_pass"),
             headers={"Host": "test-api.com"},
-            timeout=60,
+            timeout=ERP_TIMEOUT,
         )
 
     def test_validate_config_success(self):
@@ -66,7 +67,7 @@ class TestERPApi(TestCase):
             self.api.validate_config()
         self.assertEqual(str(context.exception), "Не указан пароль к системе ERP")
 
-    @patch("kernel.erp.requests.post")
+    @patch("kernel.erp.requests.Session.post")
     def test_sync_product_successful(self, mock_post):
         """Тест успешной синхронизации продукта"""
         mock_response = Mock()
@@ -87,7 +88,7 @@ class TestERPApi(TestCase):
         self.assertEqual(response, 12345)
         mock_erp_sync.add_log.assert_called()
 
-    @patch("kernel.erp.requests.post")
+    @patch("kernel.erp.requests.Session.post")
     def test_sync_product_error(self, mock_post):
         """Тест ошибки при синхронизации продукта"""
         mock_response = Mock()
@@ -109,7 +110,7 @@ class TestERPApi(TestCase):
 
         self.assertEqual(str(context.exception), "Ошибка на сервере")
 
-    @patch("kernel.erp.requests.post")
+    @patch("kernel.erp.requests.Session.post")
     def test_sync_specifications_successful(self, mock_post):
         """Тест успешной синхронизации спецификаций"""
         mock_response = Mock()
@@ -129,7 +130,7 @@ class TestERPApi(TestCase):
         self.assertEqual(response, {"error": False, "message": "Success"})
         mock_erp_sync.add_log.assert_called()
 
-    @patch("kernel.erp.requests.post")
+    @patch("kernel.erp.requests.Session.post")
     def test_sync_specifications_error(self, mock_post):
         """Тест ошибки при синхронизации спецификаций"""
         mock_response = Mock()
@@ -149,6 +150,22 @@ class TestERPApi(TestCase):
             )
 
         self.assertEqual(str(context.exception), "Ошибка спецификации")
+
+    def test_stand_in_keeps_connection(self):
+        """Запросы к ERP идут через одно keep-alive соединение"""
+        with ERPStandInServer() as server:
+            with ERPApi(base_url=server.base_url, login="test_user", password="test_pass") as api:
+                erp_sync = Mock()
+                ids = [
+                    api.sync_product(idwicad=i, modelslug="m", art="a", name="n", params={}, erp_sync=erp_sync)
+                    for i in range(3)
+                ]
+                spec = api.sync_specifications(idwicad=1, iderp=ids[0], count=1, structure=[], erp_sync=erp_sync)
+
+        self.assertEqual(ids, [1, 2, 3])
+        self.assertEqual(spec["nomspec"], 4)
+        self.assertEqual(len(server.requests_to("/products/id")), 3)
+        self.assertEqual(len(server.connections), 1)
     #
     # @patch("kernel.erp.requests.post")
     # def test_post_failure(self, mock_post):
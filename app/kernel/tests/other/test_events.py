@@ -0,0 +1,95 @@
+import asyncio
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from channels.layers import get_channel_layer
+
+from kernel.consumers import GROUP_TOPIC, GROUP_USER_ID
+from kernel.events import (
+    EVENT_COALESCE_INTERVAL, discard_deferred_event, send_event_to_topic, send_event_to_users, to_native,
+)
+from kernel.tasks import send_coalesced_event
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class EventsTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.channel_layer = get_channel_layer()
+
+    def join(self, group):
+        channel_name = async_to_sync(self.channel_layer.new_channel)()
+        async_to_sync(self.channel_layer.group_add)(group, channel_name)
+        return channel_name
+
+    def receive(self, channel_name):
+        return async_to_sync(self.channel_layer.receive)(channel_name)
+
+    def test_to_native_matches_json_round_trip(self):
+        data = {
+            'id': 1,
+            'created_at': timezone.make_aware(datetime.datetime(2026, 10, 19, 12, 30, 15, 123456), datetime.UTC),
+            'date': datetime.date(2026, 10, 19),
+            'duration': datetime.timedelta(minutes=5),
+            'amount': Decimal('1.50'),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'label': _('Автор'),
+            'items': (1, 'a', None, True),
+            2: {'nested': [1.5]},
+        }
+
+        self.assertEqual(to_native(data), json.loads(json.dumps(data, cls=DjangoJSONEncoder)))
+
+    def test_send_to_topic_and_users(self):
+        subscriber = self.join(GROUP_TOPIC % 'sync_erp')
+        author = self.join(GROUP_USER_ID % 1)
+
+        send_event_to_topic('sync_erp', 'sync_erp', {'id': 5}, user_id=1)
+
+        expected = {'type': 'send.eventtoapi', 'command_type': 'sync_erp', 'data': {'id': 5}}
+        self.assertEqual(self.receive(subscriber), expected)
+        self.assertEqual(self.receive(author), expected)
+
+    def test_progress_coalesced(self):
+        channel_name = self.join(GROUP_USER_ID % 1)
+
+        with mock.patch.object(send_coalesced_event, 'apply_async') as apply_async:
+            for processed in range(1, 4):
+                send_event_to_users(1, 'task_updated', {'progress': processed}, coalesce_key='task_updated:7')
+
+        # первое событие окна уходит сразу, последнее - одной отложенной отправкой в конце окна
+        apply_async.assert_called_once_with(('task_updated:7',), countdown=EVENT_COALESCE_INTERVAL)
+        self.assertEqual(self.receive(channel_name)['data'], {'progress': 1})
+
+        send_coalesced_event('task_updated:7')
+        self.assertEqual(self.receive(channel_name)['data'], {'progress': 3})
+
+        send_event_to_users(1, 'task_updated', {'status': 'success'})
+        self.assertEqual(self.receive(channel_name)['data'], {'status': 'success'})
+
+    def test_discarded_progress_not_sent(self):
+        channel_name = self.join(GROUP_USER_ID % 1)
+
+        with mock.patch.object(send_coalesced_event, 'apply_async'):
+            for processed in range(1, 3):
+                send_event_to_users(1, 'task_updated', {'progress': processed}, coalesce_key='task_updated:8')
+
+        self.assertEqual(self.receive(channel_name)['data'], {'progress': 1})
+
+        discard_deferred_event('task_updated:8')
+        send_event_to_users(1, 'task_updated', {'status': 'success'})
+        send_coalesced_event('task_updated:8')
+
+        self.assertEqual(self.receive(channel_name)['data'], {'status': 'success'})
+        with self.assertRaises(asyncio.TimeoutError):
+            async_to_sync(asyncio.wait_for)(self.channel_layer.receive(channel_name), 0.1)
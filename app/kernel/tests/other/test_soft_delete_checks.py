@@ -0,0 +1,19 @@
+from django.apps import apps
+from django.test import SimpleTestCase
+
+from catalog.models import DirectoryEntryValue
+from kernel.checks import check_soft_delete_indexes
+from ops.models import Attribute, BaseComposition, Item, ItemChild, ProjectItem, Variant
+
+
+class SoftDeleteIndexesCheckTestCase(SimpleTestCase):
+    def test_hot_models_have_partial_indexes(self):
+        app_configs = [apps.get_app_config('ops'), apps.get_app_config('catalog')]
+        flagged = {warning.obj for warning in check_soft_delete_indexes(app_configs)}
+
+        for model in (Item, ItemChild, Attribute, BaseComposition, Variant, ProjectItem, DirectoryEntryValue):
+            self.assertNotIn(model, flagged)
+
+    def test_warning_id(self):
+        for warning in check_soft_delete_indexes():
+            self.assertEqual(warning.id, 'kernel.W001')
@@ -14,7 +14,7 @@ from ops.models import (
     Project, DetailType, Item, ProjectItem, ItemChild, FieldSet, Attribute, Variant, BaseComposition, ERPSyncLog,
     ERPSync,
 )
-from ops.resources import get_resources_list
+from ops.resources import get_resource_class, get_resources_list
 from ops.widgets import MarkingTemplateWidget
 from taskmanager.choices import TaskType
 from taskmanager.models import TaskAttachment, Task
@@ -279,8 +279,7 @@ class ItemAdmin(ImportMixin, admin.ModelAdmin):
 
                 # убеждаемся, что ресурс существует
                 resource_name = f'{category}_{designation}'
-                resources_list = get_resources_list()
-                if not any(r.__name__ == resource_name for r in resources_list):
+                if get_resource_class(resource_name) is None:
                     self.message_user(request, f'Ресурс "{resource_name}" не найден', level=messages.ERROR)
                     return redirect(request.get_full_path())
                 # создаём задачу в БД
@@ -160,3 +160,18 @@ class ImportFromCRMPermission(BasePermission):
                 return True
 
         return False
+
+
+class ProjectSketchBookPermission(BasePermission):
+    """
+    Для выгрузки эскизов проекта требуется разрешение:
+
+    - Может просматривать элементы табличной части проекта
+    """
+
+    def has_permission(self, request, view):
+        if view.action in ['sketch_book']:
+            if request.user.has_perm('ops.view_projectitem'):
+                return True
+
+        return False
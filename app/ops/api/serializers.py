@@ -189,6 +189,24 @@ class GetSketchSerializer(serializers.Serializer):
     format = serializers.ChoiceField(
         choices=["svg", "pdf"], default="svg", required=False, label=_("Формат файла"),
     )
+    vector = serializers.BooleanField(
+        default=False, required=False,
+        label=_("SVG без встроенного изображения: эскиз исполнения подключается ссылкой, подписи - текстом"),
+    )
+
+
+class SketchBookSerializer(serializers.Serializer):
+    output = serializers.ChoiceField(
+        choices=["pdf", "zip"], default="pdf", required=False,
+        label=_("Один PDF со всеми эскизами или ZIP архив с файлами позиций"),
+    )
+    format = serializers.ChoiceField(
+        choices=["svg", "pdf"], default="pdf", required=False, label=_("Формат файлов в ZIP архиве"),
+    )
+    positions = serializers.ListField(
+        child=serializers.IntegerField(), required=False, allow_empty=True,
+        label=_("Идентификаторы позиций проекта (по умолчанию все позиции)"),
+    )
 
 
 class CRMProjectItemSerializer(serializers.Serializer):
@@ -342,6 +360,7 @@ class ItemImportSerializer(serializers.Serializer):
     designation = serializers.CharField(required=True)
     file = serializers.FileField(required=True)
     is_dry_run = serializers.BooleanField(default=False)
+    is_bulk = serializers.BooleanField(default=False)
 
 
 class ItemChildSerializer(CleanSerializerMixin, FlexFieldsModelSerializer):
@@ -6,7 +6,7 @@ from io import BytesIO
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.db.models import Q
-from django.http import HttpResponse, FileResponse
+from django.http import HttpResponse, FileResponse, StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
@@ -29,9 +29,9 @@ from catalog.models import PipeMountingRule, ComponentGroup
 from kernel.api.decorators import choices_action
 from kernel.api.exceptions import UserWithCRMLoginNotFound, DependentError
 from kernel.api.filter_backends import MappedOrderingFilter
+from kernel.api.pagination import KeysetPagination
 from kernel.api.permissions import ActionPermission, AnyOneCanViewChoicesPermission
 from kernel.api.views import CustomModelViewSet
-from kernel.consumers import send_event_to_all
 from kernel.models import Organization
 from ops.api.exceptions import ItemNotFound, ResourceNotFound, FormatNotSupported, ProjectNotFound, \
     ProjectItemProductFamilyNotSet, ProjectItemSelectionTypeNotSet
@@ -39,7 +39,7 @@ from ops.api.filters import ProjectFilter, DetailTypeFilter, ItemFilter, Variant
     AttributeFilter
 from ops.api.permissions import (
     OwnActionPermission, ProjectItemPermission, ERPSyncPermission, ImportFromCRMPermission,
-    ProjectERPSyncPermission, ClonePermission, ProjectOrgPermission,
+    ProjectERPSyncPermission, ClonePermission, ProjectOrgPermission, ProjectSketchBookPermission,
 )
 from ops.api.serializers import (
     CalculateLoadSerializer, ProjectSerializer, DetailTypeSerializer, ItemSerializer, ProjectItemSerializer,
@@ -49,27 +49,34 @@ from ops.api.serializers import (
     ShockCalcResultSerializer, AvailableTopMountsRequestSerializer, TopMountVariantSerializer, AssemblyLengthSerializer,
     AvailableMountsRequestSerializer, MountingVariantSerializer, ShockSelectionParamsSerializer,
     SpacerSelectionParamsSerializer, GetSketchSerializer, WVDSelectionParamsSerializer,
-    ProjectItemSetProductFamilySerializer,
+    ProjectItemSetProductFamilySerializer, SketchBookSerializer,
 
 )
 from ops.api.utils import sum_mounting_sizes, get_selection_params_serializer_class
 from ops.choices import ERPSyncType, AttributeUsageChoices, AttributeType
+from ops.item_export import (
+    EXPORT_CONTENT_TYPES, EXPORT_STREAM_LIMIT, get_export_queryset, iter_csv, iter_export_rows, prepare_export_resource,
+    write_xlsx,
+)
 from ops.loads.utils import get_suitable_loads
 from ops.marking_compiler import get_jinja2_env
-from ops.sketch.pdf import render_sketch_pdf
+from ops.sketch.cache import render_sketch_cached, render_sketch_pdf_cached
 from ops.models import (
     Project, DetailType, Item, ProjectItem, ProjectItemRevision, ItemChild, FieldSet, Attribute,
     Variant, ERPSync, BaseComposition
 )
-from ops.resources import get_resources_list
+from ops.resources import get_resource_class
 from ops.services import get_selection_available_options_class
 from ops.services.clone_utils import get_model_fields_for_clone, generate_unique_copy_name, clone_image_field
+from ops.services.sketch_data import save_sketch_data
 from ops.services.product_selection import ProductSelectionAvailableOptions
 from ops.services.shock_calc_service import calculate_shock_block
 from ops.services.shock_selection import ShockSelectionAvailableOptions
 from ops.services.wvd_selection import WVDSelectionAvailableOptions, WVD_SELECTION_TYPE
-from ops.tasks import task_sync_erp, task_sync_project_to_erp, process_import_task
-from ops.utils import render_sketch
+from ops.tasks import (
+    notify_erp_sync, task_sync_erp, task_sync_project_to_erp, process_import_task, process_export_task,
+    process_sketch_book_task,
+)
 from taskmanager.api.serializers import TaskSerializer
 from taskmanager.choices import TaskType
 from taskmanager.models import Task, TaskAttachment
@@ -92,7 +99,8 @@ class ProjectViewSet(CustomModelViewSet):
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
     permission_classes = [
-        ImportFromCRMPermission | ProjectERPSyncPermission | OwnActionPermission | ProjectOrgPermission | ActionPermission
+        ImportFromCRMPermission | ProjectERPSyncPermission | ProjectSketchBookPermission | OwnActionPermission
+        | ProjectOrgPermission | ActionPermission
     ]
     filter_backends = [DjangoFilterBackend, MappedOrderingFilter, SearchFilter]
     filterset_class = ProjectFilter
@@ -110,6 +118,8 @@ class ProjectViewSet(CustomModelViewSet):
             return CRMProjectSyncERPSerializer
         if self.action == 'import_from_crm':
             return CRMProjectSerializer
+        if self.action == 'sketch_book':
+            return SketchBookSerializer
 
         return ProjectSerializer
 
@@ -190,12 +200,41 @@ class ProjectViewSet(CustomModelViewSet):
             raise ProjectNotFound
 
         erp_sync = ERPSync.objects.create(author=request.user, type=ERPSyncType.PROJECT, project=project)
-        send_event_to_all('sync_erp', erp_sync.to_json())
+        notify_erp_sync(erp_sync)
 
         task_sync_project_to_erp.delay(erp_sync.id)
 
         return Response(erp_sync.to_json())
 
+    @action(methods=['POST'], detail=True)
+    def sketch_book(self, request, *args, **kwargs):
+        """
+        Запустить выгрузку эскизов позиций проекта (всех или переданных в positions)
+        одним PDF или ZIP архивом. Файл сохраняется в результате задачи.
+        """
+        project = self.get_object()
+
+        serializer_class = self.get_serializer_class()
+        serializer = serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        data = serializer.validated_data
+
+        task = Task.objects.create(
+            owner=request.user,
+            type=TaskType.SKETCHES,
+            parameters={
+                'project_id': project.id,
+                'positions': data.get('positions') or None,
+                'output': data['output'],
+                'format': data['format'],
+                'composition_type': 'specification',
+            },
+        )
+        process_sketch_book_task.delay(task.id)
+
+        return Response(TaskSerializer(task).data, status=status.HTTP_202_ACCEPTED)
+
     @action(methods=['POST'], detail=False)
     def import_from_crm(self, request, *args, **kwargs):
         """
@@ -607,6 +646,11 @@ class ProjectItemViewSet(CustomModelViewSet):
         project_item.original_item = item
         project_item.save()
 
+        try:
+            save_sketch_data(project_item, selection)
+        except NotImplementedError:
+            pass
+
         serializer = ProjectItemSerializer(project_item)
 
         return Response(serializer.data)
@@ -634,10 +678,13 @@ class ProjectItemViewSet(CustomModelViewSet):
 
         if export_format == "svg":
             content_type = "image/svg+xml"
-            output, filename = render_sketch(request, project_item, composition_type="specification")
+            output, filename = render_sketch_cached(
+                request, project_item, composition_type="specification",
+                vector=serializer.validated_data.get("vector", False),
+            )
         elif export_format == "pdf":
             content_type = "application/pdf"
-            output, filename = render_sketch_pdf(project_item, request.user, composition_type="specification")
+            output, filename = render_sketch_pdf_cached(project_item, request.user, composition_type="specification")
         else:
             raise FormatNotSupported(f"Формат {export_format} не поддерживается. Доступные форматы: svg, pdf.")
 
@@ -663,17 +710,18 @@ class ProjectItemViewSet(CustomModelViewSet):
         if export_format == "svg":
             content_type = "image/svg+xml"
             try:
-                output, filename = render_sketch(
+                output, filename = render_sketch_cached(
                     request, project_item, composition_type="specification",
                     field_name="subsketch",
                     coords_field_name="subsketch_coords",
+                    vector=serializer.validated_data.get("vector", False),
                 )
             except Exception as exc:
                 raise ValidationError(str(exc))
         elif export_format == "pdf":
             content_type = "application/pdf"
             try:
-                output, filename = render_sketch_pdf(
+                output, filename = render_sketch_pdf_cached(
                     project_item, request.user, field_name="subsketch",
                     coords_field_name="subsketch_coords",
                     composition_type="specification",
@@ -1248,6 +1296,7 @@ class ItemViewSet(CustomModelViewSet):
     """
     queryset = Item.objects.all()
     # permission_classes = [ERPSyncPermission | OwnActionPermission.build(owner_field='author') | ActionPermission]
+    pagination_class = KeysetPagination
     filter_backends = [DjangoFilterBackend, MappedOrderingFilter, SearchFilter]
     filterset_class = ItemFilter
 
@@ -1274,42 +1323,30 @@ class ItemViewSet(CustomModelViewSet):
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
 
-        # TODO: Временное решение, потом найти другую библиотеку или хороший способ встроить в текущую библиотеку
-        parameters_filters = None
+        # Фильтры вида parameters.<name>[.<lookup>]=<value> выполняются по индексируемой таблице
+        # ItemParameterValue, где 12 и "12", true и "true" считаются равными
+        parameters_filters = {}
         for key, value in request.GET.items():
             if key.startswith('parameters.'):
-                parts = key.split('.')
-                filter_param = '__'.join(parts)
-                found = False
-
-                if value in ('true', 'false'):
-                    pythonic_value = True if value == 'true' else False
-                    key_filter = Q(**{filter_param: str(value)}) | Q(**{filter_param: pythonic_value})
-                    found = True
+                filter_param = '__'.join(key.split('.'))
 
-                if not found:
+                if filter_param.endswith('__in'):
+                    pythonic_value = value.split(',')
+                elif value in ('true', 'false'):
+                    pythonic_value = value == 'true'
+                else:
                     try:
                         pythonic_value = int(value)
-                        key_filter = Q(**{filter_param: pythonic_value})
-                        found = True
                     except ValueError:
                         try:
                             pythonic_value = float(value)
-                            key_filter = Q(**{filter_param: pythonic_value})
-                            found = True
                         except ValueError:
-                            pass
+                            pythonic_value = str(value)
 
-                if not found:
-                    key_filter = Q(**{filter_param: str(value)})
-
-                if parameters_filters is None:
-                    parameters_filters = key_filter
-                else:
-                    parameters_filters &= key_filter
+                parameters_filters[filter_param] = pythonic_value
 
         if parameters_filters:
-            queryset = queryset.filter(parameters_filters)
+            queryset = queryset.filter_parameters(**parameters_filters)
 
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -1368,7 +1405,7 @@ class ItemViewSet(CustomModelViewSet):
             raise ItemNotFound
 
         erp_sync = ERPSync.objects.create(author=request.user, type=ERPSyncType.ITEM, item=item)
-        send_event_to_all("sync_erp", erp_sync.to_json())
+        notify_erp_sync(erp_sync)
 
         task_sync_erp.delay(erp_sync.id)
 
@@ -1383,6 +1420,7 @@ class ItemViewSet(CustomModelViewSet):
         В зависимости от флага 'is_dry_run':
             - Если True, импорт выполняется как dry-run (тип задачи: DryRunImport);
             - Если False,выполняется реальный импорт (тип задачи: Import);
+        Флаг 'is_bulk' включает пакетный импорт (bulk_create/bulk_update без истории изменений).
 
         Файл, переданный в поле 'file', сохраняется в модели TaskAttachment с полем slug равным 'imported_file'.
         Остальные параметры (например, category, designation, type файла, is_dry_run) сохраняются
@@ -1404,12 +1442,12 @@ class ItemViewSet(CustomModelViewSet):
         designation = data['designation']
         uploaded_file = data['file']
         is_dry_run = data['is_dry_run']
+        is_bulk = data['is_bulk']
 
         if file_format not in ['xlsx', 'csv']:
             raise FormatNotSupported
 
-        resources = get_resources_list()
-        resource = next((resource for resource in resources if resource.__name__ == f'{category}_{designation}'), None)
+        resource = get_resource_class(f'{category}_{designation}')
 
         if not resource:
             raise ResourceNotFound
@@ -1418,6 +1456,7 @@ class ItemViewSet(CustomModelViewSet):
             'category': category,
             'designation': designation,
             'file_format': file_format,
+            'is_bulk': is_bulk,
         }
 
         task = Task.objects.create(
@@ -1457,25 +1496,37 @@ class ItemViewSet(CustomModelViewSet):
         if file_type not in ['xlsx', 'csv']:
             raise FormatNotSupported
 
-        resources = get_resources_list()
-        resource = next((resource for resource in resources if resource.__name__ == f'{category}_{designation}'), None)
+        resource = get_resource_class(f'{category}_{designation}')
 
         if not resource:
             raise ResourceNotFound
 
-        if is_empty:
-            dataset = resource().export(queryset=Item.objects.none())
-        else:
-            dataset = resource().export(
-                queryset=Item.objects.filter(type__category=category, type__designation=designation)
+        queryset = get_export_queryset(category, designation, is_empty)
+
+        # Большие выгрузки формируются в фоне, результат сохраняется в TaskResult задачи
+        if not is_empty and queryset.count() > EXPORT_STREAM_LIMIT:
+            task = Task.objects.create(
+                owner=request.user,
+                type=TaskType.EXPORT,
+                parameters={
+                    'category': category,
+                    'designation': designation,
+                    'file_format': file_type,
+                },
             )
+            process_export_task.delay(task.id)
 
-        content_types = {
-            'csv': 'text/csv',
-            'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        }
+            return Response(TaskSerializer(task).data, status=status.HTTP_202_ACCEPTED)
+
+        rows = iter_export_rows(prepare_export_resource(resource), queryset)
+
+        if file_type == 'csv':
+            response = StreamingHttpResponse(iter_csv(rows), content_type=EXPORT_CONTENT_TYPES[file_type])
+        else:
+            content = BytesIO()
+            write_xlsx(rows, content)
+            response = HttpResponse(content.getvalue(), content_type=EXPORT_CONTENT_TYPES[file_type])
 
-        response = HttpResponse(getattr(dataset, file_type), content_type=content_types[file_type])
         response['Content-Disposition'] = f'attachment; filename="{designation}.{file_type}"'
         return response
 
@@ -5,6 +5,8 @@ class OpsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ops'
 
+    auditlog_excluded_models = ('ItemParameterValue',)
+
     def ready(self):
         import ops.signals # noqa: F401
 
@@ -12,4 +14,7 @@ class OpsConfig(AppConfig):
         # Core models
         app_models = apps.get_app_config(self.label).get_models()
         for model in app_models:
+            # Производные таблицы пересобираются автоматически, история изменений по ним не нужна
+            if model.__name__ in self.auditlog_excluded_models:
+                continue
             auditlog.register(model)
\ No newline at end of file
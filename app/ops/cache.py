@@ -1,4 +1,6 @@
-from typing import List
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
 from django.core.cache import cache
 
@@ -63,6 +65,30 @@ def get_cached_attributes_with_topological_sort(variant) -> List:
     )
 
 
+class VariantMetadataCache:
+    """
+    Атрибуты исполнений в памяти на время пакетной операции (импорт, пересчет).
+
+    Атрибуты каждого исполнения читаются из кэша один раз, а не для каждой детали.
+    """
+
+    def __init__(self):
+        self._sorted_attributes = {}
+        self._attributes_dicts = {}
+
+    def sorted_attributes(self, variant) -> List:
+        if variant.id not in self._sorted_attributes:
+            self._sorted_attributes[variant.id] = get_cached_attributes_with_topological_sort(variant)
+
+        return self._sorted_attributes[variant.id]
+
+    def attributes_dict(self, variant) -> Dict:
+        if variant.id not in self._attributes_dicts:
+            self._attributes_dicts[variant.id] = variant.get_attributes_dict(cached=True)
+
+        return self._attributes_dicts[variant.id]
+
+
 def get_cached_catalog_entry(model_path: str, pk):
     """
     Получает запись каталога по модели и первичному ключу.
@@ -91,3 +117,219 @@ def get_cached_directory_entry(directory_id: int, entry_id: int):
         lambda: DirectoryEntry.objects.get(id=entry_id, directory_id=directory_id),
         timeout=CACHE_TIME,
     )
+
+
+# Как часто процесс сверяет реестр ресурсов импорта/экспорта с базой, с
+RESOURCES_VERSION_TTL = 5
+
+SPRING_BLOCK_INDEX_VERSION_SEQUENCE = 'ops_spring_block_index_version_seq'
+
+
+def normalize_spring_block_value(value) -> Optional[str]:
+    """
+    Приводит значение типоразмера/номинального хода к ключу индекса.
+
+    В Item.parameters значения хранятся то числом, то строкой (12, 12.0, "12"),
+    поэтому числа приводятся к одному представлению.
+    """
+    if value is None:
+        return None
+
+    try:
+        return repr(float(str(value).strip().replace(',', '.')))
+    except ValueError:
+        return str(value).strip()
+
+
+def build_spring_block_index(product_family_id: int) -> Dict[Tuple[str, str, str], List[int]]:
+    """
+    Строит индекс деталей пружинных блоков семейства изделий.
+
+    Ключ - (серия, типоразмер, номинальный ход), значение - отсортированный список ID Item.
+    В индекс попадают исполнения с серией, у которых есть атрибуты с использованием "Типоразмер" и
+    "Номинальный ход", тип детали входит в группу SERIES_SELECTABLE и разрешен для семейства
+    через SpringBlockFamilyBinding.
+
+    Исполнения, их атрибуты и детали читаются тремя запросами независимо от числа исполнений.
+    """
+    from django.db.models import Exists, OuterRef, Q
+
+    from catalog.choices import ComponentGroupType
+    from catalog.models import ComponentGroup, SpringBlockFamilyBinding
+
+    from ops.choices import AttributeUsageChoices
+    from ops.models import Attribute, Item, Variant
+
+    selectable_group = ComponentGroup.objects.filter(
+        group_type=ComponentGroupType.SERIES_SELECTABLE,
+        detail_types=OuterRef('detail_type'),
+    )
+    allowed_detail_types = SpringBlockFamilyBinding.objects.filter(
+        family_id=product_family_id,
+    ).values_list('spring_block_types', flat=True)
+
+    variants = list(Variant.objects.annotate(
+        is_series_selectable=Exists(selectable_group),
+    ).filter(
+        is_series_selectable=True,
+        series__isnull=False,
+        detail_type_id__in=allowed_detail_types,
+    ).values_list('id', 'detail_type_id', 'series'))
+
+    if not variants:
+        return {}
+
+    # Атрибуты всех исполнений и их типов деталей одним запросом, в порядке Attribute.objects.for_variant
+    attributes = list(Attribute.objects.filter(
+        Q(variant_id__in=[variant_id for variant_id, _detail_type_id, _series in variants])
+        | Q(detail_type_id__in={detail_type_id for _variant_id, detail_type_id, _series in variants}),
+    ).values_list('name', 'usage', 'variant_id', 'detail_type_id'))
+
+    variant_attribute_names = defaultdict(set)
+    for name, _usage, variant_id, _detail_type_id in attributes:
+        if variant_id:
+            variant_attribute_names[variant_id].add(name)
+
+    parameter_names = {}
+    for variant_id, detail_type_id, series in variants:
+        names = {}
+
+        for name, usage, attribute_variant_id, attribute_detail_type_id in attributes:
+            if usage not in (AttributeUsageChoices.SIZE, AttributeUsageChoices.RATED_STROKE) or usage in names:
+                continue
+
+            if attribute_variant_id == variant_id:
+                names[usage] = name
+            # Атрибуты исполнения приоритетнее одноименных базовых атрибутов типа детали
+            elif attribute_detail_type_id == detail_type_id and name not in variant_attribute_names[variant_id]:
+                names[usage] = name
+
+        if len(names) == 2:
+            parameter_names[variant_id] = (series, names[AttributeUsageChoices.SIZE],
+                                           names[AttributeUsageChoices.RATED_STROKE])
+
+    index = defaultdict(list)
+
+    rows = Item.objects.filter(variant_id__in=parameter_names).values_list('id', 'variant_id', 'parameters')
+
+    for item_id, variant_id, parameters in rows:
+        series, size_name, stroke_name = parameter_names[variant_id]
+        parameters = parameters or {}
+
+        size = normalize_spring_block_value(parameters.get(size_name))
+        rated_stroke = normalize_spring_block_value(parameters.get(stroke_name))
+
+        if size is None or rated_stroke is None:
+            continue
+
+        index[(series, size, rated_stroke)].append(item_id)
+
+    return {key: sorted(ids) for key, ids in index.items()}
+
+
+def _next_spring_block_index_version() -> None:
+    from django.db import connection
+
+    if connection.vendor != 'postgresql':
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT nextval(%s)', [SPRING_BLOCK_INDEX_VERSION_SEQUENCE])
+
+
+def get_spring_block_index_version() -> Optional[int]:
+    """
+    Текущая версия данных индекса пружинных блоков - значение последовательности в базе, общее для всех процессов.
+    Вне PostgreSQL версии нет (None).
+    """
+    from django.db import connection
+
+    if connection.vendor != 'postgresql':
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT last_value FROM {connection.ops.quote_name(SPRING_BLOCK_INDEX_VERSION_SEQUENCE)}')
+        return cursor.fetchone()[0]
+
+
+def invalidate_spring_block_index() -> None:
+    """
+    Меняет версию индекса пружинных блоков. Вызывается при записи деталей исполнений с серией,
+    атрибутов, исполнений и настроек семейств (сигналы и пакетные операции).
+
+    nextval не откатывается и не ждет транзакций, поэтому версия меняется сразу (изменения видны
+    своей транзакции) и еще раз после фиксации: индекс, перестроенный другим процессом до фиксации
+    по старым данным, останется под устаревшей версией.
+    """
+    from django.db import transaction
+
+    _next_spring_block_index_version()
+    transaction.on_commit(_next_spring_block_index_version)
+
+
+def get_cached_spring_block_index(product_family_id: int) -> Dict[Tuple[str, str, str], List[int]]:
+    """
+    Получает индекс деталей пружинных блоков семейства изделий из кэша или строит его заново.
+    Ключ кэша содержит версию из базы (get_spring_block_index_version): проверка актуальности -
+    один запрос, а изменения из любого процесса сразу приводят к перестроению индекса.
+    """
+    version = get_spring_block_index_version()
+
+    if version is None:
+        return build_spring_block_index(product_family_id)
+
+    cache_key = f"spring_block_index:{product_family_id}:{version}"
+
+    return cache.get_or_set(
+        cache_key,
+        lambda: build_spring_block_index(product_family_id),
+        timeout=CACHE_TIME,
+    )
+
+
+_resources_version = {'value': None, 'checked_at': None}
+
+
+def get_resources_version_stamp() -> Tuple:
+    """
+    Отметка состояния типов деталей и атрибутов в базе: количество записей (всех и неудаленных)
+    и время последнего изменения/удаления. Меняется при любом изменении, видном любому процессу.
+    """
+    from django.db.models import Count, Max, Q
+
+    from ops.models import Attribute, DetailType
+
+    stamp = []
+    for model in (DetailType, Attribute):
+        values = model.all_objects.aggregate(
+            total=Count('id'),
+            alive=Count('id', filter=Q(deleted_at=None)),
+            modified=Max('modified'),
+            deleted=Max('deleted_at'),
+        )
+        stamp.append((values['total'], values['alive'], values['modified'], values['deleted']))
+
+    return tuple(stamp)
+
+
+def get_resources_version() -> Tuple:
+    """
+    Возвращает текущую версию ресурсов импорта/экспорта (зависит от типов деталей и атрибутов).
+    Версия берется из базы не чаще раза в RESOURCES_VERSION_TTL секунд,
+    так что изменения из других процессов видны не позже чем через этот интервал.
+    """
+    now = time.monotonic()
+    checked_at = _resources_version['checked_at']
+
+    if checked_at is None or now - checked_at >= RESOURCES_VERSION_TTL:
+        _resources_version['value'] = get_resources_version_stamp()
+        _resources_version['checked_at'] = now
+
+    return _resources_version['value']
+
+
+def invalidate_resources() -> None:
+    """
+    Заставляет текущий процесс сверить реестр ресурсов импорта/экспорта с базой при следующем обращении.
+    """
+    _resources_version['checked_at'] = None
@@ -1,4 +1,4 @@
-from django.db.models import TextChoices
+from django.db.models import IntegerChoices, TextChoices
 from django.utils.translation import gettext_lazy as _
 
 from kernel.mixins import MaxLengthMixin
@@ -79,6 +79,16 @@ class ERPSyncLogType(TextChoices):
     EXCEPTION = 'exception', _('Exception')
 
 
+class ERPSyncLogVerbosity(IntegerChoices):
+    """
+    Подробность лога ERP синхронизации. Полные данные запросов (payload) при уровне ниже FULL
+    сохраняются только при ошибке.
+    """
+    ERRORS = 0, _('Только ошибки')
+    NORMAL = 1, _('Ход синхронизации')
+    FULL = 2, _('Все запросы и ответы')
+
+
 class EstimatedState(MaxLengthMixin, TextChoices):
     COLD_LOAD = 'cold', _('Холодная нагрузка')
     HOT_LOAD = 'hot', _('Горячая нагрузка')
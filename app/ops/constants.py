@@ -1,3 +1,4 @@
 STALE_SET_KEY = "ops:stale_item_ids"
 STALE_LOCK = "ops:recalc_lock"
 STALE_BATCH = 500
+ERP_SYNC_TOPIC = "sync_erp"
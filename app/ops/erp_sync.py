@@ -0,0 +1,342 @@
+"""
+Порядок обхода состава при синхронизации с ERP.
+
+Спецификация изделия отправляется только после того, как синхронизированы все его дочерние элементы
+(в ней передаются их erp_id). Независимые ветки состава синхронизируются параллельно в пуле потоков:
+время синхронизации многоуровневой сборки определяется глубиной состава, а не суммой задержек ERP.
+
+Состав строится один раз как граф без повторов: общий для нескольких сборок элемент обрабатывается однажды.
+Для каждого изделия хранится отпечаток отправленных данных (erp_fingerprint, erp_spec_fingerprint),
+поэтому повторная синхронизация отправляет только новые и изменившиеся элементы и спецификации.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Set, Tuple
+
+from django.db import connections
+from django.db.models import Prefetch
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from ops.choices import AttributeCatalog, AttributeType, ERPSyncLogType, ERPSyncLogVerbosity
+
+
+class ERPSyncCycleError(Exception):
+    pass
+
+
+def get_erp_fingerprint(data: Dict[str, Any]) -> str:
+    """
+    Отпечаток данных, отправляемых в ERP. Ключи сортируются, Decimal и прочие типы приводятся к строке.
+    """
+    content = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def build_item_dag(item) -> Tuple[Dict[int, Any], Dict[int, List[Any]]]:
+    """
+    Собирает состав изделия одним запросом на уровень вложенности: {id: Item} и {id: [ItemChild]}.
+
+    Общий дочерний элемент попадает в граф один раз, а ItemChild ссылаются на те же экземпляры Item,
+    чтобы erp_id, полученный при синхронизации элемента, был виден всем его родителям.
+    """
+    from ops.models import ItemChild
+
+    items = {item.id: item}
+    links = {}
+    frontier = [item.id]
+
+    while frontier:
+        for item_id in frontier:
+            links[item_id] = []
+
+        children = ItemChild.objects.filter(parent_id__in=frontier).select_related(
+            'child__type', 'child__material',
+        ).order_by('parent_id', 'position')
+
+        frontier = []
+        for link in children:
+            if link.child_id not in items:
+                items[link.child_id] = link.child
+                frontier.append(link.child_id)
+
+            link.child = items[link.child_id]
+            links[link.parent_id].append(link)
+
+    return items, links
+
+
+def _close_connections(func: Callable[[Hashable], None]) -> Callable[[Hashable], None]:
+    """
+    Соединения с БД в Django привязаны к потоку, поэтому поток пула закрывает свои соединения после узла.
+    """
+    def wrapper(node):
+        try:
+            return func(node)
+        finally:
+            connections.close_all()
+
+    return wrapper
+
+
+def run_bottom_up(graph: Dict[Hashable, Iterable[Hashable]], func: Callable[[Hashable], None], workers: int = 1) -> None:
+    """
+    Вызывает func(node) для каждого узла graph ({узел: дочерние узлы}) после того, как func выполнена
+    для всех его дочерних узлов. Узлы, готовые одновременно, обрабатываются в workers потоках.
+
+    При workers <= 1 узлы обрабатываются по очереди в текущем потоке (и в текущей транзакции).
+    Первая ошибка останавливает обход: новые узлы не запускаются, исключение пробрасывается.
+    """
+    children = {node: set(graph.get(node, ())) for node in graph}
+    for node_children in list(children.values()):
+        for child in node_children:
+            children.setdefault(child, set())
+
+    parents = {node: [] for node in children}
+    for node, node_children in children.items():
+        for child in node_children:
+            parents[child].append(node)
+
+    pending = {node: len(node_children) for node, node_children in children.items()}
+    ready = [node for node, count in pending.items() if count == 0]
+    processed = 0
+
+    def complete(node):
+        for parent in parents[node]:
+            pending[parent] -= 1
+            if pending[parent] == 0:
+                yield parent
+
+    if workers <= 1:
+        while ready:
+            node = ready.pop()
+            func(node)
+            processed += 1
+            ready.extend(complete(node))
+    else:
+        func = _close_connections(func)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(func, node): node for node in ready}
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    node = futures.pop(future)
+
+                    if future.exception() is not None:
+                        for other in futures:
+                            other.cancel()
+                        raise future.exception()
+
+                    processed += 1
+                    for parent in complete(node):
+                        futures[executor.submit(func, parent)] = parent
+
+    if processed < len(children):
+        raise ERPSyncCycleError('Состав содержит циклическую ссылку')
+
+
+class ERPPayloadBuilder:
+    """
+    Собирает данные изделий для отправки в ERP без запросов на каждый параметр.
+
+    При создании одним запросом загружаются атрибуты всех исполнений синхронизируемых изделий,
+    а записи встроенных справочников и кастомных справочников (Directory) со значениями полей загружаются
+    пачкой на справочник. Параметры каждого изделия собираются из памяти.
+    """
+
+    def __init__(self, items: Iterable[Any]):
+        from ops.models import Attribute
+
+        items = list(items)
+
+        self.attributes = defaultdict(list)
+        variant_ids = {item.variant_id for item in items if item.variant_id}
+        for attribute in Attribute.objects.filter(variant_id__in=variant_ids).select_related('variant'):
+            self.attributes[(attribute.variant_id, attribute.variant.detail_type_id, attribute.name)].append(attribute)
+
+        references = defaultdict(set)
+        for item in items:
+            for key, value in (item.parameters or {}).items():
+                attributes = self.attributes.get((item.variant_id, item.type_id, key), [])
+
+                if len(attributes) == 1 and attributes[0].type == AttributeType.CATALOG and value is not None:
+                    try:
+                        references[attributes[0].catalog].add(int(value))
+                    except (TypeError, ValueError):
+                        continue
+
+        self.catalog_rows = {
+            catalog: self.load_catalog_rows(catalog, ids) for catalog, ids in references.items()
+        }
+
+    @staticmethod
+    def load_catalog_rows(catalog: str, ids: Set[int]) -> Dict[int, Tuple[str, Dict[str, Any]]]:
+        """
+        Возвращает {pk: (строковое представление, поля записи)} для записей справочника.
+        """
+        from catalog.models import DirectoryEntry, DirectoryEntryValue
+        from ops.models import Attribute
+
+        rows = {}
+
+        if catalog in AttributeCatalog.values:
+            catalog_model = import_string(f'catalog.models.{catalog}')
+            serializer_class = import_string(Attribute.CATALOG_SERIALIZERS[catalog])
+
+            for pk, instance in catalog_model.objects.select_related().in_bulk(ids).items():
+                rows[pk] = (str(instance), serializer_class(instance).data)
+
+            return rows
+
+        try:
+            directory_id = int(catalog)
+        except (TypeError, ValueError):
+            return rows
+
+        entries = DirectoryEntry.objects.filter(id__in=ids, directory_id=directory_id).prefetch_related(
+            Prefetch('values', queryset=DirectoryEntryValue.objects.select_related('directory_field')),
+        )
+        for entry in entries:
+            fields = {'id': entry.id, 'display_name': entry.display_name,
+                      'display_name_errors': entry.display_name_errors}
+            for value_obj in entry.values.all():
+                fields[value_obj.directory_field.name] = value_obj.value
+
+            rows[entry.id] = (entry.display_name, fields)
+
+        return rows
+
+    def get_attribute(self, item, key: str):
+        attributes = self.attributes.get((item.variant_id, item.type_id, key), [])
+
+        if not attributes:
+            raise Exception(f"Не найден атрибут с наименованием {key}")
+        if len(attributes) > 1:
+            raise Exception(f"Существует дубликаты атрибута с наименованием {key}")
+
+        return attributes[0]
+
+    def get_catalog_row(self, attribute, value) -> Tuple[str, Dict[str, Any]]:
+        rows = self.catalog_rows.get(attribute.catalog, {})
+
+        try:
+            return rows[int(value)]
+        except (KeyError, TypeError, ValueError):
+            raise Exception(f"Объект справочника {attribute.catalog} с идентификатором {value} не существует")
+
+    def get_params(self, item) -> Dict[str, Any]:
+        params = {}
+
+        if item.material_id:  # материал
+            params["materialname"] = item.material.name
+            params["materialgroup"] = item.material.group
+
+        for key, value in (item.parameters or {}).items():
+            attribute = self.get_attribute(item, key)
+            erp_name = attribute.erp_name
+
+            if attribute.type == AttributeType.CATALOG and value is not None:
+                instance_str, fields = self.get_catalog_row(attribute, value)
+
+                if erp_name:
+                    if key in erp_name:
+                        params[erp_name[key]] = instance_str
+
+                    for field, field_value in fields.items():
+                        name = f'{key}_{field}'
+                        if name in erp_name:
+                            params[erp_name[name]] = field_value
+                else:
+                    params[key] = instance_str
+            else:
+                name = key
+                if erp_name and name in erp_name:
+                    name = erp_name[name]
+
+                params[name] = value
+
+        return params
+
+    def get_product(self, item) -> Dict[str, Any]:
+        return {
+            'idwicad': item.inner_id,
+            'modelslug': item.type.erp_modelslug,
+            'art': item.marking,
+            'name': item.name,
+            'weight': item.weight,
+            'params': self.get_params(item),
+        }
+
+
+class ERPSyncLogBuffer:
+    """
+    Буфер лога ERP синхронизации: записи копятся в памяти и сохраняются bulk_create при заполнении буфера
+    (max_size), не реже flush_interval секунд и при завершении синхронизации.
+
+    Записи с полными данными запросов (payload=True) при подробности ниже FULL не сохраняются,
+    а держатся в памяти (последние payload_history) и записываются только вместе с ошибкой.
+    """
+
+    def __init__(
+            self, erp_sync, verbosity: int = ERPSyncLogVerbosity.NORMAL, max_size: int = 500,
+            flush_interval: float = 5, payload_history: int = 50,
+    ):
+        self.erp_sync = erp_sync
+        self.verbosity = verbosity
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.entries = []
+        self.payloads = deque(maxlen=payload_history)
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+
+    def make_entry(self, log_type, request, response):
+        from ops.models import ERPSyncLog
+
+        return ERPSyncLog(
+            erp_sync=self.erp_sync, log_type=log_type, request=request, response=response, created_at=timezone.now(),
+        )
+
+    def add(self, log_type, request=None, response=None, payload: bool = False) -> None:
+        entry = self.make_entry(log_type, request, response)
+        is_error = log_type == ERPSyncLogType.EXCEPTION
+
+        with self.lock:
+            if is_error:
+                # данные последних запросов нужны для разбора ошибки
+                self.entries.extend(self.payloads)
+                self.payloads.clear()
+                self.entries.append(entry)
+            elif payload and self.verbosity < ERPSyncLogVerbosity.FULL:
+                self.payloads.append(entry)
+                return
+            elif self.verbosity >= ERPSyncLogVerbosity.NORMAL:
+                self.entries.append(entry)
+            else:
+                return
+
+            should_flush = (
+                is_error
+                or len(self.entries) >= self.max_size
+                or time.monotonic() - self.last_flush >= self.flush_interval
+            )
+
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        from ops.models import ERPSyncLog
+
+        with self.lock:
+            entries, self.entries = self.entries, []
+            self.last_flush = time.monotonic()
+
+        if entries:
+            ERPSyncLog.objects.bulk_create(entries, batch_size=self.max_size)
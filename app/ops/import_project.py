@@ -1,185 +1,148 @@
 import logging
 
+from django.db import transaction
 from openpyxl.reader.excel import load_workbook
+from openpyxl.utils import column_index_from_string
 
 from catalog.models import PipeDiameter, Material
+from ops.cache import VariantMetadataCache, invalidate_spring_block_index
 from ops.choices import EstimatedState
-from ops.models import DetailType, Variant, Item, ProjectItem, TemporaryComposition
+from ops.models import DetailType, Variant, Item, ItemParameterValue, ProjectItem, TemporaryComposition
 
 logger = logging.getLogger(__file__)
 
 
-def process_opory_sheet(project, sheet):
+# Колонки листов "Опоры" и "Подвесы", общие для обоих листов
+ITEM_COLUMNS = {
+    'position_number': 'A',
+    'item_name': 'B',
+    'question_list': 'C',
+    'tag_id': 'D',
+    'nominal_diameter': 'E',
+    'pipe_diameter': 'F',  # Не используется
+    'max_temperature': 'G',
+    'min_temperature': 'H',
+    'ambient_temperature': 'I',
+    'insulation_thickness': 'J',
+    'estimated_state': 'K',
+    'load_z': 'L',
+    'load_x': 'M',
+    'load_y': 'N',
+    'move_z': 'O',
+    'max_move_z': 'P',
+    'move_x': 'Q',
+    'move_y': 'R',
+    'test_load': 'S',
+    'count': 'T',
+    'hot_load': 'U',
+    'cold_load': 'V',
+    'load_change': 'W',
+    'load_adjustment': 'X',
+    'spring_travel_up': 'Y',
+    'spring_travel_down': 'Z',
+    'regulation_range_plus': 'AA',
+    'regulation_range_minus': 'AB',
+    'chain_weight': 'AC',
+    'detail_type': 'AF',
+    'category': 'AG',
+    'spring_stiffness': 'AI',
+}
+
+OPORY_PARAMETER_COLUMNS = {
+    'Hs': 'AJ', 'E': 'AK', 'H': 'AL', 'H1': 'AM', 'm': 'AN', 't': 'AO', 'k': 'AP', 's': 'AQ', 'p': 'AR', 'd': 'AS',
+}
+OPORY_COMMENT_COLUMN = 'AT'
+
+PODVESY_PARAMETER_COLUMNS = {
+    'Hs': 'AJ', 'E': 'AK', 'm': 'AL',
+}
+PODVESY_COMMENT_COLUMN = 'AM'
+
+SPECIFICATION_COLUMNS = {
+    'tag_number': 'B',
+    'position': 'C',
+    'name': 'D',
+    'lgv': 'E',
+    'clamp_diameter': 'F',
+    'material': 'G',
+    'count': 'H',
+    'weight': 'I',
+    'total_weight': 'J',
+}
+
+# Лист спецификации заканчивается после стольких пустых строк подряд
+SPECIFICATION_EMPTY_ROWS_LIMIT = 10
+
+
+def cell_value(row, column):
+    """
+    Значение ячейки строки, прочитанной через iter_rows(values_only=True), по букве колонки.
+    """
+    index = column_index_from_string(column) - 1
+    return row[index] if index < len(row) else None
+
+
+def read_item_row(row, item_type, parameter_columns, comment_column):
+    project_item_data = {'type': item_type}
+    project_item_data.update({key: cell_value(row, column) for key, column in ITEM_COLUMNS.items()})
+    project_item_data['parameters'] = {key: cell_value(row, column) for key, column in parameter_columns.items()}
+    project_item_data['comment'] = cell_value(row, comment_column)
+
+    return project_item_data
+
+
+def process_items_sheet(sheet, item_type, parameter_columns, comment_column):
     project_items = []
-    row = 4
-
-    while sheet[f'A{row}'].value:
-        project_item_data = {
-            'type': 'opory',
-            'position_number': sheet[f'A{row}'].value,
-            "item_name": sheet[f"B{row}"].value,
-            "question_list": sheet[f"C{row}"].value,
-            "tag_id": sheet[f"D{row}"].value,
-            'nominal_diameter': sheet[f'E{row}'].value,
-            'pipe_diameter': sheet[f'F{row}'].value,  # Не используется
-            'max_temperature': sheet[f'G{row}'].value,
-            'min_temperature': sheet[f'H{row}'].value,
-            'ambient_temperature': sheet[f'I{row}'].value,
-            'insulation_thickness': sheet[f'J{row}'].value,
-            'estimated_state': sheet[f'K{row}'].value,
-            'load_z': sheet[f'L{row}'].value,
-            'load_x': sheet[f'M{row}'].value,
-            'load_y': sheet[f'N{row}'].value,
-            'move_z': sheet[f'O{row}'].value,
-            'max_move_z': sheet[f'P{row}'].value,
-            'move_x': sheet[f'Q{row}'].value,
-            'move_y': sheet[f'R{row}'].value,
-            'test_load': sheet[f'S{row}'].value,
-            'count': sheet[f'T{row}'].value,
-            'hot_load': sheet[f'U{row}'].value,
-            'cold_load': sheet[f'V{row}'].value,
-            'load_change': sheet[f'W{row}'].value,
-            'load_adjustment': sheet[f'X{row}'].value,
-            'spring_travel_up': sheet[f'Y{row}'].value,
-            'spring_travel_down': sheet[f'Z{row}'].value,
-            'regulation_range_plus': sheet[f'AA{row}'].value,
-            'regulation_range_minus': sheet[f'AB{row}'].value,
-            'chain_weight': sheet[f'AC{row}'].value,
-            'detail_type': sheet[f'AF{row}'].value,
-            'category': sheet[f'AG{row}'].value,
-            'spring_stiffness': sheet[f'AI{row}'].value,
-            'parameters': {
-                'Hs': sheet[f'AJ{row}'].value,
-                'E': sheet[f'AK{row}'].value,
-                'H': sheet[f'AL{row}'].value,
-                'H1': sheet[f'AM{row}'].value,
-                'm': sheet[f'AN{row}'].value,
-                't': sheet[f'AO{row}'].value,
-                'k': sheet[f'AP{row}'].value,
-                's': sheet[f'AQ{row}'].value,
-                'p': sheet[f'AR{row}'].value,
-                'd': sheet[f'AS{row}'].value,
-            },
-            'comment': sheet[f'AT{row}'].value,
-        }
-        project_items.append(project_item_data)
-        row += 1
 
-    return project_items
+    for row in sheet.iter_rows(min_row=4, values_only=True):
+        if not cell_value(row, 'A'):
+            break
 
+        project_items.append(read_item_row(row, item_type, parameter_columns, comment_column))
 
-def process_opory_specifications_sheet(sheet, project_items):
-    row = 2
+    return project_items
 
-    while True:
-        # Если 10 строк подряд пустые, завершаем
-        if all(not sheet[f'A{row + i}'].value for i in range(10)):
-            break
 
-        position = sheet[f'A{row}'].value
-        matching_item = next((item for item in project_items if item['position_number'] == position and item['type'] == 'opory'), None)
+def process_specifications_sheet(sheet, project_items, item_type):
+    items_by_position = {}
+    for item in project_items:
+        if item['type'] == item_type:
+            items_by_position.setdefault(item['position_number'], item)
 
-        if matching_item:
-            specification = {
-                'tag_number': sheet[f'B{row}'].value,
-                'position': sheet[f'C{row}'].value,
-                'name': sheet[f'D{row}'].value,
-                'lgv': sheet[f'E{row}'].value,
-                'clamp_diameter': sheet[f'F{row}'].value,
-                'material': sheet[f'G{row}'].value,
-                'count': sheet[f'H{row}'].value,
-                'weight': sheet[f'I{row}'].value,
-                'total_weight': sheet[f'J{row}'].value,
-            }
+    empty_rows = 0
 
-            if 'specifications' not in matching_item:
-                matching_item['specifications'] = []
-            matching_item['specifications'].append(specification)
+    for row in sheet.iter_rows(min_row=2, values_only=True):
+        position = cell_value(row, 'A')
 
-        row += 1
+        if not position:
+            # Если 10 строк подряд пустые, завершаем
+            empty_rows += 1
+            if empty_rows >= SPECIFICATION_EMPTY_ROWS_LIMIT:
+                break
+            continue
 
+        empty_rows = 0
+        matching_item = items_by_position.get(position)
 
-def process_podvesy_sheet(project, sheet):
-    project_items = []
-    row = 4
-
-    while sheet[f'A{row}'].value:
-        project_item_data = {
-            'type': 'podvesy',
-            'position_number': sheet[f'A{row}'].value,
-            "item_name": sheet[f"B{row}"].value,
-            "question_list": sheet[f"C{row}"].value,
-            "tag_id": sheet[f"D{row}"].value,
-            'nominal_diameter': sheet[f'E{row}'].value,
-            'pipe_diameter': sheet[f'F{row}'].value,  # Не используется
-            'max_temperature': sheet[f'G{row}'].value,
-            'min_temperature': sheet[f'H{row}'].value,
-            'ambient_temperature': sheet[f'I{row}'].value,
-            'insulation_thickness': sheet[f'J{row}'].value,
-            'estimated_state': sheet[f'K{row}'].value,
-            'load_z': sheet[f'L{row}'].value,
-            'load_x': sheet[f'M{row}'].value,
-            'load_y': sheet[f'N{row}'].value,
-            'move_z': sheet[f'O{row}'].value,
-            'max_move_z': sheet[f'P{row}'].value,
-            'move_x': sheet[f'Q{row}'].value,
-            'move_y': sheet[f'R{row}'].value,
-            'test_load': sheet[f'S{row}'].value,
-            'count': sheet[f'T{row}'].value,
-            'hot_load': sheet[f'U{row}'].value,
-            'cold_load': sheet[f'V{row}'].value,
-            'load_change': sheet[f'W{row}'].value,
-            'load_adjustment': sheet[f'X{row}'].value,
-            'spring_travel_up': sheet[f'Y{row}'].value,
-            'spring_travel_down': sheet[f'Z{row}'].value,
-            'regulation_range_plus': sheet[f'AA{row}'].value,
-            'regulation_range_minus': sheet[f'AB{row}'].value,
-            'chain_weight': sheet[f'AC{row}'].value,
-            'detail_type': sheet[f'AF{row}'].value,
-            'category': sheet[f'AG{row}'].value,
-            'spring_stiffness': sheet[f'AI{row}'].value,
-            'parameters': {
-                'Hs': sheet[f'AJ{row}'].value,
-                'E': sheet[f'AK{row}'].value,
-                'm': sheet[f'AL{row}'].value,
-            },
-            'comment': sheet[f'AM{row}'].value,
-        }
-        project_items.append(project_item_data)
-        row += 1
+        if matching_item:
+            specification = {key: cell_value(row, column) for key, column in SPECIFICATION_COLUMNS.items()}
+            matching_item.setdefault('specifications', []).append(specification)
 
-    return project_items
 
+def process_opory_sheet(project, sheet):
+    return process_items_sheet(sheet, 'opory', OPORY_PARAMETER_COLUMNS, OPORY_COMMENT_COLUMN)
 
-def process_podvesy_specifications_sheet(sheet, project_items):
-    row = 2
 
-    while True:
-        # Если 10 строк подряд пустые, завершаем
-        if all(not sheet[f'A{row + i}'].value for i in range(10)):
-            break
+def process_opory_specifications_sheet(sheet, project_items):
+    process_specifications_sheet(sheet, project_items, 'opory')
 
-        position = sheet[f'A{row}'].value
-        matching_item = next((item for item in project_items if item['position_number'] == position and item['type'] == 'podvesy'), None)
 
-        if matching_item:
-            specification = {
-                'tag_number': sheet[f'B{row}'].value,
-                'position': sheet[f'C{row}'].value,
-                'name': sheet[f'D{row}'].value,
-                'lgv': sheet[f'E{row}'].value,
-                'clamp_diameter': sheet[f'F{row}'].value,
-                'material': sheet[f'G{row}'].value,
-                'count': sheet[f'H{row}'].value,
-                'weight': sheet[f'I{row}'].value,
-                'total_weight': sheet[f'J{row}'].value,
-            }
+def process_podvesy_sheet(project, sheet):
+    return process_items_sheet(sheet, 'podvesy', PODVESY_PARAMETER_COLUMNS, PODVESY_COMMENT_COLUMN)
 
-            if 'specifications' not in matching_item:
-                matching_item['specifications'] = []
-            matching_item['specifications'].append(specification)
 
-        row += 1
+def process_podvesy_specifications_sheet(sheet, project_items):
+    process_specifications_sheet(sheet, project_items, 'podvesy')
 
 
 def get_load_adjustment(item_data):
@@ -224,66 +187,260 @@ def check_defis(value):
     return value
 
 
-def import_project_from_file(project, import_file, user):
-    try:
-        workbook = load_workbook(filename=import_file, data_only=True)
-    except Exception as exc:
-        logger.exception('Exception raised when import project with wrong xlsx file.')
-        raise Exception('Ошибка чтения файла: убедитесь, что это корректный xlsx-файл.')
+def get_additional_params(item_data):
+    """
+    Раскладывает нагрузки и перемещения со знаком по полям plus/minus.
+    """
+    additional_params = {}
 
-    project_items = []
+    for key in ('load_z', 'load_x', 'load_y', 'move_z', 'move_x', 'move_y'):
+        value = item_data[key]
 
-    for sheet in workbook.worksheets:
-        if sheet.title == 'Опоры':
-            project_items.extend(process_opory_sheet(project, sheet))
-        elif sheet.title == 'Опоры - спецификация':
-            process_opory_specifications_sheet(sheet, project_items)
-        elif sheet.title == 'Подвесы':
-            project_items.extend(process_podvesy_sheet(project, sheet))
-        elif sheet.title == 'Подвесы - спецификация':
-            process_podvesy_specifications_sheet(sheet, project_items)
+        if not value:
+            continue
 
-    for item_data in project_items:
-        try:
-            detail_type = DetailType.objects.get(designation=item_data['detail_type'], category=get_category(item_data))
-        except DetailType.DoesNotExist as exc:
+        kind, axis = key.split('_')
+
+        if value >= 0:
+            additional_params[f'{kind}_plus_{axis}'] = value
+        else:
+            additional_params[f'{kind}_minus_{axis}'] = abs(value)
+
+    return additional_params
+
+
+def get_specification_designation(child_item_data):
+    return child_item_data['name'].split(' ')[0]
+
+
+def get_specification_material_name(child_item_data):
+    material_name = child_item_data['material']
+
+    if material_name and material_name != '-':
+        return material_name
+
+    return None
+
+
+class ImportLookups:
+    """
+    Справочники импорта, загруженные одним проходом по всем строкам файла:
+    типы деталей, первые исполнения, материалы и номинальные диаметры.
+    """
+
+    def __init__(self, project_items):
+        categories = {get_category(item_data) for item_data in project_items}
+        designations = {item_data['detail_type'] for item_data in project_items}
+        specifications = [
+            child_item_data for item_data in project_items for child_item_data in item_data.get('specifications', [])
+        ]
+        child_designations = {get_specification_designation(child) for child in specifications}
+        material_names = {get_specification_material_name(child) for child in specifications} - {None}
+        dns = {item_data['nominal_diameter'] for item_data in project_items}
+
+        self.detail_types = {}
+        for detail_type in DetailType.objects.filter(designation__in=designations, category__in=categories):
+            self.detail_types[(detail_type.designation, detail_type.category)] = detail_type
+
+        # Первое исполнение в порядке Variant.Meta.ordering, как Variant.objects.filter(...).first()
+        self.variants = {}
+        for variant in Variant.objects.filter(detail_type__in=self.detail_types.values()).order_by('detail_type', 'name'):
+            self.variants.setdefault(variant.detail_type_id, variant)
+
+        self.child_types = {}
+        child_types = DetailType.objects.filter(
+            designation__in=child_designations, category__in=[DetailType.ASSEMBLY_UNIT, DetailType.DETAIL],
+        ).order_by('pk')
+        for detail_type in child_types:
+            self.child_types.setdefault(detail_type.designation, detail_type)
+
+        self.materials = {}
+        for material in Material.objects.filter(name_ru__in=material_names).order_by('pk'):
+            self.materials.setdefault(material.name_ru, material)
+
+        self.pipe_diameters = {}
+        pipe_diameters = PipeDiameter.objects.filter(
+            dn__dn__in=dns, standard=PipeDiameter.Standard.RF,
+        ).select_related('dn')
+        for pipe_diameter in pipe_diameters:
+            self.pipe_diameters.setdefault(pipe_diameter.dn.dn, []).append(pipe_diameter)
+
+    def get_detail_type(self, item_data):
+        key = (item_data['detail_type'], get_category(item_data))
+
+        if key not in self.detail_types:
             raise Exception('Нет тип детали с обозначением {detail_type} и категорией {category}'.format(
-                detail_type=item_data['detail_type'],
-                category=get_category(item_data),
+                detail_type=key[0],
+                category=key[1],
             ))
 
-        variant = Variant.objects.filter(detail_type=detail_type).first()
+        return self.detail_types[key]
 
-        item = Item.objects.create(
-            type=detail_type,
-            variant=variant,
-            parameters=item_data['parameters'],
-            author=user,
-        )
+    def get_child_type(self, child_item_data):
+        designation = get_specification_designation(child_item_data)
 
-        item_weight = 0
+        if designation not in self.child_types:
+            raise Exception(f'DetailType с {designation} не найден в базе.')
 
-        for child_item_data in item_data['specifications']:
-            name = child_item_data['name']
-            designation = name.split(' ')[0]
+        return self.child_types[designation]
 
-            tmp_child = DetailType.objects.filter(designation=designation, category__in=[DetailType.ASSEMBLY_UNIT, DetailType.DETAIL]).first()
+    def get_material(self, child_item_data):
+        material_name = get_specification_material_name(child_item_data)
 
-            if not tmp_child:
-                raise Exception(f'DetailType с {designation} не найден в базе.')
+        if material_name is None:
+            return None
 
+        if material_name not in self.materials:
+            raise Exception(f'Материал с наименованием "{material_name}" не найден.')
 
-            material_name = child_item_data['material']
+        return self.materials[material_name]
 
-            if material_name and material_name != '-':
-                material = Material.objects.filter(name_ru=material_name).first()
+    def get_pipe_diameter(self, item_data):
+        pipe_diameters = self.pipe_diameters.get(item_data['nominal_diameter'], [])
 
-                if not material:
-                    raise Exception(f'Материал с наименованием "{material_name}" не найден.')
-            else:
-                material = None
+        if not pipe_diameters:
+            raise PipeDiameter.DoesNotExist(
+                f'Номинальный диаметр трубы DN{item_data["nominal_diameter"]} не найден.'
+            )
+        if len(pipe_diameters) > 1:
+            raise PipeDiameter.MultipleObjectsReturned(
+                f'Найдено несколько номинальных диаметров трубы DN{item_data["nominal_diameter"]}.'
+            )
+
+        return pipe_diameters[0]
+
+
+def get_shifted_positions(existing, positions):
+    """
+    Повторяет ProjectItem.save для импортируемых элементов, сохраняемых по одному в порядке файла:
+    элемент без позиции встает после последнего, а элемент с позицией сдвигает на 1 все элементы
+    (и существующие, и импортированные раньше) с позицией не меньше своей.
+
+    existing - {pk: позиция} существующих элементов проекта. Возвращает ({pk: новая позиция} для сдвинутых
+    существующих элементов, итоговые позиции импортируемых элементов в порядке positions).
+    """
+    current = dict(existing)
+    imported = []
+
+    for position in positions:
+        if position is None:
+            occupied = [value for value in list(current.values()) + imported if value is not None]
+            position = max(occupied, default=0) + 1
+        else:
+            for pk, value in current.items():
+                if value is not None and value >= position:
+                    current[pk] = value + 1
+
+            imported = [value + 1 if value is not None and value >= position else value for value in imported]
+
+        imported.append(position)
+
+    shifted = {pk: value for pk, value in current.items() if value != existing[pk]}
+
+    return shifted, imported
+
+
+def shift_project_positions(project, positions):
+    """
+    Освобождает позиции под импортируемые элементы так же, как ProjectItem.save для каждого нового элемента
+    (см. get_shifted_positions), и возвращает итоговые позиции импортируемых элементов.
+    Сдвинутые элементы проекта сохраняются одним bulk_update.
+    """
+    project_items = list(ProjectItem.objects.filter(project=project).only('id', 'position_number'))
+
+    shifted, imported = get_shifted_positions(
+        {project_item.pk: project_item.position_number for project_item in project_items},
+        positions,
+    )
+
+    to_update = []
+    for project_item in project_items:
+        if project_item.pk in shifted:
+            project_item.position_number = shifted[project_item.pk]
+            to_update.append(project_item)
+
+    if to_update:
+        ProjectItem.objects.bulk_update(to_update, ['position_number'], batch_size=500)
+
+    return imported
+
+
+def save_imported_items(items, compositions):
+    """
+    Сохраняет изделия/детали импорта и их временные составы пачками.
+
+    Параметры, маркировка и наименование вычисляются один раз до bulk_create. Повторный расчет после создания
+    временных составов (как при поштучном сохранении) не нужен: в контекст формул входят inner_id, вес,
+    параметры и ItemChild, но не TemporaryComposition, а вес из спецификации задан до расчета.
+    """
+    metadata = VariantMetadataCache()
+    inner_ids = Item.objects.reserve_inner_ids(len(items))
+
+    for item, inner_id in zip(items, inner_ids):
+        item.inner_id = inner_id
+        if not item.comment:
+            item._set_default_comment()
+        item.update_auto_fields(metadata)
+
+    Item.objects.bulk_create(items)
+    ItemParameterValue.objects.sync_items(items)
+    invalidate_spring_block_index()
+
+    # tmp_parent получает pk из сохраненного выше Item при подготовке bulk_create
+    TemporaryComposition.objects.bulk_create(compositions)
 
-            temporary_composition = TemporaryComposition.objects.create(
+
+def import_project_from_file(project, import_file, user):
+    """
+    Импортирует табличную часть проекта из xlsx-файла CRM.
+
+    Файл читается потоково (read_only), все справочники загружаются одним проходом, все строки проверяются
+    до записи, после чего изделия/детали, временные составы и элементы проекта создаются через bulk_create
+    в одной транзакции.
+    """
+    try:
+        workbook = load_workbook(filename=import_file, data_only=True, read_only=True)
+    except Exception as exc:
+        logger.exception('Exception raised when import project with wrong xlsx file.')
+        raise Exception('Ошибка чтения файла: убедитесь, что это корректный xlsx-файл.')
+
+    project_items = []
+
+    try:
+        for sheet in workbook.worksheets:
+            if sheet.title == 'Опоры':
+                project_items.extend(process_opory_sheet(project, sheet))
+            elif sheet.title == 'Опоры - спецификация':
+                process_opory_specifications_sheet(sheet, project_items)
+            elif sheet.title == 'Подвесы':
+                project_items.extend(process_podvesy_sheet(project, sheet))
+            elif sheet.title == 'Подвесы - спецификация':
+                process_podvesy_specifications_sheet(sheet, project_items)
+    finally:
+        workbook.close()
+
+    lookups = ImportLookups(project_items)
+
+    # Проверка и подготовка всех строк без записи в БД
+    items = []
+    compositions = []
+    project_item_rows = []
+
+    for item_data in project_items:
+        detail_type = lookups.get_detail_type(item_data)
+        variant = lookups.variants.get(detail_type.id)
+
+        if variant is None:
+            raise Exception(f'Нет исполнений у типа детали {detail_type.designation}.')
+
+        item = Item(type=detail_type, variant=variant, parameters=item_data['parameters'], author=user)
+        item_weight = 0
+
+        for child_item_data in item_data.get('specifications', []):
+            tmp_child = lookups.get_child_type(child_item_data)
+            material = lookups.get_material(child_item_data)
+
+            compositions.append(TemporaryComposition(
                 tmp_parent=item,
                 tmp_child=tmp_child,
                 position=child_item_data['position'],
@@ -293,79 +450,53 @@ def import_project_from_file(project, import_file, user):
                 name=child_item_data['name'],
                 lgv=child_item_data['lgv'],
                 weight=child_item_data['weight'],
-            )
+            ))
 
             if child_item_data['weight']:
                 item_weight += child_item_data['weight']
 
         item.weight = item_weight
-        item.save()
-
-        nominal_diameter = PipeDiameter.objects.get(dn__dn=item_data['nominal_diameter'], standard=PipeDiameter.Standard.RF)
-
-        additional_params = {}
-
-        if item_data['load_z']:
-            if item_data['load_z'] >= 0:
-                additional_params['load_plus_z'] = item_data['load_z']
-            elif item_data['load_z'] < 0:
-                additional_params['load_minus_z'] = abs(item_data['load_z'])
-
-        if item_data['load_x']:
-            if item_data['load_x'] >= 0:
-                additional_params['load_plus_x'] = item_data['load_x']
-            elif item_data['load_x'] < 0:
-                additional_params['load_minus_x'] = abs(item_data['load_x'])
-
-        if item_data['load_y']:
-            if item_data['load_y'] >= 0:
-                additional_params['load_plus_y'] = item_data['load_y']
-            elif item_data['load_y'] < 0:
-                additional_params['load_minus_y'] = abs(item_data['load_y'])
-
-        if item_data['move_z']:
-            if item_data['move_z'] >= 0:
-                additional_params['move_plus_z'] = item_data['move_z']
-            elif item_data['move_z'] < 0:
-                additional_params['move_minus_z'] = abs(item_data['move_z'])
-
-        if item_data['move_x']:
-            if item_data['move_x'] >= 0:
-                additional_params['move_plus_x'] = item_data['move_x']
-            elif item_data['move_x'] < 0:
-                additional_params['move_minus_x'] = abs(item_data['move_x'])
-
-        if item_data['move_y']:
-            if item_data['move_y'] >= 0:
-                additional_params['move_plus_y'] = item_data['move_y']
-            elif item_data['move_y'] < 0:
-                additional_params['move_minus_y'] = abs(item_data['move_y'])
-
-        project_item = ProjectItem.objects.create(
-            project=project,
-            original_item=item,
-            position_number=item_data['position_number'],
-            question_list=item_data['question_list'],
-            tag_id=item_data['tag_id'],
-            count=item_data['count'],
-            nominal_diameter=nominal_diameter,
-            max_temperature=item_data['max_temperature'],
-            min_temperature=item_data['min_temperature'],
-            ambient_temperature=item_data['ambient_temperature'],
-            insulation_thickness=item_data['insulation_thickness'],
-            estimated_state=get_estimated_state(item_data),
-            max_move_z=item_data['max_move_z'],
-            test_load_z=item_data['test_load'],
-            hot_load=item_data['hot_load'],
-            cold_load=item_data['cold_load'],
-            load_change=item_data['load_change'],
-            load_adjustment=get_load_adjustment(item_data),
-            spring_travel_up=item_data['spring_travel_up'],
-            spring_travel_down=item_data['spring_travel_down'],
-            regulation_range_plus=check_defis(item_data['regulation_range_plus']),
-            regulation_range_minus=check_defis(item_data['regulation_range_minus']),
-            chain_weight=item_data['chain_weight'],
-            spring_stiffness=item_data['spring_stiffness'],
-            comment=item_data['comment'],
-            **additional_params,
-        )
+        items.append(item)
+
+        project_item_rows.append((item, item_data, lookups.get_pipe_diameter(item_data), get_estimated_state(item_data)))
+
+    with transaction.atomic():
+        save_imported_items(items, compositions)
+
+        positions = shift_project_positions(project, [item_data['position_number'] for item_data in project_items])
+
+        new_project_items = []
+
+        for (item, item_data, nominal_diameter, estimated_state), position_number in zip(project_item_rows, positions):
+            project_item = ProjectItem(
+                project=project,
+                original_item=item,
+                position_number=position_number,
+                question_list=item_data['question_list'],
+                tag_id=item_data['tag_id'],
+                count=item_data['count'],
+                nominal_diameter=nominal_diameter,
+                max_temperature=item_data['max_temperature'],
+                min_temperature=item_data['min_temperature'],
+                ambient_temperature=item_data['ambient_temperature'],
+                insulation_thickness=item_data['insulation_thickness'],
+                estimated_state=estimated_state,
+                max_move_z=item_data['max_move_z'],
+                test_load_z=item_data['test_load'],
+                hot_load=item_data['hot_load'],
+                cold_load=item_data['cold_load'],
+                load_change=item_data['load_change'],
+                load_adjustment=get_load_adjustment(item_data),
+                spring_travel_up=item_data['spring_travel_up'],
+                spring_travel_down=item_data['spring_travel_down'],
+                regulation_range_plus=check_defis(item_data['regulation_range_plus']),
+                regulation_range_minus=check_defis(item_data['regulation_range_minus']),
+                chain_weight=item_data['chain_weight'],
+                spring_stiffness=item_data['spring_stiffness'],
+                comment=item_data['comment'],
+                **get_additional_params(item_data),
+            )
+            project_item.generate_technical_requirements()
+            new_project_items.append(project_item)
+
+        ProjectItem.objects.bulk_create(new_project_items)
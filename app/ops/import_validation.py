@@ -0,0 +1,274 @@
+"""
+Быстрая проверка файла импорта без записи в БД (dry run).
+
+Вместо import_data в откатываемой транзакции (сохранение каждой строки, вычисление формул, история
+изменений) строки проверяются в памяти по данным, загруженным ресурсом в before_import:
+- в заголовке файла проверяются обязательные колонки; колонки, которых нет среди атрибутов типа детали,
+  пропускаются, как и при импорте;
+- значения параметров приводятся по правилам Attribute.convert, а ссылки на справочники проверяются
+  по заранее загруженным множествам идентификаторов;
+- строки сопоставляются с существующими изделиями/деталями через is_duplicate, совпадающие между собой
+  новые строки считаются ошибкой.
+
+Ошибки возвращаются в формате format_row_errors: [{'row': номер строки, 'errors': [...]}], ошибки заголовка
+имеют номер строки 0.
+"""
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from django.core.exceptions import ValidationError
+from django.utils.module_loading import import_string
+
+from tablib import Dataset
+
+from catalog.models import Directory, DirectoryEntry
+
+from ops.cache import VariantMetadataCache
+from ops.choices import AttributeCatalog, AttributeType
+from ops.models import Item
+from ops.resources import is_duplicate, normalize_value
+
+
+def is_empty(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and value.strip() == '')
+
+
+class ImportValidator:
+    """
+    Проверяет строки файла импорта для ресурса, у которого уже вызван before_import.
+
+    Один валидатор используется для всех частей файла, чтобы находить совпадающие строки из разных частей.
+    """
+
+    def __init__(self, resource):
+        self.resource = resource
+        self.metadata = VariantMetadataCache()
+        self.compare_fields = ['variant'] + sorted(resource.base_attrs | resource.variant_attrs)
+        self.catalog_ids: Dict[str, Optional[Set[int]]] = {}
+        self.existing_ids: Set[int] = set(resource.items_by_id)
+        self.seen_items: Dict[int, int] = {}
+        self.seen_rows: Dict[Tuple, int] = {}
+
+    def validate_headers(self, headers: List[str]) -> List[Dict[str, Any]]:
+        errors = []
+
+        missing = [column for column in self.resource.get_import_id_fields() if column not in headers]
+        if missing:
+            errors.append(f'Отсутствуют обязательные колонки: {", ".join(missing)}')
+
+        # колонки, которых нет среди атрибутов типа (например, weight), импорт пропускает, поэтому они не ошибка
+
+        return [{'row': 0, 'errors': errors}] if errors else []
+
+    def prefetch_ids(self, dataset) -> None:
+        """
+        Одним запросом находит изделия/детали других типов, указанные в колонке id
+        (get_or_init_instance ищет их через Item.objects.get).
+        """
+        if 'id' not in dataset.headers:
+            return
+
+        ids = set()
+        for value in dataset['id']:
+            try:
+                ids.add(int(value))
+            except (TypeError, ValueError):
+                continue
+
+        ids -= self.existing_ids
+        if ids:
+            self.existing_ids.update(Item.objects.filter(id__in=ids).values_list('id', flat=True))
+
+    def validate(self, dataset, offset: int = 0) -> List[Dict[str, Any]]:
+        # ресурс загружает только изделия/детали, на которые ссылается часть файла
+        self.resource.load_items(dataset)
+        self.existing_ids.update(self.resource.items_by_id)
+        self.prefetch_ids(dataset)
+
+        errors = []
+        for number, row in enumerate(dataset.dict, 1):
+            if all(is_empty(value) for value in row.values()):
+                continue
+
+            row_errors = self.validate_row(row, offset + number)
+            if row_errors:
+                errors.append({'row': offset + number, 'errors': row_errors})
+
+        return errors
+
+    def validate_row(self, row: Dict[str, Any], number: int) -> List[str]:
+        errors = []
+        resource = self.resource
+
+        item = None
+        item_id = row.get('id')
+        if not is_empty(item_id):
+            try:
+                item_id = int(item_id)
+            except (TypeError, ValueError):
+                return [f'Некорректный идентификатор "{item_id}"']
+
+            if item_id in self.existing_ids:
+                item = resource.items_by_id.get(item_id)
+                if item is None:
+                    return []
+
+        variant_value = row.get('variant')
+        variant = None
+        if not is_empty(variant_value):
+            variant = resource.variants_by_name.get(str(variant_value).strip().lower())
+            if variant is None:
+                errors.append(f'Исполнение "{variant_value}" не найдено для типа {resource.detail_type}')
+        elif item is None:
+            errors.append('Для создания объекта необходимо указать "variant".')
+
+        if item is None and variant is not None:
+            item = next((
+                candidate for candidate in resource.items_by_variant.get(variant.name.strip().lower(), [])
+                if is_duplicate(row, candidate, self.compare_fields, resource.materials_by_id,
+                                resource.materials_by_name)
+            ), None)
+
+        if item is not None:
+            first = self.seen_items.setdefault(item.id, number)
+            if first != number:
+                errors.append(f'Строка изменяет тот же объект (id={item.id}), что и строка {first}')
+        elif variant is not None:
+            first = self.seen_rows.setdefault(self.get_row_key(row), number)
+            if first != number:
+                errors.append(f'Строка совпадает со строкой {first}')
+
+        variant = variant or (item.variant if item is not None else None)
+        if variant is not None:
+            errors.extend(self.validate_parameters(row, variant))
+
+        return errors
+
+    def get_row_key(self, row: Dict[str, Any]) -> Tuple:
+        """
+        Ключ строки с той же нормализацией значений, что и в is_duplicate.
+        """
+        key = []
+        for field in self.compare_fields:
+            if field.lower() == 'material':
+                material = self.find_material(row.get(field))
+                key.append(material.id if material else None)
+            else:
+                key.append(normalize_value(row.get(field)))
+        return tuple(key)
+
+    def find_material(self, value: Any):
+        if is_empty(value):
+            return None
+
+        try:
+            return self.resource.materials_by_id.get(int(value))
+        except (TypeError, ValueError):
+            return self.resource.materials_by_name.get(str(value).strip().lower())
+
+    def validate_parameters(self, row: Dict[str, Any], variant) -> List[str]:
+        """
+        Проверяет значения параметров так же, как Item.calculate_attribute проверяет вводимые значения.
+        Вычисляемые атрибуты пропускаются: значения из файла для них все равно пересчитываются.
+        """
+        errors = []
+        attributes = self.metadata.attributes_dict(variant)
+
+        for name in sorted(self.resource.allowed_parameter_fields):
+            if name not in row:
+                continue
+
+            value = row[name]
+
+            if name.lower() == 'material':
+                if not is_empty(value) and self.find_material(value) is None:
+                    errors.append(f'Материал "{value}" не найден.')
+                continue
+
+            attribute = attributes.get(name)
+            if attribute is None or attribute.calculated_value:
+                continue
+
+            if is_empty(value):
+                if attribute.is_required and not attribute.default:
+                    errors.append(f'Параметр {name} является обязательным')
+                continue
+
+            if attribute.choices and str(value) not in [str(choice['value']) for choice in attribute.choices]:
+                errors.append(f'{name}: значение {value} отсутствует в списке значений')
+                continue
+
+            try:
+                self.convert(attribute, value)
+            except ValidationError as exc:
+                errors.extend(f'{field}: {"; ".join(messages)}' for field, messages in exc.message_dict.items())
+
+        return errors
+
+    def convert(self, attribute, value: Any) -> Any:
+        """
+        Attribute.convert, но значения справочников проверяются по загруженным идентификаторам, а не запросом на строку.
+        """
+        if attribute.type != AttributeType.CATALOG:
+            return attribute.convert(value)
+
+        ids = self.get_catalog_ids(attribute.catalog)
+        if ids is None:
+            raise ValidationError({
+                attribute.name: 'Значение должно быть либо допустимым статическим каталогом, либо '
+                                'существующим идентификатором Directory.'
+            })
+
+        try:
+            pk = int(value)
+        except (TypeError, ValueError):
+            pk = None
+
+        if pk not in ids:
+            raise ValidationError({attribute.name: f'Не найден объект справочника {attribute.catalog} '
+                                                   f'с идентификатором {value}'})
+        return pk
+
+    def get_catalog_ids(self, catalog: str) -> Optional[Set[int]]:
+        """
+        Идентификаторы записей справочника (встроенного или Directory), загружаются один раз на справочник.
+        None, если справочник не существует.
+        """
+        if catalog in self.catalog_ids:
+            return self.catalog_ids[catalog]
+
+        ids = None
+        if catalog in AttributeCatalog.values:
+            model = import_string(f'catalog.models.{catalog}')
+            ids = set(model.objects.values_list('pk', flat=True))
+        else:
+            try:
+                directory_id = int(catalog)
+            except (TypeError, ValueError):
+                directory_id = None
+
+            if directory_id is not None and Directory.objects.filter(pk=directory_id).exists():
+                ids = set(DirectoryEntry.objects.filter(directory_id=directory_id).values_list('id', flat=True))
+
+        self.catalog_ids[catalog] = ids
+        return ids
+
+
+def validate_import(resource, chunks) -> List[Dict[str, Any]]:
+    """
+    Проверяет файл, разбитый на части iter_import_chunks. Данные для проверки загружаются один раз
+    через before_import ресурса.
+    """
+    errors = []
+    validator = None
+
+    for offset, headers, rows in chunks:
+        dataset = Dataset(*rows, headers=headers)
+
+        if validator is None:
+            resource.before_import(dataset)
+            validator = ImportValidator(resource)
+            errors.extend(validator.validate_headers(headers))
+
+        errors.extend(validator.validate(dataset, offset))
+
+    return errors
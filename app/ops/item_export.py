@@ -0,0 +1,113 @@
+"""
+Потоковая выгрузка изделий/деталей в CSV/XLSX.
+
+Строки формируются ресурсами из ops.resources, но не собираются в tablib.Dataset: queryset обходится
+через iterator(chunk_size=...), а строки сразу пишутся в CSV или в XLSX в режиме write-only,
+поэтому память не зависит от количества выгружаемых изделий.
+"""
+import csv
+import io
+from typing import Any, Callable, Iterator, List, Optional
+
+from openpyxl import Workbook
+
+from catalog.models import Material
+
+from ops.models import Item
+
+EXPORT_CHUNK_SIZE = 2000
+
+# Выгрузки до этого количества строк отдаются сразу в ответе, без фоновой задачи
+EXPORT_STREAM_LIMIT = 5000
+
+EXPORT_CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+
+def get_export_queryset(category: str, designation: str, is_empty: bool = False):
+    if is_empty:
+        return Item.objects.none()
+
+    return Item.objects.filter(
+        type__category=category, type__designation=designation,
+    ).select_related('variant').order_by('id')
+
+
+def prepare_export_resource(resource_cls):
+    """
+    Создает ресурс и заранее загружает материалы, чтобы dehydrate для material не обращался к БД на каждую строку.
+    """
+    resource = resource_cls()
+    resource.materials_by_id = {material.id: material for material in Material.objects.all()}
+    return resource
+
+
+def iter_export_rows(
+        resource, queryset, chunk_size: int = EXPORT_CHUNK_SIZE,
+        progress: Optional[Callable[[int], None]] = None,
+) -> Iterator[List[Any]]:
+    """
+    Возвращает заголовок и строки выгрузки. progress вызывается после каждых chunk_size строк.
+    """
+    fields = resource.get_export_fields()
+    yield [field.column_name for field in fields]
+
+    processed = 0
+    for item in queryset.iterator(chunk_size=chunk_size):
+        yield [resource.export_field(field, item) for field in fields]
+
+        processed += 1
+        if progress and processed % chunk_size == 0:
+            progress(processed)
+
+    if progress:
+        progress(processed)
+
+
+class Echo:
+    """
+    Псевдо-файл для csv.writer: возвращает записанную строку, а не буферизует ее.
+    """
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows: Iterator[List[Any]]) -> Iterator[str]:
+    writer = csv.writer(Echo())
+
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def write_csv(rows: Iterator[List[Any]], fileobj) -> None:
+    """
+    Пишет строки в бинарный файл в UTF-8.
+    """
+    stream = io.TextIOWrapper(fileobj, encoding='utf-8', newline='', write_through=True)
+    writer = csv.writer(stream)
+
+    for row in rows:
+        writer.writerow(row)
+
+    stream.detach()
+
+
+def write_xlsx(rows: Iterator[List[Any]], fileobj) -> None:
+    """
+    Пишет строки в XLSX в режиме write-only: openpyxl не держит лист в памяти.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+
+    for row in rows:
+        sheet.append(row)
+
+    workbook.save(fileobj)
+
+
+EXPORT_WRITERS = {
+    'csv': write_csv,
+    'xlsx': write_xlsx,
+}
@@ -0,0 +1,211 @@
+"""
+Импорт изделий/деталей из CSV/XLSX частями.
+
+Загруженный файл читается потоково (csv.reader или openpyxl в режиме read-only) и делится на части
+по IMPORT_CHUNK_SIZE строк. Каждая часть импортируется отдельной celery-задачей в своей транзакции,
+а состояние импорта хранится в БД, чтобы его видели все процессы воркеров: результаты частей - в TaskChunk,
+количество частей и строк - в status_details задачи. Последняя завершившаяся часть собирает итог для задачи.
+"""
+import csv
+import datetime
+import io
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Sum
+
+from openpyxl import load_workbook
+
+from taskmanager.models import Task, TaskChunk
+
+IMPORT_CHUNK_SIZE = 1000
+
+# Минимальный интервал между уведомлениями о прогрессе импорта, в секундах
+IMPORT_PROGRESS_INTERVAL = 2
+
+ImportChunk = Tuple[int, List[str], List[List[Any]]]
+
+
+def iter_file_rows(fileobj, file_format: str) -> Iterator[List[Any]]:
+    """
+    Возвращает строки файла по одной, первая строка - заголовок.
+    """
+    if file_format == 'csv':
+        stream = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+        yield from csv.reader(stream)
+        return
+
+    if file_format == 'xlsx':
+        workbook = load_workbook(fileobj, read_only=True, data_only=True)
+        try:
+            for row in workbook.active.iter_rows(values_only=True):
+                yield list(row)
+        finally:
+            workbook.close()
+        return
+
+    raise ValueError(f"Формат '{file_format}' не поддерживается")
+
+
+def to_native(value: Any) -> Any:
+    """
+    Приводит значение ячейки к типу, который можно передать в celery-задачу через json.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, Decimal):
+        return float(value)
+
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+
+    return str(value)
+
+
+def is_empty_row(row: List[Any]) -> bool:
+    return all(value is None or value == '' for value in row)
+
+
+def iter_import_chunks(fileobj, file_format: str, chunk_size: int = IMPORT_CHUNK_SIZE) -> Iterator[ImportChunk]:
+    """
+    Делит файл на части по chunk_size строк. Возвращает (номер первой строки части, заголовок, строки).
+
+    Номер строки считается как в tablib.Dataset, с единицы без учета заголовка, чтобы ошибки частей
+    можно было привести к номерам строк исходного файла. Пустые строки пропускаются.
+    """
+    rows = iter_file_rows(fileobj, file_format)
+    headers = next(rows, None)
+
+    if not headers:
+        return
+
+    headers = ['' if header is None else str(header).strip() for header in headers]
+
+    chunk = []
+    offset = 0
+    for row in rows:
+        if is_empty_row(row):
+            continue
+
+        row = [to_native(value) for value in row[:len(headers)]]
+        row += [None] * (len(headers) - len(row))
+        chunk.append(row)
+
+        if len(chunk) >= chunk_size:
+            yield offset, headers, chunk
+            offset += len(chunk)
+            chunk = []
+
+    if chunk:
+        yield offset, headers, chunk
+
+
+def format_row_errors(result, offset: int = 0) -> List[Dict[str, Any]]:
+    errors = []
+    for row, error in result.row_errors():
+        row_errors = [str(err.error) for err in error]
+        errors.append({
+            'row': row + offset,
+            'errors': row_errors
+        })
+    return errors
+
+
+def _progress_key(task_id: int) -> str:
+    return f"import:{task_id}:progress"
+
+
+def start_import_state(task_id: int) -> None:
+    TaskChunk.objects.filter(task_id=task_id).delete()
+    Task.objects.filter(id=task_id).update(status_details=None)
+
+
+def set_import_totals(task_id: int, chunks: int, total: int) -> None:
+    """
+    Запоминает количество частей и строк после того, как все части отправлены в очередь.
+    """
+    with transaction.atomic():
+        task = Task.objects.select_for_update().only('status_details').get(id=task_id)
+        details = dict(task.status_details or {})
+        details.update({'chunks': chunks, 'total': total})
+        Task.objects.filter(id=task_id).update(status_details=details)
+
+
+def save_chunk_result(task_id: int, number: int, rows: int, result: Dict[str, Any]) -> None:
+    """
+    Сохраняет результат (ошибки) части.
+    """
+    TaskChunk.objects.update_or_create(task_id=task_id, number=number, defaults={'rows': rows, 'result': result})
+
+
+def get_import_progress(task_id: int) -> Dict[str, Optional[int]]:
+    details = Task.objects.values_list('status_details', flat=True).get(id=task_id) or {}
+    processed = TaskChunk.objects.filter(task_id=task_id).aggregate(processed=Sum('rows'))['processed']
+    return {
+        'processed': processed or 0,
+        'total': details.get('total'),
+    }
+
+
+def _is_complete(task_id: int, details: Optional[Dict[str, Any]]) -> bool:
+    chunks = (details or {}).get('chunks')
+    return chunks is not None and TaskChunk.objects.filter(task_id=task_id).count() >= chunks
+
+
+def is_import_complete(task_id: int) -> bool:
+    return _is_complete(task_id, Task.objects.values_list('status_details', flat=True).get(id=task_id))
+
+
+def claim_import_finalization(task_id: int, force: bool = False) -> bool:
+    """
+    Возвращает True ровно одному вызывающему: итог собирает либо последняя часть, либо родительская задача,
+    если все части завершились раньше, чем она записала их количество.
+    force - завершить импорт, не дожидаясь частей (ошибка родительской задачи): части, завершившиеся позже,
+    итог уже не перезапишут.
+    Проверка и отметка выполняются под блокировкой строки задачи.
+    """
+    with transaction.atomic():
+        task = Task.objects.select_for_update().only('status_details').get(id=task_id)
+
+        # список ошибок строк - итог уже записан
+        if not isinstance(task.status_details or {}, dict):
+            return False
+
+        details = dict(task.status_details or {})
+
+        if details.get('finalized') or not (force or _is_complete(task_id, details)):
+            return False
+
+        details['finalized'] = True
+        Task.objects.filter(id=task_id).update(status_details=details)
+
+    return True
+
+
+def should_notify_progress(task_id: int) -> bool:
+    """
+    Ограничивает частоту уведомлений о прогрессе одним за IMPORT_PROGRESS_INTERVAL секунд.
+    """
+    return cache.add(_progress_key(task_id), 1, timeout=IMPORT_PROGRESS_INTERVAL)
+
+
+def collect_import_results(task_id: int) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Собирает ошибки строк и исключения всех частей в порядке частей и удаляет результаты частей.
+    """
+    chunks = TaskChunk.objects.filter(task_id=task_id).order_by('number')
+
+    errors = []
+    exceptions = []
+    for result in chunks.values_list('result', flat=True):
+        result = result or {}
+        errors.extend(result.get('errors', []))
+        if result.get('exception'):
+            exceptions.append(result['exception'])
+
+    chunks.delete()
+    cache.delete(_progress_key(task_id))
+    return errors, exceptions
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from ops.parameter_indexes import get_parameter_index_stats, reconcile_parameter_indexes
+
+
+class Command(BaseCommand):
+    help = "Синхронизация индексов проекции параметров изделий/деталей с атрибутами"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Только показать, какие индексы будут созданы и удалены",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Показать статистику использования индексов",
+        )
+
+    def handle(self, *args, **options):
+        if options.get("stats"):
+            for row in get_parameter_index_stats():
+                self.stdout.write(
+                    f"{row['index']}: scans={row['scans']} tuples_read={row['tuples_read']} "
+                    f"tuples_fetched={row['tuples_fetched']} size={row['size']}"
+                )
+            return
+
+        dry_run = options.get("dry_run")
+        created, dropped = reconcile_parameter_indexes(dry_run=dry_run)
+
+        prefix = "Будет" if dry_run else "Выполнено"
+
+        for index_name in created:
+            self.stdout.write(f"{prefix}: создание {index_name}")
+
+        for index_name in dropped:
+            self.stdout.write(f"{prefix}: удаление {index_name}")
+
+        if not created and not dropped:
+            self.stdout.write("Индексы актуальны")
@@ -1,7 +1,14 @@
-from django.db.models import OuterRef, Q, Exists, QuerySet
+from typing import List, Optional
+
+from django.db import connections, models, transaction
+from django.db.models import OuterRef, Q, Exists, QuerySet, Subquery
 
 from kernel.mixins import SoftDeleteQuerySet, SoftDeleteManager, AllObjectsManager
 
+# Последовательность PostgreSQL для Item.inner_id (см. миграцию 0135_item_inner_id_sequence)
+INNER_ID_SEQUENCE = 'ops_item_inner_id_seq'
+INNER_ID_START = 100000
+
 
 class BaseCompositionQuerySet(SoftDeleteQuerySet):
     def for_variant(self, variant) -> QuerySet:
@@ -93,6 +100,98 @@ class AttributeAllObjectsManager(AttributeManagerMixin, AllObjectsManager):
 
 
 class ItemQuerySet(SoftDeleteQuerySet):
+    PARAMETER_LOOKUPS = ('exact', 'in', 'gt', 'gte', 'lt', 'lte')
+
+    def _parameter_value_q(self, name: str, lookup: str, value) -> Optional[Q]:
+        """
+        Строит условие по таблице ItemParameterValue для одного параметра.
+        Возвращает None, если условие нельзя выразить через типизированную проекцию.
+        """
+        from ops.models import ItemParameterValue
+
+        if lookup not in self.PARAMETER_LOOKUPS or value is None:
+            return None
+
+        if lookup == 'in':
+            numerics, texts = [], []
+
+            for val in value:
+                split = ItemParameterValue.split_value(val)
+                if split is None:
+                    return None
+                numeric, text = split
+                if numeric is not None:
+                    numerics.append(numeric)
+                elif text is not None:
+                    texts.append(text)
+
+            value_q = Q(numeric_value__in=numerics) | Q(text_value__in=texts)
+        else:
+            split = ItemParameterValue.split_value(value)
+            if split is None:
+                return None
+            numeric, text = split
+
+            if numeric is not None:
+                value_q = Q(**{f'numeric_value__{lookup}': numeric})
+            elif lookup == 'exact' and text is not None:
+                value_q = Q(text_value=text)
+            else:
+                return None
+
+        values = ItemParameterValue.objects.filter(value_q, name=name).values('item_id')
+        return Q(id__in=values)
+
+    def filter_parameters(self, *args, **kwargs) -> QuerySet:
+        """
+        Аналог filter(), в котором условия вида parameters__<name>[__<lookup>] выполняются
+        по индексируемой таблице ItemParameterValue вместо JSON-поля.
+
+        Числа и строки с числом сравниваются как числа, поэтому 12 и "12" считаются равными.
+        Условия, которые нельзя выразить через таблицу (вложенные ключи, isnull, has_key, сравнение с None),
+        передаются в filter() без изменений.
+        """
+        conditions = []
+        plain = {}
+
+        for key, value in kwargs.items():
+            parts = key.split('__')
+
+            if parts[0] == 'parameters' and len(parts) in (2, 3):
+                lookup = parts[2] if len(parts) == 3 else 'exact'
+                condition = self._parameter_value_q(parts[1], lookup, value)
+
+                if condition is not None:
+                    conditions.append(condition)
+                    continue
+
+            plain[key] = value
+
+        return self.filter(*args, *conditions, **plain)
+
+    def order_by_parameters(self, *names) -> QuerySet:
+        """
+        Сортирует по числовым значениям параметров из таблицы ItemParameterValue.
+        Имя с префиксом "-" сортирует по убыванию. Объекты без значения параметра идут последними.
+        """
+        from ops.models import ItemParameterValue
+
+        annotations = {}
+        ordering = []
+
+        for name in names:
+            descending = name.startswith('-')
+            name = name.lstrip('-')
+            alias = f'_parameter_{name}'
+
+            annotations[alias] = Subquery(
+                ItemParameterValue.objects.filter(item_id=OuterRef('pk'), name=name).values('numeric_value')[:1]
+            )
+            expression = models.F(alias)
+            ordering.append(expression.desc(nulls_last=True) if descending else expression.asc(nulls_last=True))
+
+        return self.annotate(**annotations).order_by(*ordering, 'id')
+
     def generate_marking(self):
         for item in self:
             item.marking, item.marking_errors = item.generate_marking()
@@ -128,3 +227,57 @@ class ItemManager(SoftDeleteManager):
 
     def update_height(self):
         return self.get_queryset().update_height()
+
+    def filter_parameters(self, *args, **kwargs):
+        return self.get_queryset().filter_parameters(*args, **kwargs)
+
+    def order_by_parameters(self, *names):
+        return self.get_queryset().order_by_parameters(*names)
+
+    def reserve_inner_ids(self, count: int) -> List[int]:
+        """
+        Выделяет count внутренних идентификаторов одним запросом.
+
+        В PostgreSQL номера берутся из последовательности: nextval не ждет завершения чужих транзакций,
+        поэтому части импорта, создающие изделия, не выстраиваются в очередь. Номера отмененных
+        транзакций не переиспользуются. На других СУБД - следующие после максимального, начиная со 100000.
+        """
+        connection = connections[self.db]
+
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT nextval(%s) FROM generate_series(1, %s)', [INNER_ID_SEQUENCE, count],
+                )
+                return [row[0] for row in cursor.fetchall()]
+
+        last_id = self.get_queryset().aggregate(largest=models.Max('inner_id'))['largest']
+        start = INNER_ID_START if last_id is None else last_id + 1
+
+        return list(range(start, start + count))
+
+
+class ItemParameterValueManager(models.Manager):
+    def sync_items(self, items) -> None:
+        """
+        Пересобирает типизированную проекцию параметров для переданных изделий/деталей.
+        """
+        items = [item for item in items if item.pk]
+
+        if not items:
+            return
+
+        rows = []
+        for item in items:
+            for name, value in (item.parameters or {}).items():
+                split = self.model.split_value(value)
+
+                if split is None:
+                    continue
+
+                numeric, text = split
+                rows.append(self.model(item_id=item.pk, name=name, numeric_value=numeric, text_value=text))
+
+        with transaction.atomic():
+            self.filter(item_id__in=[item.pk for item in items]).delete()
+            self.bulk_create(rows, batch_size=1000)
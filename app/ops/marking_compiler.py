@@ -109,8 +109,10 @@ class MarkingCompiler:
     Если `auto_wrap=True`, автоматически добавляет `{{` и `}}` в начале и конце `marking_template`.
     """
 
-    def __init__(self, item, marking_template=None, auto_wrap=False, extra_context=None, children=None):
+    def __init__(self, item, marking_template=None, auto_wrap=False, extra_context=None, children=None,
+                 attributes=None):
         self.item = item
+        self.attributes = attributes
         self.marking_template = marking_template or self.item.variant.marking_template or ""
         self.extra_context = extra_context or {}
         self.children = children
@@ -199,7 +201,9 @@ class MarkingCompiler:
         # TODO: Кэширование (в redis)
         # TODO: Безопасность jinja2
         if self.item.parameters:
-            attributes = self.item.variant.get_attributes_dict(cached=True)
+            attributes = self.attributes
+            if attributes is None:
+                attributes = self.item.variant.get_attributes_dict(cached=True)
 
             params_context = {}
             for key, value in self.item.parameters.items():
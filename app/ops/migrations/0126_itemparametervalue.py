@@ -0,0 +1,90 @@
+# Generated by Django 5.1.4 on 2026-10-19 10:00
+
+from decimal import Decimal
+from math import isfinite
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+TEXT_MAX_LENGTH = 255
+
+
+def split_value(value):
+    # копия ItemParameterValue.split_value на момент миграции
+    if value is None or isinstance(value, (dict, list)):
+        return None
+
+    if isinstance(value, bool):
+        return None, 'true' if value else 'false'
+
+    if isinstance(value, (int, float, Decimal)):
+        numeric = float(value)
+        return (numeric if isfinite(numeric) else None), str(value)
+
+    text = str(value)
+
+    try:
+        numeric = float(text.strip().replace(',', '.'))
+    except ValueError:
+        numeric = None
+    else:
+        if not isfinite(numeric):
+            numeric = None
+
+    if len(text) > TEXT_MAX_LENGTH:
+        text = None
+
+    return numeric, text
+
+
+def populate_item_parameter_values(apps, schema_editor):
+    Item = apps.get_model('ops', 'Item')
+    ItemParameterValue = apps.get_model('ops', 'ItemParameterValue')
+
+    rows = []
+    items = Item.objects.exclude(parameters__isnull=True).values_list('id', 'parameters')
+
+    for item_id, parameters in items.iterator(chunk_size=2000):
+        for name, value in (parameters or {}).items():
+            split = split_value(value)
+
+            if split is None:
+                continue
+
+            numeric, text = split
+            rows.append(ItemParameterValue(item_id=item_id, name=name, numeric_value=numeric, text_value=text))
+
+        if len(rows) >= 5000:
+            ItemParameterValue.objects.bulk_create(rows, batch_size=1000)
+            rows.clear()
+
+    if rows:
+        ItemParameterValue.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ops', '0125_alter_attribute_usage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ItemParameterValue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, verbose_name='Наименование параметра')),
+                ('numeric_value', models.FloatField(blank=True, null=True, verbose_name='Числовое значение')),
+                ('text_value', models.CharField(blank=True, max_length=255, null=True, verbose_name='Текстовое значение')),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='parameter_values', to='ops.item', verbose_name='Изделие/Деталь/Сборочная единица')),
+            ],
+            options={
+                'verbose_name': 'Значение параметра',
+                'verbose_name_plural': 'Значения параметров',
+                'default_permissions': (),
+                'indexes': [models.Index(fields=['name', 'numeric_value', 'item'], name='ops_itemparam_numeric_idx'), models.Index(fields=['name', 'text_value', 'item'], name='ops_itemparam_text_idx')],
+                'constraints': [models.UniqueConstraint(fields=('item', 'name'), name='unique_item_parameter_value')],
+            },
+        ),
+        migrations.RunPython(populate_item_parameter_values, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.1.4 on 2026-10-19 12:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Индексы создаются без блокировки записи в горячие таблицы
+    atomic = False
+
+    dependencies = [
+        ('ops', '0126_itemparametervalue'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='projectitem',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['project', 'position_number'], name='ops_projitem_project_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='projectitem',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['original_item'], name='ops_projitem_item_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='variant',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['detail_type', 'name'], name='ops_variant_type_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='attribute',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['detail_type', 'position'], name='ops_attr_type_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='attribute',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['variant', 'position'], name='ops_attr_variant_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='attribute',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['name'], name='ops_attr_name_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='item',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['type', 'variant'], name='ops_item_type_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='item',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['variant'], name='ops_item_variant_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='item',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['name'], name='ops_item_name_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='itemchild',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['parent', 'position'], name='ops_itemchild_parent_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='itemchild',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['child'], name='ops_itemchild_child_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='basecomposition',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['base_parent', 'position'], name='ops_bc_parent_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='basecomposition',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['base_parent_variant'], name='ops_bc_pvariant_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='basecomposition',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['base_child'], name='ops_bc_child_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='basecomposition',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['base_child_variant'], name='ops_bc_cvariant_alive_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.4 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ops", "0128_soft_delete_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="item",
+            name="erp_fingerprint",
+            field=models.CharField(
+                blank=True, max_length=64, null=True, verbose_name="Отпечаток данных, отправленных в ERP"
+            ),
+        ),
+        migrations.AddField(
+            model_name="item",
+            name="erp_spec_fingerprint",
+            field=models.CharField(
+                blank=True, max_length=64, null=True, verbose_name="Отпечаток спецификации, отправленной в ERP"
+            ),
+        ),
+    ]
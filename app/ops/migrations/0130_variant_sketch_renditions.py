@@ -0,0 +1,20 @@
+# Generated by Django 5.1.4 on 2026-10-19 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ops", "0129_item_erp_fingerprint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="variant",
+            name="sketch_renditions",
+            field=models.JSONField(
+                blank=True, default=dict, editable=False, verbose_name="Подготовленные копии эскизов"
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.4 on 2026-10-19 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ops", "0130_variant_sketch_renditions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectitem",
+            name="sketch_data",
+            field=models.JSONField(blank=True, editable=False, null=True, verbose_name="Данные для эскиза"),
+        ),
+        migrations.AddField(
+            model_name="projectitem",
+            name="sketch_data_fingerprint",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=64,
+                null=True,
+                verbose_name="Отпечаток параметров данных для эскиза",
+            ),
+        ),
+    ]
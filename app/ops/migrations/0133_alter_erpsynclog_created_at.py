@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-19 18:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ops", "0132_attribute_detailtype_modified"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="erpsynclog",
+            name="created_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, editable=False, verbose_name="Дата создания"
+            ),
+        ),
+    ]
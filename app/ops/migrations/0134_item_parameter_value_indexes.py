@@ -0,0 +1,51 @@
+# Generated by Django 5.1.4 on 2026-10-19 20:00
+
+from django.db import migrations
+
+# Индексы по Item.parameters из ранней версии этой миграции: запросы их не используют
+LEGACY_INDEX_PREFIX = 'ops_item_prm_'
+
+
+def create_parameter_indexes(apps, schema_editor):
+    from ops.parameter_indexes import get_drop_index_sql, reconcile_parameter_indexes
+
+    connection = schema_editor.connection
+
+    if connection.vendor != 'postgresql':
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexname FROM pg_indexes WHERE tablename = 'ops_item' AND indexname LIKE %s",
+            [f'{LEGACY_INDEX_PREFIX}%'],
+        )
+        legacy_indexes = [row[0] for row in cursor.fetchall()]
+
+    for index_name in legacy_indexes:
+        schema_editor.execute(get_drop_index_sql(index_name, concurrently=False, connection=connection))
+
+    Attribute = apps.get_model('ops', 'Attribute')
+    reconcile_parameter_indexes(attribute_model=Attribute, connection=connection, concurrently=False)
+
+
+def drop_parameter_indexes(apps, schema_editor):
+    from ops.parameter_indexes import get_drop_index_sql, get_existing_indexes
+
+    connection = schema_editor.connection
+
+    if connection.vendor != 'postgresql':
+        return
+
+    for index_name in get_existing_indexes(connection):
+        schema_editor.execute(get_drop_index_sql(index_name, concurrently=False, connection=connection))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ops', '0133_alter_erpsynclog_created_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_parameter_indexes, drop_parameter_indexes),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.4 on 2026-10-19 20:30
+
+from django.db import migrations
+
+SEQUENCE = 'ops_item_inner_id_seq'
+
+
+def create_inner_id_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(f'CREATE SEQUENCE IF NOT EXISTS {SEQUENCE} AS bigint MINVALUE 100000 START 100000')
+    # следующий номер - после максимального среди всех (в том числе удаленных) изделий/деталей
+    schema_editor.execute(
+        f"SELECT setval('{SEQUENCE}', GREATEST(COALESCE(MAX(inner_id) + 1, 100000), 100000), false) FROM ops_item"
+    )
+
+
+def drop_inner_id_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(f'DROP SEQUENCE IF EXISTS {SEQUENCE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ops', '0134_item_parameter_value_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_inner_id_sequence, drop_inner_id_sequence),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.4 on 2026-10-19 21:40
+
+from django.db import migrations
+
+SEQUENCE = 'ops_spring_block_index_version_seq'
+
+
+def create_version_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(f'CREATE SEQUENCE IF NOT EXISTS {SEQUENCE} AS bigint')
+
+
+def drop_version_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(f'DROP SEQUENCE IF EXISTS {SEQUENCE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ops', '0135_item_inner_id_sequence'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_version_sequence, drop_version_sequence),
+    ]
@@ -4,14 +4,16 @@ import re
 import traceback
 
 from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, date
 from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
 from io import BytesIO
-from typing import Optional, Tuple, Type
+from math import isfinite
+from typing import List, Optional, Tuple, Type
 
 import jinja2.exceptions
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 from constance import config
 
@@ -24,6 +26,7 @@ from django.core.validators import MaxValueValidator, MinValueValidator, RegexVa
 from django.db import models, transaction
 from django.db.models import QuerySet, Q
 
+from django.utils import timezone
 from django.utils.module_loading import import_string
 from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
@@ -34,13 +37,15 @@ from pybarker.django.db.models import ReadableJSONField
 
 from ops.cache import get_cached_attributes, get_cached_attributes_with_topological_sort, get_cached_item_children
 from ops.exceptions import TopologicalSortException
+from ops.sketch.fonts import get_font
+from ops.sketch.renditions import build_rendition, delete_rendition
 
 from catalog.choices import Standard, SeriesNameChoices, ComponentGroupType
 from catalog.models import PipeDiameter, Material, Directory, DirectoryEntry, ProductFamily, ComponentGroup, \
     ProductClass
 
 from kernel.fields import AttributeChoiceField
-from kernel.mixins import SoftDeleteModelMixin
+from kernel.mixins import SoftDeleteModelMixin, soft_delete_index
 from kernel.models import Organization
 
 from ops.choices import (
@@ -49,8 +54,9 @@ from ops.choices import (
 )
 from ops.managers import (
     BaseCompositionSoftDeleteManager, BaseCompositionAllObjectsManager, AttributeSoftDeleteManager,
-    AttributeAllObjectsManager, ItemManager,
+    AttributeAllObjectsManager, ItemManager, ItemParameterValueManager,
 )
+from ops.erp_sync import ERPSyncLogBuffer
 from ops.marking_compiler import MarkingCompiler
 
 logger = logging.getLogger(__name__)
@@ -136,6 +142,11 @@ class ProjectItem(SoftDeleteModelMixin, models.Model):
         verbose_name=_("Семейство изделий"),
     )
     selection_params = models.JSONField(null=True, blank=True, verbose_name=_('Параметры подбора'))
+    # Данные подбора для эскиза, сохраненные при формировании изделия (см. ops.services.sketch_data)
+    sketch_data = models.JSONField(null=True, blank=True, editable=False, verbose_name=_('Данные для эскиза'))
+    sketch_data_fingerprint = models.CharField(
+        max_length=64, null=True, blank=True, editable=False, verbose_name=_('Отпечаток параметров данных для эскиза'),
+    )
 
     # TODO временно сохраним выбранный вариант пружины, так как нет информации по пружинным блокам
     tmp_spring = models.JSONField(verbose_name=_('Выбранная пружина'), blank=True, null=True)
@@ -270,11 +281,19 @@ class ProjectItem(SoftDeleteModelMixin, models.Model):
     full_technical_requirements = models.TextField(blank=True, null=True, verbose_name=_('Полные технические требования'))
 
 
-    historylog = HistoryModelTracker(excluded_fields=('id',), root_model='self', root_id=lambda ins: ins.id)
+    historylog = HistoryModelTracker(
+        excluded_fields=('id', 'sketch_data', 'sketch_data_fingerprint'), root_model='self', root_id=lambda ins: ins.id,
+    )
+
+    soft_delete_unindexed_fields = ('product_family', 'nominal_diameter', 'clamp_material', 'pipe_mount', 'top_mount')
 
     class Meta:
         verbose_name = _("Табличная часть проекта")
         verbose_name_plural = _("Табличная часть проекта")
+        indexes = [
+            soft_delete_index('project', 'position_number', name='ops_projitem_project_alive_idx'),
+            soft_delete_index('original_item', name='ops_projitem_item_alive_idx'),
+        ]
         default_permissions = ()
         permissions = (
             ("view_projectitem", _("Может просматривать табличную часть проекта")),
@@ -434,7 +453,10 @@ class DetailType(SoftDeleteModelMixin, models.Model):
         verbose_name=_('Вид'), null=True, blank=True, choices=BranchQty.choices,
     )
 
-    historylog = HistoryModelTracker(excluded_fields=('id',), root_model='self', root_id=lambda ins: ins.id)
+    # Время последнего изменения, по нему процессы узнают об изменении ресурсов импорта/экспорта
+    modified = models.DateTimeField(auto_now=True, verbose_name=_('Дата изменения'))
+
+    historylog = HistoryModelTracker(excluded_fields=('id', 'modified'), root_model='self', root_id=lambda ins: ins.id)
     default_comment = models.TextField(blank=True, null=True, verbose_name=_('Комментарий по умолчанию'))
     technical_requirements = models.TextField(blank=True, null=True, verbose_name=_('Технические требования'))
 
@@ -666,6 +688,9 @@ class Variant(SoftDeleteModelMixin, models.Model):
     subsketch = models.ImageField(upload_to=upload_sketch_to, null=True, blank=True,
                                   verbose_name=_('Дополнительный эскиз'))
     subsketch_coords = models.JSONField(null=True, blank=True, verbose_name=_('Координаты дополнительного эскиза'))
+    sketch_renditions = models.JSONField(
+        default=dict, blank=True, editable=False, verbose_name=_('Подготовленные копии эскизов'),
+    )
 
     series = models.CharField(
         max_length=SeriesNameChoices.get_max_length(), null=True, blank=True, choices=SeriesNameChoices.choices,
@@ -686,7 +711,11 @@ class Variant(SoftDeleteModelMixin, models.Model):
         verbose_name=_('Формула расчёта монтажной длины пружинного блока в холодном состоянии')
     )
 
-    historylog = HistoryModelTracker(excluded_fields=('id',), root_model='self', root_id=lambda ins: ins.id)
+    historylog = HistoryModelTracker(
+        excluded_fields=('id', 'sketch_renditions'), root_model='self', root_id=lambda ins: ins.id,
+    )
+
+    SKETCH_FIELDS = ('sketch', 'subsketch')
 
     class Meta:
         verbose_name = _("исполнение")
@@ -695,6 +724,9 @@ class Variant(SoftDeleteModelMixin, models.Model):
         constraints = [
             models.UniqueConstraint(fields=["deleted_at", "name", "detail_type"], name="unique_variant")
         ]
+        indexes = [
+            soft_delete_index('detail_type', 'name', name='ops_variant_type_alive_idx'),
+        ]
         default_permissions = ()
         permissions = (
             ("view_variant", _("Может просматривать исполнения")),
@@ -735,6 +767,48 @@ class Variant(SoftDeleteModelMixin, models.Model):
             detail_types=self.detail_type,
         ).exists()
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.update_sketch_renditions()
+
+    def update_sketch_renditions(self) -> None:
+        """
+        Создает уменьшенные копии новых эскизов и удаляет копии замененных (см. ops.sketch.renditions).
+        """
+        renditions = dict(self.sketch_renditions or {})
+
+        for field_name in self.SKETCH_FIELDS:
+            field = getattr(self, field_name)
+            rendition = renditions.get(field_name)
+
+            # копии без хеша созданы до появления векторных эскизов и пересоздаются
+            if rendition and field and rendition.get('source') == field.name and rendition.get('hash'):
+                continue
+
+            if rendition:
+                delete_rendition(renditions.pop(field_name), field.storage)
+
+            if field:
+                try:
+                    renditions[field_name] = build_rendition(field)
+                except (OSError, ValueError):
+                    logger.exception('Failed to build %s rendition for Variant.id=%d', field_name, self.id)
+
+        if renditions != (self.sketch_renditions or {}):
+            self.sketch_renditions = renditions
+            Variant.objects.filter(pk=self.pk).update(sketch_renditions=renditions)
+
+    def get_sketch_rendition(self, field_name='sketch') -> Optional[dict]:
+        field = getattr(self, field_name)
+        rendition = (self.sketch_renditions or {}).get(field_name)
+
+        if field and (not rendition or rendition.get('source') != field.name or not rendition.get('hash')):
+            # эскизы, загруженные до появления копий
+            self.update_sketch_renditions()
+            rendition = self.sketch_renditions.get(field_name)
+
+        return rendition
+
     def resize_image(self, image, max_width=520, max_height=680):
         img = Image.open(image)
         width, height = img.size
@@ -766,64 +840,68 @@ class Variant(SoftDeleteModelMixin, models.Model):
         new_image = ContentFile(image_io.getvalue(), name=image.name)
         return new_image
 
-    def generate_sketch(self, item, field_name='sketch', coords_field_name='sketch_coords'):
-        sketch = getattr(self, field_name)
+    @staticmethod
+    def get_sketch_children(item) -> dict:
+        """
+        Дочерние элементы изделия одним запросом по ключам ('variant', позиция, исполнение) и
+        ('type', позиция, тип детали). При нескольких элементах на ключ берется элемент с меньшим id.
+        """
+        children = {}
+        child_items = Item.objects.filter(parents__parent=item).annotate(
+            link_position=models.F('parents__position'),
+        ).order_by('id')
 
-        if not sketch:
-            return None
+        for child_item in child_items:
+            children.setdefault(('variant', child_item.link_position, child_item.variant_id), child_item)
+            children.setdefault(('type', child_item.link_position, child_item.type_id), child_item)
 
-        sketch_image = Image.open(sketch.path)
+        return children
+
+    def get_sketch_labels(self, item, coords_field_name='sketch_coords') -> List[dict]:
+        """
+        Подписи эскиза: значения атрибутов изделия и его дочерних элементов в точках sketch_coords.
+        Координаты - в пикселях исходного эскиза.
+        """
         sketch_coords = getattr(self, coords_field_name)
 
         if not sketch_coords:
-            return sketch_image
+            return []
 
-        draw = ImageDraw.Draw(sketch_image)
+        # Атрибуты, базовый состав и дочерние элементы для всех подписей загружаются заранее
+        attributes = Attribute.objects.in_bulk({coord.get('id') for coord in sketch_coords if coord.get('id')})
+        compositions = BaseComposition.objects.in_bulk(
+            {coord.get('child_id') for coord in sketch_coords if coord.get('child_id')}
+        )
+        children = self.get_sketch_children(item) if compositions else {}
 
-        img_width, img_height = sketch_image.size
-        font_size = max(12, int(img_height * 0.02))
-        font = ImageFont.truetype(config.SKETCH_IMAGE_TEXT_FONT_PATH, font_size)
+        labels = []
 
         for coord in sketch_coords:
             attribute_id = coord.get('id')
             child_id = coord.get('child_id')
-            x = coord.get('x')
-            y = coord.get('y')
-            rotation = coord.get('rotation', 0)
 
-            attribute = Attribute.objects.filter(id=attribute_id).first()
+            attribute = attributes.get(attribute_id)
 
             if not attribute:
                 continue
 
             if child_id:
-                base_composition = BaseComposition.objects.filter(id=child_id).first()
+                base_composition = compositions.get(child_id)
 
                 if not base_composition:
                     continue
 
-                if base_composition.base_child_variant:
-                    child_item = Item.objects.filter(
-                        parents__parent=item,
-                        parents__position=base_composition.position,
-                        variant=base_composition.base_child_variant,
-                    ).first()
-
-                    if not child_item:
-                        continue
-
-                    item_for_search = child_item
+                if base_composition.base_child_variant_id:
+                    child_item = children.get(
+                        ('variant', base_composition.position, base_composition.base_child_variant_id)
+                    )
                 else:
-                    child_item = Item.objects.filter(
-                        parents__parent=item,
-                        parents__position=base_composition.position,
-                        type=base_composition.base_child,
-                    ).first()
+                    child_item = children.get(('type', base_composition.position, base_composition.base_child_id))
 
-                    if not child_item:
-                        continue
+                if not child_item:
+                    continue
 
-                    item_for_search = child_item
+                item_for_search = child_item
             else:
                 item_for_search = item
 
@@ -831,7 +909,54 @@ class Variant(SoftDeleteModelMixin, models.Model):
             if not attribute_value:
                 continue
 
-            text = str(attribute_value)
+            labels.append({
+                'text': str(attribute_value),
+                'x': coord.get('x'),
+                'y': coord.get('y'),
+                'rotation': coord.get('rotation', 0),
+            })
+
+        return labels
+
+    @staticmethod
+    def get_sketch_font_size(original_height: int) -> int:
+        """
+        Размер шрифта подписей в пикселях исходного эскиза.
+        """
+        return max(12, int(original_height * 0.02))
+
+    def generate_sketch(self, item, field_name='sketch', coords_field_name='sketch_coords'):
+        sketch = getattr(self, field_name)
+
+        if not sketch:
+            return None
+
+        # Уменьшенная копия эскиза: координаты и размер шрифта подписей масштабируются вместе с ней
+        rendition = self.get_sketch_rendition(field_name)
+        if rendition:
+            sketch_image = Image.open(sketch.storage.path(rendition['name']))
+            scale = rendition['scale']
+            img_height = rendition['original_size'][1]
+        else:
+            sketch_image = Image.open(sketch.path)
+            scale = 1.0
+            img_height = sketch_image.height
+
+        labels = self.get_sketch_labels(item, coords_field_name)
+
+        if not labels:
+            return sketch_image
+
+        draw = ImageDraw.Draw(sketch_image)
+
+        font_size = self.get_sketch_font_size(img_height)
+        font = get_font(config.SKETCH_IMAGE_TEXT_FONT_PATH, max(1, round(font_size * scale)))
+
+        for label in labels:
+            text = label['text']
+            x = label['x'] * scale
+            y = label['y'] * scale
+            rotation = label['rotation']
 
             bbox = draw.textbbox((0, 0), text, font=font)
             text_width, text_height = bbox[2] - bbox[0], bbox[3] - bbox[1]
@@ -966,7 +1091,10 @@ class Attribute(SoftDeleteModelMixin, models.Model):
 
     position = models.IntegerField(validators=[MinValueValidator(1)], verbose_name=_('Позиция'))
 
-    historylog = HistoryModelTracker(excluded_fields=('id',), root_model='self', root_id=lambda ins: ins.id)
+    # Время последнего изменения, по нему процессы узнают об изменении ресурсов импорта/экспорта
+    modified = models.DateTimeField(auto_now=True, verbose_name=_('Дата изменения'))
+
+    historylog = HistoryModelTracker(excluded_fields=('id', 'modified'), root_model='self', root_id=lambda ins: ins.id)
 
     @property
     def catalog_api(self):
@@ -980,10 +1108,17 @@ class Attribute(SoftDeleteModelMixin, models.Model):
     objects = AttributeSoftDeleteManager()
     all_objects = AttributeAllObjectsManager()
 
+    soft_delete_unindexed_fields = ('fieldset',)
+
     class Meta:
         ordering = ["variant", "position"]
         verbose_name = _("Атрибут")
         verbose_name_plural = _("Атрибуты")
+        indexes = [
+            soft_delete_index('detail_type', 'position', name='ops_attr_type_alive_idx'),
+            soft_delete_index('variant', 'position', name='ops_attr_variant_alive_idx'),
+            soft_delete_index('name', name='ops_attr_name_alive_idx'),
+        ]
         default_permissions = ()
         permissions = (
             ("view_attribute", _("Может просматривать атрибуты")),
@@ -1211,14 +1346,27 @@ class Item(SoftDeleteModelMixin, TimeStampedModel, models.Model):
 
     erp_id = models.CharField(null=True, blank=True, verbose_name=_('Идентификатор с ERP'))
     erp_nomspec = models.CharField(max_length=255, null=True, blank=True, verbose_name=_('Номер спецификации'))
+    erp_fingerprint = models.CharField(
+        max_length=64, null=True, blank=True, verbose_name=_('Отпечаток данных, отправленных в ERP'),
+    )
+    erp_spec_fingerprint = models.CharField(
+        max_length=64, null=True, blank=True, verbose_name=_('Отпечаток спецификации, отправленной в ERP'),
+    )
 
     historylog = HistoryModelTracker(excluded_fields=('id',), root_model='self', root_id=lambda ins: ins.id)
 
     objects = ItemManager()
 
+    soft_delete_unindexed_fields = ('material', 'author')
+
     class Meta:
         verbose_name = _('Изделие/Деталь/Сборочная единица')
         verbose_name_plural = _('Изделия/Детали/Сборочные единицы')
+        indexes = [
+            soft_delete_index('type', 'variant', name='ops_item_type_alive_idx'),
+            soft_delete_index('variant', name='ops_item_variant_alive_idx'),
+            soft_delete_index('name', name='ops_item_name_alive_idx'),
+        ]
         default_permissions = ('add_item', 'change_item', 'delete_item', 'view_item')
         permissions = (
             ('add_item', 'Может создавать изделия/детали/сборочные единицы всех пользователей'),
@@ -1235,12 +1383,12 @@ class Item(SoftDeleteModelMixin, TimeStampedModel, models.Model):
             models.UniqueConstraint(fields=['inner_id', 'deleted_at'], name='unique_inner_id_not_deleted')
         ]
 
-    def generate_marking(self) -> str:
+    def generate_marking(self, attributes=None) -> str:
         """
         Генерирует маркировку для элемента на основе шаблона с использованием класса MarkingCompiler.
         В случае ошибки при компиляции возвращает строку "ERROR".
         """
-        compiler = MarkingCompiler(item=self)
+        compiler = MarkingCompiler(item=self, attributes=attributes)
 
         try:
             marking = compiler.compile()
@@ -1345,7 +1493,7 @@ class Item(SoftDeleteModelMixin, TimeStampedModel, models.Model):
         children = get_cached_item_children(self.id)
         return children
 
-    def calculate_attribute(self, attribute, extra_context=None, children=None):
+    def calculate_attribute(self, attribute, extra_context=None, children=None, attributes=None):
         errors = {}
         value = None
 
@@ -1369,7 +1517,7 @@ class Item(SoftDeleteModelMixin, TimeStampedModel, models.Model):
 
             compiler = MarkingCompiler(
                 item=self, marking_template=attribute.calculated_value, auto_wrap=True, extra_context=extra_context,
-                children=children,
+                children=children, attributes=attributes,
             )
 
             try:
@@ -1430,9 +1578,10 @@ class Item(SoftDeleteModelMixin, TimeStampedModel, models.Model):
 
         return value, errors
 
-    def recalculate_parameters(self) -> None:
+    def recalculate_parameters(self, metadata=None) -> None:
         """
         Пересчитывает значение атрибутов изделия/детали.
+        metadata (VariantMetadataCache) используется при пакетной обработке, чтобы не читать атрибуты для каждой детали.
         """
         if not self.variant_id:
             return
@@ -1443,7 +1592,10 @@ class Item(SoftDeleteModelMixin, TimeStampedModel, models.Model):
             self.parameters_errors = {}
 
         try:
-            attributes = get_cached_attributes_with_topological_sort(self.variant)
+            if metadata is not None:
+                attributes = metadata.sorted_attributes(self.variant)
+            else:
+                attributes = get_cached_attributes_with_topological_sort(self.variant)
         except TopologicalSortException as exc:
             logger.exception("Topological sort failed for attributes in Item.id=%d", self.id)
 
@@ -1451,8 +1603,10 @@ class Item(SoftDeleteModelMixin, TimeStampedModel, models.Model):
                 self.parameters[field] = None
                 self.parameters_errors[field] = str(exc)
         else:
+            attributes_dict = metadata.attributes_dict(self.variant) if metadata is not None else None
+
             for attribute in attributes:
-                value, errors = self.calculate_attribute(attribute)
+                value, errors = self.calculate_attribute(attribute, attributes=attributes_dict)
                 self.parameters[attribute.name] = value
 
                 if attribute.name in self.parameters_errors:
@@ -1461,12 +1615,14 @@ class Item(SoftDeleteModelMixin, TimeStampedModel, models.Model):
                 if errors:
                     self.parameters_errors.update(errors)
 
-    def update_auto_fields(self) -> None:
+    def update_auto_fields(self, metadata=None) -> None:
         """
         Обновляет автоматически вычисляемые поля: параметры, маркировку и наименование.
         """
-        self.recalculate_parameters()
-        self.marking, self.marking_errors = self.generate_marking()
+        self.recalculate_parameters(metadata)
+        self.marking, self.marking_errors = self.generate_marking(
+            attributes=metadata.attributes_dict(self.variant) if metadata is not None else None,
+        )
 
         if not self.name_manual_changed:
             self.name = self.generate_name()
@@ -1484,9 +1640,8 @@ class Item(SoftDeleteModelMixin, TimeStampedModel, models.Model):
     def save(self, *args, **kwargs) -> None:
         """
         Переопределённый метод сохранения объекта.
-        Если объект сохраняется впервые (self._state.adding), то генерируется уникальный inner_id.
-        Если последний inner_id существует, то новый будет на 1 больше.
-        В противном случае устанавливается начальное значение 100000.
+        Если объект сохраняется впервые (self._state.adding), то генерируется уникальный inner_id
+        (ItemManager.reserve_inner_ids: следующий номер последовательности, начиная со 100000).
 
         После сохранения объекта маркировка обновляется с помощью метода generate_marking.
 
@@ -1496,12 +1651,8 @@ class Item(SoftDeleteModelMixin, TimeStampedModel, models.Model):
         # Если в первый раз сохраняется, то сгенерируем inner_id этому объекту
         # В случае отсутствия комментария при создании, будет брать комментарий у Типа
         if self._state.adding:
-            last_id = Item.objects.all().aggregate(largest=models.Max('inner_id'))['largest']
+            self.inner_id = Item.objects.reserve_inner_ids(1)[0]
 
-            if last_id is not None:
-                self.inner_id = last_id + 1
-            else:
-                self.inner_id = 100000
             if not self.comment:
                 self._set_default_comment()
 
@@ -1515,10 +1666,81 @@ class Item(SoftDeleteModelMixin, TimeStampedModel, models.Model):
             logger.info('Item.__dict__: %s', self.__dict__)
             raise
 
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'parameters' in update_fields:
+            ItemParameterValue.objects.sync_items([self])
+
     def __str__(self):
         return str(self.marking)
 
 
+class ItemParameterValue(models.Model):
+    """
+    Типизированная проекция Item.parameters для индексируемых выборок.
+
+    В Item.parameters значения хранятся то числом, то строкой, поэтому фильтры по JSON не используют индексы.
+    Здесь каждый скалярный параметр изделия/детали лежит отдельной строкой: числовое значение (если значение
+    приводится к числу) и текстовое. Таблица пересобирается при сохранении Item и при пакетном перерасчете.
+    """
+    TEXT_MAX_LENGTH = 255
+
+    item = models.ForeignKey(
+        Item, on_delete=models.CASCADE, related_name='parameter_values',
+        verbose_name=_('Изделие/Деталь/Сборочная единица'),
+    )
+    name = models.CharField(max_length=255, verbose_name=_('Наименование параметра'))
+    numeric_value = models.FloatField(null=True, blank=True, verbose_name=_('Числовое значение'))
+    text_value = models.CharField(max_length=TEXT_MAX_LENGTH, null=True, blank=True, verbose_name=_('Текстовое значение'))
+
+    objects = ItemParameterValueManager()
+
+    class Meta:
+        verbose_name = _('Значение параметра')
+        verbose_name_plural = _('Значения параметров')
+        default_permissions = ()
+        constraints = [
+            models.UniqueConstraint(fields=['item', 'name'], name='unique_item_parameter_value'),
+        ]
+        indexes = [
+            models.Index(fields=['name', 'numeric_value', 'item'], name='ops_itemparam_numeric_idx'),
+            models.Index(fields=['name', 'text_value', 'item'], name='ops_itemparam_text_idx'),
+        ]
+
+    @classmethod
+    def split_value(cls, value) -> Optional[Tuple[Optional[float], Optional[str]]]:
+        """
+        Раскладывает значение параметра на (числовое, текстовое).
+        Возвращает None, если значение не скалярное (списки, словари) или пустое.
+        """
+        if value is None or isinstance(value, (dict, list)):
+            return None
+
+        if isinstance(value, bool):
+            return None, 'true' if value else 'false'
+
+        if isinstance(value, (int, float, Decimal)):
+            numeric = float(value)
+            return (numeric if isfinite(numeric) else None), str(value)
+
+        text = str(value)
+
+        try:
+            numeric = float(text.strip().replace(',', '.'))
+        except ValueError:
+            numeric = None
+        else:
+            if not isfinite(numeric):
+                numeric = None
+
+        if len(text) > cls.TEXT_MAX_LENGTH:
+            text = None
+
+        return numeric, text
+
+    def __str__(self):
+        return f'{self.item_id}: {self.name}={self.text_value}'
+
+
 class ERPSync(SoftDeleteModelMixin, models.Model):
     author = models.ForeignKey(User, on_delete=models.PROTECT, related_name='+', verbose_name=_('Автор'))
     type = models.CharField(max_length=7, choices=ERPSyncType.choices, verbose_name=_('Тип'))
@@ -1579,10 +1801,19 @@ class ERPSync(SoftDeleteModelMixin, models.Model):
             'comment': self.comment,
         }
 
-    def add_log(self, log_type, request=None, response=None):
+    def add_log(self, log_type, request=None, response=None, payload=False):
+        """
+        Добавляет запись в лог синхронизации. payload=True помечает запись с полными данными запроса/ответа.
+        Внутри buffer_logs запись попадает в буфер, иначе сохраняется сразу.
+        """
         if isinstance(response, Exception):
             response = traceback.format_exc()
 
+        log_buffer = getattr(self, '_log_buffer', None)
+        if log_buffer is not None:
+            log_buffer.add(log_type, request, response, payload=payload)
+            return
+
         ERPSyncLog.objects.create(
             erp_sync=self,
             log_type=log_type,
@@ -1590,6 +1821,21 @@ class ERPSync(SoftDeleteModelMixin, models.Model):
             response=response,
         )
 
+    @contextmanager
+    def buffer_logs(self, verbosity=None, **kwargs):
+        """
+        Буферизует лог на время синхронизации (см. ERPSyncLogBuffer), в конце сохраняет накопленные записи.
+        """
+        if verbosity is None:
+            verbosity = config.ERP_SYNC_LOG_VERBOSITY
+
+        self._log_buffer = ERPSyncLogBuffer(self, verbosity=verbosity, **kwargs)
+        try:
+            yield self._log_buffer
+        finally:
+            log_buffer, self._log_buffer = self._log_buffer, None
+            log_buffer.flush()
+
     def __str__(self):
         instance = self.get_instance()
         return f'ERP Sync {self.id} -{instance} - {self.get_status_display()}'
@@ -1604,7 +1850,8 @@ class ERPSyncLog(SoftDeleteModelMixin, models.Model):
     request = models.TextField(null=True, blank=True, verbose_name=_('Запрос'))
     response = models.TextField(null=True, blank=True, verbose_name=_('Ответ'))
 
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_('Дата создания'))
+    # Время события, а не записи: буфер лога (ops.erp_sync.ERPSyncLogBuffer) сохраняет записи пачками
+    created_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name=_('Дата создания'))
 
     class Meta:
         verbose_name = _("Лог ERP синхронизации")
@@ -1636,6 +1883,10 @@ class ItemChild(SoftDeleteModelMixin, models.Model):
         verbose_name = _("Спецификация")
         verbose_name_plural = _("Спепцификации")
         ordering = ("parent", "position")
+        indexes = [
+            soft_delete_index('parent', 'position', name='ops_itemchild_parent_alive_idx'),
+            soft_delete_index('child', name='ops_itemchild_child_alive_idx'),
+        ]
         default_permissions = ()
         permissions = (
             ("add_itemchild", _("Может создавать любые спецификации любой изделия/детали/сборочной единицы")),
@@ -1697,6 +1948,12 @@ class BaseComposition(SoftDeleteModelMixin, models.Model):
         verbose_name = _("Комплектующая базового состава")
         verbose_name_plural = _("Комплектующие базового состава")
         ordering = ("base_parent", "position")
+        indexes = [
+            soft_delete_index('base_parent', 'position', name='ops_bc_parent_alive_idx'),
+            soft_delete_index('base_parent_variant', name='ops_bc_pvariant_alive_idx'),
+            soft_delete_index('base_child', name='ops_bc_child_alive_idx'),
+            soft_delete_index('base_child_variant', name='ops_bc_cvariant_alive_idx'),
+        ]
         default_permissions = ()
         permissions = (
             ("view_basecomposition", _("Может просматривать базовые составы")),
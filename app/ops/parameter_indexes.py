@@ -0,0 +1,161 @@
+"""
+Частичные индексы типизированной проекции параметров (ItemParameterValue) по именам параметров.
+
+Горячие выборки подбора фильтруют Item по параметрам, у атрибутов которых задано использование
+"Типоразмер", "Номинальный ход", "Нагрузка", "Длина" или "Нагрузочная группа". Условия parameters__<name>
+выполняются через Item.objects.filter_parameters, который строит подзапрос вида
+
+    SELECT item_id FROM ops_itemparametervalue WHERE name = 'L' AND numeric_value >= 300
+
+Для каждого такого имени создается индекс (numeric_value, item_id) с условием name = '<имя>': он меньше общего
+индекса (name, numeric_value, item) и читается планировщиком для условий по одному параметру.
+
+Функции модуля используются командой reconcile_parameter_indexes, celery-задачей после изменения атрибутов
+и миграциями (в них передается историческая модель Attribute).
+"""
+import hashlib
+import logging
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from django.db import connection as default_connection
+
+from ops.choices import AttributeUsageChoices
+
+logger = logging.getLogger(__name__)
+
+INDEXED_USAGES = (
+    AttributeUsageChoices.SIZE,
+    AttributeUsageChoices.RATED_STROKE,
+    AttributeUsageChoices.LOAD,
+    AttributeUsageChoices.LENGTH,
+    AttributeUsageChoices.LOAD_GROUP,
+)
+
+PARAMETER_VALUE_TABLE = 'ops_itemparametervalue'
+INDEX_PREFIX = 'ops_itemparam_prm_'
+
+# Имя параметра подставляется в условие индекса литералом, поэтому допускаются только буквы, цифры и "_"
+PARAMETER_NAME_RE = re.compile(r'^\w+$')
+
+
+def get_index_name(parameter_name: str) -> str:
+    """
+    Возвращает имя индекса для параметра. Хэш исходного имени различает параметры "L" и "l"
+    и укладывает имя в ограничение PostgreSQL на 63 байта.
+    """
+    digest = hashlib.md5(parameter_name.encode()).hexdigest()[:8]
+    name = re.sub(r'[^a-z0-9_]', '', parameter_name.lower())[:30]
+    return f'{INDEX_PREFIX}{name}_{digest}'
+
+
+def get_indexed_parameter_names(attribute_model=None) -> Set[str]:
+    """
+    Возвращает имена атрибутов, использование которых требует индекса по параметру.
+    """
+    if attribute_model is None:
+        from ops.models import Attribute as attribute_model
+
+    names = attribute_model._base_manager.filter(
+        usage__in=INDEXED_USAGES, deleted_at__isnull=True,
+    ).values_list('name', flat=True).distinct()
+
+    return {name for name in names if PARAMETER_NAME_RE.match(name)}
+
+
+def get_existing_indexes(connection=None) -> Set[str]:
+    """
+    Возвращает имена уже созданных индексов по параметрам.
+    """
+    connection = connection or default_connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexname FROM pg_indexes WHERE tablename = %s AND indexname LIKE %s",
+            [PARAMETER_VALUE_TABLE, f'{INDEX_PREFIX}%'],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def get_create_index_sql(parameter_name: str, concurrently: bool = True, connection=None) -> str:
+    connection = connection or default_connection
+
+    if not PARAMETER_NAME_RE.match(parameter_name):
+        raise ValueError(f'Недопустимое имя параметра для индекса: {parameter_name!r}')
+
+    return (
+        f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS "
+        f"{connection.ops.quote_name(get_index_name(parameter_name))} "
+        f"ON {connection.ops.quote_name(PARAMETER_VALUE_TABLE)} (\"numeric_value\", \"item_id\") "
+        f"WHERE \"name\" = '{parameter_name}'"
+    )
+
+
+def get_drop_index_sql(index_name: str, concurrently: bool = True, connection=None) -> str:
+    connection = connection or default_connection
+
+    return f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS {connection.ops.quote_name(index_name)}"
+
+
+def reconcile_parameter_indexes(
+        attribute_model=None, connection=None, concurrently: bool = True, dry_run: bool = False,
+) -> Tuple[List[str], List[str]]:
+    """
+    Приводит набор индексов по параметрам к актуальному списку атрибутов: создает недостающие и удаляет
+    индексы параметров, которые больше не помечены нужным использованием.
+
+    CONCURRENTLY нельзя выполнять внутри транзакции, поэтому в миграциях передается concurrently=False.
+    Возвращает (созданные, удаленные) имена индексов.
+    """
+    connection = connection or default_connection
+
+    if connection.vendor != 'postgresql':
+        return [], []
+
+    desired = {get_index_name(name): name for name in get_indexed_parameter_names(attribute_model)}
+    existing = get_existing_indexes(connection)
+
+    to_create = sorted(set(desired) - existing)
+    to_drop = sorted(existing - set(desired))
+
+    if dry_run:
+        return to_create, to_drop
+
+    with connection.cursor() as cursor:
+        for index_name in to_create:
+            logger.info('Creating parameter index %s', index_name)
+            cursor.execute(get_create_index_sql(desired[index_name], concurrently, connection))
+
+        for index_name in to_drop:
+            logger.info('Dropping parameter index %s', index_name)
+            cursor.execute(get_drop_index_sql(index_name, concurrently, connection))
+
+    return to_create, to_drop
+
+
+def get_parameter_index_stats(connection=None) -> List[Dict[str, Optional[int]]]:
+    """
+    Возвращает статистику использования индексов проекции параметров из pg_stat_user_indexes:
+    частичных индексов по именам и общих индексов ItemParameterValue, чтобы было видно, какие из них читаются.
+    """
+    connection = connection or default_connection
+
+    if connection.vendor != 'postgresql':
+        return []
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexrelname, idx_scan, idx_tup_read, idx_tup_fetch, pg_relation_size(indexrelid) "
+            "FROM pg_stat_user_indexes WHERE relname = %s ORDER BY indexrelname",
+            [PARAMETER_VALUE_TABLE],
+        )
+        return [
+            {
+                'index': index_name,
+                'scans': scans,
+                'tuples_read': tuples_read,
+                'tuples_fetched': tuples_fetched,
+                'size': size,
+            }
+            for index_name, scans, tuples_read, tuples_fetched, size in cursor.fetchall()
+        ]
@@ -4,6 +4,7 @@ from collections import defaultdict
 
 from django.contrib.auth import get_user_model
 from django.db.models import Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from import_export import resources
 from import_export.fields import Field
@@ -12,7 +13,8 @@ from import_export.results import RowResult
 from rest_framework.exceptions import ValidationError
 
 from catalog.models import Material
-from ops.models import Item, DetailType, Attribute, Variant
+from ops.cache import VariantMetadataCache, get_resources_version, invalidate_spring_block_index
+from ops.models import Item, DetailType, Attribute, Variant, ItemParameterValue
 
 User = get_user_model()
 
@@ -181,6 +183,9 @@ class Base(resources.ModelResource, metaclass=DehydrateMetaClass):
         self.base_attrs_by_type_id = None
         self.materials_by_name = None
         self.items_by_variant = None
+        self.items_by_id = None
+        self.loaded_variant_ids = None
+        self.imported_ids = set()
         self.materials_by_id = None
         self.variant_attrs_by_id = None
         self.base_attrs = None
@@ -222,6 +227,11 @@ class Base(resources.ModelResource, metaclass=DehydrateMetaClass):
         detail_type = self.detail_type
         item_id = row.get('id')
         if item_id:
+            try:
+                return self.items_by_id[int(item_id)], False
+            except (KeyError, TypeError, ValueError):
+                pass
+
             try:
                 instance = Item.objects.get(id=item_id)
                 return instance, False
@@ -269,13 +279,49 @@ class Base(resources.ModelResource, metaclass=DehydrateMetaClass):
             self.materials_by_name = {m.name.strip().lower(): m for m in mats if m.name}
 
             self.items_by_variant = defaultdict(list)
-            for item in Item.objects.filter(type=self.detail_type).select_related('variant'):
-                if item.variant and item.variant.name:
-                    key = item.variant.name.strip().lower()
-                    self.items_by_variant[key].append(item)
+            self.items_by_id = {}
+            self.loaded_variant_ids = set()
+            self.load_items(dataset)
 
         return super().before_import(dataset, **kwargs)
 
+    def load_items(self, dataset: Any) -> None:
+        """
+        Загружает изделия/детали типа, на которые ссылаются строки dataset: указанные в колонке id
+        и все изделия исполнений из колонки variant (среди них ищутся совпадающие строки).
+        Повторный вызов для следующей части файла догружает только новые идентификаторы и исполнения.
+        """
+        headers = dataset.headers or []
+
+        ids = set()
+        if 'id' in headers:
+            for value in dataset['id']:
+                try:
+                    ids.add(int(value))
+                except (TypeError, ValueError):
+                    continue
+        ids -= set(self.items_by_id)
+
+        variant_ids = set()
+        if 'variant' in headers:
+            for value in dataset['variant']:
+                variant = self.variants_by_name.get(str(value).strip().lower()) if value is not None else None
+                if variant is not None and variant.id not in self.loaded_variant_ids:
+                    variant_ids.add(variant.id)
+
+        if not ids and not variant_ids:
+            return
+
+        self.loaded_variant_ids |= variant_ids
+        items = Item.objects.filter(type=self.detail_type).filter(
+            Q(id__in=ids) | Q(variant_id__in=variant_ids)
+        ).select_related('variant')
+
+        for item in items:
+            item = self.items_by_id.setdefault(item.id, item)
+            if item.variant_id in variant_ids and item.variant.name:
+                self.items_by_variant[item.variant.name.strip().lower()].append(item)
+
     def import_field(self, field: Field, obj: Item, data: Dict[str, Any], is_m2m=False, **kwargs):
         column_name = field.column_name
         value = data.get(column_name)
@@ -321,8 +367,17 @@ class Base(resources.ModelResource, metaclass=DehydrateMetaClass):
         elif column_name in getattr(self, 'allowed_parameter_fields', set()):
             obj.parameters[column_name] = value
 
+    def after_save_instance(self, instance: Item, row: Dict[str, Any], **kwargs):
+        if instance.pk:
+            self.imported_ids.add(instance.pk)
+
     def after_import(self, dataset: Any, result: Any, using_transactions: bool, dry_run: bool, **kwargs):
-        items = Item.objects.select_related('type').filter(Q(name__isnull=True) | Q(name=''))
+        if not self.imported_ids:
+            return
+
+        items = Item.objects.select_related('type').filter(id__in=self.imported_ids).filter(
+            Q(name__isnull=True) | Q(name='')
+        )
         to_update = []
         for item in items:
             try:
@@ -344,7 +399,182 @@ class Base(resources.ModelResource, metaclass=DehydrateMetaClass):
         return f'{cls.category}_{cls.designation}'
 
 
-def get_resources_list() -> List[Type[Base]]:
+class BulkBase(Base):
+    """
+    Базовый класс ресурса для пакетного импорта Items.
+
+    Строки не сохраняются через Item.save(): изделия/детали накапливаются и записываются
+    bulk_create/bulk_update пачками по batch_size. Для каждой пачки одним запросом резервируется блок inner_id,
+    формулы вычисляются с общим кэшем атрибутов исполнений, проекция параметров синхронизируется пачкой.
+    История изменений (historylog, auditlog) в этом режиме не пишется.
+    """
+    BULK_UPDATE_FIELDS = [
+        'type', 'variant', 'parameters', 'parameters_errors', 'marking', 'marking_errors', 'name', 'modified',
+    ]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.metadata = VariantMetadataCache()
+
+    def get_bulk_update_fields(self) -> List[str]:
+        return self.BULK_UPDATE_FIELDS
+
+    def bulk_create(self, using_transactions, dry_run, raise_errors, batch_size=None, result=None):
+        created = list(self.create_instances)
+
+        if created and (using_transactions or not dry_run):
+            inner_ids = Item.objects.reserve_inner_ids(len(created))
+
+            for item, inner_id in zip(created, inner_ids):
+                item.inner_id = inner_id
+                if not item.comment:
+                    item._set_default_comment()
+                item.update_auto_fields(self.metadata)
+
+        super().bulk_create(using_transactions, dry_run, raise_errors, batch_size=batch_size, result=result)
+        self._after_bulk_save(created)
+
+    def bulk_update(self, using_transactions, dry_run, raise_errors, batch_size=None, result=None):
+        updated = list(self.update_instances)
+
+        if updated and (using_transactions or not dry_run):
+            now = timezone.now()
+
+            for item in updated:
+                item.update_auto_fields(self.metadata)
+                item.modified = now
+
+        super().bulk_update(using_transactions, dry_run, raise_errors, batch_size=batch_size, result=result)
+        self._after_bulk_save(updated)
+
+    def _after_bulk_save(self, items: List[Item]) -> None:
+        items = [item for item in items if item.pk]
+
+        if items:
+            ItemParameterValue.objects.sync_items(items)
+            invalidate_spring_block_index()
+            self.imported_ids.update(item.pk for item in items)
+
+    class Meta(Base.Meta):
+        use_bulk = True
+        batch_size = 1000
+        clean_model_instances = False
+        skip_diff = True
+
+
+def build_resource_class(category: str, designation: str, base_attrs, variant_attrs, bulk: bool = False) -> Type[Base]:
+    """
+    Создает класс ресурса для категории/обозначения типа деталей по именам его атрибутов.
+    """
+    base = BulkBase if bulk else Base
+
+    standard_fields = ['id', 'variant']
+    all_fields = standard_fields + sorted(base_attrs) + sorted(variant_attrs)
+
+    class_name = f'{category}_{designation}'
+    class_attributes = {
+        'category': category,
+        'designation': designation,
+        'allowed_parameter_fields': set(all_fields) - {'id', 'variant'},
+        **{f: Field() for f in all_fields}
+    }
+
+    MetaClass = type('Meta', (base.Meta,), {
+        'model': Item,
+        'fields': all_fields,
+    })
+    class_attributes['Meta'] = MetaClass
+    return type(class_name, (base,), class_attributes)
+
+
+# Реестр классов ресурсов процесса. Сбрасывается при смене версии типов деталей и атрибутов в базе (см. ops.cache.get_resources_version)
+_registry = {
+    'version': None,
+    'classes': {},
+    'lists': {},
+}
+
+
+def _get_registry() -> Dict[str, Any]:
+    version = get_resources_version()
+
+    if _registry['version'] != version:
+        _registry['version'] = version
+        _registry['classes'] = {}
+        _registry['lists'] = {}
+
+    return _registry
+
+
+def split_resource_name(name: str) -> Optional[Tuple[str, str]]:
+    """
+    Разбирает имя ресурса "<category>_<designation>". Категория сама может содержать "_" (assembly_unit).
+    """
+    for category, _label in sorted(DetailType.CATEGORIES, key=lambda choice: -len(choice[0])):
+        prefix = f'{category}_'
+
+        if name.startswith(prefix) and len(name) > len(prefix):
+            return category, name[len(prefix):]
+
+    return None
+
+
+def _build_resource_class_by_name(name: str, bulk: bool) -> Optional[Type[Base]]:
+    parsed = split_resource_name(name)
+
+    if parsed is None:
+        return None
+
+    category, designation = parsed
+
+    if not DetailType.objects.filter(category=category, designation=designation).exists():
+        return None
+
+    attrs = Attribute.objects.filter(deleted_at=None).filter(
+        Q(detail_type__category=category, detail_type__designation=designation) |
+        Q(detail_type__isnull=True, variant__detail_type__category=category,
+          variant__detail_type__designation=designation)
+    ).values_list('name', 'variant_id')
+
+    variant_attrs = set()
+    base_attrs = set()
+
+    for attr_name, variant_id in attrs:
+        if variant_id:
+            variant_attrs.add(attr_name)
+        else:
+            base_attrs.add(attr_name)
+
+    return build_resource_class(category, designation, base_attrs, variant_attrs, bulk=bulk)
+
+
+def get_resource_class(name: str, bulk: bool = False) -> Optional[Type[Base]]:
+    """
+    Возвращает класс ресурса по имени "<category>_<designation>" или None.
+
+    Класс строится при первом обращении (только для запрошенного типа деталей) и хранится
+    в реестре процесса до изменения типов деталей или атрибутов.
+    """
+    registry = _get_registry()
+    key = (name, bulk)
+
+    if key not in registry['classes']:
+        registry['classes'][key] = _build_resource_class_by_name(name, bulk)
+
+    return registry['classes'][key]
+
+
+def get_resources_list(bulk: bool = False) -> List[Type[Base]]:
+    """
+    Строит классы ресурсов для всех категорий/обозначений типов деталей.
+    При bulk=True классы наследуются от BulkBase (пакетный импорт).
+    Результат хранится в реестре процесса так же, как в get_resource_class.
+    """
+    registry = _get_registry()
+
+    if bulk in registry['lists']:
+        return registry['lists'][bulk]
+
     classes = []
     cats_and_desigs = DetailType.objects.values_list('category', 'designation').distinct()
     all_attrs = Attribute.objects.filter(deleted_at=None).select_related('variant__detail_type', 'detail_type')
@@ -363,26 +593,15 @@ def get_resources_list() -> List[Type[Base]]:
             base_attrs_map[key].add(attr.name)
 
     for category, designation in cats_and_desigs:
-        standard_fields = ['id', 'variant']
-        variant_attrs = sorted(variant_attrs_map.get((category, designation), []))
-        base_attrs = sorted(base_attrs_map.get((category, designation), []))
-        all_fields = standard_fields + base_attrs + variant_attrs
-
-        class_name = f'{category}_{designation}'
-        class_attributes = {
-            'category': category,
-            'designation': designation,
-            'allowed_parameter_fields': set(all_fields) - {'id', 'variant'},
-            **{f: Field() for f in all_fields}
-        }
-
-        MetaClass = type('Meta', (Base.Meta,), {
-            'model': Item,
-            'fields': all_fields,
-            'use_bulk': False,
-        })
-        class_attributes['Meta'] = MetaClass
-        klazz = type(class_name, (Base,), class_attributes)
+        klazz = build_resource_class(
+            category, designation,
+            base_attrs_map.get((category, designation), set()),
+            variant_attrs_map.get((category, designation), set()),
+            bulk=bulk,
+        )
+        registry['classes'][(klazz.__name__, bulk)] = klazz
         classes.append(klazz)
 
+    registry['lists'][bulk] = classes
+
     return classes
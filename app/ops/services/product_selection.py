@@ -3,7 +3,7 @@ from decimal import Decimal, ROUND_HALF_UP
 from math import isfinite
 from typing import Optional, List, Dict, Any, Tuple
 
-from django.db.models import Q, QuerySet, OuterRef, Exists, Count, Sum
+from django.db.models import Q, QuerySet, Count, Sum
 
 from catalog.choices import ComponentGroupType, Standard
 from catalog.models import (
@@ -15,13 +15,13 @@ from catalog.models import (
     LoadGroup,
     ComponentGroup,
     SupportDistance,
-    SpringBlockFamilyBinding,
     CoveringType,
     ClampSelectionMatrix,
     ClampSelectionEntry,
 )
 
 from ops.api.serializers import VariantSerializer
+from ops.cache import get_cached_spring_block_index, normalize_spring_block_value
 from ops.choices import AttributeCatalog, AttributeUsageChoices
 from ops.loads.utils import get_suitable_loads
 from ops.loads.standard_series import MAX_SIZE as MAX_SIZE_STANDARD
@@ -386,20 +386,20 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
                     )
                     return None, None
 
-                zom = Item.objects.filter(
+                zom = Item.objects.filter_parameters(
                     type_id__in=fastener_component_group.detail_types.values_list("id", flat=True),
                     parameters__LGV=load_group_id,
                 ).first()
                 return pipe_mount, zom
 
             if entry.result == "unlimited":
-                zom = Item.objects.filter(
+                zom = Item.objects.filter_parameters(
                     type_id__in=entry.matrix.fastener_detail_types.values_list('id', flat=True),
                     parameters__LGV=load_group_id,
                 ).first()
                 return pipe_mount, zom
             elif entry.result == "adapter_required":
-                zom = Item.objects.filter(
+                zom = Item.objects.filter_parameters(
                     type_id__in=entry.matrix.fastener_detail_types.values_list('id', flat=True),
                     parameters__LGV__in=hanger_load_group_ids,
                     parameters__LGV2=load_group_id,
@@ -772,7 +772,7 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
             )
             filter_params[f'parameters__{load_group_attribute.name}__in'] = load_group_ids
             self.debug.append(f'#Выбор крепления к трубе: Фильтрую по параметрам: {filter_params}')
-            found_items = pipe_clamps.filter(**filter_params)
+            found_items = pipe_clamps.filter_parameters(**filter_params)
             return list(found_items.values_list('id', flat=True))
 
         self.debug.append(f'#Выбор крепления к трубе: Фильтрую по параметрам: {filter_params}')
@@ -794,7 +794,7 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
 
             new_filter_params = copy.copy(filter_params)
             new_filter_params[f'parameters__{load_group_attribute.name}__in'] = clamp_load_group_ids
-            filtered_pipe_clamps = pipe_clamps.filter(**new_filter_params)
+            filtered_pipe_clamps = pipe_clamps.filter_parameters(**new_filter_params)
 
             if not filtered_pipe_clamps.exists():
                 continue
@@ -821,12 +821,12 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
 
             new_filter_params = copy.copy(filter_params)
             new_filter_params[f'parameters__{load_group_attribute.name}__in'] = clamp_load_group_ids
-            filtered_pipe_clamps = pipe_clamps.filter(**new_filter_params)
+            filtered_pipe_clamps = pipe_clamps.filter_parameters(**new_filter_params)
 
             if not filtered_pipe_clamps.exists():
                 continue
 
-            filtered_zom_items = zom_items.filter(
+            filtered_zom_items = zom_items.filter_parameters(
                 parameters__LGV__in=load_group_ids,  # Первый параметр LGV это по нагрузочкой группе подвеса
                 parameters__LGV2__in=clamp_load_group_ids,  # Второй параметр LGV это по нагрузочкой группе хомута
             )
@@ -941,7 +941,7 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
                     f'#Выбор крепления к трубе: У исполнение {variant} ищем по такому фильтру '
                     f'(проушина): {filter_params}'
                 )
-                finding_items = list(pipe_clamps.filter(**filter_params).values_list('id', flat=True))
+                finding_items = list(pipe_clamps.filter_parameters(**filter_params).values_list('id', flat=True))
                 self.debug.append(
                     f'#Выбор крепления к трубе: У исполнение {variant} найдено (проушина): {len(finding_items)}'
                 )
@@ -979,7 +979,7 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
                     f'#Выбор крепления к трубе: У исполнение {variant} ищем по такому фильтру '
                     f'(траверса): {filter_params}'
                 )
-                finding_items = list(pipe_clamps.filter(**filter_params).values_list('id', flat=True))
+                finding_items = list(pipe_clamps.filter_parameters(**filter_params).values_list('id', flat=True))
                 self.debug.append(
                     f'#Выбор крепления к трубе: У исполнение {variant} найдено (траверса): {len(finding_items)}'
                 )
@@ -1047,39 +1047,11 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
             self.debug.append('#Пружинный блок: Не выбран семейство изделии.')
             return None
 
-        # Ищем исполнения, у которого обязательно есть два атрибута: Типоразмер и Номинальный ход
-        has_size = Attribute.objects.filter(
-            Q(variant=OuterRef('pk')) | Q(detail_type=OuterRef('detail_type')),
-            usage=AttributeUsageChoices.SIZE,
-        )
-
-        has_rated_stroke = Attribute.objects.filter(
-            Q(variant=OuterRef('pk')) | Q(detail_type=OuterRef('detail_type')),
-            usage=AttributeUsageChoices.RATED_STROKE,
-        )
-
-        selectable_group = ComponentGroup.objects.filter(
-            group_type=ComponentGroupType.SERIES_SELECTABLE,
-            detail_types=OuterRef('detail_type'),
-        )
-
-        allowed_detail_types = SpringBlockFamilyBinding.objects.filter(
-            family=product_family
-        ).values_list('spring_block_types', flat=True)
-
-        variants = Variant.objects.annotate(
-            has_size_attr=Exists(has_size),
-            has_rated_stroke_attr=Exists(has_rated_stroke),
-            is_series_selectable=Exists(selectable_group),
-        ).filter(
-            has_size_attr=True,
-            has_rated_stroke_attr=True,
-            is_series_selectable=True,
-            series=series_name,
-            detail_type_id__in=allowed_detail_types,
-        )
+        # Индекс (серия, типоразмер, номинальный ход) -> ID деталей пружинных блоков семейства.
+        # Перестраивается при изменении пружинных блоков, их исполнений и атрибутов (см. ops.cache.invalidate_spring_block_index)
+        index = get_cached_spring_block_index(product_family.id)
 
-        if not variants.exists():
+        if not any(key[0] == series_name for key in index):
             self.debug.append(f'#Пружинный блок: Не найдено подходящих исполнений для серии {series_name}.')
             self.debug.append(
                 f'#Пружинный блок: Проверьте, что есть ComponentGroup с типом SERIES_SELECTABLE и '
@@ -1087,47 +1059,18 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
             )
             return None
 
-        found_block_items = []
-
-        for variant_index, variant in enumerate(variants):
-            self.debug.append(
-                f'#Пружинный блок: Проверяю исполнение {variant_index + 1}/{variants.count()} - {variant.name} '
-                f'(id={variant.id})'
-            )
-
-            # Получаем список атрибутов конкретного исполнения
-            # Здесь так же задаем приоритетность атрибутов: атрибуты самого исполнения приоритетнее чем базовый атрибут
-            attributes = variant.get_attributes()
-
-            size_attribute = self.get_attribute_by_usage(attributes, AttributeUsageChoices.SIZE)
-            rated_stroke_attribute = self.get_attribute_by_usage(attributes, AttributeUsageChoices.RATED_STROKE)
-
-            if not size_attribute or not rated_stroke_attribute:
-                # Если нет хотя бы одного из атрибутов, то пропускаем, это не то исполнение
-                continue
-
-            size_key = f'parameters__{size_attribute.name}'
-            stroke_key = f'parameters__{rated_stroke_attribute.name}'
-
-            self.debug.append(f'#Пружинный блок: Ищу детали по фильтру: {size_key}={size}, {stroke_key}={rated_stroke}')
-
-            # TODO: Временное решение, нужно чтобы изначально в parameters хранился значение соответствующему типу.
-            filtered_items = Item.objects.filter(
-                variant=variant
-            ).filter(
-                Q(**{size_key: size}) | Q(**{size_key: str(size)}),
-                Q(**{stroke_key: rated_stroke}) | Q(**{stroke_key: str(rated_stroke)}),
-            )
-
-            self.debug.append(
-                f'#Пружинный блок: Найдено {filtered_items.count()} деталей по фильтру: '
-                f'{size_key}={size}, {stroke_key}={rated_stroke}'
-            )
-
-            found_block_items.extend(filtered_items)
+        key = (
+            series_name,
+            normalize_spring_block_value(size),
+            normalize_spring_block_value(rated_stroke),
+        )
+        found_block_ids = index.get(key, [])
+        total = len(found_block_ids)
 
-        found_block_items = list(set(found_block_items))
-        total = len(found_block_items)
+        self.debug.append(
+            f'#Пружинный блок: Найдено {total} деталей по индексу: серия={series_name}, '
+            f'типоразмер={size}, номинальный ход={rated_stroke}'
+        )
 
         if not total:
             self.debug.append(
@@ -1139,10 +1082,10 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
             self.debug.append(
                 f'#Пружинный блок: Найдено несколько деталей пружинного блока: {total}. Выбираю первую'
             )
-            spring_ids = ', '.join([str(item.id) for item in found_block_items])
+            spring_ids = ', '.join([str(item_id) for item_id in found_block_ids])
             self.debug.append(f'#Пружинный блок: Список деталей пружинного блока: {spring_ids}')
 
-        return found_block_items[0]
+        return Item.objects.filter(id__in=found_block_ids).order_by('id').first()
 
     def get_desired_system_height(self) -> Optional[float]:
         return self.params['system_settings']['system_height']
@@ -1401,7 +1344,7 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
             filter_params = {
                 f"parameters__{attribute_name}__in": self.get_load_group_ids_by_lgv(),
             }
-            coupling_item = coupling_items.filter(**filter_params).first()
+            coupling_item = coupling_items.filter_parameters(**filter_params).first()
 
             if not coupling_item:
                 self.debug.append(f"#Поиск муфт: Для базового состава {base_composition} не нашли подходящей муфты.")
@@ -1423,7 +1366,7 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
             return None
 
         if rest_system_height in set_lengths:
-            item = qs.filter(**{f"parameters__{attr_name}": rest_system_height}).first()
+            item = qs.filter_parameters(**{f"parameters__{attr_name}": rest_system_height}).first()
             if item:
                 self.debug.append(f"Найдено подходящая шпилька: {item} (id={item.id})")
                 return item
@@ -1455,8 +1398,8 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
             visited.add(l)
 
             if need in b_set:
-                it1 = a_qs.filter(**{f"parameters__{a_attr}": l}).first()
-                it2 = b_qs.filter(**{f"parameters__{b_attr}": need}).first()
+                it1 = a_qs.filter_parameters(**{f"parameters__{a_attr}": l}).first()
+                it2 = b_qs.filter_parameters(**{f"parameters__{b_attr}": need}).first()
                 if it1 and it2:
                     studs = sorted(
                         [(int(it1.parameters.get(a_attr)), it1),
@@ -1494,9 +1437,9 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
             if third > l:
                 continue
             if third in set3:
-                it1 = qs1.filter(**{f"parameters__{attr1}": l}).first()
-                it2 = qs2.filter(**{f"parameters__{attr2}": l}).first()
-                it3 = qs3.filter(**{f"parameters__{attr3}": third}).first()
+                it1 = qs1.filter_parameters(**{f"parameters__{attr1}": l}).first()
+                it2 = qs2.filter_parameters(**{f"parameters__{attr2}": l}).first()
+                it3 = qs3.filter_parameters(**{f"parameters__{attr3}": third}).first()
                 if it1 and it2 and it3:
                     self.debug.append(
                         f"Найдены подходящие шпильки: {it1} (id={it1.id}), {it2} (id={it2.id}), {it3} (id={it3.id})")
@@ -1566,7 +1509,7 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
                     continue
 
                 if base_composition.base_child_variant:
-                    suitable_item = Item.objects.filter(
+                    suitable_item = Item.objects.filter_parameters(
                         variant=base_composition.base_child_variant, parameters__LGV__in=load_group_ids,
                     ).first()
                     bc_found_item = suitable_item
@@ -1574,7 +1517,7 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
                 else:
                     variants = Variant.objects.filter(detail_type=base_composition.base_child)
                     for variant in variants:
-                        suitable_item = Item.objects.filter(
+                        suitable_item = Item.objects.filter_parameters(
                             variant=variant, parameters__LGV__in=load_group_ids,
                         ).first()
 
@@ -1770,12 +1713,12 @@ class ProductSelectionAvailableOptions(BaseSelectionAvailableOptions):
 
                 attr_name = attr.name
 
-                # Сортируем Items по JSON полю parameters[attr_name] по возрастанию
+                # Сортируем Items по значению параметра attr_name по возрастанию
                 items = Item.objects.filter(
                     Q(type=base_child) | Q(variant=base_child_variant) if base_child_variant else Q(type=base_child)
-                ).exclude(parameters__isnull=True).exclude(**{f'parameters__{attr_name}__isnull': True}).order_by(
-                    f'parameters__{attr_name}'
-                )
+                ).exclude(parameters__isnull=True).exclude(
+                    **{f'parameters__{attr_name}__isnull': True}
+                ).order_by_parameters(attr_name)
 
                 if not items.exists():
                     self.debug.append(
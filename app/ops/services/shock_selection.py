@@ -558,7 +558,7 @@ class ShockSelectionAvailableOptions(BaseSelectionAvailableOptions):
                 self.debug.append(
                     "#Список креплений A: Атрибут материала есть, но подходящий материал не выбран — пропускаю фильтрацию по материалу")
 
-            matched = list(items.filter(**filter_params).values_list('id', flat=True))
+            matched = list(items.filter_parameters(**filter_params).values_list('id', flat=True))
             self.debug.append(
                 f"#Список креплений A: Найдено {len(matched)} подходящих элементов для варианта {variant}."
             )
@@ -634,7 +634,7 @@ class ShockSelectionAvailableOptions(BaseSelectionAvailableOptions):
                     f'parameters__{load_attribute.name}__gte': load_with_temp,
                     f'parameters__{clamp_load_attribute.name}__gte': selected_clamp_load,
                 }
-                bracket_items = list(items.filter(**filter_params).values_list('id', flat=True))
+                bracket_items = list(items.filter_parameters(**filter_params).values_list('id', flat=True))
                 self.debug.append(f"#Список креплений B: Найдено {len(bracket_items)} скоб для исполнения {variant}")
                 found_items.extend(bracket_items)
 
@@ -692,11 +692,8 @@ class ShockSelectionAvailableOptions(BaseSelectionAvailableOptions):
                 item = (
                     Item.objects
                     .filter(variant=variant_to_check)
-                    .filter(**filter_params)
-                    .order_by(
-                        f'parameters__{load_attribute.name}',
-                        f'parameters__{rated_stroke_attribute.name}'
-                    )
+                    .filter_parameters(**filter_params)
+                    .order_by_parameters(load_attribute.name, rated_stroke_attribute.name)
                     .first()
                 )
                 if item:
@@ -744,7 +741,7 @@ class ShockSelectionAvailableOptions(BaseSelectionAvailableOptions):
         )
 
         for attr in length_attrs:
-            item = Item.objects.filter(
+            item = Item.objects.filter_parameters(
                 variant__detail_type=attr.detail_type,
                 **{f"parameters__{attr.name}": str(length)},
             ).first()
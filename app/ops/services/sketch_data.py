@@ -0,0 +1,71 @@
+"""
+Сохраненные данные подбора для эскиза позиции.
+
+Данные для таблицы параметров эскиза (get_data_for_sketch) вычисляются по параметрам подбора позиции.
+Они сохраняются в ProjectItem.sketch_data при формировании изделия (update_item) вместе с отпечатком
+входных данных, и при формировании эскиза пересчитываются только если отпечаток изменился:
+
+    {'version': SKETCH_DATA_VERSION, 'selection_type': 'product_selection', 'selection_params': {...}}
+
+SKETCH_DATA_VERSION увеличивается при изменении get_data_for_sketch, чтобы сохраненные данные пересчитались.
+"""
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from ops.models import ProjectItem
+from ops.services import get_selection_available_options_class
+
+SKETCH_DATA_VERSION = 1
+
+
+def get_selection_type(project_item) -> Optional[str]:
+    product_family = project_item.product_family
+    return product_family.selection_type if product_family else None
+
+
+def get_sketch_data_fingerprint(project_item) -> str:
+    """
+    Отпечаток входных данных get_data_for_sketch: тип и параметры подбора позиции.
+    """
+    data = {
+        'version': SKETCH_DATA_VERSION,
+        'selection_type': get_selection_type(project_item),
+        'selection_params': project_item.selection_params,
+    }
+    content = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def save_sketch_data(project_item, selection=None) -> Dict[str, Any]:
+    """
+    Вычисляет данные для эскиза и сохраняет их в позиции.
+    selection - уже созданный объект подбора позиции, если он есть у вызывающего кода.
+    """
+    if selection is None:
+        available_options_class = get_selection_available_options_class(get_selection_type(project_item))
+        selection = available_options_class(project_item)
+
+    sketch_data = selection.get_data_for_sketch()
+    fingerprint = get_sketch_data_fingerprint(project_item)
+
+    project_item.sketch_data = sketch_data
+    project_item.sketch_data_fingerprint = fingerprint
+    ProjectItem.objects.filter(pk=project_item.pk).update(
+        sketch_data=sketch_data, sketch_data_fingerprint=fingerprint,
+    )
+
+    return sketch_data
+
+
+def get_sketch_data(project_item) -> Dict[str, Any]:
+    """
+    Возвращает сохраненные данные для эскиза, если параметры подбора с тех пор не менялись, иначе пересчитывает их.
+    """
+    if (
+        project_item.sketch_data is not None
+        and project_item.sketch_data_fingerprint == get_sketch_data_fingerprint(project_item)
+    ):
+        return project_item.sketch_data
+
+    return save_sketch_data(project_item)
@@ -269,7 +269,7 @@ class SpacerSelectionAvailableOptions(BaseSelectionAvailableOptions):
             }
             if material_attr and material_id:
                 params[f"parameters__{material_attr.name}"] = material_id
-            items = Item.objects.filter(variant=variant, **params).values_list("id", flat=True)
+            items = Item.objects.filter_parameters(variant=variant, **params).values_list("id", flat=True)
             result.extend(items)
         return list(result)
 
@@ -319,7 +319,7 @@ class SpacerSelectionAvailableOptions(BaseSelectionAvailableOptions):
             }
             if material_attr and material_id:
                 params[f"parameters__{material_attr.name}"] = material_id
-            items = Item.objects.filter(variant=variant, **params).values_list("id", flat=True)
+            items = Item.objects.filter_parameters(variant=variant, **params).values_list("id", flat=True)
             result.extend(items)
         return list(result)
 
@@ -663,7 +663,7 @@ class SpacerSelectionAvailableOptions(BaseSelectionAvailableOptions):
                     continue
 
                 # Базовый фильтр по нагрузке
-                qs = Item.objects.filter(
+                qs = Item.objects.filter_parameters(
                     variant=variant_to_check,
                     **{f'parameters__{load_attribute.name}__gte': check_load}
                 )
@@ -678,9 +678,8 @@ class SpacerSelectionAvailableOptions(BaseSelectionAvailableOptions):
 
                 if required_length is not None and length_attr:
                     # сначала пробуем >= требуемой длины (стандартный диапазон)
-                    qs_len = qs.filter(**{f'parameters__{length_attr.name}__gte': required_length}) \
-                        .order_by(f'parameters__{load_attribute.name}',
-                                  f'parameters__{length_attr.name}')
+                    qs_len = qs.filter_parameters(**{f'parameters__{length_attr.name}__gte': required_length}) \
+                        .order_by_parameters(load_attribute.name, length_attr.name)
                     item = qs_len.first()
                     if item:
                         self.debug.append(
@@ -695,7 +694,7 @@ class SpacerSelectionAvailableOptions(BaseSelectionAvailableOptions):
                     )
 
                 # Fallback/старый путь: только по нагрузке
-                item = qs.order_by(f'parameters__{load_attribute.name}').first()
+                item = qs.order_by_parameters(load_attribute.name).first()
                 if item:
                     self.debug.append(
                         f'#Распорка: Найден Item {item.id} по нагрузке (без учёта длины).'
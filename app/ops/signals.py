@@ -2,14 +2,19 @@ import re
 
 from django.dispatch import receiver
 
+from django.db import transaction
 from django.db.models import Q
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 
 from django.core.cache import cache
 
+from catalog.models import ComponentGroup, SpringBlockFamilyBinding
+
+from ops.cache import invalidate_resources, invalidate_spring_block_index
 from ops.constants import STALE_SET_KEY, STALE_LOCK
 from ops.models import DetailType, Item, Attribute, ItemChild, Variant, BaseComposition
-from ops.tasks import batch_recalculate_items
+from ops.parameter_indexes import INDEXED_USAGES
+from ops.tasks import batch_recalculate_items, task_reconcile_parameter_indexes
 
 
 def _mark_items_as_stale(qs):
@@ -176,3 +181,80 @@ def reset_series_if_needed(sender, instance: Variant, **kwargs):
     if not instance.has_series() and instance.series:
         instance.series = None
         Variant.objects.filter(pk=instance.pk).update(series=None)
+
+
+@receiver(pre_save, sender=Attribute)
+def remember_attribute_index_state(sender, instance: Attribute, **kwargs):
+    """
+    Запоминает имя и использование атрибута до сохранения, чтобы понять, затрагивает ли изменение индексы параметров.
+    """
+    instance._indexed_parameter_before = None
+
+    if instance.pk:
+        instance._indexed_parameter_before = sender.all_objects.filter(
+            pk=instance.pk,
+        ).values_list('name', 'usage', 'deleted_at').first()
+
+
+@receiver(post_save, sender=Attribute)
+def reconcile_parameter_indexes_on_attribute_save(sender, instance: Attribute, **kwargs):
+    """
+    Запускает пересоздание индексов проекции параметров, если атрибут стал или перестал быть индексируемым.
+    """
+    before = getattr(instance, '_indexed_parameter_before', None)
+    after = (instance.name, instance.usage, instance.deleted_at)
+
+    was_indexed = bool(before) and before[1] in INDEXED_USAGES
+    is_indexed = instance.usage in INDEXED_USAGES
+
+    if not (was_indexed or is_indexed) or before == after:
+        return
+
+    transaction.on_commit(task_reconcile_parameter_indexes.delay)
+
+
+@receiver(post_save, sender=Attribute)
+@receiver(post_save, sender=DetailType)
+def reset_resources_registry(sender, **kwargs):
+    """
+    Сбрасывает реестр ресурсов импорта/экспорта после изменения атрибутов или типов деталей.
+    """
+    invalidate_resources()
+
+
+@receiver(post_save, sender=Item)
+@receiver(post_delete, sender=Item)
+def reset_spring_block_index_on_item_save(sender, instance: Item, **kwargs):
+    """
+    Меняет версию индекса пружинных блоков после сохранения/удаления детали исполнения с серией.
+    Если исполнение не загружено, версия меняется без лишнего запроса к нему.
+    """
+    if not instance.variant_id:
+        return
+
+    if sender.variant.is_cached(instance) and not instance.variant.series:
+        return
+
+    invalidate_spring_block_index()
+
+
+@receiver(post_save, sender=Attribute)
+@receiver(post_save, sender=Variant)
+@receiver(post_save, sender=ComponentGroup)
+@receiver(post_save, sender=SpringBlockFamilyBinding)
+def reset_spring_block_index(sender, **kwargs):
+    """
+    Меняет версию индекса пружинных блоков после изменения атрибутов, исполнений, групп компонентов
+    или связей семейств с типами пружинных блоков.
+    """
+    invalidate_spring_block_index()
+
+
+@receiver(m2m_changed, sender=ComponentGroup.detail_types.through)
+@receiver(m2m_changed, sender=SpringBlockFamilyBinding.spring_block_types.through)
+def reset_spring_block_index_on_m2m_change(sender, action, **kwargs):
+    """
+    Меняет версию индекса пружинных блоков при изменении типов деталей в группе или в связи с семейством.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_spring_block_index()
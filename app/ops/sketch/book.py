@@ -0,0 +1,136 @@
+"""
+Пакетная выгрузка эскизов проекта (альбом эскизов).
+
+Позиции обрабатываются в пуле процессов billiard: задача выполняется в процессе prefork-пула Celery, который
+помечен как daemon, а процессы стандартного multiprocessing не могут создавать дочерние процессы из daemon.
+Процессы пула:
+- для одного многостраничного PDF процессы готовят изображения эскизов (get_sketch_images), а листы рисуются
+  в одном документе в текущем процессе в порядке позиций;
+- для ZIP процессы формируют готовые SVG/PDF файлы через кэш эскизов.
+
+Шрифты, логотип, копии эскизов и кэш готовых эскизов загружаются в каждом процессе один раз и используются
+для всех его позиций.
+"""
+import zipfile
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import billiard
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+
+from ops.models import DetailType, ProjectItem
+from ops.sketch.cache import render_sketch_cached, render_sketch_pdf_cached
+from ops.sketch.pdf import create_sketch_pdf, draw_sketch_page, get_sketch_images
+
+SKETCH_BOOK_PDF = 'pdf'
+SKETCH_BOOK_ZIP = 'zip'
+
+
+def get_project_item(project_item_id: int):
+    return ProjectItem.objects.select_related(
+        'project', 'nominal_diameter', 'original_item__type', 'original_item__variant',
+    ).get(pk=project_item_id)
+
+
+def prepare_position(
+    project_item_id: int, user_id: int, output: str, file_format: str, composition_type: str,
+) -> Dict[str, Any]:
+    """
+    Обрабатывает одну позицию: для PDF возвращает изображения листа, для ZIP - готовый файл.
+    Ошибка позиции возвращается в результате, чтобы не прерывать выгрузку остальных позиций.
+    """
+    try:
+        project_item = get_project_item(project_item_id)
+
+        if not project_item.original_item.variant.sketch:
+            raise Exception('У выбранного типа продукта не заведен эскиз.')
+
+        if output == SKETCH_BOOK_PDF:
+            double = project_item.original_item.type.branch_qty == DetailType.BranchQty.TWO
+            return {'images': get_sketch_images(project_item, double)}
+
+        user = get_user_model().objects.get(pk=user_id)
+        if file_format == 'svg':
+            content, filename = render_sketch_cached(None, project_item, composition_type, created_by=user)
+        else:
+            content, filename = render_sketch_pdf_cached(project_item, user, composition_type)
+
+        return {'content': content, 'filename': filename}
+
+    except Exception as exc:
+        return {'error': str(exc)}
+
+
+def prepare_indexed_position(args) -> Tuple[int, Dict[str, Any]]:
+    index, project_item_id, *rest = args
+    return index, prepare_position(project_item_id, *rest)
+
+
+def iter_prepared_positions(project_item_ids: List[int], workers: int, *args):
+    """
+    Возвращает (индекс позиции, результат prepare_position) по мере готовности позиций.
+    """
+    tasks = [(index, project_item_id, *args) for index, project_item_id in enumerate(project_item_ids)]
+
+    # процессы пула не видят незафиксированные данные транзакции, в ней позиции обрабатываются по очереди
+    if workers <= 1 or len(tasks) <= 1 or connection.in_atomic_block:
+        for task in tasks:
+            yield prepare_indexed_position(task)
+        return
+
+    # процессы наследуют открытые соединения, поэтому родитель закрывает свои перед созданием пула
+    connections.close_all()
+
+    with billiard.Pool(processes=min(workers, len(tasks))) as pool:
+        yield from pool.imap_unordered(prepare_indexed_position, tasks)
+
+
+def render_sketch_book(
+    project_items: List[Any],
+    created_by,
+    output: str = SKETCH_BOOK_PDF,
+    file_format: str = 'pdf',
+    composition_type: str = 'specification',
+    workers: int = 1,
+    progress: Optional[Callable[[int, Any, Optional[str]], None]] = None,
+) -> Tuple[bytes, List[Dict[str, Any]]]:
+    """
+    Формирует альбом эскизов позиций project_items (в их порядке): один PDF с листом на позицию
+    или ZIP с файлами позиций в формате file_format.
+
+    progress(количество обработанных позиций, позиция, ошибка) вызывается после каждой позиции.
+    Возвращает содержимое файла и список ошибок [{'position': номер позиции, 'error': текст}].
+    """
+    results = [None] * len(project_items)
+    errors = []
+    args = (created_by.id, output, file_format, composition_type)
+
+    prepared = iter_prepared_positions([project_item.id for project_item in project_items], workers, *args)
+    for processed, (index, result) in enumerate(prepared, 1):
+        results[index] = result
+
+        error = result.get('error')
+        if error:
+            errors.append({'position': project_items[index].position_number, 'error': error})
+
+        if progress is not None:
+            progress(processed, project_items[index], error)
+
+    errors.sort(key=lambda error: error['position'] or 0)
+
+    if output == SKETCH_BOOK_PDF:
+        pdf = create_sketch_pdf()
+        for project_item, result in zip(project_items, results):
+            if 'images' in result:
+                draw_sketch_page(pdf, project_item, created_by, composition_type, images=result['images'])
+
+        return bytes(pdf.output()), errors
+
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for result in results:
+            if 'content' in result:
+                archive.writestr(result['filename'], result['content'])
+
+    return buffer.getvalue(), errors
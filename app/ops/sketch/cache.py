@@ -0,0 +1,300 @@
+"""
+Кэш готовых эскизов (SVG/PDF).
+
+Эскиз зависит только от исходных данных: файла эскиза исполнения, координат подписей и атрибутов/базового
+состава, на которые они ссылаются, параметров изделия, полей позиции проекта, строк состава и данных листа
+(формат, подготовивший, дата). Ключ кэша - хеш этих данных, поэтому повторная выгрузка неизменной позиции -
+это чтение файла, а любое изменение данных дает новый ключ и старый файл просто перестает запрашиваться.
+
+Файлы хранятся в settings.SKETCH_CACHE_ROOT. При превышении settings.SKETCH_CACHE_MAX_SIZE удаляются
+файлы, которые дольше всех не запрашивались (время изменения файла обновляется при каждом чтении).
+"""
+import hashlib
+import json
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from constance import config
+from django.conf import settings
+from django.utils.translation import get_language
+
+from ops.models import Attribute, BaseComposition, ProjectItem, TemporaryComposition
+from ops.sketch.pdf import SKETCH_PDF_TIMEZONE, render_sketch_pdf
+from ops.utils import get_sketch_filename, render_sketch
+
+# Увеличивается при изменении оформления эскиза, чтобы не отдавать файлы, сформированные старым кодом
+SKETCH_CACHE_VERSION = 2
+
+
+def get_cache_root() -> Path:
+    return Path(settings.SKETCH_CACHE_ROOT)
+
+
+def get_file_data(field) -> Optional[Dict[str, Any]]:
+    """
+    Имя, размер и время изменения файла: замена файла эскиза под тем же именем тоже меняет ключ.
+    """
+    if not field:
+        return None
+
+    try:
+        stat = os.stat(field.path)
+    except (OSError, NotImplementedError, ValueError):
+        return {'name': field.name}
+
+    return {'name': field.name, 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+
+
+def get_variant_data(variant) -> Dict[str, Any]:
+    # PDF содержит и основной, и дополнительный эскиз, поэтому в ключ входят оба
+    return {
+        'id': variant.id,
+        'sketch': get_file_data(variant.sketch),
+        'sketch_coords': variant.sketch_coords,
+        'subsketch': get_file_data(variant.subsketch),
+        'subsketch_coords': variant.subsketch_coords,
+    }
+
+
+def get_labels_data(variant, coords_field_name: str) -> Dict[str, Any]:
+    """
+    Атрибуты и базовый состав, на которые ссылаются подписи эскиза (Variant.get_sketch_labels):
+    переименование атрибута или изменение базового состава меняет подписи без изменения координат.
+    PDF содержит и дополнительный эскиз, поэтому учитываются и его координаты.
+    """
+    sketch_coords = []
+    for field_name in dict.fromkeys((coords_field_name, 'subsketch_coords')):
+        sketch_coords += getattr(variant, field_name) or []
+
+    attribute_ids = {coord.get('id') for coord in sketch_coords if coord.get('id')}
+    child_ids = {coord.get('child_id') for coord in sketch_coords if coord.get('child_id')}
+
+    return {
+        'attributes': sorted(Attribute.objects.filter(id__in=attribute_ids).values_list('id', 'name')),
+        'compositions': sorted(BaseComposition.objects.filter(id__in=child_ids).values_list(
+            'id', 'position', 'base_child_id', 'base_child_variant_id',
+        )),
+    }
+
+
+def get_item_data(item) -> Dict[str, Any]:
+    return {
+        'id': item.id,
+        'name': item.name,
+        'marking': item.marking,
+        'weight': item.weight,
+        'parameters': item.parameters,
+        'material': item.material_id,
+        'branch_qty': item.type.branch_qty,
+    }
+
+
+def get_project_item_data(project_item) -> Dict[str, Any]:
+    # сохраненные данные для эскиза производны от параметров подбора, которые уже входят в ключ
+    data = {
+        field.attname: getattr(project_item, field.attname) for field in ProjectItem._meta.concrete_fields
+        if field.name not in ('sketch_data', 'sketch_data_fingerprint')
+    }
+    data['project_number'] = project_item.project.number
+
+    if project_item.nominal_diameter_id:
+        data['nominal_diameter'] = [str(project_item.nominal_diameter), project_item.nominal_diameter.size]
+
+    return data
+
+
+def get_composition_rows(item, composition_type: str) -> List[Dict[str, Any]]:
+    """
+    Строки состава, выводимые в таблице эскиза. Дочерние элементы изделия нужны всегда:
+    по ним подписываются размеры на самом эскизе.
+    """
+    rows = list(item.children.order_by('position', 'id').values(
+        'id', 'position', 'count', 'child_id', 'child__name', 'child__marking', 'child__weight',
+        'child__parameters', 'child__variant_id', 'child__type_id', 'child__material__name',
+    ))
+
+    if composition_type == 'temporary_composition':
+        rows += list(TemporaryComposition.objects.filter(tmp_parent=item).order_by('position', 'id').values(
+            'id', 'position', 'count', 'name', 'weight', 'material__name', 'tmp_child_id', 'tmp_child__name',
+        ))
+
+    return rows
+
+
+def get_sketch_cache_key(
+    project_item,
+    created_by,
+    export_format: str,
+    composition_type: str = 'temporary_composition',
+    field_name: str = 'sketch',
+    coords_field_name: str = 'sketch_coords',
+    vector_root: Optional[str] = None,
+) -> str:
+    """
+    vector_root - для векторного SVG: адрес сайта и язык, от которых зависят ссылки на копии эскизов.
+    """
+    item = project_item.original_item
+
+    data = {
+        'version': SKETCH_CACHE_VERSION,
+        'sheet': {
+            'format': export_format,
+            'composition_type': composition_type,
+            'field_name': field_name,
+            'coords_field_name': coords_field_name,
+            'vector_root': vector_root,
+            'created_by': created_by.last_name,
+            'date': date.today().strftime('%d.%m.%y'),
+            'fonts': [config.SVG_TEXT_FONT_PATH, config.SKETCH_IMAGE_TEXT_FONT_PATH],
+        },
+        'variant': get_variant_data(item.variant),
+        'labels': get_labels_data(item.variant, coords_field_name),
+        'item': get_item_data(item),
+        'project_item': get_project_item_data(project_item),
+        'composition': get_composition_rows(item, composition_type),
+    }
+
+    content = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return f'{hashlib.sha256(content.encode("utf-8")).hexdigest()}.{export_format}'
+
+
+def get_cached_sketch_file(key: str) -> Optional[bytes]:
+    path = get_cache_root() / key
+
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return None
+
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+    return content
+
+
+def save_sketch_file(key: str, content: bytes) -> None:
+    root = get_cache_root()
+    root.mkdir(parents=True, exist_ok=True)
+
+    # запись во временный файл и переименование: параллельный запрос не прочитает файл частично
+    fd, tmp_path = tempfile.mkstemp(dir=root, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, root / key)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    evict_sketch_files()
+
+
+def evict_sketch_files(max_size: Optional[int] = None) -> None:
+    """
+    Удаляет давно не запрашивавшиеся файлы, пока размер кэша больше max_size.
+    """
+    max_size = settings.SKETCH_CACHE_MAX_SIZE if max_size is None else max_size
+
+    files = []
+    total = 0
+    with os.scandir(get_cache_root()) as entries:
+        for entry in entries:
+            if not entry.is_file() or entry.name.endswith('.tmp'):
+                continue
+            stat = entry.stat()
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+    if total <= max_size:
+        return
+
+    for _, size, path in sorted(files):
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+
+        total -= size
+        if total <= max_size:
+            break
+
+
+def get_or_render_sketch(
+    key: str,
+    render: Callable[[], Tuple[bytes, str]],
+    get_filename: Callable[[], str],
+) -> Tuple[bytes, str]:
+    """
+    Возвращает (содержимое, имя файла) эскиза из кэша или формирует его через render и сохраняет.
+    Имя файла содержит время выгрузки, поэтому при чтении из кэша формируется заново.
+    """
+    content = get_cached_sketch_file(key)
+    if content is not None:
+        return content, get_filename()
+
+    content, filename = render()
+
+    try:
+        save_sketch_file(key, content)
+    except OSError:
+        # недоступный кэш не должен мешать выгрузке эскиза
+        pass
+
+    return content, filename
+
+
+def render_sketch_cached(
+    request,
+    project_item,
+    composition_type='temporary_composition',
+    field_name='sketch',
+    coords_field_name='sketch_coords',
+    created_by=None,
+    vector=False,
+) -> Tuple[bytes, str]:
+    """
+    render_sketch через кэш эскизов.
+    """
+    vector_root = None
+    if vector:
+        root = request.build_absolute_uri('/') if request is not None else '/'
+        vector_root = f'{root} {get_language()}'
+
+    key = get_sketch_cache_key(
+        project_item, created_by or request.user, 'svg', composition_type, field_name, coords_field_name,
+        vector_root,
+    )
+    return get_or_render_sketch(
+        key,
+        lambda: render_sketch(
+            request, project_item, composition_type, field_name, coords_field_name, created_by=created_by,
+            vector=vector,
+        ),
+        lambda: get_sketch_filename(project_item),
+    )
+
+
+def render_sketch_pdf_cached(
+    project_item,
+    created_by,
+    composition_type='temporary_composition',
+    field_name='sketch',
+    coords_field_name='sketch_coords',
+) -> Tuple[bytes, str]:
+    """
+    render_sketch_pdf через кэш эскизов.
+    """
+    key = get_sketch_cache_key(
+        project_item, created_by, 'pdf', composition_type, field_name, coords_field_name,
+    )
+    return get_or_render_sketch(
+        key,
+        lambda: render_sketch_pdf(project_item, created_by, composition_type, field_name, coords_field_name),
+        lambda: get_sketch_filename(project_item, 'pdf', SKETCH_PDF_TIMEZONE),
+    )
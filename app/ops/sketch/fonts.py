@@ -0,0 +1,80 @@
+"""
+Шрифты эскизов, загружаемые один раз на процесс.
+
+- get_font: FreeTypeFont по (путь, размер) для подписей на изображении эскиза и расчета переноса строк;
+- get_text_length: ширина строки как сумма ширин символов, ширина символа вычисляется один раз;
+- add_pdf_font: шрифт fpdf. Таблицы TTF (ширины символов, cmap, glyph id) разбираются один раз,
+  документу достается копия определения со своими файлом шрифта и набором символов для встраивания.
+"""
+import copy
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, Tuple
+
+from fontTools import ttLib
+from fpdf import FPDF
+from fpdf.fonts import SubsetMap, TTFFont
+from PIL import ImageFont
+
+PDF_FONT_PATH = 'fonts/ArialNarrow.ttf'
+
+_char_widths: Dict[Tuple[str, int], Dict[str, float]] = {}
+
+
+@lru_cache(maxsize=64)
+def get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size)
+
+
+def get_text_length(path: str, size: int, text: str) -> float:
+    font = get_font(path, size)
+    widths = _char_widths.setdefault((path, size), {})
+
+    length = 0
+    for char in text:
+        width = widths.get(char)
+        if width is None:
+            width = widths[char] = font.getlength(char)
+        length += width
+
+    return length
+
+
+@lru_cache(maxsize=None)
+def get_pdf_font_path(path: str = PDF_FONT_PATH) -> str:
+    from django.contrib.staticfiles import finders
+
+    return finders.find(path)
+
+
+@lru_cache(maxsize=None)
+def get_pdf_font_file(path: str) -> bytes:
+    with open(path, 'rb') as font_file:
+        return font_file.read()
+
+
+@lru_cache(maxsize=None)
+def get_pdf_font_definition(path: str, style: str) -> TTFFont:
+    return TTFFont(FPDF(), path, 'prototype', style)
+
+
+def add_pdf_font(pdf: FPDF, family: str, style: str = '', path: str = PDF_FONT_PATH) -> None:
+    """
+    Аналог pdf.add_font(family, style, путь к static-файлу path) без повторного разбора TTF.
+    """
+    font_path = get_pdf_font_path(path)
+    fontkey = f'{family.lower()}{style}'
+
+    font = copy.copy(get_pdf_font_definition(font_path, style))
+    font.i = len(pdf.fonts) + 1
+    font.fontkey = fontkey
+    # при сохранении документа fpdf урезает ttfont до использованных символов, поэтому он у каждого документа свой
+    font.ttfont = ttLib.TTFont(BytesIO(get_pdf_font_file(font_path)), recalcTimestamp=False, fontNumber=0, lazy=True)
+    font.missing_glyphs = []
+
+    reserved = '\x00 \r\n'
+    if pdf.str_alias_nb_pages:
+        reserved += '0123456789' + pdf.str_alias_nb_pages
+    font.subset = SubsetMap(font, [ord(char) for char in reserved])
+
+    pdf.fonts[fontkey] = font
@@ -1,29 +1,31 @@
 import base64
-import tempfile
-from datetime import date, datetime
+from datetime import date
+from functools import lru_cache
+from io import BytesIO
 
 import pytz
-from django.contrib.staticfiles import finders
 from fpdf import FPDF
 
 from catalog.models import Material
 from ops.choices import AttributeUsageChoices, AttributeCatalog
 from ops.models import TemporaryComposition, DetailType
-from ops.services import get_selection_available_options_class
-from ops.utils import work_with_image, calculate_image_position
+from ops.services.sketch_data import get_sketch_data
+from ops.sketch.fonts import add_pdf_font
+from ops.utils import work_with_image, calculate_image_position, get_sketch_filename
 
 WIDTH = 420
 HEIGHT = 297
+SKETCH_PDF_TIMEZONE = pytz.timezone('Europe/Moscow')
 
 
-def get_witzenmann_logo():
+@lru_cache(maxsize=None)
+def get_witzenmann_logo() -> bytes:
+    """
+    PNG логотипа, декодируется один раз на процесс.
+    """
     base64_logo = 'iVBORw0KGgoAAAANSUhEUgAACcQAAATiCAYAAACeUXLWAAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAAuIwAALiMBeKU/dgAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAACAASURBVHic7MEBAQAAAICQ/q/uCAoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIDZu/c4u8r63uPfZ+2ZZJIQcgEC4SJeULnLLQEvrVFhLonh8LIOHmtra2uL3AIJKmrV7ta2mgMmMxOQphepba1H0uPBC+QCaDxtkVtARS4qlCgqogFyAZK57PU7f0zAAJPMnpm19+959v68Xy9fkiGs9Z1ZM2vWep7f83sAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEBygncAAABeolzO9J0ZB8uyQ1UKh0o6XNJByvNZCmGWFGZJNkvS/pKmS8okzdj9X88a4YjbJOWShiTtkPSMpF27P75DQY/LbIssbFEWtijX42qp/FxTbbPWLNtZ488WAAAAAAAAAAAAAAAUhII4AICP7hVTtL3lNVJ+lLLsKJkdJYWjJL1KsrmSWrwj7rZF0qNSeFRBP5byH0rZj1RpfUAbzv+VdzgAAAAAAAAAAAAAAPAbFMQBAGqv/bNHSKXXKehEhfA6SSdKerWkknOyiXpK0gOSvivTPTLdo1L4gdYu6fcOBgAAAAAAAAAAAABAM6IgDgBQrPYrpqk0+TRJZyjXGQp2uqS53rHqaFDS/ZLdJgv/pSzcqrVLHvYOBQAAAAAAAAAAAABAM6AgDgAwMe1XTFPW+iaZ3qIQ3irpFKXf+a1ojynoVknfVpbfrBuWPuAdCAAAAAAAAAAAAACARkRBHABgjCyove8UlcIimZ0p6XRJk7xTJeZnCrpJuW6WTbpZG87/lXcgAAAAAAAAAAAAAAAaAQVxAIDRda+You0tb1TIF0vhHZIO947UQHIF3SPTNxTCdVq75H7vQAAAAAAAAAAAAAAApIqCOADAyNqvmKZs0mJJ50rqktTmnKhZPCizryrLvqy1S+7xDgMAAAAAAAAAAAAAQEooiAMA/MaCa9s0edsihexdki2SNNU7UlMzPSDpS1LlS1q/7CHvOAAAAAAAAAAAAAAAxI6COACA1NkzTwp/KOndkmY5p8HI7pDsCxqa8kXdfN427zAAAAAAAAAAAAAAAMSIgjgAaFZdfQcpz9+rkL1PsuO846Bqz8rCvyvY32vdJf/pHQYAAAAAAAAAAAAAgJhQEAcAzWbhqtOU5xdJepekNu84mJAHZfpbZeFarV2y3TsMAAAAAAAAAAAAAADeKIgDgGbQXZ6kHTPPlYWLFHS6dxwUbruCrpXCKq1d8rB3GAAAAAAAAAAAAAAAvFAQBwCN7Ozl0zXYdp5Ml0o6zDsOai6XwjcUtEJrl3zbOwwAAAAAAAAAAAAAAPVGQRwANKKuvoNkdqGkiyXN9o4DD/ZfCtlyrb34G1Iw7zQAAAAAAAAAAAAAANQDBXEA0Eg6Vs5VyD4q6U8ktXnHQQzC3ZL+Wmc8eb3K5dw7DQAAAAAAAAAAAAAAtURBHAA0guGOcB+WdIGkqd5xEKV7Jfu41l36Ne8gAAAAAAAAAAAAAADUCgVxAJCyc1bO1M7sgwq6RNJ+3nGQgvAdqfIxrVu60TsJAAAAAAAAAAAAAABFoyAOAFJ06upWzdn1AZk+KelA7zhI0gaF8BGtXXKPdxAAAAAAAAAAAAAAAIpCQRwApKaj70wF9Uh2nHcUJC+X9EUN2od0y6WPe4cBAAAAAAAAAAAAAGCiKIgDgFR09pwohT5Jb/aOgoazTUF/pf2e6tOa8oB3GAAAAAAAAAAAAAAAxouCOACI3dnLp2ug7S8kXSypxTsOGtqPFMLFWrtkg3cQAAAAAAAAAAAAAADGg4I4AIhZV99iya6S6WXeUdBEgr6hUuUD+sayn3tHAQAAAAAAAAAAAABgLCiIA4AYLbzqSOWVv5PU7h0FTespBbtcay/5BymYdxgAAAAAAAAAAAAAAKpBQRwARMWCulZ9QGbLJU33TgNI+k9Z5X1av+wh7yAAAAAAAAAAAAAAAIyGgjgAiEX7qlcoq/yDFN7qHQV4kZ0K4S90+pNXqFzOvcMAAAAAAAAAAAAAALA3Je8AAAAL6jrgfAW7Xgqv8U4DjKBV0pn6Wdtv6TVv/7Z+fOM270AAAAAAAAAAAAAAAIyEDnEA4Kmr7yCZ/aOkxd5RgCptl7RE6y75gncQAAAAAAAAAAAAAABejII4APDS0Xemgn1B0qHeUYBx+He15X+i65du9Q4CAAAAAAAAAAAAAMBzKIgDgHo7dXWr5vR/WmbLxH0YKQv6sSp6tzZcssk7CgAAAAAAAAAAAAAAEoUYAFBfb19xmIayL0vhjd5RgIIMKITLtXZJj3cQAAAAAAAAAAAAAAAoiAOAeulcuUDKviTpEO8oQOEsfFnW/8fa8KFnvKMAAAAAAAAAAAAAAJpXyTsAADQ+C+o84ONS+Lyk/b3TADURdLxCabFe1X6THl7/pHccAAAAAAAAAAAAAEBzokMcANTSgmvbNGX7P8r0u95RgDrZrpD/gdYuvd47CAAAAAAAAAAAAACg+dAhDgBqpavvcLX03yyp3TsKUEeTpXCujlq4Uw+tvdU7DAAAAAAAAAAAAACgudAhDgBqoavvZJm+KtkR3lEAN6bPa0vbB7TpvEHvKAAAAAAAAAAAAACA5kBBHAAUraP3XAV9QVKbdxQgAjerLe/W9Uu3egcBAAAAAAAAAAAAADS+zDsAADSUjt5LFPQlUQwHPOdM7cxuVefKl3sHAQAAAAAAAAAAAAA0PgriAKAQFtTZW1ZQj7i3Ai8UdIyUfUcdfa/zjgIAAAAAAAAAAAAAaGxsmQoAE9VdnqQdsz4v6T3eUYCombYqaLHWXfKf3lEAAAAAAAAAAAAAAI2JgjgAmIjuFVO0Pfs/CqHLOwqQiGcldWvdJTd6BwEAAAAAAAAAAAAANB4K4gBgvNqvmKas9WtSeKt3FCAxgwr2+1p76Ze9gwAAAAAAAAAAAAAAGkvmHQAAkrTg6v2UTfo6xXDAuLTKwhfV0fv73kEAAAAAAAAAAAAAAI2FDnEAMFaLPjdLlcF1kuZ7RwESV5HsD7Xu0n/1DgIAAAAAAAAAAAAAaAwUxAHAWHT17S+zm0QxHFCUXAp/rHVL/sk7CAAAAAAAAAAAAAAgfWyZCgDVWnD1frL8RlEMBxQpk+wf1dnze95BAAAAAAAAAAAAAADpo0McAFSje8UU7SjdIOkt3lGABlWR7N1ad+ka7yAAAAAAAAAAAAAAgHRREAcAo+nqmyzTVyXr8I4CNLh+WXi71i+52TsIAAAAAAAAAAAAACBNbJkKAPtSLmcy/QvFcEBdTFawr6qj77e8gwAAAAAAAAAAAAAA0kRBHADsy20zV0rW7R0DaCJTFeyr6uo71jsIAAAAAAAAAAAAACA9FMQBwN509V0uhSXeMYAmNEtmG9TVd7h3EAAAAAAAAAAAAABAWoJ3AACIUmffuyX7orhPAo7C3dpVerM2Xvi0dxIAAAAAAAAAAAAAQBpK3gEAIDpdfW+W7P9IavGOAjS5uWrJT9LhZ1ynzRtz7zAAAAAAAAAAAAAAgPixZSoA7GnRylfK7N8lTfKOAkCStFCTZ/V5hwAAAAAAAAAAAAAApIEOcQDwnLOXT9dQ602SXuEdBcAegubpqIW/1ENrN3lHAQAAAAAAAAAAAADEjQ5xACBJ5XKmgbYvSjrBOwqAkdiq4e2MAQAAAAAAAAAAAADYu+AdAACi0NW7XKYPe8cAsA9Bj6syNE8bLnvUOwoi0dn7EUlv846RkJ1S2PXCD1lF0vY9/rxNpp3KsmeV2zYF7ZS0XRa2qKWyRXlpi9ZevEUKVs/gGEHnytdL2V96xxiVhb/U+iX/4R0jKotWHqM865Ul/z7+Ga275JbCjtbR+48KellhxwOqZZVLtX7ZfYUes6vvzTL7eKHHrIUQPqG1S27zjpGUBde2acr2r0V/Dw/hBq1d0uMdY1Snrm7VQf1fl4xdTDBOdqXWXbreNUJH7/sV9C7XDPUQ7F+09tJ/9o7RkBaUW9Q260uSZnpHqZPPad0l/9c7REPr7P0DSb/nHaMqIXxPa5d80DtGQ+rs+0PJ3uMdY1RZy+/rxgt/6R0jKZ1975bsj7xjjCof+iPmcgB4a/EOAADuOnr/h0wf8o4BYBSmg1Vq+b9acO2btPF9u0b/D9Dwgt4j0/HeMdIyWh1bGF4yY/bCpTPBpEo2/N939uVSzxYp+7WCPSKFzcrzzZI2y8JmTc0f1vVLt9bqM8BuoXSWzM70jjG6ofO9E0Slq2+yhuzfFHSSd5QJy7W0sGMtXj1Vg7veK8YoUH+5spZaDNC3S4r/Hl0ZjH8SJTZtW0+WZWd5x6jCV7wDVOWAXSdK6vCOgYSZXe4dQUHdSuGeP1F5+LEkCuJqYfKs90t6p3eMurEQ/8KulLVfM0c20KOQSIGl2dGSKIirCXuHYv/9ZNqqGy94XLrQO0li7BzFfm2lZzWw4zHvEADAYDOA5rbwqiOVVz4vOmYCaTCdqrZtPZI+4B0Fzs5ePl0DOsY7RpPKpDBHsjkyHSeZFHb/Gg2SdmVSZ+9jCtqk3O5TpvuV55v0+u0PUmikCwAAIABJREFUqFzOXZM3FJvnnaAKT2r90oelZd454mG2oiGK4aSnNWPuA4UdbWjgZDE+AR8Pau2S7aP/tTEym1/4MYv3GKv1x8Gy+UmMHuSV270jVKUU5stoPIxx69f+237gG8GC1JfCc/nEBR3qHaEhda+Yoh36M+8YdVSR9d/tHaKhhYFPJ1MMN+xwnbNyJgsrayBo/qjrYr0F3cEuFONyuneAUZnu0sbykHcMAMi8AwCAmwXXtinPvyJptncUAGMRzlNnTxpt/1E7/W2nSWJrpXjNlentCuFyWfiCQukHum3WL9XZd526ev9U7ate4R2wAaQw8cbA5p46+94h6QLvGMUId2nNuZXCDmeVFIqH0JDsjhocM8h0WvHHLZiFNAqmYhMs/sknaZe2TL3XO0RVLOf+j4n4ntaUB1wTLOo5WtIs1wx1Y4d5J2hI27Olkg73jlFH39eGDz3jHaJhLVx1moL+0DvGmO1iwWvhFl51pEwHe8cYVRDvJGPVfs0cSUd6xxhVUA3etQFg7CiIA9C82ravkuwU7xgAxiN8Tp09r/VOAVcpFAPhhQ6SrFum1cry/1Zn70Pq7PlbdfS+ReUy7yVj0b7qFUkMbFotCk0S1f7ZIyT7O+8YhbG86EFr7unwcmfhR1zUc3QSXTkC9+jxCQkUcNkmbTpv0DtFdVL4eiJid3kH0FB2hneE+gl0iCvaos/NUgjNtVUkxS+1Uy5nyvOrleK8r2XHeUdoOJVKCos4JIXi38caXWkwkWvL+yaAOKT3YAQARejo+R1J7/eOAWDcpiuEf9fi1VO9g8BJGt05sG+vksJ5Cvqmbpv1U3X29Kqr72TvUEkoJdJNy2pQaJKiBeUWZaUvSTrAO0qBCr62GQVx8JGVih+kr2Rp3KNDxoT0WL3tqgMkvdI7xuhCGpNPZy+fLulo7xhImEVQENdc76UHa0GZLe6LVBn8uJqmw+BudKitndtn/rGkNJ5DX8IoiCtaSGTR2UCexnNrTFLpsJy1cG0BRIGCOADNp/2zRyiEv/eOAWCCTMdrcNf/8o4BLxRPNJjDpLBEZners2+TOnrfr66+yd6h4pXI93+FgjhJ0pTZfyGFN3rHKJRVihvY7FgxW7JXFXY8oHr9MqvFtpIp3KNzyfwLSVLTWjldUvCOUYU0Jp8Gp84TY9OYiBgWX1hopoK4kvbbP/4u1al4+4rDJJ3vHaPuShUK4mph0edmycJfe8cYtxCO9Y7QcCyJ4sjNuuXSx71DpCeFDsv2K9140U+8UwCAxKADgGZTLmfKWr6gZlt9BzSuC9TZu9A7BOrsrFWHSnaEdwzUip2ioL+X2WZ19n5E7VdM804UHUuiEwUDm5LUuXKBzC73jlGwx7ThskcLO1rI5imNAhM0nu9p7ZL+4g+bxD36Qa1dst07RIISmHySlCfS/S+V7haI1bMaeOpB1wTtV0xT0PGuGeptKGPb1KIMZX8laYp3jDrbpnnbfugdoiFVBj8l6SDvGBNAh7gidV9XUtAp3jGqkMYijqhYUBILsOgGCiAeFMQBaC7fmfkRSW/xjgGgMEHSP+zevgjNomWIybPmcIikTyub9JA6ey5ge57duq8rSUpha1kGNrv6DpKyf5NU8o5SqKK3ObIUVjejIYUabCvZ1TdZCicUftyiBTFBMR5mKdyvfq0NFz/iHaJKKXw9Ea+7tbE85Joga5knqbneUSxQEFeE9lVHS+H3vGM4uF3lcu4douG09x4v6TzvGBN0mBZ9jgYGRdn+y+Ml7ecdY1RmjBuNVWfva5REs48avGsDwDhREAegeXT1nawQyt4xABRurlrza7xDoI4sY/KsuRwihavVNmuT2nvf4B3G3TM/P0FS/F3zQgRbWLmyINnnJc31TlK8vNhrG1JY3YzGVPD38rCTJcW/5XdO0fLYWVAIKdyvUrq2PNNj/CyCbZ9DKYWOoMUKdph3hIaQ2XI1WzGlREF+TVhQpqvUCN9Pg4PHeEdoGFkqXXizlJ5b45DKgsKQ1DsJgAZHQRyA5nDq6lbl9nlJrd5RANSCdauzpxlX1zarNF7+UbQTlek/1NXbowXXtnmHcZNKQWho8pW+HX0fkunt3jFqIhS+9cVpBR8PqE5mxRfEWSrPKHlz36PHo2PlqyQd6B1jVLXofFgLZ606VBKFNRi/LPMviLMktsguWgMu9qizhT2nS7bYO4aLnC30CtfZ+x5Jb/aOUYiSsW1qUdIomqrI+u/2DpGcLIlra8pamnyRLICYUBAHoDkctOtjCjrJOwaAWgq9elvPwd4pUGPlciaKJ5pZJtMlatt+uxatbM7Vw2kUW1T0bGvzDmx29sxT0Ke8Y9SIqS3fVNjR2j97hJhYhY8dmrfth8UfNoktNXdpy9R7vUOkp5TCtZUsT6PYoGRneEdA4kIWw0Rr8xXEhUAh60Tl2WckBe8YLqw1hp/bxnH28ulSWO4dozC5jvWO0EDif2413asNH3rGO0ZyLIn3zR/phgue8g4BAM+hIA5A4xueMP+odwwANTdbrVrpHQI1dvvsoyXN8I4Bdyeqkt2uzp6zvYM4SGHw6z5tvPBp7xAuzlw9QwpfljTJO0pNmB7U9Uu3Fna8kEiBCRqQ3alyOS/8sCGFe7Rt0qbzBr1TJCdL4drKNNji3zWrKpbC9rOI1zbN3/KQa4KFVx0p6VDXDB4sNN/nXKSuvsWSLfCO4eRhbTj/V94hGsrA5E+oke5DWaBDXBEWr54qJVBcyJaaY9ddniTpdd4xqsC1BRAVCuIANLbu60qqhH+WNNk7CoB6CO9We09jblGHYcbkGZ43XQpfUWfPBd5B6qb9immSUuiM17yDX627PifpFd4xaqb4QWvu6XBSg20lO1bMlumowo9buES21IyNJdAJKugh3XLRE94xqhT/1xMRs001KWoei0qlSb+HrXGKb+qtXM5k1qhdpEcXlEYH01Sc1ftqKSzxjlEoEwVxRajsPE1Si3eM0RnvJGO1ffZJSmGeM4huoACiQkEcgMa2/bGLpMDWekAzycLq4Q49aEgpTEainkpSuEqdPUu9g9RF1jJPKQxsNuvgV1fvn8r0u94xaqvgQetAQRy8hBrcp0rzlcIWaMGYkB6rU1e3KoVuDJZIsUG5nEk61TsGEhaCfyfE0LTvpWyZOl63zX6vUvhdUisW0vgdlYqS+pRCYczYHKqOFbO9QyTPQgpdjaWsREHcWGWWxrNHzv0eQFwoiAPQuDpWzlXQX3jHAFB3h6pl5196h0CNBDrE4SWCFFaoq/di7yA1Z1kaA5shb76BzY4Vx8maYNvuQgetLcjCKcUdDxiDfLD4grgskcmnCpNPY3bQzpMkTfGOMapUtp76zv7HSNrfOwYSZuZfECed4R3AyWx1r4j/fhib7vIkyT7pHcOV6TbvCA2js+8dkjq9Y9RE1ppCR/y4pVEQ94yefeIB7xDJMaVwbQeU6XveIQBgTxTEAWhcWXalJLpEAU0pXKiOvuZdeduoFlzbJoUTvWMgUqae3QPDjSuNblo79fjU+7xD1NWCa9sUSl+UNNU7So31y+zewo62qOdoBc0s7HhA9X6pDZc9Wvxhkyja/7U2XPyId4jkpDGxmFA3hlIaX09EzHy7EQ93jTzZNYOnZ8Nc7wjJ2THrIkmv8I7hqJ8CiYJ0r5gi2ZXeMWqncqx3gvRZCs9Zd2ljecg7RIJSuLbf1dol/d4hAGBPFMQBaEwLe35bpnd7xwDgpqRgV0kW/7ZVqN6UHSdJmuQdA9HKJPsXdfY0cNFkSGF7hE3adN6gd4i6atveq+bY/uieQgc2K4l0PEQDCrXqohV/QVxIZEvN6CRREJdON4Ysick8xGuL1i3d7Jogla6RtVLJDvWOkJSzl0+X7HLvGM6KfY9oZtuzj6ihiyvDcd4JktZ+zRxJR3rHGBXvJGN3zsqZkl7tHWNUoWbv2gAwbhTEAWg8C8otysM1kiiEAZrbm9TZ9y7vEChUs25Lg+pNVQj/Pjzp0GAWXn2IZEd4x6hCcw1+dfW9U9Kfeseoi+IHreMvHkKjKr6zUPuqV8h0cOHHLVreZPfoogRLoSA9nW4MqXTcQ6z8t0sNobnfS4Md5h0hKf1tl0thjncMVxS/FOPM3pcphA96x6gpEwVxE5H1p/H7KTfeScaqvzRfKcx3cm0BRIiCOACNZ/LMD0iivTYASbpSC67ezzsECmJ2mncEJMD0ag20Nd4WIpWhFCbjpVoUmsTqzN6XyWy1d4z6CUVfWwri4CPUoCisVEmjwCcwQTFmZ66eoRS6MSiRYoMF17ZJdoJ3DKTM/AviTKk8l9eGiQ5x1Wq/Zo6ClnjHcGepbOkduZawStJU7xg1RkHcxKTxjm0V3knGKk9igQ7vmwCi1OIdAAAKdebqGQq7Plm/E4a7ZflN9TvfS87foaCT/M5fK+E7svz/eadQUCaFy9SIBeRBf6vctjmdfbJCuLRO5zpMU4Y+LKmO9wXUUBorHRGDP1Hnyi9p3dKN3kEKk4X5MvNOMbpS3hyDXwvKLWoJ/1uy2d5R6iYfKm4iq7s8STuaYptZxMc0kG0q/qhJdLwyDbb4F5KkJts5XwoJvA8mMvk0afspklq9YyBhFmK4jzX5e2mgIK5aYaAsqfG6l49VHm7zjpC89p6zJDvbO0YdzFXHitlav+xJ7yBpSuKd5JfacNmj3iGSk2m+4h8S3KYztv5Y67xjAMALURAHoLGUdn5UCgfV8Yz9Wn/pR+p4vhfq7HtEsr91O3/tXKn1l37FO4QkqbPnLVJotK5UW3T6UxeqXM5dzt616q2yvF4FcZJpmTpWXqP1Sx+r2zlRvI4VsyW90jsGkhGkrE8LyqdoY3nIO0whzFIY2HxCN1z6iLTUO0ftTZn11zJ7vXeMOnpS65c+LC0r5mg7Zr5O0uRiDgaMQdBDuuWiJ2pw5BTu0T+u0efe2LLsdCUw+6SsJY2CuMxOT2G3J0Qsz3y7Eb/tqgOkSnO/lwY6xFVl0cpXqqI/9o4RgV9rw8WPeIdIWnd5knaEVd4x6iZrPUbSf3nHSI8FqS+FDnF0jByf+K9t0B1u800AsA8JrHAEgCp19R2uEC6u70lt/u4iDSeV9X7nrpmKSi3f8g7xvJBt8I5QPLvJ9eXE8rPqfMZpCuHP63xOFC1rPV3MnmFsTtCU2e/1DlEMCzKlUJx9uxQSqBqYoM6eDpk+6B2jzu4o+NrGP5iLRlV8IUX3dSVJJxd+3OKlUTAVnQQK0k1bdeOFP/aOUSXu/5iIX+qmi3/hmqA09Ho1+3up6TDvCEmoZJ+WNMk7RgToDjdRO2Ytk/Ra7xj1k7Nt6nh09r5G0izvGKOyRLoax6Rz5ctlOtg7xqjMKHYEECUK4gA0DrO/kTS1zmctSdlb6nzO31i3dLOCUhn4rlK4Qzdc8JR3iudZxXFL3BoJ2c2+51e9C+IkhT9WZ08TDR41IMvjn4xEfMw+qe5y+pMQ7Ve9VkEzvWNUwbdjRz20XzNHCv+kZnuXLn7QmoIIOAnF36ee+fkJkqYVftyiBQrixiUk0P0vhIQK0pPYygvRCv73sUyne0dwR4e40XX0vU7SO71jRCHQDWpC3r7iMEl/5h2jrswoiBsPS+UZK/P/XZ4ayxK5tk0wJgggSc01iA+gcS286jWS3u1y7iyc6XLe55garGDL4urINn3brZKe9o5RqMqg3/fM4isPlLl00GiR9DcO50VxKJ7AeBypHbN/1zvEhJUqqQx+NfbAZrmcqTTwr5IO8Y5Sf0UPWqcyWI+GU6lBR4JUJijywIT0WC286sgkujGERDptvO2qAyQ191aTmBizu7wjSOEM7wTu6BA3umBXirm3YTx/TMxQ6UpJ+3nHqK9AQdx4ZEm8Y5umVCL4XZ6YNK6tZEZBHIAo8VAOoDHklU9puOCl/kydLud9TsgbqyAuZHF9PmvKA5K+7R2jQPdrw2WPup19cNJZcnv+CO9QZw9FVckyrh3GyS7wTjBhqaz0zSc19sDmd2Z+RObR5TQC1lrcwObZy6dLOrqw4wHVG5IGvlf4US2BDmLSgDIV/7k3ukoljU5QtSj0rIXWyulq9q0mMTFZ5vysaUGm03wzRGGqzlw9wztEtDpXLpDku3g6HhS/TERn75skvcs7hoNjvQMkySz+dxLTg7p+6VbvGMkxS+Gd5Cdav/Qx7xAAMBIK4gCkr733ePm2oX+5OlYc5Xb21oFbJA26nb9Y2/WrSfEN5jdSFz5z7sAXzLmQIDTXNgONYtHKV0phjncMJGueOlae4h1iguIf2JT+WxvO/5V3iJrp6JuvEMreMZw8Uui17W87TYxFwIPpB9rwoWdqcOQU7tHf1dol/d4hkpNKN4ZKMtsTpfH1RLwqLZtcz9+x8lgFzXTNEIvWfrrEjciCQnald4qIPEDxyzh1X1eSdLWas5B8rjpWzPYOkZTu8iRJr/OOMarQ4LsK1MLwvcBjt50ximBbewDYCwahAaQv01/J+34Wsna3c3/t8h2SGqX9/C3adF58xX0teVzbuE5ECL7Ffea8xbB0thauYkV3avJAdzhMTMj+0DvCuHX1TZZ0oneMKjTu4Nc5K2cq2JcltXpHcWGFD2xyT4ePWkzAtF8xTdIxhR+3eI3yvlhfaXRjeES3XPq4d4iqpNC5BDH7ifvii5CxXepzch3qHSFKXb3nynSqd4xomG7zjpCs7Y9dpDTGAWojlOgSNxbbZ58kabJ3jNEl0tU4Js/8/ARJ07xjVCGVBToAmhAFcQDStnDlSZLO9o4hy3y7XnkXORUl1s/jhqUPSMFvm9HiDCgf8Nv+tavvWMmOcDv/sKA8/5hzBoyVhRQmIxG3d0iW6srqk5XEwGYDD37tyq6R9HLvGG5CwYPWgYI4OLEa3KeylnmSWgo/buGYfBqzZLoxpFLsaEGBRS6YEP9nTct4L31OllMQ92Knrm6Vwqe8Y0QlS+V3VGTar5kjqewdw1c4zjtBWvI0Fh1kJd5JxsqyRK5tzv0eQLQoiAOQtjx8WDG0Dg/2Vi0oe06ENEYHs3wozoI4STKLN1vVwq012iaqOrn3dqnPO0edPc27yjJJdJPAhB2mhVeluVLfktlerDEHNjt7LpD0P71jOCu6IC6V72k0mqKLO6V0JigqgQmKsUqmG0MixY5dq14p6UDvGEhYCHd5R1BIomtkfVhgy9QXm9P/fple7R0jKjnPH+NSGvgM2zPndIgbixBSeCfZpWlPfN87RHLSGBOs6NnWu71DAMDeUBAHIF3tq14hhW7vGLvtrykH+A2M7XfInZKedDt/MTZr/bKHvEPsVVADFMSZb+FkkN/Wwi8UpPBh7xCo0oJyixRS6M6B2FXyLu8I45NEQWhF+cA93iEK1957vBSu9I7hbKjQa9t+zRyZXlbY8YDqPatdW+8v/KhZEhMUT+qmJfG+Z8UqL6VR+BIS6bSRxmQeYmbmWxB39vLpkuhY9BtzvQNEpf2KaTL7hHeMyDyj/ifv8w6RnIWrTpPpD7xj+KND3Bgl8JwV7tGa8oB3igQlcG11nzZe+LR3CADYGwriAKQryz+omLansdyv+9WacysK+pbb+YsQtM47wj4Nlm6SlHvHmJDcsZNgd3mSpN92O/9LvUtn9jIhn4LJM06UNNU7BhpA0Ju8I4xLCt20TPe6diCthfYrpinoOklTvKM4K/ja9sf//YxGdbc2locKP6ql0I0h3CkF806RHEuiIH1QLZPSKEi3RLbyQqxMbfkm1wSDU+dJKrlmiIrRIW5P2eSlokjwxe6qybNXIyuXM+X51WLeVqIAuXrnrJwpJdCdshbduhvdgqv3k5RCt0SuLYCoxVNIAgBj0X7NHGngfd4xXii0Syq7nd7CTZL9jtv5J8pC3B3YbrnoCXX23C2F07yjjNMWveGpe9xK4p4+4E1Svp/T2UfSohZdLOlD3kEwilCaJ0U9h2uSPiuzineQEWXZNJlNkrS/FEqSzZJpkqSDFDRH0gHOCevpDHVfV9Kac+O8ViPpWDFbpqO8Y4wqNODgV5jUp6BjvGP4K3jQOmheoccDqlf8fWrh1YcoHzqi8OMWzXK2KxuPTPPjfgSVpHCvvn7es94pqpLGVl6IVdBDun7pVtcMlqfRNbJuwqHeCaKx+MoDNWgf9I4RnSCeP8bq9lnvVxrdoOrhEC2+8kB9/YNbvINEr780X7L4iyjzBhw3qrW2gdOkLP5ifIodAUSOgjgAacoGzld0HTtsvs5ZOdNtkC4PG5RFP2K/NxW1Vb7pHWJUIdsgs1QL4m5WuezX4c7yM93OvXd/oq6+T2ntku3eQbAPZvMVvEPsS3hY65akW1jZ1TdZ0qtk+VEyHS9l8xRsnqRGXPG/v555/FhJ93oHqVrI5klx/wRIkkx3ekcoVEfvuQr6I+8YkSj22lIQAT/F36cqQ6cncIeWlDFBMVZnL5+ugQSKolOZfDp1dau062TvGEhaDM+aFMTtKYiCuOcMtn5M0gzvGNGxQEHcWCz63CxVBv/KO0ZUBiYdI+k/vGNEL5lt6StpPLfGxLLIx8R3y3nfBBA3CuIApGd4MPU87xgjKGlX6a2SvuJy9g0XP6Ku3h/LEmiR/RLhDvfVvtWwyk1S9jHvGOMSnDvwBbVH2GFhhszeL2mFdxDsQ+zdOVKZiNybtUv6Jd2/+39fe/7j7b3HqxQWSdYt06le8QpnlbQK4iykMfiV+s/Bnrr6XiWzv/eOEY284ImsoM2ysKbQY8Yq2DHDhcbRWyeFHd4ham7Ibi38mFmYL4v5IWU3a42hkCQt/W2nKSSwNWIqnTbm9B8vi21B4whC9jZlQ5u9Y2AEQxbDeBEFcXsyzVW5nLkuvIzBwquOVF65wDtGlFqGKIgbi+FiuIO8Y8TFjhMFcVWwFArintT6pQ9Ly7xzpCX2MfFhz6r/yfu8QwDAvlAQByA9B/W/U9Jc7xgjCnaWvAriJMl0k5RiQZx5beQ5NtO33aods56WFNPWn9WpDPoVxC2+8kANKtaOABeqXO5p+kHcWKXQnSOVicix2nDJDyT9QNJydfbMk8LFkt4jKf5tGPbFQtzfTy+WyuDXrq33e4coxKmrW2W7/lXS/t5RIvG0Zsx9oNAjrr3k/EKPF7POnmulEHtB3KCmV96hNct2egdJkiUx+fSINpz/K+8QyUml2DFLpvvOGd4BqrBNpz+xkfdCjKh91Suk/BDvGJFp1X/MPEjS495BXOWVv5A02TtGfMKj+sayn3unSEZ77/GS/tQ7RnSCjvWOkIj4d7Mxu10KCTxcR8bCfMU+KGi6SxvLQ94xAGBf0p7QAtCk8gu9E+yVqdP1/CH37QI2XiFLI/ea8oCkb3vHGIf7teGyR93OPjjpLMX7zPFK3TbzLO8Q2IuBSadKkXfnSGcicvzWXXqn1l3yXmX5qVLY6B1nQiwc7R1hjOZ5BxhVIw1+HbTrM0pj0r5Owl1ac27FO0W6Utge1r5HMdx4WZAlMPkkNf5zSi1YnsDPr3bo9Ccf9A5RHYv/eUa6k2I47FWW0x1uJJOy5t42dbiI6fe8Y8TJeP6omgVluko0LxmBHeedIHoLrzpSsTaO2FMIjbmYuJY6Vs6V7AjvGKMKDbpQHEBDiXVyGgBGtnDlSVJ4o3eMfXi5OlYc5Xb21oFbJA26nX98tutXk9J5cB7uwpcWc+7AN9w5MWIhxi2YIUmhFPvEw4Cke7xD1M2NS7+rdRe/VSF8RFKaRTIhgcGk53SufLlMB3vHGFWjDH51reqStNQ7RlQaaSvcejt7+XRJCRTgMjExbu1XvVZBM71jjI6f4/EJsT+DSrJ0Crgsga0mmajFvpjF/z3sIVdzF8SV9GnFvoDPS6Agv2qdve+R9GbvGFEKgYK40eRDKSzikNQg40b1lCXw/CxJpju9IwDAaCiIA5CWPIt/m6WQtbud+2uX71BqXQAsfFObzkuniK8lT2N71xfIbnY9vSnygjgt1ttXHOYdAiOJvZuEfV9rl/R7p6ivYFq7ZLmkszVcEJia+AvMnhNSmIxXYwx+va3nYCm/VlLwjhKVnEKacRtom680xlu4xuOVSregvAk62RbtrFWHSkrg3SCRa5tMgXAl/ecZ1E7IYrvnx9GdObME7pU10tn7Jpne7h0jWiysqc7Zy6dLYbl3jGiZDtbiKw/0jhG3FLqSS8on3eUdITmWpXFtS6U03kkANLUUBmgBYFj3iikynesdY3ThTOcAvsVPY5UprQKzG5Y+IAW/7UfHbkD9Jb9tXrv6jpV0uNv5q9OiodL7vUNgBLF3kwjZbd4R3Ky75EaF/F1Kr1NcOgVxyiIvCN0t5GlPdpTLmVrDF5PoxldvVkn72vpKY/A6zxi8Hr8U7tGDmlFpnk62RSlZGltnp/L7d3DqPKUw/jzUksbXE/XXXZ4k2SneMfbwE0k/9Q4hSbJm7hBnn/FOMCzc551gBEMaGtzkHSIJA22flJr556gKlZZjvSNEzZJ47/xvbTj/V94hEpTAtbVf6caLfuKdAgBGE/+ABAA85+mWd6SxLY3eqgXlFrezh7De7dzjkQ+luAVpQpnDrdp44dNup89j3y71ee9TucxzUUw6Vs5V9MWUeXN3kli79HqZIpkIqNp+WnBtm3eIqpglMPilX2vd0s3eISbk9tkfl/Q27xgR+qU2XJbSAoC4WBIr9bfpDU/8yDtEwhK4xuFerVm20ztFcixP4NoqnQKuNL6eP9NNF//COwQi9czMkyVN9o7xPAv3SLbZO4YkyUJzFvJ09pwthTd6x5D0tIK+5R1iBPdqw4ee8Q4RvbN6Xy3pYu8Y0asECuL2pvu6koJiKtjemzSeWaNiQaZTvVOMLpGO1QCaHhO/ANJh9j7vCFWaoSkH+HU12u+QOyU96Xb+sdms9cse8g4xZkEJFcSZbwe+IL8thMfmSN0++7e8Q2APWeTd4STJEtuiuhay8ClJP/SOMSbTdk7xjjCq7uuD1DJWAAAgAElEQVRKUgIDmyHxn4GOvt+S2Se8Y0Qq7WvrLSRR0HqnyuXcO0SSuvomSzrRO8aozPg5Ho+QQkFreDShAq4Evp4NsP07aqcS4uoaGey7CiGObizBmq8grvu6kpT9jXeM3T6rPH+Vd4iXMDVvJ/2xKKlPMRXbxioLx3lHiNaOXxwnaT/vGKNjC+UxW9RzdBqNQQLXFkASKIgDkIauvsMlLfCOUTXL/bpirTm3ItlGt/OPRdA67wjjMli6SVIaE4i545a03eVJkn7b7fxjZfb73hGwp1LcW5GZtmrdJXTWWbukX6bLvWOMyVB//B3invn5CZKmeccYXUh3AnnR52Yp2L9I8uvqGzNj0Hrc2j97hFLY+oii7omIq1vQ3gQmKMZsuGN0/N0YQlL3aArikLZgkS3UsntkiqMgznSYd4S62/7YeyWLoUBni4baViqEyL4/lf6iqXro6PkdSZ3eMZJgUfy8xSkksJBYknK6iI1ZpZTGtQ10/wOQBgriACTC/kBSyTtF9YJzV6zMtytYtSwk1GltD7dc9IRkd3vHqMIWveGpe9zOvn3WG5XESrXnvVPdK+LvHNUsLLaJhxcJukMK5h0jCq9/6utSJJMy1QgJFDFYlsLksZQnNSG/BwsaGvq8pCO9k8QrS/TaRiCU0vj5pQBk/CyJAh8mKMbj1lnHStrfO8ao8kSubcfKuVISBTNpfD3hJLIOcXnlHkmbvWNIar4OcQuubVOmsneMYeFTynYdIWm2d5KXyDOKX/ale8UUhXCld4x0UBC3V3kW90LiYYOaUfGbm0iVJdFx3jSQbfIOAQDVoCAOQCr+p3eAsbH5WvS5WX7nr6z3O3fVKiq1fMs7xPglUcx3s+tWWEF+nRLHZ4a2lxZ7h4Ce685xmneMfTIKCZ43fJ/5J+8YVTOLvyNYGsUWpqFSmj8HXX0XKdg53jEiZppSucs7RLKyFLZblJRnaf78RiGJCYodOv3JB71DJKeUyM9vlkinjZDFVUg0MlNbzmQeRtZ+zRxJr/COsYcntOGyR6U8ksVI4aDdOwM0h8nbLpTpZd4xJG1W0GqV9AbvIC9h2qo3PEEn/X15uvRRSS/3jpGOMEeLrzzQO0WUQgrvJOFerVm20ztFcrIkxgR/PNw0AgDiR0EcgPgtWnmMTMd7xxijkipDb3E7+7qlm6XwkNv5qxLu0A0XPOWdYvzy+LvwBeeivSDnTonjEMJ7vCNA0u2zj5Y0wzvGPqUyEVkvFm70jlC1VqUwGJfA4Fd4OMnBr4WrTpBpuXeMqJke1PVLt3rHSJYlUFAT9FPddPEvvGMkK6Rwj9YdrgtjUmV5Ctc2V+vOFLqVSyk8z/A7D/uS9cdW1Pnd3f+/2TPEHoKemnWId4i6OHP1DIXwUe8Yw+wTWrukX3l4o3eSlwg8f+zTopWvlOlD3jH24QbvACMamkSXuBdbvHqqpPi/LiHVXQUcLbi2TaYTvGNUgWsLIBkUxAGIXyV7l3eEcQnm3B3LIi/Yij3fKKZvu1XS094x9qky6FcQt/jKA2U62e3842Yd6uqLf5ukRpdCd6yBnBf/Pe3/5Hcl9XvHqIq1PesdYZ/ar5gm6RjvGKNKcWCz/YppyvPrJLE99r6wzeL4lcuZZKd4xxiVcY3HrWPFbJmO8o5RBa7xeFg43TtCFe7T1y7f4R2iOkl0LqFbJvYuZLHdE4a3ndu17WeShnyj7NaSp7At8sS19n9Y0gHeMSTdqzO2/pskKcTYIc5u844QtUpppaQ27xgjs28qt17vFHtxrHeA6FR2niYp/t0Pct5Jxqxt68mS4u++yrgRgIRQEAcgBd3eAcbF1Ol6/pDHvaVnyOLON5o15QFJ/887xj7cP7yVhpPBSWcpzeeMyVLe5R0CNs87wSh+olsufdw7RFTWlAdkz3csiNszU+LuEFeanMbAZooTyNmkqyUd7R0jfgkWO8bijgOOk5RAYX3gGo9XyOZJCt4xRhUo3B+zxaunKiTRmT6NLsXlciaF07xjjC5P73kG9WN5XB3iQhh+39pYHlJQHJ1eLRzqHaHmOlbOldkl3jEkSSG7XOVyPrydr8VXoB/opL9XXX3tkp3tHWMvKpKWKrMfewcZkVn8ndDqLYWu5JKkCu8kYxVKsRXjjyzFRbIAmlaKE9UAmkl77/FKdxXQy9WxwnFwovRNxbJi9KW2aecT6Q+SmCLucmc3+57eznQ9/0RY9jveERB7NwkKCUYU9BPvCFUY1Mb37fIOsU+5pTH4VUls8Kur512S/sA7RhKyUlrXNiZ5JfLfX7tlefrP4V7i6xY0sqEWfo7HanDXKUqhID2Vyafv7H+MkigQztL4eqL+4izqvOf5f8oj2TY1a4KCuBD+XNI07xiS/kNrL14rScoG4tsuVTK1DnJPHUl3eZLM+rxj7JWFz2vdpd/XGdt+KinG8ZJU54ZqJ42CuB3a//AHvUOkJ/pF4pI0IMvSWBQNAKIgDkDssnCOd4QJyVr8tk1du2S7ZLFOdn1TG8uxFutVLwvxdrmzzLdYLwTnLYMnwhZp8eqp3ima1oJr26RwoneMfWMbkL3Y6h2gCnF0UtiXoBQGvwY1o3LP6H8tEh0rjpKFv/OOkYh+md3rHSJdSUxMVPRs693eIdKVwgRFeFQ3XRz/77vYWCIF6XkqBVylFO6HA8r0Pe8QiFR8XV93aueTP/rNH8NmtyR7MjV2QdxZva+Wwh95x5Ak5frI8/8cQoQFceFhff2DW7xTRGnHrMskvdY7xl48LVX+XJJULucyPeKcZwR0iHup2BcSS5LdqTXnVrxTJMeUwjvJd7V2Sb93CACoFgVxAGK30DvAhORqdz1/cC6K2ivn7mVFWbvkfin4bUu6dwPqL33b7exdfcdKdoTb+SduqgZ2JVzQl7i2rSdLmuQdYxSJTETWmdlT3hGq8FPvAKMKSmBgM9yrNcvi3nr2OV19kxVavqy4JjRjdg8DmxOSwuD1fdp44dPeIRIWf0FcKh3EYhOSKGh9Vv1P3ucdokrx/6wwmYd9sUpc26Wavv+ChaWZxdGdu9G3TC2Fv5bU6h1Dsq9owyW3/uaPeoNjmL2IdlG2r66+wyV9zDvGXpl9WuuXPvb8n0OIcNvUMEddfQd5p4hG+zVzJB3pHWN07K4xZh0rZkt6pXeMUQWuLYC0UBAHIF5dfQelsdplH4K9Vaeu9hs4sUqcHcwsj7RQbxzMYvwa/5fzRKdvIWgRMnV6R2hepdgnz4bU2kZnnZGEEOPWGi8UFGMR828svPoQmV7mHWNUSRVb2HLJTvFOkY6Urm1khrvLxt+9wAKTlePVufLlMh3sHWNUXOPxir+g1XRXMp3WQ4j/6ynd6R0AEbPIvoeDvXBrMoukIC7YYd4RambhqtMke6d3DEkVhewTz/+pq29ylO83QTx/jCTXlZL2846xFz/TpCk9L/hIUIQFcZLYNvU3SoNx/X7aO8YWxiprPV1S8I4xupxnaABJoSAOQLzMFkoqeceYoP01Z8CvqG/6YXdIiq1jz2atX/aQd4jCBMVYEOebySz97mpGQZyfyAuhTT/Q18971jtGpKZ7BxiVRd4hrjKUyMBmSGPwq7N3oUxLvGMkJaSyFV+EBvpPldTiHWN0FD2OWxoFPlJg8mnMUum0ERLpvrPg2jbJTvCOUYU0nmfgI8RWJJvd88I/s2VqzeX5ZxRHYcK1wztU7GY2T9Jkvzh7YXabd4TodPa+ScHO9Y6xV6bLXzK+ZZEWxFke/8KjerE87nHT57RUeCcZK8sje/bYC6MAGkBaKIgDELO0t0t9juV+xUFrzq1I9i2384/I1nsnKFTr4M2Scu8YL5BlfgVx3eVJkt7sdv7ivFyLVh7jHaI5RT7ZnMpEpI8EtqQM3/dOMIrYOyQOqyRQUPP2FYdJ+oLimMRKx1AC1zZWmcX9++s5SXV4jE2Wwj26otaddLIdq1Q6baRStDxp+ymKYovBUZTyNL6eqL+zl0+XKa7xgCx/UYe4SiQd4hq0IK6rr13S27xjSNqlfOgvX/CREN7olGVf+hWy2N+162tBuUXS1Yr3ffQOrV/ypZd8NMotUyUp0CHueSGFgrhf6BvLfu4dIkEpvG9u0xlbI71PAMDIKIgDEKdyOVMcAw9F8O2WZSGyDmZZ42yXKklf/+AWBd0z+l+smyc0/wm/SbDts94oaZrb+YuUlzq8IzSdjhWzJXuVd4x9SmUi0oOF+DvEKY+7SCC6ThQjeloz5j7gHWKfyuVMQ9k/SzrQO0pintRNSxqni2+9WRKD189q19b7R/9rGJElUfR4n752+Q7vEMlJpdPGYCIFraUkJmp3aN62H3qHQKT6p5yuuHasqKg05d4XfGT/7T9VHIszZ2jB1bFuBzlOFiT7G+8UkiSzXm247NEXfkxvcEqzD+FurV3S750iKlNmXyTpRO8Y+3CZFOwlH60MRFroEugQJ2n4/qRTvVOMjo6RY2dBUvzP0EF3qFyO4fkDAKpGQRyAOH1nxkmSDvCOUZD5OmflTLezt+QxFaBV1Fb5pneIwpni+RpbuNn1pSQ4F4AWiW1T6y9k8xTv6tlhKXTG8hIs9uKjHXGvYrQg02neKUYX7hruQBux22Z9Ugpv9Y6RoDtGnBRBteIvljLdpY3lIe8YSeq+riTpZO8YVeA5ZTzS2A73l7r5kri3fn9OGgWGTOZh7+Lr+vrDl2xruKY8IOkxnzgvMtUaq0tcZ9+7ZBEUnJi2Svn/etEHg2Sv9wm0D5bTSX9P7dfMUW5/7h1jH67Tukv+c8R/s2HZzyTtrG+catjx3gmisPDqVyuJObPAtvRj1bXqlUphUWfO+yaA9FAQByBOWdZIk5gt2lXy+3xuWPrfUoik20e4Q9cv3eqdonCmeLrwZc7FeUHtrucvlP3W7i1gUS8hi23i4cV2RN8Zy1dc2wq9mOmeqCc+2696rYL8CuirFft2iwt7flvSx71jJMkiv7Yxa79mjqQjvWOMim2/x++Zn5+gFLogx36PjlIqBelK6Oc3iQ5xTNRi7yy6Ive97UoQx7ap+WDjFMSdurpVCp/yjrHbp7V+2ZMv+Ehn72skHeQTZx9CSOh3VB1k/csjfrcfkFX+bO//OpiCHq5fnKodqK6++L73661Sie3308gspefWSNj/Z+/e4+wqqzz/f9Y+VUkFck8EEUQugnIVSQII3Rol1AWUH05P6LEvtvZMm2khlQTx1nbrsdW2EU0llaCT6Z6mx9GelvTMMM1A5QadtruVuygiIgjhIiIQyA1Sqaqz1++PCkiSOnVue5/1PKfW+/Xq16slVc/+Vu2qU/s8e+21IugOB/5+0zkXJS+Ic86FSXm3dYRMiRqPTdVACrY0nE5qWZr+4r8Be6xjAFAatjvX7/vqXDSKzhnVOow9s8+2DjGhqIb+5j/8zlhWulbOBsK+EZLIrdYRxlUohf7zv1/AT/pe8vVZqPwPwhpxFQ/14oC6FYbjuDHhY7/rp0kcr9F+86l2o8UFs6xjVBRL0fLoNeEJ1jEqC/h6xtmTwG5KC/eV+e/bmhukDE3Cfh9Yi7mDHwF9s3UM4Gkmdaw95L+qBDguFUgTv/54xcVr5oN80DpGWap9bLxq/AfnlTA762vJx6YKC6wjVCElkXusQ0Qnjg7LoOrX0M656HhBnHMuPAuLbcBvWMfIlPXoRQmkg5kkYeTI2uioiu9ax0B5kE0fe9Ls+MPti2i9a4t3WQeYWDT0jR3f5C0naTvDOkJFKRusI4wvCf3nf5QkgW5+qZAOfxPlWOskB9LbgH+2TlGVkhfE1S2WzevhSApqQhTHE/svM7jjJ9YhoiPBdYIqI5KC1qT9XECsY1QkPu7JlXFJ3wkoR1rHOICW6xAn25qaoxyRo60jZKLz2sORUDpN62cPGZMLIFxgEKYCfZZNSx+zThGEYjEhTa8j3L3R5yhN+XLFj5JQC+ISL4iL4j2JPMhA7y7rFNGRCDosC0+wcUUY49qdc64GoV6YOecmssNmzgOmW8fI2HF0rbR7wnCk4zZgxOz4o3ayd3vrFpOo8ahSADHuBKjYdkLMg+o7rSNMGJ1rjgc5wjrG+LyTRFmqYT6p/mvP844X7rYOMS7VGG7IP8MtV4Yxmulg3auXo7zXOsZBnmK47XKE3dZBqvAYty7/lXWIaInE8fu7ZdkT1iEiFv4NCuVuthat3/PFRyO4+QTKlFLY1zGv0DSG18NfMtD7lHUIF6iR5DzrCIdoH/7h2P+gYVyXa9oaHeJk0lXA661jAA8xuOO/j/kvSoDvu31c6qtun/1HhHzNKPI5tizZWfHj0kAL4oRTrSOYWlychHCWdYyKVP01oVbz1rVDBFN31B8occ7FyQvinHPh0eQd1hFykbTZFQttWbITzN+M3NbSN2gSse9+p4ltUZ5I6xXEwW+w+AYfvdcMMYyL9E4S43m/dYAKNlAsptYhyurpnwycaR2jMgnzd6Bz9TyQyk+6N9cIkvwHbr1yO0Qw1kQDPbdRUEGZb52iCtbvBeLVee3hwCnWMSoS8/d7sQr/GlT5KTeu2GEdo0ox/M3z3xVXnoT2kIo8yU1XPz/mP2kgBXEi8RfEve+rcxGuto6x36fH3D+95OuzEN5ikGd84teYwOj5Qb9oHaMs5UH2vvBXVX1sImEWxMHE7hC3a/ZZwGTrGFXwh4lrNWfwTGCKdYzKfN/IORcnL4hzzoUnlpFDtUrpND2+GBdLoVtsj5+zgd6fAJZPmQ+xr2A3ku2SvlNA32h2/PxMZ9czp1uHmBA0+O46T3sniTLeu/JoCLwYJNVvWkcYl6S+sVmvhddNJeHbhPb9E4oMLP03OtccH9zYrbGIj9KsW/fqk4FZ1jEqUj/HdStMng+0WceoSCIZqRmSWArSo3ooQ8O+JgQgDe96xgVEQusQV2ZcKgDbmhWigvgL4obaPkMY00ruZEPvjWP+y/DQBYR4P0+53TpCEErDXwTmWscoK0k+VvWD6iNeEBemSO6ZJf7gQc0KUXSsjuw9iXPO/Vp4F9DOOYe0Zoc40ffsb39sQ0vG4zRT+5GieRMMv8fyPbZescfs8Gmhy+zYudPwuxy0htC/z76hU85I2+8AYh2jPHmS83fcap1iXGkSekHoqBA3vzpGvgHBdUr4Z6Ye9ZdAHN0vR4V3bmMhxPH7ixdL1S0NrVtQGaVhv1ap3dsJraB6LBLJjcWe/hNBjrCOUZEGWODvwjBaJPs26xgH0vIFcdPSJwBtXpayjrYO0JCL174JkT+2jgGA8imQsc9pIhc0OU01UkY64hjpnaeL15wBfMQ6Rnl6GwNLB6r+8M1X/hKw22Muby6d3wj/OiMvEkXR1CDPTv6xdYjoxNEgpET73nutQzjnXD28IM45F5bRNzXHWcfIyXTmDNoVfEw7+k7gRaOjb2PjVY8YHbt51HBsqqbGBY/aiuNSR0kMXQ4it7DYxugNyXDFciOy2Xr6J4Mut44xLtVvBj0uFYik8FYZSu6xDnGArtUfBn7POsZBnqOU/A7rLy8BoFFsWpdIh8brPuLGlcTx+zul5Dcr6yXBF+0DPMOmjz1pHSI60RQ7RtLhUSMYPwtK+yR/PXRj09LZhFYkK+l9Zf9t/VV7EZ5tYppy3gAa8ANSFaSlLxDGeb+Fjcv+qey/Kuc3MUuV5EG2LNlpncKWCqV0LeF2Ey6RFGrcsxEFfp5LmkbJ0ETuEhfBdZbewz1Lhq1TxCeKfaMH+MdP7rYO4Zxz9fCCOOdcWArDcWxI1ysxHJu6/vISaPmNlVzpRpvjNln70GbApuiiULDrwLe4OAl4p9nx8ybiBXF5O2zG6cDh1jHGJ95JYiya/kfCHpEzjKR/bR2iCjFsfj3MrVdutw7xqotWn4Sw2jrGQRSR/8jmpU+/5r+Ff26V+9n08ZesY0RLoyioeYgbV+ywDhEtieD32DvZ1ieJ4twOMuPF+61DVCeKAv+fcfNHrR4UdMELblwqSPv4Dy2kQYxNncyF1822DlGX0c5ev2sdA0gR+dOy/zpvXTtCeHtTqn790dX/e0jIe6L619yytJ7riFDHpp5qHcDEonUzgJOsY1QmcTzEEZJLr5kGvNU6RhX83DrnouUFcc65sKiebR0hZ7ZdtMw6mCWtPy4V4Karn0ew6LCynXO227Ws3jXrAmCq2fHzppzJwus7rGO0NE1CvxmZgnoniYNd1jcT5E+sY4xL5X+yYcU26xjjuqxvJlFsbAa0+dXTP5kC3wGmWUc5gMhKBnpvevV/x9D9EsIchRuL0dFqZ1rHqILfrKzXxde9HuVY6xgVaSQdxEITRxfPe1lfHLIOUaUYCoT9d8WVp0loP8MvcssVT4z7EcLjTcoyvska8kNS5aXplwnjHtm3Gegtv5945N6zgcOaF6dKyQS/xrz0mmkIf2kdYxy7SdqLdX5uqAVxE7NDXLL3HMJ4rarEr7NqNdQRx7kV/EFx51y0wn+Rdc5NLMIZ1hFyds7+G9822lKLwrQSHaXbDI5rQ2n+91hli+k4QDEu9MxfO4ftOd06REtLA795JvyEgd5d1jGCMyhfB462jjGOFEa+Yh2iokE5F4hgxFBAXRJVv0ZohWbCPUx94cAC0SmzzyD47pcAXkhTN0nPIowRWxX4Oa5baSTsa5RX+Gj32nWtnA16onWMimIpdpy3rp3Q/jaPxW/mufGIBtYhTn+wf3RheRJEhzgopSG/Lxxb9+rfAC6xjgEMUUiL435EKhc0J0qNVG+3jmBqeMrnCLtj/l9wyxXP1PWZ6gVxQSlE8RAHpIm/J6ldJOfW32865+LlBXHOubAoZ1lHyFkbg4X3mB395hWPAj9v7kHlzgk1okmSLU0/ZmJQhPdaYjgKuFlS9YK4PAmhj1fyG2cH6+7/AMgHrGOMT/4XG696wDpFRXF0pwmni1jnqvcCH7WOcZA9SOF3Dungo5FsbCaFMM5tjNLgOsmMzc9xI0K/RgFQOtJ7rENEJ2mPoyBdkjh+f+e+fAYwxTpGZQEV+LuwdH7jCOBN1jEOJPdV/BDVMDrEJRJyUVAZGkZnL+Eb+/drx/uY85uUphYvMbjjJ9YhzFzSdwqqvdYxypMnae/or//TAy2IkwlaEBfHvtFzbFr6mHWI6MRxbl9m3wvh768651wZXhDnnAtH57WHA8dbx8idqPHY1GYXT+nEGJf6iqnb/xXY09RjDmvzi/BeceHaOWgEnQAaphNzw6UZLr1mGnCqdYxxqT8Fd4CeNe8B/RvrGBUMksonrUNUJYmiaGqYqSM/tA5BT/8xJPK3BFfAoH/MLVf+7ND/rDGc25d4efuD1iHiFcU5HuTw7T+yDhEtCbyLLYDy0wn1AFJWNI3h9xcKpUiuQ5MYvp9hXM+4MBUGAyw40vIjNF/9kCSMgjgNukvWoXr6LoMguq7tYUi/XPGjNMSCOLmLrcUR6xRmSslKoN06Rnn6CW5a8nLdnz6sYRbEwZz9BcwTjMbwkE4cD3GERqLYU7hnQr/eO+ei5wVxzrlwJG1nMhFel5Qu0+MLm5t7vKS5x7M22h3mu007nvIgW5Y90bTjHay9dBET4vfWC+JyMzRpHlCwjjGuUDpjhaC77x1o+n+BDuso41L9SkRPpkawsak/ZP1Ve00jLCy2oenfA3NMcxxMuJ4Ny7815r9FUew4wW9kNUqiOMc/OKR7oauSCsp86xQViUZSMBWcCH5/2c7Ny+O4nonib14A1zMuXBpg19e0ig5xjGzLPUc1VOMpiFt8QwEtfNE6BgAi13Lr8l+N+zGX9J0AHNWcQDXQdOJef/T0/3ug2zpGWcodbOj9TkNrjP5c7swmUMZkaGLt0S5afSwhvgYcTMT3TmvV038MYY9dHuXn1jkXuda/ge2ci4iE3SEoO8fTtfLNZkcf6bgNaNaNz53s3T7xNkia2YVP1LbgULHteNgsiUyszZZm0uC7SbzM3hfutw4RhJ7+34VkCzDVOkoFjzNpyjXWIarS3XccypHWMSoLYPNr8qxiIF0cfk14mPbBZWP+26XXTEM5pcmJaidqf25j1bVyNordNX21/BzXr3PtWxBmWseoKJaRmkFRIY6CuDtA1DpEVWIY96Q+LtWNR86zTnCQQbZ3PFTxo7S0Lf8oVZAIbui/Ys8zfxDIFIDnaN/bV/GjShJgdzhAJmgn/cUrp6B6rXWMcSjC1dlcP8jPG18jD0H8/jZPm4ZXsD2W1N931ixN/dw651wTeEGccy4cyknWEZomabMrItqyZCc0qYuAyj9NyK4jiTSvSE0T25G0IhOjIE55Iz39061jtKTwu0ncOyFfx15r8copdK9ajeq3gMOs41SQIskfNjQapJnCLwjdz/gGck//uxA+ZZrhUPtAfpt//OTusf+1Yz6hd78E39hsSOEcghvfO4bUu5zWrVCK4zW65L/HNetZcwIw1zpGFeI4t5deMw30rdYxquAFcW5si28ogJ5tHeMg93PPkuGKH7Xp4y8Bz+cfpxI92jpBVRZe3wH6OesYACifL/te4rUksIeCXlFKJmZB3O7kT4DjrGOM4ztsWPavmaykhDk2deI9tBzBVAGUkYJfZ9UuhnMLksbxnsQ558rwgjjnXDgSCb/DQlZUjYuIZEtTDpM0sVNaSAZ6fwLyZBOONMS+wj834Thj6+k/FfSNZsdvLiEtTZzXqGZSwn4abqI+9fyKnv73sbvwY5Be6yhVUb2WgaW3WceoWhJBNxWwHRvc0/86VP+O0IrLlI8x0PuDsv8ey7nVkm9s1iuWc5xM8L9jjYih4xUMMuNF72RbKw3+gYxRShy/v8OHLSC0v9Nj8r95roxdz5wOhPYAXPnrzIMJj+eYo9oQcXSI69i9FOVY6xjAY0x/8a+q+kglwA5x8iSblz5tnaLpLuk7AeRq6xjjGIT005mtJmmYBXEpE2XK0H4xvCeRn3PrldutU0RHAhzXfqjn2LBim3UI55xrRJt1AOece1UMI9lK9AoAACAASURBVIeycyHz1rVX9bRnHlI2kZD/E5HpiO04T0uiW1A+nPNBvsfWK/bke4xxpHpRBH1RMiTHA/dap2gpXX1HAcdYxxhfOgGfcFShe3Un8AlU32OdpmrCPUzb8VnrGDVRjWBjk92c+8JPGbA4tAra/98guBFMN7Ox9+sw9rRUADQ9J4LmYc+w6WPNKOBvTXH8/r7AwNJHIY6a5gDFcI7vZX1xyDpEdETPJfxBpPF02tA0ht+V3Uw/5qfWIVygkgBfE0Tuq+GjtwHzckpSrSNZfEOB9ZeXjHOUd1nfTAb1k9YxRslnqvr73dM/HQ1yPOTt1gFMlJJVQId1jHH0ZVq4Ijwc3GsjgBDi70Q+Ft9QYPcvrV/fq6BH07060BG7IYui0YA/UOKci54XxDnnAqEC/Sdap2ii6RwxdA7wbyZHH3rxTibP2oEwM8ejPMbGqx7Jcf3xXdJ3CjeveNDs+MomyLkgTlPbgkNhYoxLfYUkJ1hHaD0RjIvUJo2YDkFX31Egv4Ws+c8Q3QiKXyKF34qqKGB0YzO00Uxj0LsoFlOTQ3evuRp4n8mxy3uK4cIfgFS4NRDDU9yRdB4Kli4IvuhR9Y7KP6tuTD39k1E90zpGFfz3uB4q5xDkHd7XEB6Jp9NGBK+HcHfQhTrOVsq5Af4IV98hTkPoEEeBHb86Egi3a9hg8klgjnUM4Iec98J32FDFR2r6DpDwOnBqOvGuP3r6O1EN7b3pa+izjEy5Jtsl9eFA/77P4cJVR3Lr8l9ZB8nd7qdPA5lqHaMKUwDfN29FsXSsds65cfjIVOdcGLpWvR6I4eI+O5raFRNtLY4gmvNIObUdl1pKrqSn367zVPvwFiDfAoJCwe57vLg4CXiX2fEtqB5vHaHlBD9uTp9t6bbwi28o0Ll6Ht2rr6J79VYkeQqRNRDkE+jjeYmU93HLlSHcCKre6Gimw61jVCY2T4NevGY+6BdNjl1eivLBigUKUXS/BFT9Sd96da45HuQI6xgVidHvbyuQ9CxgsnWMKvg5rtW8de2gZ1nHqEhjOrcS/rgnIY5ue86GcJ51hIOk7C38uPoPlzDeBxVKR1tHKGv0+jyMlrkin6j6gaMgx6UCIhOrQGJxcRKqa6xjjC/5LFuW7Mx0yfZSmCNTASYVYtu3qo+Gvm/qWp74vpFzLn7eIc45FwaR8G8aZk46gaLZ4VU2I/y7HI9wa45rV0E6SfVu4HqTw9909fP0rP4BmtvYihc5Z/u93JLT6pXsnnE+E62IVfCCuKyFPm6ulQoJLlw7h7bhN5HI6aicAZzJ7l+eR8J062gNGkHkA2zqvcc6SM1CHM00Jmn+DeSF100lHfk2MKnpxx6PUmTjsn+q+HGShHZTtYykdV7jmi1Jwy/+GOXnuF5pcm7wHcQACqmf41odOfQ2UqZYx6gskuvQi9a8AdJwi2BeoVxJ9+o/so5hRvgFA8vOsI4RpEXrZsDgW61jHORnbL1iT/Ufnm4LoouTyhusI5QlSRE4zDoG8M8M9Fb/cKvIBTlmqdcw7R33Wodoql0zr0Y42TpGWcqD7Hvhv2W+7k1XP0/36heBWZmv3bD0NCDnh/1DEEFXY9fKlOG2u61DOOdco7wgzjkXBtGj0QA2b5pKF3BZ30xuXLHD5PBt6SZKOTYKFXl9fotX0LnmeEjfjNCJVUEcgLIZciuIm8ods6cCu3Jav4Kk0+a4po6zDtBSisWE21lgHWNcyjDdqxZbxxiTJNNA20hJSGQGAKodqE4hkRkocxkdB3Mk8CYoHQ5Jq+2jDYF8gIHem6yD1EUD//l/hRgU1EwZWYcGdsNB+S7Tj/qLKj867GLfUcqUkm9s1i+Oc9w+HEdBTZA0htfo7dy8/DFYYZ0jLmnpnCAKRypJIhlHV4imQPgwwiiGsTIBigbqlOw9BySwKTpa/bhUAE0eD2JCumiYxbEXrz2ZtPRh6xiAIvKpqj968Q0Fdv8ywGtOuZ+blrxsnaJpevqPQfXT1jHGJbqCrcWRnFZ/BILcuzjVOkBTSOAPErtW93DFCQnOORcBL4hzzoUhlWNi2JPOWBuDybuB/2Ny9JtXPEr36p8DJ+ayvsoiwKadvKRd+/+/RRSLSdWjCDLPkWxG0+o3u2rTjqYLgX/Maf3xCZ0tVlhTmWJX5NmK7prxFmCGdYwK3g/yfusQY9L9v4Dymv8fQKTVit7KGULS32ZgxY3WQRoQww3kXzLQ+1RTj9iz6o9Qfqepx6zsBUr8PusvL1X34RpDscVDZg9ltIQozvGj3HT189YhoiXE0MXzdoKogIhNFKOnhtDkPusQVYrh++lS7xhalkh4nX1Vavv9T3gskL9ZR1kHGFNa+hLQbh0D5B8Y6L296g/f9Yu3jT4IFxqt/mtoBapfI+QJGaoDbFy+Mbf1hYeDfJhPaf2Rqe9bdxjDg63/dbqQ+fWjc64lBPb0k3NuwpKA2+rnSbnI+PjVt+mvffF3M2+dzYaT6Cvf17l8f8ZZJhkApm7/V6CGMRc1ksTm5+fCtXNQ3m5ybEvCTBavjGC8UiRSCW9DzcXiBSTpiboYrvPaw4FTrGNUpNLc7jQ9/aeisqqpx6xMQT/MlmVPVPXRxWICMj/nTFmIo/NQiOataweJ4DpIffO6Xpf1zUR5s3WMilpptHtzxVCQ/kMGevdZh6iOdy6JQtLka7qYSICvCVpjh7iB3l0o9g86iITXIa571QLgt6xjACUKpc/V9BlJEuK4VBCdOK8nXf2/CYQ5NWBUCZVP5HoE5eFc16/f6dYBcje0bx7e1MaZkrusEzjnXBa8IM45FwYNcNOkGYRu4+NvznH1aRy59x05rj+2xTcUQBa++r/FcLTn+uIQ8N3c1le1+draSxcxUa8hdsuR1hFahkp4Nx5cDO6nkC5gYGncY58Kk+cTxcZm2rzNr4XXd6D6d4Q3zmwVG5ZX3431jtlvBabnFycjim9s1mvuy2cQ3s/poSTxYql6Dcq5RNACkNSLHmu2aN0MCGwk91gkkuKleIrAJ7qU9r33WocIkwpBFslO/mEdn7Qt6xQ10xAfdpYvE8TfdP1rbl7xYG2fwvk5hWmMTpAHaxYW2xBdSxA/P2Uo/5VNy36c6zFEQi2Im8XF17X4JI/UHzpwtpJ0YrzeO+da3sS8me2cC4/oEdYRjBxPT38+I0urMdJxGzCS2/olaX7B1p5nFgCzX/Nf7AriAETyLDo8me6+43Jcf2zWnQ0tJV4Qlx3vJuFqpPIdBtvO5+YVj1pHaZjGMl6siQU1HTtXAW9r2vGqIdyDyKdr+pxUA7ypOgbxQpr6JXH8/mrJN6/rpVGM1FRGCl7YWqvCvgXEsBcaS7FjLEXg7gH+8ZO7rUMEqavvRGCudYyDPMWmP3625s8SHs8hS400rIK47lVdwIXWMYC9SPLF2j9NwusQp+zgvB2hFkhlq2PmUuBM6xjj2M2Ifj73o6TBdoiDdKS1x4lKFO9JXOsaQpPaRrg751ygwt8Ecs5NFLMrf0jLsivY2rJkJ+TY6l5MCqcO/n6ev380nZUcx9Ji0wFPZOIWxJWkxZ8+bJKF13eAhLyx6MLyIsISNvb+B7Zekd8Y6qaKoiBUmVK6uylH6lr1WyBLmnKs6u1B9XdrHlmXRFHsuA9JfmQdIlpxnONhpqlvXtcrhnMsPMKtV263jhGdxIuWMxVNgf+E5wXS5UhynnWEQwj1/f2WADrEQUDTP1Qg+QvrFACI9DHQ+1RNn/PelUeDvjGnRPUTuYNiMbWOkbvObxyBymetY4xL+SK3Lv9V7sdpawu3IA5p7YI4/DrLmfphzfthzjkXKC+Ic84FQiZuQZyqcXGRbMlx8Xl0rWzuudX04AKxySST3tXUDK810PsTkCdzW19lUW5rj+WSvlOC3JRrnon7WpWlKbvPAiZZx3BR+AeG9RQGlv1X6yCZkig2Nh/ixhU7cj9K59feiEh451f5KBuWP1T750XxFPcPfGOzATGcY+FHrL9qr3WMiC2wDlCREkfBVGhi+P2NqfuORlHg72IpsLQgSYhFsj+o67NUA+gQx2wWr5xiHQKArv4PgJ5tHQN4kaTtqzV/Vin5jRyyNE4nyPi8ZN81CDOtY4zjMfZN72/KkW7+6ItAoA9hpKdaJ8hN5zeOAI6zjuEmNL9+dM61DC+Ic84FQmdZJzB0IfPWtZsdPc21g1kBSZo3nuDSa6bBGDc5rIsORXMsOtRFLL6hkN/6Bxkx6EgXFh8JlIVYRgo6S3dC+m42LFvclKeem+ni616Pcqx1jIpU8t/8WlhsI2n7e8IrNv7vbFz2P2r+rIXXd4CekUOejPmN8bpdes000Ldax6go9c3runX3HYdypHWMyprwGt2SNPxiR+HOaLrvxNBN0UGa+OtFOZqG1yFOpc4Or0kIBXHwshxlHYF569oR/tw6BgCqX9pfUFTj5wU4LhVGO8S1uu5VC0A+aB1jXMqn2PrhwSYeMdBC/RbuEFcY9n1TZ8sfqHDOtRAviHPOBUAFmGGdwtB05gzabczPOOoOoPbNmWpp0rxitOFJFwKHFhdKEzOMRWVzjqvP4qWn5+e4/oFsxuCGxAvisiARdF5xVn6E6r9nQ+95bFix1TpMLtLhSG4ep3flfojJM78InJ/7cWoijzBpcGldnzpp19mMdR0SGvEb43UbPmwB0LwHEeolXixVN03ieI1OJkiHliwtWn0sYF+oUVEkN58WXt+BEkER+IT3MvteeMA6RJAWXt8BcqZ1jEOkUmeHuNK2bIPUqZS8wToCc/cuAU60jgH8gunp1+v6TAntPRIASvtwHH+j6lUsJiBrCfu+6e1s7F3f5GMGWhBH6xbExfAQh2ttpUJrv9475yaUkC/snHMTxaVfmQq0WccwlWDXdWv95SXQf8ptfdHmfW1li+/0NHr6j2lajoMJW4D8nvIvSXO+x4uLkwC78bMhSGQiF+9mSPxJR/daKbAFkUvZ0HsWG5f/LxC1DpWbGMa1AZBz0VTX6ncj8vFcj1G7fQiX84+f3F3XZyeRdL8ciaTYIkSaxvH7Wyh5sVS9kiheo4fQpM4OQhNYWySv0Slx/P6OFoFPso7hKlDuZmtxxDpGkKbsmUdoP8PKDjZdua2uzx1pD6NDnOjRpsdfeN1URD5jmuFV8qd1jbDvvPZwlLflEKgxwiPcdPXz1jFydfvsP4Kgu58qklzd9P0SDbYgbhZdfRE87FCHaPaNXIvayfnbf2YdwjnnsuIFcc45eyNTD7eOEADjkZ5JjiM9eRMXrz05x/VfY5zCsNRwbOpA73NQ79iLqizKce1f2zXrAmBqU44VKtVp1hGi17VyNmgIT2s7a8I9iHyKpHACG5ZdxEDvTS1dCPeKOMaLDZHww9xW7/zGEQjfJrT3o8LHGeitryvH6AIxnNsX2Nz7iHWIiMVwjnezYOdD1iGipRrDOb6Pgd591iHiE8VrNJTIv0NrFgqRfD8nOvER2mWlpfDGpYrcV/f7oVuv3A7U91BHlhTbDnFTSlcBrzfNMOqnDL7wrbo+s9BxLiE+OK6RFGzX65KvzwL9onWMcQn/k4Gl/2Zw3FAL4kCSU60jZE8FtHnTYJw71F0Ui/k1d3DOuSYL6waEc26C0snWCQJwDpf1zTQ7elLamOv6pZH8O5h1rjke9M1l/10Mu/ABoJtyW1p4Bz39+Y/yTKQ5hXdh85GpjZJkASDWMZyJF4GbUL2aQnoiA8vmM9B7DbdcGUY3g6ZQQYlhYzO/YotiMaEw9C3CG1t3CwO9axtcI4LiALlrQhSe5ieCc8ydvnldp8U3FICzrWNU5CNx6xVDh7ht3Lr8V9YhqhJLx8yJTqS1C1gaIUl4rwmaNvYgpRDA+yqxK4h731fnovoxs+MfQD9Zd3fGNL0g4zDZUG3t15OR4S8Bc61jjGMQKfyJyZHTgAvikNYbm3rxdScBc6xjuAms1QugnXMTjhfEOefsjegU6wgBaGMwebfZ0W9e8Sjw89zWl3KjTDOUVBzNuohi0e7vniSbc1y9HU0X5rj+KE2NiwoDILRbR4iet/2fiPYi/CnTXnw9G5ZdysblX9v/d2fi6Vz7FmCWdYyK8iy2uH3WJ1DjzriH+gXtw3/QUKHYhWvnAMdnFyknmvrGZr16+o8BbMeAVcOLH+r30i/OAMLvXp762OOaxVLsqDH9/vo1fRSG/fViHOF1iEtooFMxANuyiNEQMewQN9z2Z4TwEKNyBxuW3VT35wvnZ5gmO9LCBRI9/W9H+Ih1jHEpXzN7mLAgARfEaesVxKUjfo3lrMXRsdo556rkBXHOOXttIx3WEYJgfXNYya+DGfpu5q3Lt5BIKo5Encv3Z5yVa4bxTN3+r8Ce3NbPu+jwwrVzQMK/iZQ3FS+Ia1Qc4yJdtqagfJE9s56ge/VKulaW7+bZ6gqlSH7+03w2v7pXLQA+n8va9UuR5IPcdPXzDa3SXjqXGLpfqm9s1k0j+fvlxVL10ySOc1wotO4N6bzseuZ0Yih2lEh+f7tWzgZOsI7hKnqGLcuesA4RpK6+o0DfaB3jEEpjHeI0gA5xatQhrrvvOJAlJsc+mKSfqvtBm9EHecPrXgj7kORH1iHyoUKqq4CCdZLy9FkS+YrZ4Qd6d4E+a3b8cbVgQZw/dOCspYnvGznnWooXxDnn7GnBC+IAhG7j4+fZwWwaR+59R26rL76hgFK5w54kdh3O1heHUP2X3NbXih3yGtNeugi/bgBNvSCuUaq+sTNRKUcCK5DCQ3Sv/t/0rAlzFEyukgXWCapSKmR/Q/6yvpkg3wEmZb52Y/6cgaW3ZbBOHK9tJS+Iq1ss4wF987p+Sviv0coObrki4C4dgUo0xOKCscRREJe0x1EE7rx4thwp5Lc/Vb99PDflwcaWEPuCOFGjbrrJF4DJNsc+wE1sWLG17s++c85pBNlRXO5loHefdYpc9Kz+fYR3WscYl/Cno0VppsK8/tQWHJkay4NYrjUJT7B56dPWMZxzLkt+Y9s5Z0+1zTpCII6np/9Es6OPdNwGjOS2fppjB7w9zywAZlfxkbYjP5Mkxy58nDz6RGxOrDsYhkK8Q1xDOtccD3KEdQxnLgHej6b/SvfqzfT0v906UNNoFDfkd3L+9p9lvuqgfJ3wRor+C9OO+mJGa8Vwbrdx6/JfWYeIliQRnGN50jevGxL+ORbubGi880QVx43FEdKhRsclNkcsBcITnUbScdCCBHhNLvyYe5YMN7ZIui2TLI1Qg/HyF685A/idph/3UCkqf9bYChrmuFT0dusEubj0mmmofNk6RgU/Ye+O661DEGpBnDBztOtni1hcnIRgN+HGOY3kAR3nnKuBF8Q55+xJ4hv6r0grjv3Mz5YlO8nziXSV/L421a4qP/ICFl43NbcclaQjeXbhA8nxe5zn2nHxgrhGRDMu0jXRIlTvpmf13/C+r861DpOrnv7JwJnWMapwF8VimumKXav/M8gHMl2zcS8ywu+x/vJS40upQAydpcQ7xdSrWExAIxgdr36O69V57eHAKdYxKhLv+FSnGK5B72fTx1+yDlGlGL6fjsRvaJajARZAK40XxGpi3yEODmPRuhlNPWKa/iVB3OfSb7Kx94cNrhFmF3Vp0WvMoY4iYDPmt1oiK9hazO8B9upzPGIdobxC63SJ2z3zbYTR7dJNWOLXj865lhPAGwXn3ISnI9nedI2ZGBbEjcqvYEuYT9fKarq41aHq79skpqS/mU+GKmy86gGQJ3NbX5N8fn4u6TsF9I25rB0d78jREBW/eebGkqB8mOH2n9Gz+iPWYXIj6VnEsLEpGW9+da08DeFrma7ZOEX5MFuWPZHJal19JwJzMlkrV6mP0qzX92adCky3jlGR+kjcuhUmzwfC71xe8o5PNRt9IOpU6xiVxXRudb51AleRMqV0t3WIIC2+oQDMs45xCOW+xtdo39Z4kAy072tel7iu/t8ELm7a8cobIi38eQbrhFkQpy1YEHdJ3ynAUusYFdzMQG+e00aqlwbaIQ4AbZ2CuBALtt3EIt4hzjnXerwgzjlnLxEviHuVLGLeOrsOVCl5vskuIMmFma966TXToIYiG02Niw7TW/NbWxft39zN1khiO2o2LPusA0TOC+LceGahrKOr/+9HX9tbTDQFoaXsCmoWXt+BFP4OOCyzNbMg9LNx2f/NbsFCHOdWvENc3QqR/P4mfo7rFsdITSh50WPNOobmA9m/R8qaRNLN65K+E0COsI7hKlB+yo0rdljHCNKeZ84E7CYHlJNFh7hNf/wsYN9pMm1ixy3Rv2zasca3lk1LH2tohQtXHQmckE2cLOmzbFixzTpF5kqFPsKeAjGClj5pHeJViQRcECetUxBHEn7nedfKUtr33msdwjnnsuYFcc45eyUfmfoa05kzaPfGZ8ZRdwAv5rZ+Hh3MhiddSE0bGGJb3KWS59jUWex6JvsnnQXrzoUB0SHrBNFaWGwD3m4dw0VA9LcZ6ribztWnW0fJVCzFFiNt2d2Q79i1hvDGxN7P3umfynTFJIpzWyIdavxG60SlaQzn2DevG6IxnONt3Lr8V9YhoqNJDOcW0pE4ClpLBe9cEgPv7lFeqiH+DKcMtf0ok5WUbDogNyJJm1MQ1736/cD5TTnW+HaTTrqm4VXakzC7w5Hcbp0gc92rFoN2WccYl8h/GZ00Eoi9hYeBMO/hSBpBJ+AqSRTvSVzreoB//ORu6xDOOZc1L4hzztlTLVlHCEqCXcHW+stLwNbc1hfN/muruchOT6On/5jMc1Qrkc1Afl0RJeOfn8XFScC7Ml0zZoIXxNXrsBmnA4dbx3DROJmE79G9OvvOonZi2Nh8is1Ln85kpe5Vi4H/lMla2XmJNLmcrR8ezHTVGMaaKPez6eP2HUNipRL+OfbN68ZIBK/R6h0A6yJBFr8cbDfTj/mpdYjqqHcuiUJMI3ibLMzXhEfYesWeTFYSHs9knUao5D8ydXQ6whdzP041hGv2d+drkIZZEKdpa11/LF45BeQr1jHGpeygbejz1jEOMPoaFeaDGdoiHeIWrZsBnGwdw01ofv3onGtJXhDnnLNXkL3WEQJj241Lcu1g9iYuXpvxG7s6Or6lavc9Huh9DuS+3NbXjL+23TPOJ8RxInZ8ZGq9Uu8m4Wo2DbiFrtWXWwdp2GV9M4GTrGNUltHN09Fxan+VyVpZEv0om5ZmW3AwOur+bZmumQfvFFO/9607DCGGjpWtdbOymS6+7vUox1rHqEi8wKU+MYw81rv2P5wWAe9cEoXUC2jLk/OsExxCJbsuvsK2zNaq31G5H2H30x8CQugK9UtKQ6syWiuEbneHSgqt1SFud/InwHHWMcaV8CVuuvp56xhjCHNsqjCTi9Y0b1RzXpK95+D37J0l3zdyzrUo/+PqnLMniXerONC5XPL1WWZHL8mGfNcfya6DWXffcaBvrvnzxLAgDgDdlNvSwvn09E/Pbr2Cj0s9kBfE1c27Sbi6TEL4O3pW/bZ1kIbsK5wDiHWMyuSuhpeYt66dUuFbwIzG82RI5TsMLP9m5useOfQ2YErm62bOC2nqNjx4NtBmHaMiL5aqXzocR4GPJF7gUquuvqMAu+7gVZM4fn/nrWsHebt1DFfRIDNevN86RJBGH1IJr/uOaHYPTWoAHeLQfDvELby+A5LP5XqMail/nkkX5sUrpwBnNx4ocyno3dYhMtPTfyLI1dYxKngMZI11iDFpoAVxAFKKv0tcIYaHOFxLkzSO9yTOOVcjL4hzztkrDHpB3IEKlIYXmh1909LHgEdzW19qHXE6nkJXnSEuoli0+xsoSZ5d+NrIcsSppnYjfEOk6iNT6yURjBR0oSqg8j/oWdNjHaRuaZCjmQ4lSeObX68b/AvQd2SQJkPyCAkfyWXpUhrHuU0KvrFZL43k9zfN4Pd3otIobj6NUBrMr8t0q5IkvE5QY4vj93fuy2cAh1nHcBXdy/qiv28dy6CcS5D3QzS7DnFIAAVxkm+npsm7ekHfmOsxqiE8zPMd/y2TtXa1zQcmZbJWloSfMNC7yzpGdnQV0GGdYlwin2CgN8yHcSXggrhCEn9BXBzvSVzrepmXd/7YOoRzzuUhwDeAzrkJp8M7xB1CsC1CEvLrYIa+e/94scbV3+ltLt+fcVYmGeqi/wbk+XOfzc/PhWvngIT4hKodkUHrCFFaeN1UlFOsY7iotaPperr6wx9NORYhhg6JjT/937W6G/hYNnEyM0yS/l5uN3LiOLcv8fL2B61DREuiuDHxMvteeMA6RLQSYjjH92fSgWbiieHcQlspjoI4kji+nxOdesfQ8gIclwowTIYFz6Vt2a1VJyG/grjL+mYifDK39WuR8qfcs2Q4k7VEL8hknawprdOdtqe/E+W91jHGJ99nYOn/sk5Rlmq4BXFpECOUG+STNZype9haHLEO4ZxzefCCOOecvfUrBoGSdYygKHV2Psvq+JJnB7NpzN3X+Cbk4hsKKO+u+/MlsSs6HOjdh+p3c1tfMxoJ2166CL9WOFDKdusIUeoYmg8UrGO46B2O8A/7Rx3FRaK4If/ThorGLlx1JML1hDYaVvk4tyzP80ZODN3D7vaNzYaE//urfo7rp4Iy3zpFRdJCN6SbSsP//YWn+H9X/cI6RFXiKB51WXT8bVVhdn19mluX/yqz1Upt9h3ilKNym8qwVz4FzM5l7Zro3WzsXZ/hgudnuFZ2RFvj+mNxcRKqYY4h/TVFWQ6i1kHKCrlDnGjcHeIWrT4WOMo6hpvARPz60TnXsvwmt3MuAKIou61TBOZ4evpPNDv6yORbgfxuqkkGYzj3PLOAhjbBMioaq1eS5NiFj7dw8do3ZbDOogzWaDUvWAeIU8GfcnQZ0Tezt3C9dYqadPcdh3KkdYzKGugmUiwmtMu3gNdnlycDqgNs7O3Pbf1F62YAJ+e2fla8kKZ+Pf2vA46zjlGRRDJuMUSda98CzLKOUVHq57hmigM6/gAAIABJREFUxWICEn6xYyN/f5vNR3nFoVDyv/tjUgm062u247A3X/lLwLqzfTv/MvN1ma960Zo3ILI083XrocmnsytcUgHC7F7YKh3i9sz6OOG/b/s2G3vDviZon/IIEGrB3mn7f5fi1B7k3yc3oaR3WSdwzrm8eEGccy4MIs9bRwhOaliwtWXJTsjxpotKFl9bg0V18ht0Xnt4Bjnqk47k2YUPdKTxokPBtmgwRIn6a1U9JMgn8V2sRC+je9XvWceomkYzXqz+za/bZ/8J4RVR/4JJIx/M9Qn7wr4FRPGeWnxjs16lNJK/XxEV1ISmUIrkNTqWkZoB+f70U4Dp1jEqiqWb16XXTAN9q3UMV9F2bl7+mHWIIF183UnAHOsYh1B+kO2CoghPZrtmHSYl2Y9NTbQIHJb5urUSNrOxd0tm640W52dfQNi4lxjc8RPrEA3r6T8G5dPWMSrYywifsQ5R0U1LXgaeto5Rxgze25ffuOa8aRrJexLXsrRFOoI659wY2qwDOOfcfs8Bb7YOERTRi4D/YphgM3m17Bfm07VyNhuvqr/bVuNjQSdR6HgnMNDgOvXZeNUDdK9+Cjgml/U1uQj4q7o//5K+UyhxbHaBWkSa+MjUeqicE+5DpAA8BPIj6xDV0cOBScBkhMNQ2oBpjN4YmMuEub6XPnr6NzLQ+5x1kooSOQcN+ud/VFKo74b8xavOJdXPZpymUSnwB9x0db5FzImeG/ZL236lYd/YrFdBzoniHCdtcRTUhCiOjle7mX7MT61DxKcQw7kFjaSb176O+QgF6xiuojuCHrdnSUfOgwCbByWSbYc4AOVx4KTM161Fyhsgw2K/i9eeTFr6cGbr1U8pZVxcVdDzA73evJOtxfymhzSLshKweyC6GsJX2bLsCesY1ZGHQY+2TjGmUttpQBxj6A8RxXsS17qeY8OKbdYhnHMuLxPkhplzLnzedelQsoh569q5Z8mwzeGTzWj6uZxWLyDJhcD6uj770mumMUTjHTs0vQirgrjRAFtAPpTT2otYfEOB9ZeX6vr0kaQzxL1icwleEFerrr6jQN9oHWN80seG3nXWKTJx4do5TEqPJOV4hBMRTkL1LOAsYKp1vAzNRfXLwH+yDlKRagwbm4Mcvr32otDL+mYyKH8PtGcfqSFfYMOyW3M/ihLDOOhn2PQx+y4hsdIMrjdzp89yy5WPW6eIWASv0XpX3df0E1lCDAWtKVK41zpEVSSG10NHnp3+Y6cS6s9wxh3iANiWw5q1STIumElHvgwSwr2s77Bp2T2ZrpjqBYHuv8VRsD2erv7fBP331jHGJfwK5KvWMaqmPIyw0DpGGacCm6xD1KxYTLids61juAlMWuD13jnnxhHCmwjnnAPluUDf/FuazpzBBcD3TI6+d/sddMzaCczIZf3RDmb1FcQNT7qQTG6+S+NjRRuhshnhQzmtPotdz8yj3g1xH5c6tmH1griaRTAuMomkM0c1br1yO7AdOHC0yeIbCux66q1I0glyCfBOwitiqtWH6FzzVTYtDbdrzuIbCuz+ZQwbm/exvjhU82cNJn8DHJd5msb8C9OO+kKTjhVDQVzrvL41nQr0z7NOUVlyu3WCaPX0T0b1TOsYlYkXuNQjhoJW4ScM9O6yjlEdXRBkdy13IPW/++XJeQF2Ld/FwNJHoTfjZeVx869VyW50YfeqBSDvz2y9+g2jpT/LfFXJaTpHoySN+/VkYbEN0esI/Y+X6mfYsCySawFAeNg6Qlmqp1lHqMudc06DdJp1DDeBpf5AhXOutXlBnHMuEPpc6O9PTSR0YlUQt7U4Qvfq24B8Np1E6y9G02RRNiH0NN678mj+31U27dQT2YxqCiS5rC90Uk9B3OLiJHbzruwDtYCRtvrH/E5U4Y+LfImXd/7YOkTuRjvLPLD///pYtG4Ghb2/D/JRhFOM09WrQKJ/DlxuHaSsXc+cjgQ+ngUArf1vRdeqK8nrGqF+L5IUfr8pnZQWrT4WMrzRlxfhLusI0br4upNImWMdoyKp4/fXjZL0LFQmW8eoKPYb0hYWr5zCbk63jlFRVMVLyQLzApuK5Pug91unsFXyvwljWbxyCrv1DOsYh1Duy2fEbbrNfI9VJcvr5L/E/AsC4K/YeNUjma544do5UHpLpmtmZaQt7teTjlm9QHi/9wf6IdPe8LfWIWoipYfRfLaxGydxFsSpxvCgHSCfGP374qonXcB/tE5RBd83cs61NC+Ic86FIZFfBL+3akIXAUWzw4tsRjWvm91v4uK1J3PLlT+r+TOFzsx+XkbaLgL+NqPVajPQ+xzd/feB5tM9SPUi4Is1f97uGefTWqMVs7KTrVfssQ4RndDHRSr3sLU4Yh2j6bYs2QmsBb2OnjUXoXotEEGXnIPpb3HR6pPYvCzMp5ST9Bw0hHs3FdW2+dW5+nSEr+SUpX6S/iG3LGvO6Mj24It9R6USUbFFYEqlc4O49VpJyQvi6qYS9jXKK2K/IW1hd2EeMXTClUi6MXT1HQX6RusYFYl8gYHeAesYLkC72uYjGt5rguh9uayryeO51NnVQjSbgrieNT1o+p5M1mrMSyRt2XehnpSejwZ4xSk8wealT1vHqNuFq44EPmsdo6JUP96Uh7mylOrDAf7E7qenjXb5tn4BrJFq+F2NYZhpI2tZf9Ve6yBR6V51YRj13ONSRgpeEOeca2mhlvI75yaalCesI4RJzmXRunxGllZnU66rl0Zq7xLX3XccykmZZRC1HQ2q6ebc1hbeQU//9No/r+DjUseiPGYdITrFYoIy3zrGuEQneLGIKAO9m5h21NmIfBTYaZ2oRgmJftQ6RFmxFFskNRRbdF57OMINwJT8AtVlDQMrbmza0TSN4dwqU0p3W4eIVhLF76/SPsnPcb2UGM7xU1HfkLYTw7mNp2hZkvOsI1RBadvnN/Pc2IRAf4aTH+SyrA5vy2XdmjJwdMNrFIsJmn4pgzSNE1ZyyxXPZL5uml6Q+ZpZ0Ej+PpXTLtcAlvvp1biJTcvz2xPOS9L2CJBaxyhjOj1rGn/tabYo3pPoD70Yrh4R7CkIj3DrldutYzjnXJ68IM45F4ZEvCBubG20Ddo9CTnQ+3Pg0dzWl6SOwqtCV6YZlE6KRbu/hyJ5bn60Qx2jTzWtf5xtS5Nt1gmi8705JyPMtI4xrqhGVeVo/eUlBnq/QVI4B+VB6zg1EfkwndeGOpY0/M0vZQe3XFF9h72kfW1wY3aFHzOt9MkmHzT8cwsPceOKHdYhohV6h9NRD3HzR1+0DhGx8M+x+HVKXeIoSH+ZfS88YB2iSuGP8hIe4aarn7eO4QIlgXbfSUr5dIib8cangeFc1q5WFh3i7pj9AeDtjYdp2PMgX81lZZHzc1m3URrxuPbuvncAH7SOUcEIWvq0dYi6DPTuQ3jKOsY4TrUOUJP3rTsM4XTrGJVJHF2NQ7J45RSI4NxqJB2rnXOuAV4Q55wLw1DiBXHlKLbduiTPLnH6buatq21sRfYd3eby/RlnZbxm9aa9+C/AS7mtrzV+vy5cOwcknxGusUu0OWP4WkmhFP7NSC35G//XuuXKn5HIeQgxPak8g2TS+6xDHGK0SC/8zVjhzqpHinStvhzkQ/kGqtlLJOnlTX1aefENBWBe045XL/VN67r19E8G3mYdoyI/x/W7rG8mZNh1Oi+p36CoS6jFLwe6h63FEesQ1Yng++kPubjxKCH+DA9x+M6f5LLy6AhG44IVeR2Li5Pq/vR569pR/XyGgeon8iUGendlvu7ofmiY7ymSwu3WEepSLCaQrCb4GYX6dTZeFUtR/KGU6h+oazZNT7OOUJOhffOANusYVfD3JLXa0342o80KAud7Cs651ucFcc65MIy25c2vKChmgm23Ls21g9k05u6rfnTF4hsKKO/OPIUkdt/j9cUhVL+b4xFq+9omjSzCrw/Gpl4QVzOVEG88vNbTbPrYk9YhgjPQu4u2jsviurGoi60THKIweT5RbGxqdZtfPf0nIvxVzmHqIFdy84rmdjXc/fRpwNSmHrMuVZ5bdyhJzwImW8eozM9x3QblXIK/WQpI6ue4Vj39rwOOs45RhUius1TQCB6YUo3k++ma7qI1bwCOsY4xhgdYXxzKcf1tOa5dDeHFWa+v+7OPGPzPwInZxanb48A3cln5iH3zgMNyWbsxw7RNymecb96+P+sjhN7VVNlB+8gXrGM0RAIuiEPiKogjDf9BYoCCvyepmaah74mPEi92dM61Pr/h7ZwLiI8jLONEevrtNoE6SrcB+T25LjWM59zzzAJgdvYhMu86V5skybELH2/h4rVvqvqjVWy/F0Hz16g6hL0RGc2NSAM3LXkZ0veDRFIwKD0svC6sAiWNYBTfqLsqfsS8de2k+m1gev5xanIDG3r/tulHjWMUH4gXS9XNz3Hri+Mcp0jhXusQ0SlFcvMploLWnjWnIMy0jlGRjxd25bRpoCMpybngKIAH+trSo+v6vNH3dZ/JNkydlD9joHdfLmun6QW5rNso4Uej+wGR6Vo5GyH8QjPhC9GP+A65QxzEVRAnUbwn2c2CnQ9Zh4hQ6HviAMNMHfmhdQjnnMubF8Q55wKS+oV1OalhwdaNK3aAVL5ZXq/aCrBy6uQmv7F/tJ2NdCTf0YSlUvXfYzEe0Rsy8YK4moyOmzvTOsa4lDjHgDTLxhW/hPSPrGNUaQodw6HdUIhh8wtUK/+Nn7v3K0hwo6Z+jojRz2cUm9b7kORH1iGiFUdBq5/jRkgUr9EP5DKirdUVoniNhqQtjoI4fz10sdNAR/4m3JfvAcS+IE7lDXV9XsfI1ShHZpymHvfzjhe/ndvqQqjFmnEWGCeFLwFzrWNU8Cgi11mHaJhIyAVxp4KG3wX612K4zrqTYjG1DhGhGM7tfay/aq91COecy5sXxDnnwiHJT60jBMt6bCqaXwczYT5dK6vr+qa5FQZOotDxzpzWrmzjVQ8Av8htfZHqfn4617wV5djccsRNgZ9bh4jM2wl93FwicW70NtOG5RsR/p91jOrIu6wTHEACvfn2WsITo4WP4+hZ04PIsiYlqtYwif6uWaGIaPgbm8p9uXWzmBjCP8fwAz/HDZAoznEcBVOh0eAKuMegz3LLlfbFKtXQCP7mIff666EbR5ivCbl3iAvggb6kjoK40bHXK7IPUweVT+dbBCLvyG/tBkiEI6h7+t+OEsHDfPLxlvh7VQq6IG46PWvq607ZbKOvd8dZx6iCvyep1YVr5wDHW8eogp9b59yE0GYdwDnnfi19CGJ6gKeJlHezsNjG1mJ+o0vHI8lmNP1cTqsXSNreA/zDuB916TXTGMpxI1PTi4CB3NavHGAzyIdyWnsRi28osP7y0rgflqhx4WXQnvAOHTUKv5tEib2Fe6xDRGGEqyhwMcE/TCMLrRO8qvMbR6BD4RcYa4XNr/euPJqR9JuEd4H2KW5ZbnOj5n3rDmN4MPwxLDHeyArFZX0zGeQk6xiVRTJuMUTdfccF0nlmfOI3KGqnAv3zrFNUlsTTpTjhHNQ6RAWa+t88N7Z569phMMTXBEUk566GpW3mb9+U2gviVP8MmJ59mJr9Cxt7b85t9Z7+E1E9Krf1GyFt8fyNAkAF7V8LFKyTVKbX0r36WusUjUvD/l6nejrwlHWMikrpuSShbbWMQVJ/T1Kr9tK5hLePNpb8pkI551xAvCDOORcO4aHgN1qtCDPpmLEA+L7J8fduv4OOWTuBGbmsP9r5bfyCuH0d70Foz+X4AFTZRS0vKpsRPpTT6rPY9cw8Kj31I3qR/w6WIdxvHSE+wXeT+DFbr9hjHSIKm5c9TPfqfwIutI4yPn17VcW/zZDsOy+KvS8dZ/OrWEy4PfkmoY2dUR1g47I+MGpaV9o7HySG99G+sVmvQYlj81oSvzFRL03OieAMQ+qdbGt28XUnkTLHOkZFEklB68LrO9BdZ1jHqEj8d8WVMWfwTOAw6xiHkp/n/sBd2vY4ifGEu1pHpnb3HQd8JJcstUr5VL7r6/lBXosoO7jliofhSusk1evu/yAEOn72UCdYB5gQhFOBDdYxKipI+A8dAIy0xXHdGpbQ98RHpYlfQzvnJoTAuzw45yaUoSk/hSjeBhhJ7Aq2RjvT3ZbjEboqfoSQ17jU/fQ03rvSrqV6IpuB/HYrkwrjZhcXJ6EszO34sVN+bB0hPhLmaJpf8zf9tRC53jpCFTrY8cswNphV4tj8Gu9J39tnfRbkPU1MU5nwK0b4MIjd9WIs57bkxQF1i+UcpyN+juuVRHGOX2bfCw9Yh4hOqRT69eeoUiQFcR073g5Mso5Rkd/Mc+UkGuprQs7jUoHtk54CbB8UEq1xjy35IjA5lyy1ULmRTcu+l+sxRC/Idf16Cbebvteq1aXXTAO+bB3DBUYJv6M7xPK+8yk2L33aOkR0NPiHxAF2cv72n1mHcM65ZvCCOOdcOLYs2Qlss44RrgoFTXkT2Zzj6m/i4rUnj3988i8IHGmz+x4P9D4H/DC39bVCQeHuGecDU3M7fuzUO8TVpGvlbNATrWOML5IbkaGYOvK/gZesY1RU4HTrCMDoeLHwpUjh3jH/pav/N4E/bW6cilJS+T1uXf4r0xQxbForO9jc+4h1jGjF8fv7AhtX/Nw6RLTiuEFxz/6Hklwt4ih2VNon3W0doipSCLWY6DX0WTYtfcw6hQuUJmH+DGt6X+7HuGfJMMIvcj/OeGoZmdq96kzgA/mFqVoJRprwPkhC7WgWV4HxUMfngTBHzzo7ox3iAqcCOt86RWW+d1o7FUQWWKeowl0Ui8atZJ1zrjm8IM45FxjN/ynJaMm5LFqXz8jSaqQjeRbEQWmkfMFbd99xKCflenwYHRlqSXVTjqufT0//9LL/KgXbrz10ot4hrhaSLCD0cXM+hqw266/aC4xdPBWSZvytqBxCUMLf2BR+Muaopku+PotEvwUUmh9qPPoXbOzdYp0ignHQ+0fHRdTZITwxbF7f6ee4TotvKABnW8eogl+n1EOD7Qb1Wg9x80dftA5RHY3g9dCv6d04RM+zjjCmpNCcvU/l8aYcpxypoSAOuYYw7lX9LRuvyrdD6+jeXJgFOxJRx82e/lOJarara6LTRgvOAnZR/5uBOdYxKpO7rBNEp2fNCcBc6xgViXixo3NuwgjhTYZzzr1G4gVx5bXRNmg3umzjVY8Aj+a2viTjFGQVKo9UzYLSSbFo97cx3y587cC7yv6rpnYjecM3giQPWYeIigT6JP6v7WbGUQ9ah4hQBBthav90ePfqk4FZ1jEqShlj80uF0vD1KMc2P9A4lDt4bsqfW8eg8xtHAG+yjlGR+FPcdetcczzKkdYxqhDPzcrQ7HrmdOBw6xiV+e9xzXr6JwNnWseoQjy/v0ro1/QgEX0/XXN1rZwNITwsMwZp2t7ntiYdp5wZLLyu8iSCi1e9E+jOP05Fg6Qjn8/9KKmeT3APHwGgDEVUIKGsZHSv07mDTaNz5THWIcZViOIhjtG9GFcbjaLjPKT+ftM5N3F4QZxzLixpE8YGxKzS2Mu8CTl2MNN3M29dmY0MXZTfcQ8wl+/POKtJxzqUyL8CL+e2vpbpgHfh2jkgMXTKsPIgA737rENEJfhRZHoX6y8vWaeIjnKPdYTKEvuCOIng5vGoQwsce9YsA/6/5kcZh7IDSf8D9ywZto5Csi/MLiMHK/nGZt0KpcD/fu2n/qR+3ZJIbj6NeNermkl6FjDZOkZlkbxGjxYTnWAdoyLldusILlBJ+7kE2bVcn+WWK55p0rFsO8QBHKaVu8SlyV82IUkVdA2bPvZk7ocRvSD3Y9RDeIRbr9xuHaMqXasvB23Ow9MuTtJ2mnWECiLowktKIhHsAwZG0zj2FNLE9xSccxOGF8Q558KihfDHsVkSMR7pmWsHs2nMHeNG8+hYo+Z1xksMR4eOFl19N8cjjP21TRpZhF8TjEO/Z50gPqGPV/KbzHVJJPyuehJCZ6ck8J//V6QH3pDvXnUmql82ClOe8IdsWLHNOgYAKnFsbJZi6OYYqFjOsbb7Oa6XxnDzSZ9ly7InrFNEJw2+Q/GopBBHQVywxUQHUDpSv1HrxqZpoK8J0rx9TxX7grh0ePyCuO7+fwf6jialKU/ZwXDbNU062vlNOk5tYikwXrxyCsJXrGO40GngBXExvO+UBxno3WWdIjoSxbl9ks1Ln7ZO4ZxzzeI3v51zYRm9EHvKOka49M1c0mf3lHZH6TZgJLf1kzE6mO15ZgEwO7djHqxcF7XmybPo8K109x13yH9V40LL4Mn3rRNEpXPN8SBHWMcYn8ax0RuakuywjlCZ2o/BC75DIgCDPH/Y/a/+r4XXTQW5AeiwizSm69iw7P9Yh3hVEsXoi23cuvxX1iEiFsM5fpRNf/ysdYiIRXCOE79OqUskf38P3/4j6xBViaO7xYPcuCKC61NnQ0Lt7NuscamAbGvescrQpHxB3OIbCqBfaGKa8oRrmtIdbWGxLdhCmFhGI+4qfAZ4k3UMFzo51TpBWaMTct5mHaMiiaSrcUhGz+3brWNU5OfWOTfBeEGccy5E3o1pPCNJp9mxb1yxA3Ic0ZQy1tfW7K/3N+m81q6gIs1zLC2gyaHjZ8V4FG/okoIXxNUihnFzqt5Zpx7thRhuONoWdPX0TyaGjU2494ARpB0jXwfeYhdnDMKPmVb6uHWMX1NBmW+dogq+sVmvhcU2Yti89nNcv9Fr/HBvjr3Cb1DUR2IodpQfsL44ZJ2iSuF/P2PpZuQMqARbJKvc17yDjWxr3rHKEDm67L/tefoPCePv8tO0d/Q35UiTZr0NmNqUY9WqkIRfENfTfyLCx6xjuCiE2yHudXvPAqZYx6gsx3tArWruy2cQw7lNfU/BOTexeEGccy5A8m/WCYIm1h3MNL+CLWE+XSsP7AbX/I5tkyh0vLPJx/y1Tct+TJ5dEg8ufutc81aUY3M7Xvye55YrHrYOEZXwx809zsYVv7QOEaUFz+4E1DrG+MR240nSs4DJphmqoa8ptuju/xDw+2ZZxvYSSXo566/aax3kVd2rTwZmWceoSL2Qpm5TZp8B2HeZrMjPcd0Kk+cDbdYxKkp9tHvNulbORnmzdYyKoip21PCLwJNIuhm55utc+xZCvW5Lm9ghbvquJ4C0accbi6Zjd4hbeH0HmvxZk9OMTbTITUtebsqxErmgKcepXRwdTFVXY/0QnIuDcNpocXSAwt83HZWW/DqrZkkc51bSiN6TOOdc47wgzjkXnlS9IG48Ku/Z38HChiR5jvQskLS959X/dek104Bzczze2DS1LjrckuPiF42OpdgvUbuOg1GQ74EEXgAUnAXWAcYn/qa/XsViCgxaxxif8YZnLBubrzzp27XyzaDN6YZQC5Febl7xoHWMA4jB9UhdEn+Nq5dG0A0JvFiqEXGcY2VK6W7rEPEpnAOEedPztWLpxnBJ3wkgR1jHqMhfD105iYY6LnUPF7z486YdbbQj5TNNO95YRMYuiJuyexnoG5ucZiw/Y++O65t2NOX8ph2rNvcG38G0c9V7gUusY7hoTGVRfwivMWOIYt9okOcPu986RHSSKN5vpkjhXusQzjnXTF4Q55wLz4yj7gN2W8cIljCTjhl2BSd7t98B7Mxt/dd2hNvX8R6gPbdjlWM9QlQlz6LDWex++uxX/5d5x8HQqY9LrcVose7ZFT/OlPpopcZMsg5QwUumR4+j2AIo3UlP/2SkcAMwzTrNgWQ9A71/Y53iEHEUO5bQfb6xWS8NdLTagYaZUWpeZ5mWE8U5fogbV8QwojwsSRSv0ZBEUsBViqK7xcvse+EB6xAuUKKhPshw3/6HjJppW5OPd7BDC+Iu65uJ6icMshxK9U/YWhxp2vEk2IK4sPdJFhcnkcjXrGO4yLQnYY5NlSjek9zLPUuGrUNEJ459owcY6N1lHcI555rJC+Kcc+FZf3kJCfyNuLnErqvX1uIIKv+U4xF+/bVZFaYpp/PelUebHBtAJ20hz7EWIqPf48XFSSgLcztOK0j0e9YRojJ59mmEP24ujs4cIZq3rh0oVPw4W80ZdVNeDJtfL7Bxxc+BrwJvtw5zkEcZmfxH1iHKCP/cKvez6eO2RaExEwn15vlryP1BjRKOjUTwe4yPgKxLHAWtLzCw9FHrEFWK4ft5V1OLWFxcUsLsECdyX/MPqo83/5gHOHRvbV/yaWB286Mc4i42LvvfTTvaotXHBtIV71Aa+PXH7tmfAE62juEik5ZOtY5wiEXrZhDDz7Kq753W6tJrpoG+1TpGFfzcOucmHC+Ic86FKSXPkZEtwLirl6R5djA7jovXjr4xFOwK/0ba7L7Hm/74/2fvzuPtqut7/78/a5+TgSEJqEzXOiAOTMqYIGgvFchAxNr2hlpbb+WnbRzIOUkcW2vdaquXooQEkEbtz9vbwZa0vVaEk3MCNbWijMos4ECQUZAkJJDk5Jy9PvePBGTImfbZe3++371fz794+Ohjfd/NOnvtvb7rsz6fRyXd0rTj++5Cw60zT5a0T9PWyd9T8iLtTcHUWKIPHn5lSN3T6J5Ur1nbU3hoMZa4YqC3r5gl6dVh64/fTzVv1Xvk/sHoIM+zU/J36KrFzetCW68Fq6ZKen10jLHtHoWLictl89qd3yX1mnvpAXK9LDrG2Hj4VB+P66A+Xu7XSebRMcYngwJDS7x4A3HOWr2XTEdFxxhBQJdX29D6NZ/jEMl/NdL6jIsOkevcwDy/YsXHW3pd7kq2O5xUqaR7TV2w6qWSfzw6BjJUWHod4iqDJyqL5/LsLUzY4LQTlP5LxOLcAuhEGXzxAuhIRVNHRrYBm7P7jaIYXg409fi12hk68+KXywMLC6JHibo389/4ZC1YNUNWYVzqqOxq9fUMRqfIS+IPI0236vLF0R3E8tWtA6MjjM3iCuIGK7Ml2Zj/d/FOlOkrSi2r6RNauzTVjbmbkLd/AAAgAElEQVRjJU2NDjE2Cmnqls3mtVL9jKSvGEy9aH+XMpORmilZuOJQyQ6IjjEmy+Tcnlrtkiy1DrIv5Jn8e6L1hgdPlNQVHWOPylpAhziL7hA3Vadd8qsXqyrlZyTtFRfnGWvVt+Q/Wrqi2SktXW/c/FFdeW7038nIXBco/UkESJErvYI4lem/dCBJBb+zJqzIYlyqVNQ4twA6DgVxANLUt+RmyR+NjpGwLnVv+42w1fuX/0RS88a9mM6Q1+Y17fjj4ZqrajXue9KaWhTarVr56/Lgor/klf3RCTKU9s1/SVv4SbFK3Cjp8TJ/PGxtT/zvP21r1dfzxegQI8rl3Fboalq3bDaveTBRN8/iHO/QzE23RYfITq2SwbhjSVbk8Tt0+v5HK41ildF1DXM9xEhSLYAe0uCsO1u+qoePTJWm+iGSpPkXvlbSH8aGkSSV8vITLV/VU+0QZ9+PTjCiBRe9RfJF0TGQrSOe06EyBZbFPclG9S1p3nOfduVZFDtu1y/2uiM6BAC0GgVxABJlLllr39TLjRfBxUzezIKtt8htYROPPx4v1nX7vyFs9X03/ZeaOfqvsHdIOr5px28HVlAQNxGnXrKPpCOiY4yq8GujI2TNaxmME1TgA58MxoulyPQLFV3npD1GLotz+5S2Pf6j6BDZymPzeqvmbLwrOkS2ihwKW+2HWlPdGZ0iO3l8fl1dg3l0eCw9hwLDh/St5Q9Gh0CiPNm/4Tu1/pwdLV/Viw0tX/P5auXuF6vs80qje9/X1b/sBy1dce75e0v++pauOX5pFhifWu2SlxdGx0DW9tGZl7wsOsTzpD1ZQ5Lcr0t7fyZVWRQ73qSbFg9FhwCAVqMgDkC6XM0dy5m/2A5qKpp5fvaV/K1NPP54zQ1bedfDsP9q4gq/J34HjOan6uv5aXSIrEyvHa/Ux80VnseDyGRZ2gWPkkJHAlkOxRbJKVXzd+nKDz4SHWRUeZzbG7W+OhwdIl+W6sPzZ/EbVK2W0Sny5CbXCdEpxuRlmg+kU5dFpw37qS7/8C+jU4xT+g9qTel2M0IKEr0m+A9Dlp05dJ+k2MKGwg7RvFWzJb09NMcuQzL7VMtXLaacpDSKAV/IEu0yPW2/HklHR8dA5tzT2cea+8Vfk3RIdIwxmeXR1Tgl81YcLOml0THGgXMLoCPxIBxAunzKFZJq0TES9iotXHFo2OrTav8hqZkPXuO/o+JHijazC1/8v2/a6A43Ual3k3Bt1olP3B0dI3OJjnh5lqiRQGde/HK5DgxZO2dm/0sDS5v5XTd58y7YX67DomOMzdnYrNeuzev0R0KLcal1m7/yNZL2i44xplxGaqbk+NXdko6NjjEmy+gabRkUCDvXQ4zg9JUvU6rf6W43h6y7Zvl2mR4NWftprkNk5eclpTC68K9DXn40O6Xla45PKfmN0SFe4LQLD5T059Ex0A7KI6MTPKPSnf5vLEly42XiiSqUx7nN6Z4EABqIh+EA0jXw/kclxtuNariI62D2jWWbpba/QXqTzlq9V9jqXqMoK4rZ2ugI2bHEu0kUorPOZJx28YskpT8ytbCfh6xbq+Wx+ZWW6/Xo1Gp0iLFVZiuNh3ejo5CmflacFB1hXKzkHNfLcnlAwRv7E/aiHa+XND06xpjKTM7t287bV/IMfu/RTREj6E64Y2QRVBAnSaU2hK0tSfI/kOwtsRkkSU+qnPIXISu7vzFk3bGY7lRfz5boGC/QVfyVpJnRMdAG3NMpiJOnvW/6NO9u9+c9jedFur8/nq1WyeOeBAAajII4AGlz+2Z0hKRZdAczb/extlO1c8evh63ev/wOSQ+Erd+5tmqf4auiQ+Qn+W4SFFhPxpThhUr/3mGb9jloQ8jKqReEpsa1WSp/VzctHoqOMqYi4QerzzbEm76TkMc5Hu7iHNetyOEa/bj6lvwsOkR2Kplco4tMOpoNTjtBUiU6xhhqGh66KToEEpVq0ZHkGpoaVxBniumi/SuvDV7/aV/Y9fJ1i1WrhaQ0/zY9wX2SuStPlvm7omOgXVg6BXGexe/Wn4VcJ/OXw7l9TANL7o0OAQARUn+oBaDj1f4tOkHS3N6iU6tdYetbkfaYs0YwRY9NvTp4/c5julxrlm+PjpGVMy85SPJfi44xqhrFIpPi9tvREcbmP9Sas2NGrXsWm1/pML1fa5dtiI4xLu45nNtHdFVvTHfE9pB6QbckPaB1Sx6KDpGtPD7H10nm0SGy42UO53ZI+wzfEh1iXHIoAnfdpoGPPBUdA6nyVL/T79VVi5+IW96jC+JS8JjMVoSsfO2so5RqtzNXWgXb1WqhQhcqhw7dyMXhksf/PVWrheTHRccYB/ZOJ8xNruOjU4wD5xZAx6IgDkDa+pf/RNJd0TGSZZqlaTPjOh5sf/w6SYGbei1gihtLK0lm7V90mJxyTXSC7NSGU33w8CxTufGv15mXHCTpzOgYY3LFjHVYdFlFphw2NtPgulRre/8pOsb45TDWxLi+1WtXx470N68tsYeVOVmwaqqkN0THGAc+x/Xw5DsUS/JbsnnZJocCQ3Ouh9iz41d3S5bmb3LTD0PXd6MgzvTZsNGgVpwSsu54VIq0rqnX7b9Yovs6GmofnXnJy6JD6PoXHSlpRnSMcWBc6kQtvPB1Ms2KjjEmY98IQOeiIA5A+kwUp4yqiCvYWl8dltu3w9ZvBddRWrDqpWHrd+3sl1SGrd95ntQ+3h8dIkOpb1jS8n8yasN/JKk7OsbY7Achy2555ChJ+4SsnR27QzNqH4pOMW5zL3qlZAdExxiT0QGzbt+fcbhyeDBRUixVNyuPkTQ1OsaYrOAcT9TbzttXlswYvlFkMi5VkpRDh7ic/j3RUgfufIOk6dEx9sgtblyqJMk2xK4fboNkXw5b3f3ksLVHt1V7H3hndIhnzLtgf7l/JjoG2lBZix+bWtbS/421C/ckE1Ur8ji3JftGADoXBXEA0lcr/jE6Qto8dqSnle3fwcx1etjal3/4l5LyGLHTFpxxqfWw1MfN0UmibgtWzZBpaXSMcekqbwxZt8igm0oadkjlO7O6xhZl4te23RgJXb+iK49zbCXnuF6eQYGP5OoapBvDRO2cNls57GvmUrQ8b8XBkuJeBBuvrvLa6AhIVK12UnSEEXl0h7gOH5nq+oT6egYDE6TaIe5GrTm7Fh3iGVZ8TtKLo2OgHVl8QVwOLx1Iwyp3xn5f5SmHc+sarnC/CaBjpb9xBAADS+6SgjePkmZzdPrqmWHLezkQtnarWHDRoXv7/xsnw+hIOWFucp0QnWJUdJKoX+kflbR/dIxxeFBXLI0ZsZ5HsUU81xKtXXprdIwJSr37pSS5uqfEFIO2hRxG4qqUVWI6YLYDz+EBhf1090swmAj3PApaa5U8CuKK1F9wkSQ9oROfuDs6BBJlCY9QLi12T3Nn14bQ9WPdqjdu+qew1U+78EBJrwxbf3TpFBgvWHWsZO+NjoF2VR4RnSCPexLdpoGPPBUdIj+e/rk1/URXn/t4dAwAiEJBHIBM2NejEySsS93bfiNs9f7lP5H0s7D1W8H9dFWrcd+ZZu3fhS8NW9U9jXGpEzX34tfKNCs6xqgKCuLqMv/C18r04egY4+Lql8yDVk9/8yvev6i/96vRISYui2KLu3XFBzZFh8iWZ1AAYrpTfT1bomNkLP1rdC4dxFJjWRSkP6GTH78nOsS4eBbjnm5QtVpGh0CqLNEOcf6o1i15KDTC+g8+KakzH4S7PhZ63ejSm8LWHosrkX0SN7mvlFSJToJ2Fdwh7qzVe8l0VGiGceGeZMIWrJoq2dHRMcbkjMIF0NkoiAOQh5r9gyQ2PkfiRWwHM3mbF2zZAbpu/zfELW/flcQbWs33z7p88bboENlJf6TgTtFldOKOX90tt7+VNDU6yriYrw1Z96zVe0mKf9s4Zaafq9L9x9ExJuzUapdkx0THGJMbG5v1WnTBdCmDBxPJPKzM0NtXzJL06ugYY6KTbb3S7/Bouj6jAq4MCuI8nW5GSMtpF79I8ldFx9izIo17UdOG6Agt5/qO+ntj7hOfZpbquFSpLNIYnzf/oj+U9OboGGhrR4S+6D604zhJXWHrj18a14S8HKsc9k2dcwugs1EQByAP65Y8JPn66Bjpsrmx6xedMNIz7t+4r2dQ0n+Frd8pSn0tOkKmUn8YecvuzxAm4sWDl8gy6Jy0y7AqU64KWbm2/QTlsbEZZVheviPLDmbT9z9a0t7RMcbGW9x1e7L7OEnd0THGZLzNXbfBymxJFh1jTJzjiTt95cskHRIdY0zumRQ7usl1fHSKMZUUCGMEXeVJSvV67+XN0REkSe73RUdoOSs/Hh1BrpOjI4zgvvDOhZL0tvP2lfxz0THQ9vbWtTNfFrh+Bi8dSCoq3JNMVB6jcJmcAqDj8fAGQD7c/kamt0THSJMfpoUrDtUVy2JGl06r/Yd2FMNq5+8V9zMknReYYJ2k+YHrt7u7NdDzfak3OkeOUr/5p5PERM1b+UmZ/1F0jAm4JqzgqizmSFGTWjPg+oT6l30/OkZdSp+T6GPV52LUYv08+Q6nu1jJOa5XHp/jIe0zfEt0iOx022x5Bt+/VuTx+V1w0eFyzYqOMaYa3S0wgsLnJPuTvEilW7ltiE7QUqZ/VV/wfciiC6Zrq44NzTCyNIojdk77tKSDo2OM01ZJj0WHSNSLJc2IDjEqrxwpBXXKdJstS/VL6hlPau8D74wOkR9PfU9c4n4TANq4cAFA+ynsX+W+UrtusvB8tcoZklaHrP2NZZs1f+WNkk4KWb813qy55++tgY/EjC4tNUBf1yYyfVUZ7E4kZ8GqqXJ/fXSMURlvwY2fm+av+pSkT0UnmRj/u8DFU++QGMj69caNX1B/dI665XBuB2XFrdEhspXHg4lt2vbE7dEhsmVZfI5v1prl26NDZMfL2ak2g3qOnZkUtObR3eJeXb30F9EhkKx096JcaXSIk93XQS/y1FSUn4wOoaeKEyVNiY4xgvh9kgWrjpD7udExxq30d2pg6beiYyRp/sqqkt9H8iMlXRGytOVQNGU3as3ZtegU2THNTv+r1W/hfhNAp+PROoB89PUMyvQP0TGSZX5G6Pru7T42dYpsypvDVh/ovV3SA2Hrt7dhWdffR4fIkpXHSJoaHWNUw3RPGpfjV3dr3kX/W8lvYr7Adg1P/5e45XPY2Izgj6qovFvVahmdpG5m6XcPc93MSOhJyOLBhG7S+upwdIhsWRZFPvxOqYdncI2W7sungMszKB51uj5jBG4qky2Afkonbf5xdAhJnTYy9W90xbIfRYdQaadERxhRmUAnfS8vktQdHWOcrqYYbjR2d3SCMZmOCFl3waqXSHplyNoTQef5iZt3wf5yHRYdY2zGuQXQ8SiIA5CXmr4aHSFZpU7TqdW4zp9m68LWbhVTbNGhdHXw+u3J7Vu68oOPRMfIUlmk/jDyca3r+Ul0iOTNu+BIvWTHNTL/n9FRJs6/oasWPxGy9NxLD5D08pC101aq1B9kfV1923n7Sv666BhjMgpp6pbNgwk2r+t25sUvl+vA6Bhj4uHTxC26rCLTcdExxiG++854mVL/TS85XZ8xggUXHS5LduTvLem8INIxI1O3y+yz0SEkSaaToyOMYEgza7GjfOetPFuyt4RmGL+aimJZdIikeS39grhdHeJar1am/xtLkmSMpZ8oK05UFi2r2TcCAAriAORloPd2ya+JjpEk0yxNmxn3VuyOTddKiilKaBmbF7q8q9278MUw/0p0hHwl3k3C/XpG4Y7i1GqX5q/8E1nlJuUxHvKF3P5P2NrFYLqjmWL9lQaW5l0kPzjtBEmV6Bhjo5Cmbrk8mCg5x3Wr1fI4x55R0VQqtj50pKR9omOMyTP5/J76tWlyHR0dY0wFBXEYUcq/yWOLjp6tNnVDdIQWWam+ngSmK7jJU/3bDB6fd9bqvWT6q7D1J+6vdeWS26JDJM2H71byM5ntCFWrrX8ebpnstQ1l8rs1JW45dCOXKiXnFkDHoyAOQH7cVkVHSFcxN2zp9dVhuX07bP2W8CO1YNVLw5afMjQgKZG3i9vGPTpp09roENlKvZtEUcSPAUlRtVpo/oWLNG2/OyR9TqmPvR3ZzzTj4MjCqzw2NlvrBu27Kbexuy+U+rXtaUUXG5v1yuXBhLF5Xbc8zvETyYzSy0ku12gVeXx+p20+VtKU6Bhj2Knt+94cHQKJck/3muBK5+92V1ft9n6J1bVZXjs/OoYkaeGFr5P04ugYexZcYDw8+Anl02l9k7qHqtEhkjfwkackPRwdYwx76Xsvav3fnWVRNPWIrur9eXSI7BTK4dw+oROfyKCDIwA0FwVxAPIzuOnfZOJH+h557EhPK/PuCDMe7qeFrX35h38p161h67cluyCdESaZWfil/eQ6LDrGqOis81xvXzFL81ct1rX73y3ZZZJeEx1pUlzna83ZtbD1zdJ9+BbBtVll8btaU90ZHWXyEu9+Ke36977ygxTS1MuSH/ktyR/V2mUbolNkLP1zbLqe36F1yKMbQ00++IPoEOPiRQ7/njdr/Tk7okMgWYl24ZLkCXWI22VDdICmMvuc+pdvjI4hSapZquNSY7vTLlj1KrkvD1t/olyf1uUf/mV0jExkUHRTa/HYVDfl8SIlXXjrk8O5vZH7TQCgIA5AjtZXhyX7UnSMNNkcnb56ZtjyNWv/gjgptuiwYGxqA21UOfj30SGyVQ6fKMmiY4zCpRoFcYsumK4Fq87S/FWXaUfxsOR/LXnahYzj85hm1P42bnk3uU6IWz9BZh/QwJJ7o2M0RgbFjmbXMRK6Xm6SZ/D5ZTxg3RZdVpF0XHSMMblzjuuTfgGX67bd3VLSl0d3Cz4r2LO55+8t6YjoGCMY1s4Zd0SHeJ4N0QGa6EF1T70kOsQzzE6JjjCiSiXumuq+UtK0sPUn5m79chrPH8bLMiiIM2vt98UZqw6T9KKWrlkP0w3REbIzf8Ur5DowOsaYjD0FAJCkrugAAFCXouvLqg19UtLe0VES06Xubb8h6Rshq6/r/bHmr/yZpEND1m+NeapWi7C3a0pbJ/OPhqzddvxL2TyoSlHpc5Iuh5N+nMzb4a10/OpuvWjH61XYW2R+hrbqTZJPj47VcGYXa83y7WHrz1/5Gsn2C1s/Ob5aa3u/Hp2iIeatOFjSf4uOMSajA2bdcnkwIeMc12vrQ0dKlsF9oh2kBSv/ODpFVkoVklrc3aMOpp2NP7d2t/p6/rOxx5SUR3eL/fmspK64X31L+lq+rE2ZrXSfb/wovc6Gfl/a77RNgtmf6/LF26JjPMOVakHcxl1dps9t/coLVp0l94WtX7huy3XT4qHoENlwvyf964u19jdkl82WZ/AOW429hQnzYnbyf+6SpBrFjgCgdG8YAWB0V3xgkxas/Du53hcdJTllMVdRBXGSJF8n2eK49Zvuxbpu/zdIQaMvBvf9rqZt2SZpr5D128dOufOm52QUmq2093Xa+y24U782TdO3HqpaeagqxWEq/WiZHSPtOErSFMmV+PmZjCe0s4h9+98tk82vlrhT3dPzGXszFivSHbv1HMbGZr0qPif9hzXaNU4T9THNyeQ78L1yvTc6RFYy+OjuNlve4M5rpo9LamxB3LwL9pcrh87Bvy/X70eHwCisXCkpoCAu4fHYbqmNS5Vk90UnaJK7tX3j/4kO8YyzvvBiDenV0TH2yD2my/SCVVPl/oWWr1u/q7W298roEHmx9DvEFd7agjgvZ2fw49XVPeXG6BDZsSxeKJGGu9hTAABREAcgZ0V5vmrFe8W17LnMYkd6utbJ1M4FcZI0V1EFcevP2aH5K78jaX7I+u3j6+pf9nB0iMwlfvPv2zRv1enRKUZUqJCXzxtxXewt8ym7/tv2knxvlb6vCpsp1yzJDpL5iyW9RL7lQLmkwiT33XtseTz9nzSzz+vqcx8PzVBk8qZv8+2Q2zuT6sYweTmMjpN2lmxs1s1yOMeuoouix3p5FucYmJiyGd07KrOVwZNaZMCDRnK5zUl2gryVN0dHeCHb0Jb3jFZ+XOurw9ExnjHUdbJSvbZGjc8r/aMyvSZk7YkbVqml0SGy47V7ZJXoFKNzHd7aqS9Z3JPcoys+sCk6RIbSLch/ht2vdUseik4BACmgiARAvq5Y9jPNX/l1Se+KjpIWP0wLVxyqK5b9LGT56X61dlhNUuJ3wZPgfoak8wITrBMFcZNRymvnR4fI2tyLXikvD4yOMTpbLPN0i3NdeuEe+bO7uu3+D7Pn/m9t+Pxigh5Q19SLokPIPYeNzeYz9Wptzy3RMRosg41NbdDVS38RHSJbrhw6PPJgYnK4RqPdlCrspoYfNeXuWshLadeGrGsp/yb39DrElX6fiugQDXe9+pb+u7QsOsevmJ2S7H27B3TSn/vFX5PpYy1ft36XaqD39ugQ2Znx0nu19eFBSVOjo4xiL90w8xWSmv/M5PjV3dKONzR9ncmKKmjP2aLLKtr68HHRMcZkjMIFgKe13y0QgM5SFp+T1KK3ejJSq8R1ifvGss2S2r2jxZs09/y9w1YvinVha7cDtzXqX35HdIysVWoJP3hAW3N9LLwb2aLqFEnpb2w2m+lf1df75egYDVWtFpKOj44xDmxs1mtRdYpMx0THGAfOcb3OWr2XpCOiYwANZbpTfT1bmnDkxDs+IxOPaWDJvS1fdf6KV0g6pOXrjo+rMjW9l0ZqlQ3RERrO9fGQEaCjcZ0cHWEEruFK6/dri64LJMXtoU7MJnUPfSY6RJbWnF2Tt6DQbLKGrDX3CQfufIOk6S1Za1LKdn+G03hbHjlKOVzTSvYUAOBpFMQByNvAkrtk+r/RMZJjHjw21QdC12++qbIpbw5b/colt0l6IGz9vJWq2F9Gh8hfwcMzRLhe/T1fjw6hLfsfo7Tfem4Bu19l7Y+jUzTc92ccLmlGdIwxOW/61i2Xzy/nuH617SeIaQhoN017oOX8psfkWUDHKUkyS7nD4YYkO71efe7jkrZGx2igK9Tf++3oEM+xYNVUSSdExxjBj3f/DbTO/JWnSfofLV1zUqyqyz/8y+gU2TLdEx1hTJXiyJasUytT/o56loL7zokqyjxeEreScwsAu1EQB6AN2F+KIXLPVeo0nVqNexBUVNq9IE4yzQ1OcHXw+rm6bHdBISbDPZONHbSRnSqK9ybx9n/R8X//wyr9HepfvjE6SONV8tjYZNN6EnLZvA4qLmgHZdHp12i0I7PGX/cXrjhUsgMaflx0nqhxa550QdzN0QFGZj+PTtAgpYryz6JDvIDXjpM0LTrGCFr7Wd21L72ipWtOzl16bOql0SGyZro7OsKY3FtTEGdZdOEdVKH0upmmzi2HPYVSVvlBdAgASAUFcQDy19fzQ8n+JTpGUkyzNG1m3I3X9sevk/RE2PqtYIrtwmfG2NSJK1WK7nCTteiyiqRjo2Ogw7j+IpliVs9iY7OZPqmB3u9Fh2iKQjlsbNbkg2xs1suy2LwelBW3RofIWKdfo9GOilrjixhqRQ7XQ+SgLIOKuO2kmHXHwfXD6Agj8w3RCRrC7e915bL0Cg+tOCU6woi8xQVxU2f1Sjq6pWtOhhXLddPioegYWXNPv0OcqTUjUz2DvQXXzerrGYyOkaH0z63pTvX1bImOAQCpoCAOQHsoij+TNBwdIylWiSvYWl8dlrQ+bP1WcB2lBateGrZ+rXud6Iw4MaZ/0kDv7dExsvfUg0dL2js6BjrKLfrltP8VHeJZUu5G0Wzf1r4Hnx8domk8i3N7uwY+8lR0iIylv3nNg4nJsY7v4on2s12/2OuOJhw3/eshcuDqnnJjy1ddVJ0iebovaRWWXqHWr2yIDtAAO9VV+3R0iD1ynRwdYUSua1u21mkXHiizT7Zsvcm7Sn1L+qJD5M8y6BCnw1WtNve5+OmrZ8r02qau0QgmOs9P1Fmr95JaVFQ5GSXnFgCejYI4AO3hynPvkfS30TGS4mXwSE9v/7Gp7qeFrT3w/keV9BiO5AyrVnw2OkRbcKPzClppUGbnJPOm9ttXzJL06ugYMfxRefn7WnN2LTpJUyy6YLqko6JjjAOjNOuVy+eXBxP1m3vpAXK9LDoG0GA3Ned3kFMQh8lz3aUrPrCp5etu2f8YpTuWUlLKHeLsvugEk+b+JV2x7GfRMUbwxugAI9ihmZta13G9286XNLNl603OsLy2NDpEW7AMCuKkvXTDzFc0dYXK4InK4dm764boCNmpbT9BUld0jDGZsacAAM+S/pcyAIxXV+1TkrZHx0iHzdHpq+M2H2odMdIzeGyqOuHfuFG+rIEld0WHaAtudF5BC1nvrtHoiRiszJZk0TECuEq9R/3LHo4O0jRPdh8nqTs6xpjYtK7frs9vBnsgzuZ1vYrBdMfnAfUya3wh9KnVLsmOafhx0XnMYwr1TSlf7x9XX88D0SFG5J57QdxW+dTPR4fYo3kXHCbpoOgYe+Y3aU11Z0uWmrvyZEl/0JK1GsF0ifqXN6MTa+fp63lM0sboGGMqK0c2eYE8Xjow7jsnzC2Tc8tLdgDwbBlsBgPAOH1r+YMy+1J0jIR0qXvbb4Stvq73x5LuDVu/JfwMyeMKI1zt34WvMZ6QWTU6RBvJ4+Yf7eDvtbZndXSI5/AO/fs3na+Bpd+KjtFUXsvj3LJpXb9cPr+1JhS/dA662KL9lE247k/f/2hJezf8uOg8HvSdlfJ4bNMPoiOMzjZEJ5gc+6vdExPSUxTpjktViz6r1WqhQhcqn5fINmlnhWkSjeT6cXSEMbk3tyDOMiiacm3WSZvTP1epyaMgbrsenXp7dAgASAkFcQDazWckPRIdIhlexHYwa/uxqXaAFlwU92b9jhnXSNoWtn4u3D+7+y1FTNapl+wj6YjoGOgIt6h72uLoEC/UkePFbtA+mz4ZHaL5stjYfEo7Nt8ZHSJfWXx+N2pdz/Vt4aEAACAASURBVE+iQ2TL6GKLNmRl4wvicikQRvqKoII4T7hDnPvN0RFGNVxm3CHOH9WU7SujU4zI7ZToCCNyteazeu2s9ymnFxTc/1xXn/t4dIz2ksXY1Gbva6b/GTBdr2q1jI6Rnyz2FG7STYuHokMAQEooiAPQXvp6tsj0qegY6bC5oct7B4z0LD2u6HD9OTsk+6+w9fPwMxXFxdEh2sb02vGSKtEx0PYeUVn8li5fnGLB7wnRAVrsCZXF77ZsvE6sHAppbtT66nB0iGxZDgUgdoNkHp0iT27yjrtGo+35o1q7bEPjD5vFwzykL6YDyYJVL5F0aMvXHbfih9EJRnV176PK98XKT+ubH9saHWJEpnQ7xNV0bdPXmHfB/pJ9uunrNIrrR/rl9LQ60reDwu+JjjA2a16HuLlf/DVJhzTt+A1D5/kJm3vpAZJeHh1jHDi3APA8FMQBaD9zNn1VppuiY6TBD9PCFXEbhdP9akm1sPVbwRTbhc/L9i86nBT7iPp6BqNTtI0y4dE0aBdbZHamBpakN3L7zItfLung6Bgt5fpAkuei0XY9WH1ldIyxsWldt/krXiHXgdExxuQl41LrNX/layTtFx0DaKwmdd8qcigQRgZuDOpAkm53OEmq1NLuELer8P7n0SnqcK/23fzV6BAjevuKWfJku+k/oqt6m3/OrfJ5SS9u+jqNs5wuSs2QQ4c4P1yLLmvOy75WyeU31g3RAbJTGcplT5xzCwDPQ0EcgPZTrZZS0SuJ7gqSVKvEFWx9Y9lmtf+P8Ddr7vl7h61eqbT5WNpJ+Z7WLvm/0SHaCg/P0FzbVfhZ6utJs6tCOdxZf/9uX1F/7z9Gx2iJMpNrmxUUxNXLizzOsTjHdfMsxh4DE2SNvya87bx95Tq84cdFJ4op4k77Ja1t2uu/5dAdKb+xqeZ/knTX6sGuNyrVZ21uLegOt+I4Se9p+jqNc4X6e9dGh2hLlkNBnKbryUde0ZQjF5nck7i3+/OaJvD0R+FKUlnwkh0APE+aP9IBYLL6llwj6Z+jY6ShDB6b6u1esDVVNuXNYatfee7tkh4KWz9dQ5K/n7FjDZfHzT9yNCz5O3Tl0u9EBxlZJhubjXGnpkxdGh2idco8zu0QHeLqls2DiW4eTNQrl3MMTIQ1YeTR4LQTJDWnKwo6izWpg+GY6ybdIe5WrTk7gykJ5YboBBN0i+ZsXhMdYlRleUp0hBGZN/mz6iarXKx8vluG5bWPRYdoW3sP/URSGR1jTF42Z2xqDi/pmH6u/mUPR8fIjivlgvynPdYRUx4AYIIoiAPQvoZ8qaRN0THCub1Fp1a7wtY3a/+RnqFjU80ltf+/8cR9QWuX3hodoq2ceclBcr0sOgba0qDMfk9rl34zOsioPJMuYpO3Q27v1OWLt0UHaRnLYNNa/mhLRh21K/cMzrHu1cD7H40Oka08zjEwEa6iq/FFshSPolFqQ60viKtWC6X8kpYrzU7XL5BZh7jSP7JrGkjCTCdHRxiRN7mb47xV75b8jU1do5HcL1b/8juiY7StNcu3S7o/OsbYrPEFcdVqIflxDT9uo3lQQXvW3CQdH51iHHiJEgD2IK5AAgCa7eqlv9C8lX8q06XRUUKZZmnqrF7NvzDoIap1SV5TPm8KTpzpLM2/sPkjCEY2GLh2in6qfWufjQ7RdmrDc2TRIdCGnlTpv62B3rQLexddVtHWh9Pf2GwE1zL199wSHaN13KRV6T5YfUYR+Tsjb7l8fr0JoxE7xaLqFG3VG6JjAA12j674QBNe8Mtk3BNS97AGPtT6gofv7XeECs1o+brjVejm6Ajj4rovo3v7/9TA0rTvFXe9hJzqtbVUYTc17egLVs2Q+1827fiNt1HDXX8RHaID3C3p5dEhxnBEw4+Y+nfUr9CVfKLOvOTVKvWi6BhjMvYUAGBPKIgD0N7euOnLuna/d0kJv6nXCmZfiFu8AyZWul4t2WXRMbBb6e/f/UYiGqmw2fIO+DyjlTbKbKEGetMv9Nn60JGS7RMdo/n839S/9K+jU7TUGasOk3LY2GRcat2eevBoqdg7OsaYOMf127L/MTKfGh0DaLDmXBPyGPeE1EV1l0l7XKrknkeHONeGTAriXGYfjw4xpr1edIzKMtV7xTvU17OlaUcvy0/L7OCmHb/h/JO6+tzHo1N0gLslzY0OMYbGd4grfI5yuLgaXcQmrByencW5LdlTAIA9YWQqgPZWrZYqivdJGoqOAqAl/i75t4ezRTcJNJDpdtV0kvp60i+GkyTrhIfHdr+8/KPoFC3XlcnouBobm3XzIo9zbAWja+pVeAdco9FxvAnX/XkrDpb00oYfF53HPKogLuXrfU3d0/MYw+jFhugI47Qmi/vFWnlKdIQRuTXv32/BqiNk9sGmHb/RXD/Sjs1fjo7REdzviY4wDodr0WWNnmaTw75pqe7tP4gOkaEczq1ruEL3PwDYAwriALS/K5fcJimn9u0A6vO4yikfjg7RntxUZnHzjzz8k2o7T9K63h9HBxm3smj3v/9hmf2e+pdvjA7Scl7mUCzl6p5yY3SIbLlyOMfDqu3IY8xaipzfKGhDpsYXHBVJFxMhK2VUkVLCf8N2ly5fvC06xbisO/dhSTuiY4xhWGXxqegQ42IJTyWxsnnFq+4XS+pu2vEbzXyZ1leHo2N0hKLIoSBumrY88MrGHjKLl+3u0Dc/tjU6RHbcEv798TT7KR0wAWDPKIgD0Bkem/Y5mW6KjgGgiVw9Gnj/o9Ex2tLci18r06zoGMjesMw+rrW9v6eBjzwVHWZCrM27D7l/Sn1LromOESOLTet7dMUHNkWHyFba3WSedlt218W05HCOgYkYlBW3NvyouXTMROpKWaX13WXedt6+ko5o+brjlsm4VEmSuWQPRKcYlemrGlhyV3SMcUq3IK5s0njjBRf+rqTfaMqxm+NyrV3aHx2iY1hxd3SE8ak0bmzqogumSzqqYcdrHrqST9Txq7tlekN0jDEZUwUAYCQUxAHoDDctHlJRvkvpvwEJoD7/ov7ef4wO0baspPMKJutOmb1ZfT3nRQeZsLNW76WkH75Nlq3XjEPyOy+NcPzqbimDjU1v0oOsTnDqJfvIdXh0jDE1oxNUp3j7ilmSXh0dA2go183q6xlswpEpiEMj3KG+ni0tX3XntNmSGj3ernHcM+v06huiE4xiu2R5TPo48+KXK91R1Fs18+AfNfyoZ63eS2453T8OqagwTaKVZv/yfknpd8y0Bu7zbK0crxw6JpoYqTlRL9l+jKRp0THGVIqCOAAYAQVxADrHFct+JLNqdAwADfeAvLY4OkRby6O7DtI0LPfzZHac+nqiRitNTm37CZK6omM0yWOq2e9rzdm16CAhdm1sTo+OMbaSTet6Tdt5glJ+eP40Nq/rN1iZLcmiYwANZd6EIlk3uY5v/HHRgWKKuD3xjs1FJaMOcZKk+6IDjMh1gfp60u5g97SyTLc7nPyGptznDe34M0kvb/hxm+ciXXluDiM820e1Wkr6SXSMcWhch7hcXjqwkvvOifIspgpwbgFgFO36YAcA9myfg76grQ+/VdKboqMAaIhSKt+l/uUbo4O0uTxu/pGa6yX/I/UvbfzIr1bKZfNr4lxm79G6JQ9FBwnjNjuLMhq6h9XPKnPkHp1iHGpsXtfL+Y2CNmRF468JCy98nWrFrIYfF53Hg36XWDFHSvg7vWswr3se132J/g7epK7uL0aHGD8/JTrBiKxo/AtpC1a9Su7LG37c5tkor+XRbbD93CPp9dEhRuUNLIhzmy1L+Dtql23a9sTt0SGyY8phasqQ9s2tUy0AtA4d4gB0ljVn12T2e5Iej44CoAFMX9DaZeujY7S1BaumKvVNLKTmPpkW66RNb9TazIvhpHYuiPui+noujw4RK4tzOygr8v8cRfEyh3O8VTNeeld0iHx5DucYmJhhb3xBXK2Sdnct5KNSBBXEJd0h7j5d/uFfRoeYoA3RAUbwF7riA5uiQ0xAuh3ivGz8Z9V9paSpDT9us7g+wQu0QVx3R0cYk+l1WnRZY7qJWxb3JD/Q+upwdIgMpfz7Yze/RWuWb49OAQCpoiAOQOfp63lApb9bSb9aCmBMptu1fcanomN0gGOV04YnIj0ms4/L7LXq6/3y7jEZbSCLjc0J8hu176ZPRKcIl8Omtetm9fUMRsfIVw5Fj00aZ9U5TogOADTYRq3racKYMc+huwXSt1V7H3hny1dduOJQuQ5s+brjl19XloqnODL1Qe1buzQ6xLidesk+ko6OjjGioruxxdXzL3ybpIUNPWZz3anBTV+NDtGxCs9hTO00bXnglZM+yoJVL5E0+eM0mxmd5yfq9NUzJb0mOsbYjI7zADAKCuIAdKaBpd+SlM8mC4Dne1JFebbWn7MjOkj74+EZxnSrTIvVPe0V6us5r62Kd+ZeeoCkl0fHaLAnVXT9vtZUd0YHCZXLxqaJjc16zVtxsKSXRscYG5vXdTvz4pdLOjg6BtBg16spM7cyKAJHDm4MKeJOv8PhD6MDTNhO2xAdYQ8+kVWHm6m1kyR1RccYwQZd+cFHGna0BaumyuwLDTteK5gtoxtWIMugQ5wkqTL5samlMvmNVd4QnSA7lcETlUUdhXFuAWAUqf5gB4Dm2zHjQ5q25U1iFCCQH9d7dMWyH0XH6AieQ2t4BKjJ1KfSVqp/ydXNeXCbgMrQnLbrJ2v2Pl15bg5vazdXsX22ZBlsbDZhbF6nKJTL55dzXK9yeLZk0SmAxvImXPdP/do0aQv7HmiEuHGpKX+ne4Yd4vY7+EFtfXhIUnd0lN3u0o5N/xAdYkLMT4mOMCJvcCeo0j8q06sbeszm+nf19QxEh+hoU/xu7cjhd7ofKenfJ3eMMo97klqF+84Jy+TcVmp0/wOAUWTwAAAAmmT9OTuk8jclPR4dBcCEXKD+3suiQ3QMy+VNR7RATfJr5Fqqouul6us9S/09V7VtMZwkedluf/9/o76evB40NUslh1GakoouNq3r5UUe57irxjmuWyafY2BCisZfE6ZtPlbSlIYfF53HypgHrqVOCll3vGoZdojb1envgegYzzD7aIbdvE6ODjCiRn5W537x12T6WMOO13w7VVQ+Gh2i431j2WbJH42OMabCJt8hzrK4J3lMA0vujQ6RnyKHqSlbdeITmXRkBIAYFMQB6Gxrl22Q2TsltX7kA4B6fE/7bvqT6BAdY+GX9pPrsOgYiGT3S/p7yd4ps/21dumb1N+7sqHjV5KWxcbm+Jh+rCk7lkXHSIZncG5dm3XlB38cHSNfnkOH04f0reUPRofIllO0jzbk3Y0feZRLgTDSNxxQqL9g1VSZjmn5uuO3SVf13B8doj52X3SC3b6rvp7Lo0NMSLVaSAl30y8b2CGu0rVC0t4NO17zraIjeios/fNQ6ojJHcBNUg5FU7yEVQ/zHH5DX69qtYwOAQApY2QqAPT1DGj+ys9KqkZHATAK0y80XCzSmurO6Cgdoxw+UVn0hkeDDMl1h0w3SnaNSvvPzn6D1E1alcPG5ngMysqz9c2PbY0Okg5P/9yarm/rDozNVK0WutZOiI4xNr82OkG2Fl1W0daHj4uOATTYzzTw/sZ3Uyk0O+lxk8iD6edat+ShgJWPlTQ1YN3x+kG+v9fKDUnc7lvx8egIE/b9/Y+W+czoGCMY0sxaY7oWzl95mly/05BjtcZjmlb+ZXQIPONuSW+KDjEq0+u06LLK7q6ZEzdvxaukyosanKrxzCiIm6i5X/w1SYdExxgHzi0AjIGCOACQpLU9n9H8la+X7LejowDYo2GZnx20Ad+56LzSrmqSNmjX5uRdMt0t81u0beYtu8aJQ5I0f+VrJNsvOkZj+HJduezm6BTJOH3lyyQdHB1jTKaYsWTt4Lr9Xyf5jOgYY7ImjEbsFFseOUqmfaJjAA3WnGuC22xREYfJ8gZ2nJqYtMelmmX8GzuFDnH2TfUtuSY6xYRZeUoSxYR75LdozfLtkz7MqdUumS7M6+vDPrlrVCeS4Lon2Y/Jr0zT5ocPlVRfZ/aia448gw9J6dx3TpRV8tgTt5JzCwBjoCAOACRJ5hpe/f+pa8frpMm2ygbQeHauruz9TnSKzpNFa3hIT0jaKWmrXFtkvlFmm1TaRhW+SbKHVfpDKooHNVTer03THtZNi4eiQyfPbXYGm7djM31Lfb2XSkujk6Sjy+ek+wDr2azxY/M6RelzsjjFPJioX1HO3jWhCGgnTbgmzLtgf8lf1fDjovN4GVMQ58mPQG9MJ64IrvuCfy/V5MN/GpqgbnZydIIRWdGYDsTT91sq11ENOVZL2B3asfFvolPgOe6ODjAuXeWRqrcgLofO85JruMLewsTlcG5jxtkDQGYoiAOAp121+AnNX7FQVlwr14HRcQA8zc/X2t7V0Sk6U/l5eWVVdIoOMSj3bS/4X632hLqsfM7/NlQOqXv6k9prx46GvPmNPesqr9Fw5YzoGJM2PPWGfMc4NUnRdb1qZfrndkeFcZr1Kuw7KpX+OR7c9/vREbJVlt+WutI/x0iMr5FpVnSKEVml8Q+0iq5hlZrb8OOi8/iUW2PWtRWS0i1ymVa7MTpC3aYMXa6dU+K+Sws9qbXL7whbf1J8pbz439Ep9mjY72nMgey78gx+Tz/Naj/R+upwdAw8S2HfzuKerCzrL9wr7WuSvtW4ME1gtWFd3ft4dIzsVCr/oJpfFR1jVIWVTNMBgLHxOi0APN/8C0+UbL2kvaKjAB3P9K+as+lsVavl2P/HAAAAALAHZ1x0iCrlg9ExRjGkfWszedkBAAAAAACgMYroAACQnLVLb5D83ZLopgKE8htV2/mHFMMBAAAAmJQuT3e8nSTJbqMYDgAAAAAAoHEoiAOAPVm7dI3c/yw6BtDB7lU5daEGPvJUdBAAAAAA2TspOsCo3K+LjgAAAAAAANBOKIgDgJH0L/2cTCujYwAdaKMq5UINvP/R6CAAAAAA2oCXaRfEmV0fHQEAAAAAAKCdUBAHAKPp61km09eiYwAd5ClJv6krlv0oOggAAACANnD86m7JjouOMSoTBXEAAAAAAAANREEcAIzKXI9OWyzpiugkQAfYLpVv1dre70YHAQAAANAmXrL9GEnTo2OMYqvmbLwrOgQAAAAAAEA7oSAOAMZy0+IhdU87W67vREcB2thOWfE7WrtsfXQQAAAAAG3ELO1xqdL1qlbL6BAAAAAAAADthII4ABiPyxdv05RpCyRbHx0FaEM1mf9P9S3piw4CAAAAoO2kXxAHAAAAAACAhqIgDgDG6/LF21QOvpVOcUBDuVzvU9/Sf44OAgAAAKANeeIFcVZSEAcAAAAAANBgFMQBwEQMfOQpFXaWpGujowBtoCbXe9Tf+9XoIAAAAADa0NxLD5B0aHSMUQ13URAHAAAAAADQYBTEAcBE9fVs0fC0+ZK+Fx0FyNiQXO9Uf+/XooMAAAAAaFPFYNrd4WT3a92Sh6JTAAAAAAAAtBsK4gCgHlctfkLd086QNBAdBcjQoKw8W/29l0UHAQAAANDOLO2COHO6wwEAAAAAADQBBXEAUK/LF2/TvpvOkulfo6MAGXlKpZ+lvmXfiA4CAAAAoO2lXRDndl10BAAAAAAAgHZEQRwATMaa6k7tc/DvysTYR2Asrs0qNVcDS9dFRwEAAADQ5hZdVpF0YnSMUZnoEAcAAAAAANAEFMQBwGStObumOZveK+mC6ChAwh6Q+X/XQO/3ooMAAAAA6ABbHjlK0j7RMUZRU/f2H0SHAAAAAAAAaEcUxAFAI1Srpdb2fkjmfyxpODoOkJhbVQ6frLVLb40OAgAAAKBT+BujE4zhDn3zY1ujQwAAAAAAALQjCuIAoJH6ln5Frv8haVt0FCAN1i+zN2vgQ/dHJwEAAADQQcznREcYA+NSAQAAAAAAmoSCOABotP7ef1fhb5HpF9FRgFBmF2vfgxaqr2dLdBQAAAAAncZOik4wKnMK4gAAAAAAAJqEgjgAaIYrl16nSu14STdERwECuKRPq69nidacXYsOAwAAAKDDvH3FLEmviY4xKtd10REAAAAAAADaFQVxANAs31r+oHbM+HVJfxsdBWihx+U6U2t7q9FBAAAAAHSowa43Ku19z23asfnO6BAAAAAAAADtKuWNIQDI3/pzdmht77tlWixpODoO0GQ/VFmcqP7etdFBAAAAAHQwL+dERxiV60atr7JHAAAAAAAA0CQUxAFAK/T1fllmCyU9Fh0FaJKvaseMkzWw5N7oIAAAAAA6nZ0UnWBU5oxLBQAAAAAAaCIK4gCgVfp6BlROOUrSVdFRgAYalPkfa23vH2n9OTuiwwAAAADodG6Sz45OMSorro+OAAAAAAAA0M4oiAOAVhp4/6PasWmBpM9LKqPjAJNjP5GXJ6tv6VeikwAAAACAJGnBRYdL2i86xqiGnII4AAAAAACAJqIgDgBabX11WGt7/1SuhTL9IjoOUKe/0Y7Ksepf9oPoIAAAAADwLGmPS5Ue0VW9P48OAQAAAAAA0M4oiAOAKP29ayU7Wm7fiI4CTMAvZeVvaW3ve7X+g09GhwEAAACA53CfEx1hDNdFBwAAAAAAAGh3XdEBAKCj9fU8Jum3NP/CRXL7skyzoiMBIzKtU6V2jr61/MHoKAAAAACwR67/VGE/i44xIq9REAcAAAAAANBkFh0AALDb3IteqaL8W0lvjo4CPM82uX9M/b2XSObRYQAAAAAAAAAAAAAAGAkFcQCQFDctWPkuua2QtH90GkCy9SqKxbry3HuikwAAAAAAAAAAAAAAMBYK4gAgRfNWHKyiuEiu34mOgo61UaY/UV/vl6ODAAAAAAAAAAAAAAAwXhTEAUDK5q08W6YLJR0cHQUdw+X6mlT7iPqXb4wOAwAAAAAAAAAAAADARFAQBwCpW7Bqhtw/KalXUnd0HLS1u6Ty/Vq7bH10EAAAAAAAAAAAAAAA6kFBHADk4oyVr1bhK2W2IDoK2s4mmZ2nfTau0JrqzugwAAAAAAAAAAAAAADUi4I4AMjN/JW/JdlfSX5YdBRkb0jul6hrymd0xQc2RYcBAAAAAAAAAAAAAGCyKIgDgBwdv7pbB+w4R65PSzooOg6ydJW8tlT9y++IDgIAAAAAAAAAAAAAQKNQEAcAOXvbeftqcOqHZfYhSXtHx0EO/Bq5fVL9vd+OTgIAAAAAAAAAAAAAQKNREAcA7eC0Cw9Ut31M0mJJe0XHQZK+p9KrGli6LjoIAAAAAAAAAAAAAADNQkEcALSTs77wYg11nytpmaQZ0XGQhGtl9jn19VweHQQAAAAAAAAAAAAAgGajIA4A2tGCVS+R+3JJ75c0MzoOQnxXrr9Uf+/a6CAAAAAAAAAAAAAAALQKBXEA0M5OvWQfTR9+p1wfkvSa6DhoulKmK+Xl57R22fejwwAAAAAAAAAAAAAA0GoUxAFAJzi12qXps35Hbh+SdGJ0HDSYa7PMv6KydpEGPnR/dBwAAAAAAAAAAAAAAKJQEAcAnWb+hSfK7X0yvUPSXtFxMCl3yvTX2t71Na3/4JPRYQAAAAAAAAAAAAAAiEZBHAB0qrevmKXB4l1yWyz5kdFxMG5b5PbPKvT/q6/n2ugwAAAAAAAAAAAAAACkhII4AIA074IjpeJdKuzdch0YHQd7YLpJ0pe1vesf6QYHAAAAAAAAAAAAAMCeURAHAPiV41d364DB+XK9S/K3SpoeHanD3SLTGpW1f1b/8p9EhwEAAAAAAAAAAAAAIHUUxAEA9mzRBdP1ZNfpcl8k6TclzYiO1CHulLRGZfFPGlhyV3QYAAAAAAAAAAAAAAByQkEcAGBsp35tmqY9MVduvynTfEmHREdqI0NyfV+mPnntX+gEBwAAAAAAAAAAAABA/SiIAwBM3MIVh2q4OEumt0p6s6Sp0ZEyc6+kdZJfpWm+Tt9Ytjk6EAAAAAAAAAAAAAAA7YCCOADA5Jx6yT6aXjtZpf+6TP9d0omiQO557H7Jr5Hruyo1oHW9P45OBAAAAAAAAAAAAABAO6IgDgDQWIsumK6tNkcq3ij5CTI7Qa6XRcdqoSG5fiD59yX7vgr7nvp6HogOBQAAAAAAAAAAAABAJ6AgDgDQfHMvPUA2dKJMx8p1lMyPkPRaSVOio03SwzLdLtdtct2uSnGb9h66Q2uWb48OBgAAAAAAAAAAAABAJ6IgDgAQ4/jV3Tpo22EqK0dKepXcD5XplXJ7peQvUxrFci7pYUkbJL9Psg2S3SfV7tZQ9226+tzHY+MBAAAAAAAAAAAAAIBnoyAOAJCeRZdVtPkXB6oYPkiqHCz5ASp0iNwPkBezJM2QlTNkNlNuMyXfW9K0Zx1hv2f+y7VZJpd8SLInd/+vT0naLvfHZfa4TI9LtlGl7/pvKx6V2QPy8j719Qy27v9xAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGDkk2QAAES9JREFUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADw/9iDAwEAAAAAIP/XRlBVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVpDw4IAAAAAIT8f92QAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMBM2n7fyh2NVqoAAAAASUVORK5CYII='
 
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
-        logo_bytes = base64.b64decode(base64_logo)
-        tmp_file.write(logo_bytes)
-
-    return tmp_file.name
+    return base64.b64decode(base64_logo)
 
 
 def get_comment(project_item):
@@ -174,14 +176,17 @@ def calculate_scaled_dimensions(image_width, image_height, max_width_pixels=512,
     return image_width, image_height, w_mm, h_mm, new_width, new_height
 
 
-def draw_main(pdf, project_item, double, field_name="sketch", coords_field_name="sketch_coords"):
+def get_sketch_images(project_item, double, field_name="sketch", coords_field_name="sketch_coords"):
+    """
+    Изображения эскиза и дополнительного эскиза с подписями, подогнанные под лист (результаты work_with_image).
+    Это самая затратная часть формирования PDF, при пакетной выгрузке она выполняется в пуле процессов.
+    """
     sketch_path = project_item.original_item.variant.generate_sketch(
         project_item.original_item,
         field_name=field_name,
         coords_field_name=coords_field_name,
     )
-    image_data = work_with_image(sketch_path, project_item, double, coords=(90, 120))
-    sketch_path = image_data['sketch']
+    image_data = work_with_image(sketch_path, project_item, double, coords=(90, 120), encode=False)
 
     if project_item.original_item.variant.subsketch:
         subsketch_path = project_item.original_item.variant.generate_sketch(
@@ -189,10 +194,17 @@ def draw_main(pdf, project_item, double, field_name="sketch", coords_field_name=
             field_name='subsketch',
             coords_field_name='subsketch_coords',
         )
-        subimage_data = work_with_image(subsketch_path, project_item, False, coords=(300, 50))
-        subsketch_path = subimage_data['sketch']
+        subimage_data = work_with_image(subsketch_path, project_item, False, coords=(300, 50), encode=False)
     else:
-        subsketch_path = None
+        subimage_data = None
+
+    return image_data, subimage_data
+
+
+def draw_main(pdf, project_item, double, field_name="sketch", coords_field_name="sketch_coords", images=None):
+    image_data, subimage_data = images or get_sketch_images(project_item, double, field_name, coords_field_name)
+    sketch_image = image_data['sketch']
+    subsketch_image = subimage_data['sketch'] if subimage_data else None
 
     # Рисуем внешнюю границу с отступом 5 мм
     pdf.set_line_width(0.2)
@@ -208,23 +220,16 @@ def draw_main(pdf, project_item, double, field_name="sketch", coords_field_name=
     # Линия в центре горизонтально (с отступом 1 см слева, длина 2 см вправо)
     pdf.line(5, HEIGHT / 2, 15, HEIGHT / 2)
 
-    # Добавляем изображение sketch_path на 5 см слева, 5 см сверху
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
-        tmp_file.write(base64.b64decode(sketch_path))
-        tmp_image_path = tmp_file.name
-
+    # Добавляем изображение эскиза на 5 см слева, 5 см сверху
     w, h, w_mm, h_mm, new_width, new_height = calculate_scaled_dimensions(image_data['image_width'], image_data['image_height'])
     x, y = calculate_image_position(new_width, new_height, 90, 120)
-    pdf.image(tmp_image_path, x=x, y=y, w=w_mm, h=h_mm)
+    pdf.image(sketch_image, x=x, y=y, w=w_mm, h=h_mm)
 
-    # Если есть subsketch_path, добавляем его справа 10 см сверху 5 см
-    if subsketch_path:
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
-            tmp_file.write(base64.b64decode(subsketch_path))
-            tmp_image_path = tmp_file.name
+    # Если есть дополнительный эскиз, добавляем его справа 10 см сверху 5 см
+    if subsketch_image:
         w, h, w_mm, h_mm, new_width, new_height = calculate_scaled_dimensions(subimage_data['image_width'], subimage_data['image_height'], max_width_pixels=480, max_height_pixels=638)
         x, y = calculate_image_position(new_width, new_height, 300, 50)
-        pdf.image(tmp_image_path, x=x, y=y, w=w_mm, h=h_mm)
+        pdf.image(subsketch_image, x=x, y=y, w=w_mm, h=h_mm)
 
 
 def draw_metadata(pdf, project_item):
@@ -331,9 +336,7 @@ def draw_specifications(pdf, project_item, composition_type):
 def draw_attributes(pdf, project_item, created_by, created_date):
     pdf.set_font('ArialNarrow', size=9)
 
-    available_selection_class = get_selection_available_options_class(project_item.selection_type)
-    available_selection = available_selection_class(project_item)
-    data_for_sketch = available_selection.get_data_for_sketch()
+    data_for_sketch = get_sketch_data(project_item)
 
     x_start = 225
     y_start = 206
@@ -554,7 +557,7 @@ def draw_attributes(pdf, project_item, created_by, created_date):
     pdf.set_xy(x_start + 73, y_start + 65)
     pdf.cell(0, 10, '№ ОЛ заказчика:')
 
-    pdf.image(get_witzenmann_logo(), x=x_start + 128, y=y_start, w=56)
+    pdf.image(BytesIO(get_witzenmann_logo()), x=x_start + 128, y=y_start, w=56)
 
     pdf.set_xy(x_start + 130, y_start + 27.5)
     pdf.cell(0, 10, 'Кол-во штук:')
@@ -581,47 +584,54 @@ def draw_attributes(pdf, project_item, created_by, created_date):
     pdf.line(x_start + 129.5, y_start + 67, WIDTH - 10, y_start + 67)
 
 
-def render_sketch_pdf(
+def create_sketch_pdf():
+    pdf = FPDF(orientation='L', unit='mm', format='A3')
+    pdf.set_auto_page_break(auto=False, margin=0)
+    add_pdf_font(pdf, 'ArialNarrow', '')
+    add_pdf_font(pdf, 'ArialNarrow', 'B')
+    pdf.set_font('ArialNarrow', size=10)
+    return pdf
+
+
+def draw_sketch_page(
+    pdf,
     project_item,
     created_by,
     composition_type='temporary_composition',
     field_name="sketch",
     coords_field_name="sketch_coords",
+    images=None,
 ):
+    """
+    Добавляет в pdf лист эскиза позиции. images - готовый результат get_sketch_images.
+    """
     if not project_item.original_item.variant.sketch:
         raise Exception('У выбранного типа продукта не заведен эскиз.')
 
-    if composition_type == 'temporary_composition':
-        composition_objects = TemporaryComposition.objects.filter(tmp_parent=project_item.original_item)
-    else:
-        composition_objects = project_item.original_item.children.all()
-
     today = date.today().strftime('%d.%m.%y')
-    last_name = created_by.last_name
     double = project_item.original_item.type.branch_qty == DetailType.BranchQty.TWO
 
-    # Создание PDF
-    pdf = FPDF(orientation='L', unit='mm', format='A3')
-    pdf.set_auto_page_break(auto=False, margin=0)
-    pdf.add_font('ArialNarrow', '', finders.find('fonts/ArialNarrow.ttf'), uni=True)
-    pdf.add_font('ArialNarrow', 'B', finders.find('fonts/ArialNarrow.ttf'), uni=True)
     pdf.set_font('ArialNarrow', size=10)
     pdf.add_page()
 
-    draw_main(pdf, project_item, double, field_name, coords_field_name)
+    draw_main(pdf, project_item, double, field_name, coords_field_name, images=images)
     draw_metadata(pdf, project_item)
     draw_attributes(pdf, project_item, created_by, today)
     draw_specifications(pdf, project_item, composition_type)
 
-    # Сохранение PDF
-    tz = pytz.timezone('Europe/Moscow')
-    when_formed = datetime.now(tz).strftime('%d.%m.%y_%H.%M.%S')
-    filename = f'{project_item.position_number}_{project_item.project.number}_{when_formed}.pdf'
 
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
-        pdf.output(tmp_file.name, dest='F')
-        tmp_image_path = tmp_file.name
+def render_sketch_pdf(
+    project_item,
+    created_by,
+    composition_type='temporary_composition',
+    field_name="sketch",
+    coords_field_name="sketch_coords",
+):
+    # Создание PDF
+    pdf = create_sketch_pdf()
+    draw_sketch_page(pdf, project_item, created_by, composition_type, field_name, coords_field_name)
+
+    # Сохранение PDF
+    filename = get_sketch_filename(project_item, 'pdf', SKETCH_PDF_TIMEZONE)
 
-    with open(tmp_image_path, 'rb') as f:
-        pdf_output = f.read()
-    return pdf_output, filename
\ No newline at end of file
+    return bytes(pdf.output()), filename
@@ -0,0 +1,95 @@
+"""
+Подготовленные копии эскизов исполнений.
+
+На листе эскиз не может быть больше SKETCH_MAX_MM, поэтому большие изображения при каждом формировании
+эскиза уменьшались заново. Копия нужного размера создается один раз при загрузке эскиза и сохраняется рядом
+с оригиналом, а в Variant.sketch_renditions записываются ее имя, масштаб, размеры и хеш содержимого:
+
+    {'sketch': {'source': 'sketches/FHD/a.png', 'name': 'sketches/FHD/a_render.png', 'scale': 0.5,
+                'original_size': [4000, 3000], 'size': [2000, 1500], 'hash': '5f1c...'}}
+
+Если оригинал уже помещается на лист, копия не создается: name совпадает с source, scale равен 1.
+
+По хешу строится адрес копии для векторных SVG эскизов (get_rendition_url): содержимое по адресу никогда
+не меняется, поэтому копия отдается с долгим кэшированием, а новый эскиз получает новый адрес. Расширение адреса
+и тип содержимого берутся из имени файла: уменьшенная копия - PNG, а оригинал может быть, например, JPEG.
+"""
+import hashlib
+import mimetypes
+import os
+from io import BytesIO
+from typing import Any, Dict, Optional
+
+from django.core.files.base import ContentFile
+from django.urls import reverse
+from PIL import Image
+
+# Отношение пикселя к мм
+PX_TO_MM = 0.26458333
+# Максимальный размер эскиза на листе, мм
+SKETCH_MAX_MM = 650
+# Время кэширования копии эскиза клиентом, с
+RENDITION_CACHE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+def get_rendition_scale(width: int, height: int) -> float:
+    return min(SKETCH_MAX_MM / (width * PX_TO_MM), SKETCH_MAX_MM / (height * PX_TO_MM), 1.0)
+
+
+def get_rendition_name(name: str) -> str:
+    root, _ = os.path.splitext(name)
+    return f'{root}_render.png'
+
+
+def build_rendition(field) -> Dict[str, Any]:
+    with field.open('rb'):
+        content = field.read()
+
+    image = Image.open(BytesIO(content))
+    image.load()
+
+    width, height = image.size
+    scale = get_rendition_scale(width, height)
+    rendition = {
+        'source': field.name,
+        'name': field.name,
+        'scale': 1.0,
+        'original_size': [width, height],
+        'size': [width, height],
+        'hash': hashlib.sha256(content).hexdigest(),
+    }
+
+    if scale < 1.0:
+        size = (int(width * scale), int(height * scale))
+        if image.mode == 'P':
+            image = image.convert('RGBA')
+        image = image.resize(size, Image.Resampling.LANCZOS)
+
+        buffer = BytesIO()
+        image.save(buffer, format='PNG')
+        content = buffer.getvalue()
+        rendition['name'] = field.storage.save(get_rendition_name(field.name), ContentFile(content))
+        rendition['scale'] = scale
+        rendition['size'] = list(size)
+        rendition['hash'] = hashlib.sha256(content).hexdigest()
+
+    return rendition
+
+
+def delete_rendition(rendition: Optional[Dict[str, Any]], storage) -> None:
+    if rendition and rendition.get('name') != rendition.get('source'):
+        storage.delete(rendition['name'])
+
+
+def get_rendition_extension(rendition: Dict[str, Any]) -> str:
+    return os.path.splitext(rendition['name'])[1].lstrip('.').lower() or 'bin'
+
+
+def get_rendition_content_type(rendition: Dict[str, Any]) -> str:
+    return mimetypes.guess_type(rendition['name'])[0] or 'application/octet-stream'
+
+
+def get_rendition_url(variant_id: int, field_name: str, rendition: Dict[str, Any]) -> str:
+    return reverse(
+        'sketch_rendition', args=[variant_id, field_name, rendition['hash'], get_rendition_extension(rendition)],
+    )
@@ -1,30 +1,43 @@
 import copy
+import itertools
+import tempfile
 import traceback
 from typing import List
 
 from celery import shared_task
 from celery.utils.log import get_task_logger
 
+from constance import config
+
 from django.core.cache import cache
+from django.core.files import File
+from django.core.files.base import ContentFile
 
 from django.db.models import Prefetch
 from django.utils import timezone
-from django.utils.module_loading import import_string
 
 from tablib import Dataset
 
-from kernel.consumers import send_event_to_all, send_event_to_users
+from kernel.events import discard_deferred_event, send_event_to_topic, send_event_to_users
 from kernel.erp import ERPApi
 
-from catalog.models import DirectoryEntry
-
-from ops.constants import STALE_SET_KEY, STALE_LOCK, STALE_BATCH
-from ops.models import Item, ItemChild
-from ops.choices import ERPSyncStatus, ERPSyncLogType, AttributeType, AttributeCatalog
-from ops.resources import get_resources_list
-
-from taskmanager.choices import TaskStatus
-from taskmanager.models import Task
+from ops.cache import VariantMetadataCache, invalidate_spring_block_index
+from ops.item_export import EXPORT_WRITERS, get_export_queryset, iter_export_rows, prepare_export_resource
+from ops.import_validation import validate_import
+from ops.item_import import (
+    claim_import_finalization, collect_import_results, format_row_errors, get_import_progress, is_import_complete,
+    iter_import_chunks, save_chunk_result, set_import_totals, should_notify_progress, start_import_state,
+)
+from ops.constants import ERP_SYNC_TOPIC, STALE_SET_KEY, STALE_LOCK, STALE_BATCH
+from ops.erp_sync import ERPPayloadBuilder, build_item_dag, get_erp_fingerprint, run_bottom_up
+from ops.models import Item, ItemChild, ItemParameterValue, ProjectItem
+from ops.parameter_indexes import reconcile_parameter_indexes
+from ops.choices import ERPSyncStatus, ERPSyncLogType
+from ops.resources import get_resource_class
+from ops.sketch.book import SKETCH_BOOK_PDF, render_sketch_book
+
+from taskmanager.choices import TaskResultType, TaskStatus
+from taskmanager.models import Task, TaskResult
 
 logger = get_task_logger('erp_task_logger')
 
@@ -53,23 +66,31 @@ def batch_recalculate_items():
 
         changed = []
         parent_ids = set()
-        fields = ["parameters", "parameters_errors", "marking", "marking_errors", "name"]
+        # modified пишется явно: bulk_update не обновляет auto_now
+        fields = ["parameters", "parameters_errors", "marking", "marking_errors", "name", "modified"]
+        metadata = VariantMetadataCache()
+        now = timezone.now()
 
         for item in items:
             before = (copy.copy(item.parameters), item.marking, item.name)
 
-            item.update_auto_fields()
+            item.update_auto_fields(metadata)
 
             if before != (item.parameters, item.marking, item.name):
+                item.modified = now
                 changed.append(item)
                 parent_ids.update(item.parents.values_list("parent_id", flat=True))
 
             if len(changed) >= 1000:
                 Item.objects.bulk_update(changed, fields, batch_size=200)
+                ItemParameterValue.objects.sync_items(changed)
+                invalidate_spring_block_index()
                 changed.clear()
 
         if changed:
             Item.objects.bulk_update(changed, fields, batch_size=100)
+            ItemParameterValue.objects.sync_items(changed)
+            invalidate_spring_block_index()
 
         if parent_ids:
             cache.sadd(STALE_SET_KEY, *parent_ids)
@@ -83,138 +104,71 @@ def batch_recalculate_items():
         raise
 
 
-def sync_item_to_erp(api, erp_sync, item):
-    from ops.models import Attribute
-
-    if item.erp_id:
-        erp_sync.add_log(
-            ERPSyncLogType.DEBUG, f'Объект {item} (id={item.id}) уже был синхронизирован (erp_id={item.erp_id})',
-        )
-        return
-
-    params = {}
-
-    if item.material_id:  # материал
-        params["materialname"] = item.material.name
-        params["materialgroup"] = item.material.group
+@shared_task(ignore_result=True)
+def task_reconcile_parameter_indexes():
+    """
+    Создает и удаляет индексы проекции параметров после изменения атрибутов с индексируемым использованием.
+    """
+    created, dropped = reconcile_parameter_indexes()
 
-    if item.parameters:
-        parameters = item.parameters
-    else:
-        parameters = {}
+    if created or dropped:
+        logger.info('Parameter indexes reconciled: created=%s, dropped=%s', created, dropped)
 
-    for key, value in parameters.items():
-        # Маппинг пока смотрим через Attribute
-        # TODO: Попытаться найти лучший способ
-        try:
-            attr = Attribute.objects.get(name=key, variant_id=item.variant_id, variant__detail_type_id=item.type_id)
-        except Attribute.DoesNotExist:
-            raise Exception(f"Не найден атрибут с наименованием {key}")
-        except Attribute.MultipleObjectsReturned:
-            raise Exception(f"Существует дубликаты атрибута с наименованием {key}")
-
-        if attr.type == AttributeType.CATALOG and value is not None:
-            allowed_builtin_catalogues = [item for item in AttributeCatalog]
-
-            if attr.catalog not in allowed_builtin_catalogues:
-                directory_id = int(value)
-
-                try:
-                    instance = DirectoryEntry.objects.get(id=value, directory_id=directory_id)
-                except DirectoryEntry.DoesNotExist:
-                    raise Exception(f'Объект справочника с идентификатором {value} не существует')
-
-                fields = {'id': instance.id, 'display_name': instance.display_name,
-                          'display_name_errors': instance.display_name_errors}
-                for value_obj in instance.values.select_related('directory_field'):
-                    fields[value_obj.directory_field.name] = value_obj.value
-                return fields
-
-            else:
-                package = f'catalog.models.{attr.catalog}'
-                catalog_model = import_string(package)
-
-                try:
-                    instance = catalog_model.objects.get(pk=value)
-                except catalog_model.DoesNotExist:
-                    raise Exception(f"Объект справочника {catalog_model} с идентификатором {value} не существует")
-
-                instance_str = str(instance)
-
-                serializer_package = attr.CATALOG_SERIALIZERS[attr.catalog]
-                serializer_class = import_string(serializer_package)
-
-                serializer = serializer_class(instance)
-                fields = serializer.data
-
-            if attr.erp_name:
-                if key in attr.erp_name:
-                    name = attr.erp_name[key]
-                    params[name] = instance_str
-            else:
-                params[key] = instance_str
-
-            for field, field_value in fields.items():
-                if not attr.erp_name:
-                    continue
-
-                name = f'{key}_{field}'
-
-                if name in attr.erp_name:
-                    name = attr.erp_name[name]
-                    params[name] = field_value
-        else:
-            name = key
-            if attr.erp_name and name in attr.erp_name:
-                name = attr.erp_name[name]
 
-            params[name] = value
+def sync_item_to_erp(api, erp_sync, item, builder=None):
+    """
+    Отправляет изделие в ERP, если оно новое или данные изменились после прошлой синхронизации.
+    builder (ERPPayloadBuilder) собирается заранее на весь синхронизируемый состав.
+    """
+    builder = builder or ERPPayloadBuilder([item])
+    product = builder.get_product(item)
+    params = product['params']
+    fingerprint = get_erp_fingerprint(product)
 
-        name = key
-        if attr.erp_name:
-            name = attr.erp_name
+    if item.erp_id and item.erp_fingerprint == fingerprint:
+        erp_sync.add_log(
+            ERPSyncLogType.DEBUG,
+            f'Объект {item} (id={item.id}) не изменился после синхронизации (erp_id={item.erp_id})',
+        )
+        return
 
-    erp_sync.add_log(ERPSyncLogType.DEBUG, f'Подготовлен params: {params}')
+    erp_sync.add_log(ERPSyncLogType.DEBUG, f'Подготовлен params: {params}', payload=True)
 
-    erp_id = api.sync_product(
-        idwicad=item.inner_id,
-        modelslug=item.type.erp_modelslug,
-        art=item.marking,
-        name=item.name,
-        weight=item.weight,
-        params=params,
-        erp_sync=erp_sync,
-    )
+    erp_id = api.sync_product(**product, erp_sync=erp_sync)
     item.erp_id = erp_id
-    item.save(update_fields=('erp_id',))
+    item.erp_fingerprint = fingerprint
+    # save() пересчитывает формулы изделия, а здесь меняются только служебные поля синхронизации
+    Item.objects.filter(pk=item.pk).update(erp_id=erp_id, erp_fingerprint=fingerprint)
     erp_sync.add_log(ERPSyncLogType.DEBUG, f'Сохранили erp_id={erp_id} у {item}')
 
 
-def sync_item(api, erp_sync, item):
-    sync_item_to_erp(api, erp_sync, item)
-    children = item.children.all()
-
-    if not children.exists():
+def sync_item_specification(api, erp_sync, item, children):
+    if not children:
         erp_sync.add_log(ERPSyncLogType.DEBUG, f'У объекта {item} нет дочерних элементов.')
         return
 
     structure = []
     for child in children:
-        erp_sync.add_log(
-            ERPSyncLogType.DEBUG,
-            f'Синхронизация дочерного элемента объекта {item} (id={item.id}): {child} (id={child.id})',
-        )
-        sync_item(api, erp_sync, child.child)
         structure.append({
             'idwicad': child.child.id,
             'iderp': child.child.erp_id,
             'count': child.count,
         })
 
+    fingerprint = get_erp_fingerprint({'iderp': item.erp_id, 'structure': structure})
+
+    if item.erp_nomspec and item.erp_spec_fingerprint == fingerprint:
+        erp_sync.add_log(
+            ERPSyncLogType.DEBUG,
+            f'Спецификация объекта {item} (id={item.id}) не изменилась (nomspec={item.erp_nomspec})',
+        )
+        return
+
     logger.info('Syncing specification of item %s (id=%d)', item, item.id)
     erp_sync.add_log(
         ERPSyncLogType.DEBUG,
         f'Синхронизация спецификации для объекта {item} (id={item.id}: {structure}',
+        payload=True,
     )
     json_data = api.sync_specifications(
         idwicad=item.id,
@@ -227,13 +181,33 @@ def sync_item(api, erp_sync, item):
     erp_sync.add_log(ERPSyncLogType.DEBUG, f'Успешно отправлен спецификация, получен nomspec={nomspec}')
 
     item.erp_nomspec = nomspec
-    item.save(update_fields=['erp_nomspec'])
+    item.erp_spec_fingerprint = fingerprint
+    Item.objects.filter(pk=item.pk).update(erp_nomspec=nomspec, erp_spec_fingerprint=fingerprint)
+
+
+def sync_item(api, erp_sync, item, workers=None):
+    """
+    Синхронизирует изделие и его состав. Дочерние элементы синхронизируются раньше родителя,
+    независимые ветки - параллельно в ERP_SYNC_WORKERS потоках. Каждый элемент состава обрабатывается один раз,
+    в ERP отправляются только новые и изменившиеся элементы и спецификации.
+    """
+    items, links = build_item_dag(item)
+    builder = ERPPayloadBuilder(items.values())
+
+    def sync_node(item_id):
+        node = items[item_id]
+        erp_sync.add_log(ERPSyncLogType.DEBUG, f'Синхронизация объекта {node} (id={node.id})')
+        sync_item_to_erp(api, erp_sync, node, builder)
+        sync_item_specification(api, erp_sync, node, links[item_id])
 
+    graph = {item_id: [link.child_id for link in item_links] for item_id, item_links in links.items()}
+    run_bottom_up(graph, sync_node, workers or config.ERP_SYNC_WORKERS)
 
-def sync_project(api, erp_sync, project):
-    project_items = project.items.all()
 
-    for project_item in project_items:
+def sync_project(api, erp_sync, project, workers=None):
+    original_items = {}
+
+    for project_item in project.items.select_related('original_item__type', 'original_item__material'):
         erp_sync.add_log(ERPSyncLogType.DEBUG, f'Синхронизация {project_item}')
         original_item = project_item.original_item
 
@@ -241,7 +215,22 @@ def sync_project(api, erp_sync, project):
             erp_sync.add_log(ERPSyncLogType.DEBUG, f'Отсутствует original_item у {project_item}')
             raise Exception(f'Отсутствует original_item у {project_item}')
 
-        sync_item_to_erp(api, erp_sync, original_item)
+        original_items[original_item.id] = original_item
+
+    builder = ERPPayloadBuilder(original_items.values())
+
+    run_bottom_up(
+        {item_id: [] for item_id in original_items},
+        lambda item_id: sync_item_to_erp(api, erp_sync, original_items[item_id], builder),
+        workers or config.ERP_SYNC_WORKERS,
+    )
+
+
+def notify_erp_sync(erp_sync):
+    """
+    Отправляет состояние синхронизации с ERP ее автору и подписчикам темы sync_erp.
+    """
+    send_event_to_topic(ERP_SYNC_TOPIC, 'sync_erp', erp_sync.to_json(), user_id=erp_sync.author_id)
 
 
 @shared_task(ignore_result=True)
@@ -257,25 +246,28 @@ def task_sync_erp(erp_sync_id):
     erp_sync.add_log(ERPSyncLogType.DEBUG, 'Начало синхронизации ERP')
 
     api = ERPApi()
-    send_event_to_all("sync_erp", erp_sync.to_json())
+    notify_erp_sync(erp_sync)
 
-    try:
-        sync_item(api, erp_sync, item)
-        erp_sync.status = ERPSyncStatus.SUCCESS
-        erp_sync.finished_at = timezone.now()
-        erp_sync.save(update_fields=['status', 'finished_at'])
-        erp_sync.add_log(ERPSyncLogType.DEBUG, 'Синхронизация завершена')
-        send_event_to_all("sync_erp", erp_sync.to_json())
-    except Exception as exc:
-        erp_sync.status = ERPSyncStatus.ERROR
-        erp_sync.finished_at = timezone.now()
-        erp_sync.save(update_fields=['status', 'finished_at'])
-        erp_sync.add_log(
-            ERPSyncLogType.EXCEPTION,
-            request=f'Произошла ошибка при синхронизации: {exc}',
-            response=exc,
-        )
-        send_event_to_all("sync_erp", erp_sync.to_json())
+    # лог копится в памяти и сохраняется пачками, данные запросов - только при ошибке
+    with erp_sync.buffer_logs():
+        try:
+            with api:
+                sync_item(api, erp_sync, item)
+            erp_sync.status = ERPSyncStatus.SUCCESS
+            erp_sync.finished_at = timezone.now()
+            erp_sync.save(update_fields=['status', 'finished_at'])
+            erp_sync.add_log(ERPSyncLogType.DEBUG, 'Синхронизация завершена')
+            notify_erp_sync(erp_sync)
+        except Exception as exc:
+            erp_sync.status = ERPSyncStatus.ERROR
+            erp_sync.finished_at = timezone.now()
+            erp_sync.save(update_fields=['status', 'finished_at'])
+            erp_sync.add_log(
+                ERPSyncLogType.EXCEPTION,
+                request=f'Произошла ошибка при синхронизации: {exc}',
+                response=exc,
+            )
+            notify_erp_sync(erp_sync)
 
 
 @shared_task(ignore_result=True)
@@ -291,40 +283,32 @@ def task_sync_project_to_erp(erp_sync_id):
     erp_sync.add_log(ERPSyncLogType.DEBUG, 'Начало синхронизации ERP')
 
     api = ERPApi()
-    send_event_to_all('sync_erp', erp_sync.to_json())
-
-    try:
-        sync_project(api, erp_sync, project)
-        erp_sync.status = ERPSyncStatus.SUCCESS
-        erp_sync.finished_at = timezone.now()
-        erp_sync.save(update_fields=['status', 'finished_at'])
-        erp_sync.add_log(ERPSyncLogType.DEBUG, 'Синхронизация завершена')
-        send_event_to_all('sync_erp', erp_sync.to_json())
-    except Exception as exc:
-        erp_sync.status = ERPSyncStatus.ERROR
-        erp_sync.finished_at = timezone.now()
-        erp_sync.save(update_fields=['status', 'finished_at'])
-        erp_sync.add_log(
-            ERPSyncLogType.EXCEPTION,
-            request=f'Произошла ошибка при синхронизации: {exc}',
-            response=exc,
-        )
+    notify_erp_sync(erp_sync)
 
-        send_event_to_all('sync_erp', erp_sync.to_json())
+    # лог копится в памяти и сохраняется пачками, данные запросов - только при ошибке
+    with erp_sync.buffer_logs():
+        try:
+            with api:
+                sync_project(api, erp_sync, project)
+            erp_sync.status = ERPSyncStatus.SUCCESS
+            erp_sync.finished_at = timezone.now()
+            erp_sync.save(update_fields=['status', 'finished_at'])
+            erp_sync.add_log(ERPSyncLogType.DEBUG, 'Синхронизация завершена')
+            notify_erp_sync(erp_sync)
+        except Exception as exc:
+            erp_sync.status = ERPSyncStatus.ERROR
+            erp_sync.finished_at = timezone.now()
+            erp_sync.save(update_fields=['status', 'finished_at'])
+            erp_sync.add_log(
+                ERPSyncLogType.EXCEPTION,
+                request=f'Произошла ошибка при синхронизации: {exc}',
+                response=exc,
+            )
 
+            notify_erp_sync(erp_sync)
 
-def format_row_errors(result):
-    errors = []
-    for row, error in result.row_errors():
-        row_errors = [str(err.error) for err in error]
-        errors.append({
-            'row': row,
-            'errors': row_errors
-        })
-    return errors
 
-
-def notify_task_status(task):
+def notify_task_status(task, progress=None):
     """
     Отправляет уведомление владельцу задачи с информацией о таске.
     """
@@ -333,7 +317,91 @@ def notify_task_status(task):
         "status": task.status,
         "status_details": task.status_details,
     }
-    # send_event_to_users(task.owner.id, command_type="task_updated", data=data)
+    if progress is not None:
+        data["progress"] = progress
+
+    # уведомление не должно ломать саму задачу, например если слой каналов не настроен
+    # промежуточный прогресс отправляется не чаще раза в EVENT_COALESCE_INTERVAL, смена статуса - всегда,
+    # а отложенный прогресс при этом отменяется, чтобы не прийти клиенту после итогового статуса
+    coalesce_key = f'task_updated:{task.id}'
+    try:
+        if progress is None:
+            discard_deferred_event(coalesce_key)
+            coalesce_key = None
+
+        send_event_to_users(task.owner_id, command_type="task_updated", data=data, coalesce_key=coalesce_key)
+    except Exception:
+        logger.warning(f"Не удалось отправить уведомление по задаче {task.id}: {traceback.format_exc()}")
+
+
+def get_import_resource(task):
+    params = task.parameters or {}
+    category = params.get('category')
+    designation = params.get('designation')
+
+    resource_name = f"{category}_{designation}"
+    resource_cls = get_resource_class(resource_name, bulk=params.get('is_bulk', False))
+    if resource_cls is None:
+        raise ValueError(f"Ресурс '{resource_name}' не найден")
+
+    resource_obj = resource_cls()
+    resource_obj.category = category
+    resource_obj.designation = designation
+    return resource_obj
+
+
+def import_chunk(task, offset, headers, rows):
+    """
+    Импортирует часть файла в отдельной транзакции. Возвращает ошибки строк с номерами строк исходного файла.
+    """
+    resource_obj = get_import_resource(task)
+    dataset = Dataset(*rows, headers=headers)
+
+    result = resource_obj.import_data(
+        dataset,
+        user=task.owner,
+        use_transactions=True
+    )
+    return format_row_errors(result, offset)
+
+
+def finish_import_task(task, errors, exceptions=()):
+    if exceptions:
+        task.status = TaskStatus.ERROR
+        task.status_details = {'exception': '\n'.join(exceptions), 'errors': errors}
+    elif errors:
+        task.status = TaskStatus.ERROR
+        task.status_details = errors
+    else:
+        task.status = TaskStatus.DONE
+        task.status_details = {}
+    task.save()
+    notify_task_status(task)
+
+
+@shared_task(ignore_result=True)
+def process_import_chunk(task_id: int, number: int, offset: int, headers: List[str], rows: List[List]) -> None:
+    """
+    Celery-задача импорта одной части файла.
+
+    Ошибки части сохраняются в БД (TaskChunk), владельцу задачи отправляется прогресс (не чаще IMPORT_PROGRESS_INTERVAL).
+    Последняя завершившаяся часть собирает ошибки всех частей и завершает задачу.
+    """
+    task = Task.objects.get(id=task_id)
+
+    try:
+        result = {'errors': import_chunk(task, offset, headers, rows)}
+    except Exception:
+        logger.error(f"Ошибка импорта части {number} задачи {task_id}: {traceback.format_exc()}")
+        result = {'exception': traceback.format_exc()}
+
+    save_chunk_result(task_id, number, len(rows), result)
+
+    if is_import_complete(task_id):
+        if claim_import_finalization(task_id):
+            finish_import_task(task, *collect_import_results(task_id))
+    elif should_notify_progress(task_id):
+        notify_task_status(task, progress=get_import_progress(task_id))
 
 
 @shared_task
@@ -343,9 +411,12 @@ def process_import_task(task_id: int) -> None:
 
     При запуске:
         - Статус задачи обновляется на Processing.
-        - Извлекаются параметры импорта и файл из TaskAttachment (slug = 'imported_file').
-        - Производится вызов метода импорта ресурса.
-        - При успешном импорте статус меняется на Done.
+        - При dry run файл только проверяется в памяти (ops.import_validation), без записи в БД.
+        - Файл из TaskAttachment (slug = 'imported_file') читается потоково и делится на части
+          по IMPORT_CHUNK_SIZE строк.
+        - Файл из одной части импортируется сразу, иначе каждая часть импортируется
+          задачей process_import_chunk в своей транзакции.
+        - Ошибки строк всех частей собираются в status_details, статус меняется на Done или Error.
         - Если возникает ошибка, статус меняется на Error и traceback записывается в status_details.
     """
     task = Task.objects.get(id=task_id)
@@ -353,51 +424,171 @@ def process_import_task(task_id: int) -> None:
     task.save()
     notify_task_status(task)
 
+    try:
+        params = task.parameters or {}
+        resource_obj = get_import_resource(task)
+
+        attachment = task.attachments.get(slug='imported_file')
+        if not attachment.file:
+            raise Exception("Файл для импорта не найден")
+
+        if task.dry_run or params.get('is_dry_run', False):
+            resource_obj.user = task.owner
+
+            with attachment.file.open('rb') as fileobj:
+                errors = validate_import(resource_obj, iter_import_chunks(fileobj, params.get('file_format')))
+
+            finish_import_task(task, errors)
+            return
+
+        start_import_state(task.id)
+
+        with attachment.file.open('rb') as fileobj:
+            chunks = iter_import_chunks(fileobj, params.get('file_format'))
+            first = next(chunks, None)
+            second = next(chunks, None)
+
+            if second is None:
+                errors = import_chunk(task, *first) if first else []
+                finish_import_task(task, errors)
+                return
+
+            count = 0
+            total = 0
+            for number, (offset, headers, rows) in enumerate(itertools.chain((first, second), chunks)):
+                process_import_chunk.delay(task.id, number, offset, headers, rows)
+                count += 1
+                total += len(rows)
+
+        set_import_totals(task.id, count, total)
+        notify_task_status(task, progress=get_import_progress(task.id))
+
+        # Все части могли завершиться раньше, чем записано их количество
+        if is_import_complete(task.id) and claim_import_finalization(task.id):
+            finish_import_task(task, *collect_import_results(task.id))
+
+    except Exception as exc:
+        logger.error(f"Ошибка импорта: {traceback.format_exc()}")
+
+        # части, уже отправленные в очередь, могли завершить задачу; иначе они не перезапишут эту ошибку
+        if claim_import_finalization(task.id, force=True):
+            task.status = TaskStatus.ERROR
+            task.status_details = {'exception': traceback.format_exc()}
+            task.save()
+            notify_task_status(task)
+
+
+@shared_task
+def process_export_task(task_id: int) -> None:
+    """
+    Celery-задача для потоковой выгрузки изделий/деталей в CSV/XLSX.
+
+    Строки пишутся во временный файл по мере обхода queryset, количество обработанных строк
+    сохраняется в status_details. Готовый файл сохраняется в TaskResult со slug 'exported_file'.
+    """
+    task = Task.objects.get(id=task_id)
+    task.status = TaskStatus.PROCESSING
+    task.save()
+    notify_task_status(task)
+
     try:
         params = task.parameters or {}
         category = params.get('category')
         designation = params.get('designation')
         file_format = params.get('file_format')
-        is_dry_run = params.get('is_dry_run', False)
 
         resource_name = f"{category}_{designation}"
-        resources = get_resources_list()
-        resource_cls = next((r for r in resources if r.__name__ == resource_name), None)
+        resource_cls = get_resource_class(resource_name)
         if resource_cls is None:
             raise ValueError(f"Ресурс '{resource_name}' не найден")
 
-        resource_obj = resource_cls()
-        resource_obj.category = category
-        resource_obj.designation = designation
+        queryset = get_export_queryset(category, designation, params.get('is_empty', False))
+        total = queryset.count()
 
-        attachment = task.attachments.get(slug='imported_file')
-        if not attachment.file:
-            raise Exception("Файл для импорта не найден")
+        def progress(processed):
+            Task.objects.filter(id=task.id).update(status_details={'processed': processed, 'total': total})
+
+        rows = iter_export_rows(prepare_export_resource(resource_cls), queryset, progress=progress)
+
+        with tempfile.TemporaryFile() as tmp:
+            EXPORT_WRITERS[file_format](rows, tmp)
+            tmp.seek(0)
 
-        raw = attachment.file.read()
-        dataset = Dataset().load(raw, format=file_format)
+            result = TaskResult(task=task, slug='exported_file', type=TaskResultType.FILE)
+            result.result_file.save(f'{designation}.{file_format}', File(tmp), save=False)
+            result.save()
+
+        task.status = TaskStatus.DONE
+        task.status_details = {'processed': total, 'total': total}
+        task.save()
 
-        resource_obj.before_import(dataset, user=task.owner)
+    except Exception:
+        task.status = TaskStatus.ERROR
+        task.status_details = {'exception': traceback.format_exc()}
+        logger.error(f"Ошибка экспорта: {traceback.format_exc()}")
+        task.save()
 
-        result = resource_obj.import_data(
-            dataset,
-            dry_run=is_dry_run,
-            user=task.owner,
-            use_transactions=True
+    notify_task_status(task)
+
+
+@shared_task
+def process_sketch_book_task(task_id: int) -> None:
+    """
+    Celery-задача для выгрузки эскизов позиций проекта одним многостраничным PDF или ZIP архивом.
+
+    Позиции обрабатываются в пуле процессов (config.SKETCH_BOOK_WORKERS), после каждой позиции владельцу
+    задачи отправляется уведомление с прогрессом. Готовый файл сохраняется в TaskResult со slug 'sketch_book',
+    ошибки отдельных позиций - в status_details.
+    """
+    task = Task.objects.select_related('owner').get(id=task_id)
+    task.status = TaskStatus.PROCESSING
+    task.save()
+    notify_task_status(task)
+
+    try:
+        params = task.parameters or {}
+        output = params.get('output', SKETCH_BOOK_PDF)
+        file_format = params.get('format', 'pdf')
+
+        project_items = ProjectItem.objects.filter(project_id=params['project_id']).select_related(
+            'project', 'nominal_diameter', 'original_item__type', 'original_item__variant',
+        ).order_by('position_number', 'id')
+        if params.get('positions'):
+            project_items = project_items.filter(id__in=params['positions'])
+        project_items = list(project_items)
+        total = len(project_items)
+
+        def progress(processed, project_item, error):
+            task.status_details = {'processed': processed, 'total': total}
+            Task.objects.filter(id=task.id).update(status_details=task.status_details)
+            notify_task_status(task, progress={
+                'processed': processed,
+                'total': total,
+                'position': project_item.position_number,
+                'error': error,
+            })
+
+        content, errors = render_sketch_book(
+            project_items, task.owner, output, file_format, params.get('composition_type', 'specification'),
+            workers=config.SKETCH_BOOK_WORKERS, progress=progress,
         )
 
-        if result.has_errors():
-            task.status = TaskStatus.ERROR
-            task.status_details = format_row_errors(result)
-        else:
-            task.status = TaskStatus.DONE
-            task.status_details = {}
+        if total and len(errors) == total:
+            raise ValueError('Не удалось сформировать эскиз ни для одной позиции')
+
+        number = project_items[0].project.number if project_items else params['project_id']
+        result = TaskResult(task=task, slug='sketch_book', type=TaskResultType.FILE)
+        result.result_file.save(f'{number}_sketches.{output}', ContentFile(content), save=False)
+        result.save()
+
+        task.status = TaskStatus.DONE
+        task.status_details = {'processed': total, 'total': total, 'errors': errors}
         task.save()
 
-    except Exception as exc:
+    except Exception:
         task.status = TaskStatus.ERROR
         task.status_details = {'exception': traceback.format_exc()}
-        logger.error(f"Ошибка импорта: {traceback.format_exc()}")
+        logger.error(f"Ошибка выгрузки эскизов: {traceback.format_exc()}")
         task.save()
 
     notify_task_status(task)
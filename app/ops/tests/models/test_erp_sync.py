@@ -1,7 +1,9 @@
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-from ops.choices import ERPSyncType, ERPSyncStatus, ProjectStatus, LoadUnit, MoveUnit, TemperatureUnit
+from ops.choices import (
+    ERPSyncLogType, ERPSyncLogVerbosity, ERPSyncType, ERPSyncStatus, ProjectStatus, LoadUnit, MoveUnit, TemperatureUnit,
+)
 from ops.models import ERPSync, ERPSyncLog, Project, Item, DetailType, Variant
 
 User = get_user_model()
@@ -113,6 +115,26 @@ class ERPSyncModelTest(TestCase):
         self.assertEqual(log.request, "dummy request")
         self.assertEqual(log.response, "dummy response")
 
+    def test_buffer_logs(self):
+        """В buffer_logs записи сохраняются одним bulk_create, данные запросов - только при ошибке."""
+        sync = ERPSync.objects.create(author=self.user, type=ERPSyncType.ITEM, item=self.item)
+
+        with sync.buffer_logs(verbosity=ERPSyncLogVerbosity.NORMAL):
+            with self.assertNumQueries(0):
+                sync.add_log(ERPSyncLogType.DEBUG, 'step 1')
+                sync.add_log(ERPSyncLogType.HTTP_REQUEST, 'payload 1', 'response', payload=True)
+                sync.add_log(ERPSyncLogType.DEBUG, 'step 2')
+
+        self.assertEqual(list(sync.logs.values_list('request', flat=True)), ['step 1', 'step 2'])
+
+        with sync.buffer_logs(verbosity=ERPSyncLogVerbosity.NORMAL):
+            sync.add_log(ERPSyncLogType.HTTP_REQUEST, 'payload 2', 'response', payload=True)
+            sync.add_log(ERPSyncLogType.EXCEPTION, 'error')
+
+        self.assertEqual(
+            list(sync.logs.values_list('request', flat=True)), ['step 1', 'step 2', 'payload 2', 'error'],
+        )
+
     def test_str(self):
         """Метод __str__ должен возвращать строку, содержащую 'ERP Sync', строковое представление связанного объекта и отображение статуса."""
         sync = ERPSync.objects.create(
@@ -1,9 +1,14 @@
+from datetime import timedelta
+from unittest import mock
+
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.db.utils import IntegrityError
+from django.utils import timezone
 
 from ops.models import ERPSync, ERPSyncLog, Project, Item, DetailType, Variant
 from ops.choices import ERPSyncType, ERPSyncStatus, ERPSyncLogType
+from ops.erp_sync import ERPSyncLogBuffer
 
 User = get_user_model()
 
@@ -86,3 +91,17 @@ class ERPSyncLogModelTest(TestCase):
         self.assertLessEqual(log1.created_at, log2.created_at)
         sorted_logs = sorted(logs, key=lambda x: x.created_at)
         self.assertEqual(logs, sorted_logs)
+
+    def test_buffered_log_keeps_event_time(self):
+        """Проверяем, что запись из буфера сохраняется со временем добавления, а не сохранения."""
+        buffer = ERPSyncLogBuffer(self.erp_sync, flush_interval=60)
+        added_at = timezone.now() - timedelta(minutes=5)
+
+        with mock.patch('ops.erp_sync.timezone.now', return_value=added_at):
+            buffer.add(ERPSyncLogType.HTTP_REQUEST, request="Buffered request")
+
+        self.assertFalse(ERPSyncLog.objects.filter(erp_sync=self.erp_sync).exists())
+        buffer.flush()
+
+        log = ERPSyncLog.objects.get(erp_sync=self.erp_sync)
+        self.assertEqual(log.created_at, added_at)
@@ -0,0 +1,58 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from ops.models import DetailType, Item, ItemParameterValue, Variant
+
+User = get_user_model()
+
+
+class ItemParameterValueTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="test@example.com", password="password")
+        self.detail_type = DetailType.objects.create(name="Шпилька", designation="ST", category=DetailType.DETAIL)
+        self.variant = Variant.objects.create(detail_type=self.detail_type, name="1")
+
+    def create_item(self, parameters):
+        return Item.objects.create(
+            type=self.detail_type, variant=self.variant, parameters=parameters, author=self.user,
+        )
+
+    def test_split_value(self):
+        self.assertEqual(ItemParameterValue.split_value(12), (12.0, '12'))
+        self.assertEqual(ItemParameterValue.split_value('12,5'), (12.5, '12,5'))
+        self.assertEqual(ItemParameterValue.split_value('M12'), (None, 'M12'))
+        self.assertEqual(ItemParameterValue.split_value(True), (None, 'true'))
+        self.assertIsNone(ItemParameterValue.split_value(None))
+        self.assertIsNone(ItemParameterValue.split_value([1, 2]))
+
+    def test_sync_on_save(self):
+        item = self.create_item({'L': '300', 'thread': 'M12', 'catalog': [{'fn': 1}]})
+
+        values = {v.name: (v.numeric_value, v.text_value) for v in item.parameter_values.all()}
+        self.assertEqual(values, {'L': (300.0, '300'), 'thread': (None, 'M12')})
+
+        item.parameters['L'] = 400
+        item.save()
+        self.assertEqual(item.parameter_values.get(name='L').numeric_value, 400.0)
+
+        item.save(update_fields=['comment'])
+        self.assertEqual(item.parameter_values.count(), 2)
+
+    def test_filter_parameters(self):
+        item_300 = self.create_item({'L': '300', 'thread': 'M12'})
+        item_400 = self.create_item({'L': 400, 'thread': 'M16'})
+
+        self.assertEqual(list(Item.objects.filter_parameters(parameters__L=300)), [item_300])
+        self.assertEqual(list(Item.objects.filter_parameters(parameters__L__gte='350')), [item_400])
+        self.assertEqual(list(Item.objects.filter_parameters(parameters__thread='M16')), [item_400])
+        self.assertEqual(
+            set(Item.objects.filter_parameters(parameters__L__in=[300, '400'])), {item_300, item_400},
+        )
+
+    def test_order_by_parameters(self):
+        item_300 = self.create_item({'L': '300'})
+        item_40 = self.create_item({'L': 40})
+        item_empty = self.create_item({})
+
+        self.assertEqual(list(Item.objects.order_by_parameters('L')), [item_40, item_300, item_empty])
+        self.assertEqual(list(Item.objects.order_by_parameters('-L')), [item_300, item_40, item_empty])
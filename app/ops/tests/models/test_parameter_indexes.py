@@ -0,0 +1,70 @@
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from ops.choices import AttributeType, AttributeUsageChoices
+from ops.models import Attribute, DetailType, FieldSet, Item, Variant
+from ops.parameter_indexes import (
+    get_index_name, get_indexed_parameter_names, get_parameter_index_stats, reconcile_parameter_indexes,
+)
+
+User = get_user_model()
+
+
+class ParameterIndexesTestCase(TestCase):
+    def setUp(self):
+        self.fieldset = FieldSet.objects.create(name='Main')
+        self.detail_type = DetailType.objects.create(
+            name='Пружинный блок',
+            designation='FED',
+            category=DetailType.ASSEMBLY_UNIT,
+        )
+
+    def create_attribute(self, name, usage, position):
+        return Attribute.objects.create(
+            detail_type=self.detail_type,
+            type=AttributeType.INTEGER,
+            usage=usage,
+            name=name,
+            fieldset=self.fieldset,
+            position=position,
+        )
+
+    def test_index_name(self):
+        self.assertNotEqual(get_index_name('L'), get_index_name('l'))
+        self.assertLessEqual(len(get_index_name('x' * 200)), 63)
+
+    def test_indexed_parameter_names(self):
+        self.create_attribute('size', AttributeUsageChoices.SIZE, 1)
+        self.create_attribute('stroke', AttributeUsageChoices.RATED_STROKE, 2)
+        self.create_attribute('comment', AttributeUsageChoices.CUSTOM, 3)
+        deleted = self.create_attribute('L', AttributeUsageChoices.LENGTH, 4)
+        deleted.delete()
+
+        self.assertEqual(get_indexed_parameter_names(), {'size', 'stroke'})
+
+    @skipUnless(connection.vendor == 'postgresql', 'Индексы создаются только в PostgreSQL')
+    def test_filter_uses_parameter_index(self):
+        self.create_attribute('L', AttributeUsageChoices.LENGTH, 1)
+        variant = Variant.objects.create(detail_type=self.detail_type, name='1')
+        user = User.objects.create_user(email='indexes@mail.ru', password='testpassword')
+
+        for length in range(100, 1100, 100):
+            Item.objects.create(type=self.detail_type, variant=variant, parameters={'L': length}, author=user)
+
+        created, dropped = reconcile_parameter_indexes(concurrently=False)
+        self.assertEqual(created, [get_index_name('L')])
+        self.assertEqual(dropped, [])
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE ops_itemparametervalue')
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+        plan = Item.objects.filter_parameters(parameters__L__gte=300).explain()
+        self.assertIn(get_index_name('L'), plan)
+
+        stats = {row['index'] for row in get_parameter_index_stats()}
+        self.assertIn(get_index_name('L'), stats)
+        self.assertIn('ops_itemparam_numeric_idx', stats)
@@ -4,7 +4,8 @@ from PIL import Image
 from django.core.files.base import ContentFile
 from django.db import IntegrityError
 from django.test import TestCase
-from ops.models import Variant, DetailType
+from django.contrib.auth import get_user_model
+from ops.models import Variant, DetailType, Item, ItemChild
 from django.conf import settings
 
 
@@ -53,4 +54,18 @@ class VariantTestCase(TestCase):
         # TODO Написать тест для генерации скетча в варианте
         pass
 
+    def test_get_sketch_children(self):
+        """Дочерние элементы для подписей эскиза загружаются одним запросом"""
+        user = get_user_model().objects.create_user(email='sketch@example.com', password='password')
+        parent = Item.objects.create(type=self.detail_type, variant=self.variant, author=user)
+        first = Item.objects.create(type=self.detail_type, variant=self.variant, author=user)
+        second = Item.objects.create(type=self.detail_type, variant=self.variant, author=user)
+        ItemChild.objects.create(parent=parent, child=first, position=1, count=1)
+        ItemChild.objects.create(parent=parent, child=second, position=2, count=1)
 
+        with self.assertNumQueries(1):
+            children = Variant.get_sketch_children(parent)
+
+        self.assertEqual(children[('variant', 1, self.variant.id)], first)
+        self.assertEqual(children[('type', 2, self.detail_type.id)], second)
+        self.assertNotIn(('variant', 3, self.variant.id), children)
@@ -0,0 +1,91 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from tablib import Dataset
+
+from ops.choices import AttributeType
+from ops.models import Attribute, DetailType, FieldSet, Item, ItemParameterValue, Variant
+from ops.resources import BulkBase, get_resources_list
+
+
+User = get_user_model()
+
+
+class BulkImportTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(email='testuser@example.com', password='testpass')
+        self.detail_type = DetailType.objects.create(
+            name='Тестовая деталь', designation='FHD', category=DetailType.ASSEMBLY_UNIT,
+        )
+        self.variant = Variant.objects.create(detail_type=self.detail_type, name='wil')
+
+        fieldset = FieldSet.objects.create(name='general')
+        Attribute.objects.create(
+            variant=self.variant, type=AttributeType.INTEGER, name='H', fieldset=fieldset, position=1,
+        )
+        Attribute.objects.create(
+            variant=self.variant, type=AttributeType.INTEGER, name='L', fieldset=fieldset, position=2,
+        )
+
+        self.existing = Item.objects.create(
+            type=self.detail_type, variant=self.variant, parameters={'H': 5, 'L': 3}, author=self.user,
+        )
+
+    def get_resource(self):
+        resource_cls = next(r for r in get_resources_list(bulk=True) if r.__name__ == 'assembly_unit_FHD')
+        self.assertTrue(issubclass(resource_cls, BulkBase))
+
+        resource = resource_cls()
+        resource.category = 'assembly_unit'
+        resource.designation = 'FHD'
+        return resource
+
+    def import_rows(self, rows, dry_run=False):
+        dataset = Dataset(headers=['id', 'variant', 'H', 'L'])
+        for row in rows:
+            dataset.append(row)
+
+        resource = self.get_resource()
+        resource.before_import(dataset, user=self.user)
+        return resource.import_data(dataset, dry_run=dry_run, user=self.user, use_transactions=True)
+
+    def test_loads_only_referenced_items(self):
+        other_variant = Variant.objects.create(detail_type=self.detail_type, name='other')
+        other = Item.objects.create(type=self.detail_type, variant=other_variant, author=self.user)
+
+        resource = self.get_resource()
+        resource.before_import(Dataset(['', 'wil', 1, 2], headers=['id', 'variant', 'H', 'L']), user=self.user)
+        self.assertEqual(set(resource.items_by_id), {self.existing.id})
+        self.assertEqual(resource.items_by_variant['wil'], [self.existing])
+
+        # следующая часть файла догружает свои изделия
+        resource.load_items(Dataset([other.id, '', 1, 2], ['', 'wil', 3, 4], headers=['id', 'variant', 'H', 'L']))
+        self.assertEqual(set(resource.items_by_id), {self.existing.id, other.id})
+        self.assertEqual(resource.items_by_variant['wil'], [self.existing])
+        self.assertNotIn('other', resource.items_by_variant)
+
+    def test_bulk_create_and_update(self):
+        result = self.import_rows([
+            ['', 'wil', 1, 2],
+            ['', 'wil', 3, 4],
+            [self.existing.id, 'wil', 7, 8],
+        ])
+        self.assertFalse(result.has_errors())
+
+        created = list(Item.objects.filter(type=self.detail_type).exclude(id=self.existing.id).order_by('inner_id'))
+        self.assertEqual(len(created), 2)
+        self.assertEqual(
+            [item.inner_id for item in created],
+            [self.existing.inner_id + 1, self.existing.inner_id + 2],
+        )
+        self.assertEqual(created[0].parameters, {'H': 1, 'L': 2})
+
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.parameters, {'H': 7, 'L': 8})
+
+        self.assertTrue(ItemParameterValue.objects.filter(item=created[1], name='L', numeric_value=4).exists())
+        self.assertTrue(ItemParameterValue.objects.filter(item=self.existing, name='H', numeric_value=7).exists())
+
+    def test_dry_run_rolls_back(self):
+        result = self.import_rows([['', 'wil', 1, 2]], dry_run=True)
+        self.assertFalse(result.has_errors())
+        self.assertEqual(Item.objects.filter(type=self.detail_type).count(), 1)
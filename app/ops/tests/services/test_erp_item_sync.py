@@ -0,0 +1,126 @@
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from kernel.erp import ERPApi
+from kernel.erp_stand_in import ERPStandInServer
+
+from catalog.models import Material
+
+from ops.choices import AttributeCatalog, AttributeType, ERPSyncType
+from ops.erp_sync import ERPPayloadBuilder, ERPSyncCycleError, run_bottom_up
+from ops.models import Attribute, DetailType, ERPSync, FieldSet, Item, ItemChild, Variant
+from ops.tasks import sync_item
+
+User = get_user_model()
+
+
+class RunBottomUpTestCase(SimpleTestCase):
+    graph = {1: [2, 3], 2: [4], 3: [4], 4: []}
+
+    def assert_children_first(self, order):
+        self.assertEqual(sorted(order), [1, 2, 3, 4])
+        for node, children in self.graph.items():
+            for child in children:
+                self.assertLess(order.index(child), order.index(node))
+
+    def test_sequential(self):
+        order = []
+        run_bottom_up(self.graph, order.append)
+        self.assert_children_first(order)
+
+    def test_parallel(self):
+        order = []
+        run_bottom_up(self.graph, order.append, workers=3)
+        self.assert_children_first(order)
+
+    def test_cycle(self):
+        with self.assertRaises(ERPSyncCycleError):
+            run_bottom_up({1: [2], 2: [1]}, lambda node: None)
+
+
+class SyncItemTestCase(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email='sync@test.com', password='password')
+        detail_type = DetailType.objects.create(name='Сборка', designation='SB', category=DetailType.ASSEMBLY_UNIT)
+        variant = Variant.objects.create(detail_type=detail_type, name='1')
+
+        def create_item():
+            return Item.objects.create(type=detail_type, variant=variant, author=user)
+
+        self.root, self.unit, self.part = create_item(), create_item(), create_item()
+        ItemChild.objects.create(parent=self.root, child=self.unit, position=1, count=1)
+        ItemChild.objects.create(parent=self.root, child=self.part, position=2, count=2)
+        ItemChild.objects.create(parent=self.unit, child=self.part, position=1, count=4)
+
+        self.erp_sync = ERPSync.objects.create(author=user, type=ERPSyncType.ITEM, item=self.root)
+
+    def sync(self):
+        root = Item.objects.get(id=self.root.id)
+
+        with ERPStandInServer() as server:
+            with ERPApi(base_url=server.base_url, login='erp', password='erp') as api:
+                sync_item(api, self.erp_sync, root, workers=1)
+
+        return server
+
+    def test_sync_item(self):
+        server = self.sync()
+
+        # общая деталь отправляется один раз, спецификации - после дочерних элементов
+        self.assertEqual(len(server.requests_to('/products/id')), 3)
+        specifications = server.requests_to('/specifications/id')
+        self.assertEqual([spec['idwicad'] for spec in specifications], [self.unit.id, self.root.id])
+        self.assertTrue(all(row['iderp'] for spec in specifications for row in spec['structure']))
+
+    def test_repeated_sync(self):
+        self.sync()
+        self.assertEqual(self.sync().requests, [])
+
+        Item.objects.filter(id=self.unit.id).update(name='Измененная сборка')
+        server = self.sync()
+
+        self.assertEqual([product['idwicad'] for product in server.requests_to('/products/id')], [self.unit.inner_id])
+        # у сборки новый erp_id, поэтому спецификация корня отправляется заново
+        specifications = server.requests_to('/specifications/id')
+        self.assertEqual([spec['idwicad'] for spec in specifications], [self.unit.id, self.root.id])
+
+
+class ERPPayloadBuilderTestCase(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email='sync@test.com', password='password')
+        fieldset = FieldSet.objects.create(name='Main')
+        detail_type = DetailType.objects.create(name='Хомут', designation='HZ', category=DetailType.DETAIL)
+        variant = Variant.objects.create(detail_type=detail_type, name='1')
+        Attribute.objects.create(
+            variant=variant, type=AttributeType.INTEGER, name='L', fieldset=fieldset, position=1,
+            erp_name={'L': 'length'},
+        )
+        Attribute.objects.create(
+            variant=variant, type=AttributeType.CATALOG, catalog=AttributeCatalog.MATERIAL, name='mat',
+            fieldset=fieldset, position=2, erp_name={'mat': 'material', 'mat_group': 'material_group'},
+        )
+        materials = [Material.objects.create(name=f'Сталь {i}', group='Сталь') for i in range(3)]
+
+        self.items = [
+            Item.objects.create(
+                type=detail_type, variant=variant, parameters={'L': 100 + i, 'mat': material.id}, author=user,
+            )
+            for i, material in enumerate(materials)
+        ]
+
+    def test_params_from_memory(self):
+        items = list(Item.objects.filter(id__in=[item.id for item in self.items]).order_by('id'))
+        builder = ERPPayloadBuilder(items)
+
+        with self.assertNumQueries(0):
+            params = [builder.get_params(item) for item in items]
+
+        self.assertEqual(params[0], {'length': 100, 'material': str(Material.objects.get(name='Сталь 0')),
+                                     'material_group': 'Сталь'})
+
+    def test_unknown_parameter(self):
+        item = self.items[0]
+        item.parameters['X'] = 1
+
+        with self.assertRaises(Exception):
+            ERPPayloadBuilder([item]).get_params(item)
@@ -0,0 +1,134 @@
+import io
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from openpyxl import Workbook, load_workbook
+
+from ops.choices import AttributeType, LoadUnit, MoveUnit, ProjectStatus, TemperatureUnit
+from ops.import_project import (
+    get_additional_params, get_shifted_positions, process_opory_sheet, process_opory_specifications_sheet,
+    save_imported_items, shift_project_positions,
+)
+from ops.models import Attribute, DetailType, FieldSet, Item, Project, ProjectItem, TemporaryComposition, Variant
+
+
+User = get_user_model()
+
+
+class ImportProjectSheetsTestCase(SimpleTestCase):
+    def build_workbook(self):
+        workbook = Workbook()
+        items = workbook.active
+        items.title = 'Опоры'
+        items['A4'] = 1
+        items['B4'] = 'Опора 1'
+        items['L4'] = -5
+        items['AF4'] = 'FHD'
+        items['AJ4'] = 10
+        items['AT4'] = 'комментарий'
+        items['A5'] = 2
+        items['AF5'] = 'FHD'
+
+        specifications = workbook.create_sheet('Опоры - спецификация')
+        specifications['A2'] = 1
+        specifications['D2'] = 'ZOM 1'
+        specifications['I2'] = 2.5
+        specifications['A8'] = 2
+        specifications['D8'] = 'ZOM 2'
+        specifications['A30'] = 1
+        specifications['D30'] = 'после пустых строк'
+
+        content = io.BytesIO()
+        workbook.save(content)
+        content.seek(0)
+        return load_workbook(content, read_only=True, data_only=True)
+
+    def test_read_sheets(self):
+        workbook = self.build_workbook()
+
+        project_items = process_opory_sheet(None, workbook['Опоры'])
+        process_opory_specifications_sheet(workbook['Опоры - спецификация'], project_items)
+
+        self.assertEqual([item['position_number'] for item in project_items], [1, 2])
+        self.assertEqual(project_items[0]['item_name'], 'Опора 1')
+        self.assertEqual(project_items[0]['parameters']['Hs'], 10)
+        self.assertEqual(project_items[0]['comment'], 'комментарий')
+        self.assertEqual([spec['name'] for spec in project_items[0]['specifications']], ['ZOM 1'])
+        self.assertEqual([spec['name'] for spec in project_items[1]['specifications']], ['ZOM 2'])
+
+    def test_additional_params(self):
+        item_data = {'load_z': -5, 'load_x': 3, 'load_y': None, 'move_z': 0, 'move_x': None, 'move_y': -1}
+
+        self.assertEqual(
+            get_additional_params(item_data),
+            {'load_minus_z': 5, 'load_plus_x': 3, 'move_minus_y': 1},
+        )
+
+
+class ShiftedPositionsTestCase(SimpleTestCase):
+    def test_non_contiguous_positions(self):
+        shifted, imported = get_shifted_positions({1: 1, 2: 2, 3: 3, 4: 4, 5: 5}, [1, 10])
+
+        self.assertEqual(shifted, {1: 2, 2: 3, 3: 4, 4: 5, 5: 6})
+        self.assertEqual(imported, [1, 10])
+
+    def test_later_rows_shift_earlier_imported(self):
+        shifted, imported = get_shifted_positions({1: 1, 2: 2}, [5, 1])
+
+        self.assertEqual(shifted, {1: 2, 2: 3})
+        self.assertEqual(imported, [6, 1])
+
+    def test_position_without_number_goes_last(self):
+        shifted, imported = get_shifted_positions({1: 1, 2: 2, 3: None}, [None, 2])
+
+        self.assertEqual(shifted, {2: 3})
+        self.assertEqual(imported, [4, 2])
+
+
+class ImportProjectSaveTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpassword')
+        self.project = Project.objects.create(
+            number='12345',
+            owner=self.user,
+            status=ProjectStatus.DRAFT,
+            load_unit=LoadUnit.KN,
+            move_unit=MoveUnit.MM,
+            temperature_unit=TemperatureUnit.CELSIUS,
+        )
+
+    def test_shift_matches_sequential_save(self):
+        for position in range(1, 6):
+            ProjectItem.objects.create(project=self.project, position_number=position)
+
+        positions = shift_project_positions(self.project, [1, 10])
+
+        self.assertEqual(positions, [1, 10])
+        self.assertEqual(
+            list(ProjectItem.objects.filter(project=self.project).order_by('position_number').values_list(
+                'position_number', flat=True,
+            )),
+            [2, 3, 4, 5, 6],
+        )
+
+    def test_parameters_use_specification_weight(self):
+        detail_type = DetailType.objects.create(name='Опора', designation='FHD', category=DetailType.ASSEMBLY_UNIT)
+        child_type = DetailType.objects.create(name='Деталь', designation='ZOM', category=DetailType.DETAIL)
+        variant = Variant.objects.create(detail_type=detail_type, name='1')
+        Attribute.objects.create(
+            variant=variant,
+            type=AttributeType.NUMBER,
+            name='total_weight',
+            calculated_value='weight * 2',
+            fieldset=FieldSet.objects.create(name='Main'),
+            position=1,
+        )
+
+        item = Item(type=detail_type, variant=variant, parameters={}, author=self.user, weight=2.5)
+        composition = TemporaryComposition(tmp_parent=item, tmp_child=child_type, position=1, count=1, weight=2.5)
+
+        save_imported_items([item], [composition])
+
+        item.refresh_from_db()
+        self.assertEqual(item.parameters['total_weight'], 5)
+        self.assertTrue(TemporaryComposition.objects.filter(tmp_parent=item).exists())
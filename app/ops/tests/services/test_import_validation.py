@@ -0,0 +1,59 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from ops.choices import AttributeType
+from ops.import_validation import validate_import
+from ops.models import Attribute, DetailType, FieldSet, Item, Variant
+from ops.resources import get_resource_class
+
+
+User = get_user_model()
+
+
+class ImportValidationTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpassword')
+        fieldset = FieldSet.objects.create(name='Main')
+        detail_type = DetailType.objects.create(name='Хомут', designation='HZ', category=DetailType.DETAIL)
+        Attribute.objects.create(
+            detail_type=detail_type, type=AttributeType.INTEGER, name='L', fieldset=fieldset, position=1,
+        )
+        variant = Variant.objects.create(detail_type=detail_type, name='1')
+        self.item = Item.objects.create(type=detail_type, variant=variant, parameters={'L': 100}, author=self.user)
+
+        self.resource = get_resource_class('detail_HZ')()
+        self.resource.user = self.user
+
+    def validate(self, headers, rows):
+        return validate_import(self.resource, [(0, headers, rows)])
+
+    def test_valid_rows(self):
+        item_count = Item.objects.count()
+
+        errors = self.validate(['id', 'variant', 'L'], [['', '1', '100'], ['', '1', '200'], [self.item.id, '', '5']])
+
+        self.assertEqual(errors, [])
+        self.assertEqual(Item.objects.count(), item_count)
+
+    def test_unknown_columns_are_ignored(self):
+        # импорт пропускает колонки, которых нет среди атрибутов типа, проверка тоже
+        errors = self.validate(['id', 'variant', 'L', 'weight', 'material'], [['', '1', '200', '12.5', 'Сталь 20']])
+
+        self.assertEqual(errors, [])
+
+    def test_missing_id_column(self):
+        errors = self.validate(['variant', 'L'], [['1', '200']])
+
+        self.assertEqual([error['row'] for error in errors], [0])
+
+    def test_row_errors(self):
+        errors = self.validate(['id', 'variant', 'L'], [
+            ['', '1', 'abc'],
+            ['', '2', '5'],
+            ['', '1', '300'],
+            ['', '1', '300'],
+            ['', '1', '100'],
+            [self.item.id, '1', '150'],
+        ])
+
+        self.assertEqual([error['row'] for error in errors], [1, 2, 4, 6])
@@ -0,0 +1,55 @@
+import csv
+import io
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from openpyxl import load_workbook
+
+from ops.choices import AttributeType
+from ops.item_export import get_export_queryset, iter_export_rows, prepare_export_resource, write_csv, write_xlsx
+from ops.models import Attribute, DetailType, FieldSet, Item, Variant
+from ops.resources import get_resources_list
+
+
+User = get_user_model()
+
+
+class ItemExportTestCase(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email='testuser@example.com', password='testpassword')
+        fieldset = FieldSet.objects.create(name='Main')
+        self.detail_type = DetailType.objects.create(name='Хомут', designation='HZ', category=DetailType.DETAIL)
+        Attribute.objects.create(
+            detail_type=self.detail_type, type=AttributeType.INTEGER, name='L', fieldset=fieldset, position=1,
+        )
+        variant = Variant.objects.create(detail_type=self.detail_type, name='1')
+
+        for length in (100, 200, 300):
+            Item.objects.create(type=self.detail_type, variant=variant, parameters={'L': length}, author=user)
+
+        resource_cls = next(r for r in get_resources_list() if r.__name__ == 'detail_HZ')
+        self.resource = prepare_export_resource(resource_cls)
+        self.queryset = get_export_queryset('detail', 'HZ')
+
+    def test_rows_and_progress(self):
+        progress = []
+        rows = list(iter_export_rows(self.resource, self.queryset, chunk_size=2, progress=progress.append))
+
+        self.assertEqual(rows[0], ['id', 'variant', 'L'])
+        self.assertEqual([row[2] for row in rows[1:]], ['100', '200', '300'])
+        self.assertEqual(progress, [2, 3])
+
+    def test_write_csv(self):
+        content = io.BytesIO()
+        write_csv(iter_export_rows(self.resource, self.queryset), content)
+
+        rows = list(csv.reader(io.StringIO(content.getvalue().decode())))
+        self.assertEqual(len(rows), 4)
+
+    def test_write_xlsx(self):
+        content = io.BytesIO()
+        write_xlsx(iter_export_rows(self.resource, self.queryset), content)
+        content.seek(0)
+
+        sheet = load_workbook(content).active
+        self.assertEqual(sheet.max_row, 4)
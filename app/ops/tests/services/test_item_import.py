@@ -0,0 +1,75 @@
+import io
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from openpyxl import Workbook
+
+from ops.item_import import (
+    claim_import_finalization, collect_import_results, is_import_complete, iter_import_chunks, save_chunk_result,
+    set_import_totals, start_import_state,
+)
+from taskmanager.choices import TaskStatus, TaskType
+from taskmanager.models import Task
+
+
+class ImportChunksTestCase(SimpleTestCase):
+    def test_csv_chunks(self):
+        content = io.BytesIO('id,variant,L\n,1,100\n,1,200\n\n,1,300\n'.encode('utf-8'))
+
+        chunks = list(iter_import_chunks(content, 'csv', chunk_size=2))
+
+        self.assertEqual([offset for offset, _, _ in chunks], [0, 2])
+        self.assertEqual(chunks[0][1], ['id', 'variant', 'L'])
+        self.assertEqual(chunks[1][2], [['', '1', '300']])
+
+    def test_xlsx_chunks(self):
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(['id', 'variant', 'L'])
+        sheet.append([None, '1', 100])
+        sheet.append([None, '1'])
+        content = io.BytesIO()
+        workbook.save(content)
+        content.seek(0)
+
+        chunks = list(iter_import_chunks(content, 'xlsx'))
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(chunks[0][2], [[None, '1', 100], [None, '1', None]])
+
+
+class ImportStateTestCase(TestCase):
+    def test_collect_results(self):
+        user = get_user_model().objects.create_user(email='import@example.com', password='testpassword')
+        task_id = Task.objects.create(owner=user, type=TaskType.IMPORT, status=TaskStatus.PROCESSING).id
+
+        start_import_state(task_id)
+        save_chunk_result(task_id, 1, 2, {'errors': [{'row': 3, 'errors': ['error']}]})
+        self.assertFalse(is_import_complete(task_id))
+        self.assertFalse(claim_import_finalization(task_id))
+
+        set_import_totals(task_id, chunks=2, total=4)
+        save_chunk_result(task_id, 0, 2, {'exception': 'traceback'})
+        self.assertTrue(is_import_complete(task_id))
+
+        self.assertTrue(claim_import_finalization(task_id))
+        self.assertFalse(claim_import_finalization(task_id))
+
+        errors, exceptions = collect_import_results(task_id)
+        self.assertEqual(errors, [{'row': 3, 'errors': ['error']}])
+        self.assertEqual(exceptions, ['traceback'])
+
+    def test_forced_finalization(self):
+        user = get_user_model().objects.create_user(email='import@example.com', password='testpassword')
+        task_id = Task.objects.create(owner=user, type=TaskType.IMPORT, status=TaskStatus.PROCESSING).id
+
+        start_import_state(task_id)
+        save_chunk_result(task_id, 0, 2, {'errors': []})
+
+        # ошибка родительской задачи до записи количества частей
+        self.assertTrue(claim_import_finalization(task_id, force=True))
+
+        set_import_totals(task_id, chunks=2, total=4)
+        save_chunk_result(task_id, 1, 2, {'errors': []})
+        self.assertTrue(is_import_complete(task_id))
+        self.assertFalse(claim_import_finalization(task_id))
@@ -0,0 +1,62 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ops.choices import AttributeType
+from ops.models import Attribute, DetailType, FieldSet, Variant
+from ops.resources import get_resource_class, get_resources_list, split_resource_name
+
+
+class ResourceRegistryTestCase(TestCase):
+    def setUp(self):
+        self.fieldset = FieldSet.objects.create(name='general')
+        self.detail_type = DetailType.objects.create(
+            name='Тестовая деталь', designation='FHD', category=DetailType.ASSEMBLY_UNIT,
+        )
+        self.variant = Variant.objects.create(detail_type=self.detail_type, name='wil')
+        Attribute.objects.create(
+            variant=self.variant, type=AttributeType.INTEGER, name='H', fieldset=self.fieldset, position=1,
+        )
+
+    def test_split_resource_name(self):
+        self.assertEqual(split_resource_name('assembly_unit_FHD'), ('assembly_unit', 'FHD'))
+        self.assertEqual(split_resource_name('detail_A_B'), ('detail', 'A_B'))
+        self.assertIsNone(split_resource_name('unknown_FHD'))
+
+    def test_class_is_cached(self):
+        resource = get_resource_class('assembly_unit_FHD')
+
+        self.assertIsNotNone(resource)
+        self.assertIs(get_resource_class('assembly_unit_FHD'), resource)
+        self.assertEqual(resource._meta.fields, ['id', 'variant', 'H'])
+        self.assertIsNone(get_resource_class('assembly_unit_MISSING'))
+
+    def test_rebuilt_after_attribute_change(self):
+        resource = get_resource_class('assembly_unit_FHD')
+
+        Attribute.objects.create(
+            detail_type=self.detail_type, type=AttributeType.INTEGER, name='L', fieldset=self.fieldset, position=2,
+        )
+
+        rebuilt = get_resource_class('assembly_unit_FHD')
+        self.assertIsNot(rebuilt, resource)
+        self.assertEqual(rebuilt._meta.fields, ['id', 'variant', 'L', 'H'])
+
+    def test_rebuilt_after_change_in_other_process(self):
+        resource = get_resource_class('assembly_unit_FHD')
+
+        # изменение в другом процессе: сигналы текущего процесса не срабатывают
+        Attribute.objects.filter(name='H').update(name='L', modified=timezone.now() + timedelta(seconds=1))
+        self.assertIs(get_resource_class('assembly_unit_FHD'), resource)
+
+        with mock.patch('ops.cache.RESOURCES_VERSION_TTL', 0):
+            rebuilt = get_resource_class('assembly_unit_FHD')
+
+        self.assertIsNot(rebuilt, resource)
+        self.assertEqual(rebuilt._meta.fields, ['id', 'variant', 'L'])
+
+    def test_matches_resources_list(self):
+        resource = next(r for r in get_resources_list() if r.__name__ == 'assembly_unit_FHD')
+        self.assertIs(get_resource_class('assembly_unit_FHD'), resource)
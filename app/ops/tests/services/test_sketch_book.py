@@ -0,0 +1,73 @@
+import zipfile
+from io import BytesIO
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, TransactionTestCase
+
+from kernel.models import Organization
+from ops.choices import ProjectStatus, LoadUnit, MoveUnit, TemperatureUnit
+from ops.models import Project, ProjectItem, Item, DetailType, Variant
+from ops.sketch.book import SKETCH_BOOK_ZIP, render_sketch_book
+from ops.tasks import process_sketch_book_task
+from taskmanager.choices import TaskStatus, TaskType
+from taskmanager.models import Task
+
+User = get_user_model()
+
+
+class SketchBookDataMixin:
+    def setUp(self):
+        self.user = User.objects.create_user(email="sketches@mail.ru", password="testpassword")
+        self.project = Project.objects.create(
+            number="P-002",
+            organization=Organization.objects.create(name="Test Organization"),
+            owner=self.user,
+            status=ProjectStatus.DRAFT,
+            load_unit=LoadUnit.KN,
+            move_unit=MoveUnit.MM,
+            temperature_unit=TemperatureUnit.CELSIUS,
+        )
+        detail_type = DetailType.objects.create(name="Test DetailType", designation="TD002", category=DetailType.DETAIL)
+        variant = Variant.objects.create(detail_type=detail_type, name="Без эскиза")
+        item = Item.objects.create(type=detail_type, variant=variant, author=self.user)
+
+        self.project_items = [
+            ProjectItem.objects.create(project=self.project, position_number=number, original_item=item)
+            for number in (1, 2)
+        ]
+
+
+class SketchBookTestCase(SketchBookDataMixin, TestCase):
+    def test_position_errors_do_not_stop_book(self):
+        progress = []
+
+        content, errors = render_sketch_book(
+            self.project_items, self.user, output=SKETCH_BOOK_ZIP,
+            progress=lambda processed, project_item, error: progress.append((processed, project_item.id)),
+        )
+
+        self.assertEqual([error['position'] for error in errors], [1, 2])
+        self.assertEqual([processed for processed, _ in progress], [1, 2])
+        self.assertEqual(zipfile.ZipFile(BytesIO(content)).namelist(), [])
+
+    def test_task_fails_without_sketches(self):
+        task = Task.objects.create(
+            owner=self.user, type=TaskType.SKETCHES, parameters={'project_id': self.project.id, 'output': 'pdf'},
+        )
+
+        process_sketch_book_task(task.id)
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, TaskStatus.ERROR)
+        self.assertFalse(task.results.exists())
+
+
+class SketchBookPoolTestCase(SketchBookDataMixin, TransactionTestCase):
+    def test_positions_prepared_in_pool(self):
+        content, errors = render_sketch_book(self.project_items, self.user, output=SKETCH_BOOK_ZIP, workers=2)
+
+        self.assertEqual(
+            errors,
+            [{'position': number, 'error': 'У выбранного типа продукта не заведен эскиз.'} for number in (1, 2)],
+        )
+        self.assertEqual(zipfile.ZipFile(BytesIO(content)).namelist(), [])
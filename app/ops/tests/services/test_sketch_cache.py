@@ -0,0 +1,102 @@
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from ops.choices import AttributeType, LoadUnit, MoveUnit, ProjectStatus, TemperatureUnit
+from ops.models import (
+    Attribute, BaseComposition, DetailType, FieldSet, Item, Project, ProjectItem, Variant,
+)
+from ops.sketch.cache import evict_sketch_files, get_or_render_sketch, get_sketch_cache_key
+
+User = get_user_model()
+
+
+class SketchCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        settings_override = override_settings(SKETCH_CACHE_ROOT=self.tmp_dir.name, SKETCH_CACHE_MAX_SIZE=1024)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_render_once(self):
+        calls = []
+
+        def render():
+            calls.append(1)
+            return b'<svg/>', 'first.svg'
+
+        self.assertEqual(get_or_render_sketch('key.svg', render, lambda: 'second.svg'), (b'<svg/>', 'first.svg'))
+        self.assertEqual(get_or_render_sketch('key.svg', render, lambda: 'second.svg'), (b'<svg/>', 'second.svg'))
+        self.assertEqual(len(calls), 1)
+
+    def test_evict_least_recently_used(self):
+        for index, name in enumerate(['old.pdf', 'used.pdf', 'new.pdf']):
+            path = os.path.join(self.tmp_dir.name, name)
+            with open(path, 'wb') as file:
+                file.write(b'x' * 400)
+            os.utime(path, (index, index))
+
+        # чтение из кэша обновляет время файла
+        get_or_render_sketch('used.pdf', lambda: (b'', ''), lambda: 'used.pdf')
+        evict_sketch_files()
+
+        self.assertEqual(sorted(os.listdir(self.tmp_dir.name)), ['new.pdf', 'used.pdf'])
+
+
+class SketchCacheKeyTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='sketch_cache@mail.ru', password='testpassword')
+        fieldset = FieldSet.objects.create(name='general')
+
+        detail_type = DetailType.objects.create(name='Сборка', designation='SC', category=DetailType.ASSEMBLY_UNIT)
+        child_type = DetailType.objects.create(name='Деталь', designation='SCD', category=DetailType.DETAIL)
+        self.attribute = Attribute.objects.create(
+            detail_type=detail_type, type=AttributeType.INTEGER, name='L', fieldset=fieldset, position=1,
+        )
+        self.variant = Variant.objects.create(detail_type=detail_type, name='1')
+        self.composition = BaseComposition.objects.create(
+            base_parent=detail_type, base_parent_variant=self.variant, base_child=child_type, position=1, count=1,
+        )
+        self.variant.sketch_coords = [
+            {'id': self.attribute.id, 'x': 10, 'y': 20},
+            {'id': self.attribute.id, 'child_id': self.composition.id, 'x': 30, 'y': 40},
+        ]
+        self.variant.save()
+
+        project = Project.objects.create(
+            number='P-003',
+            owner=self.user,
+            status=ProjectStatus.DRAFT,
+            load_unit=LoadUnit.KN,
+            move_unit=MoveUnit.MM,
+            temperature_unit=TemperatureUnit.CELSIUS,
+        )
+        item = Item.objects.create(type=detail_type, variant=self.variant, parameters={'L': 100}, author=self.user)
+        self.project_item = ProjectItem.objects.create(project=project, position_number=1, original_item=item)
+
+    def get_key(self):
+        project_item = ProjectItem.objects.get(pk=self.project_item.pk)
+        return get_sketch_cache_key(project_item, self.user, 'svg')
+
+    def test_key_is_stable(self):
+        self.assertEqual(self.get_key(), self.get_key())
+
+    def test_key_changes_on_attribute_rename(self):
+        key = self.get_key()
+
+        self.attribute.name = 'L1'
+        self.attribute.save()
+
+        self.assertNotEqual(self.get_key(), key)
+
+    def test_key_changes_on_base_composition_change(self):
+        key = self.get_key()
+
+        self.composition.position = 2
+        self.composition.save()
+
+        self.assertNotEqual(self.get_key(), key)
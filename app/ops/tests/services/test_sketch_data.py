@@ -0,0 +1,63 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from catalog.models import ProductClass, ProductFamily
+
+from ops.choices import LoadUnit, MoveUnit, ProjectStatus, TemperatureUnit
+from ops.models import Project, ProjectItem
+from ops.services.sketch_data import get_sketch_data, get_sketch_data_fingerprint, save_sketch_data
+
+
+User = get_user_model()
+
+
+class StubSelection:
+    def __init__(self, data):
+        self.data = data
+        self.calls = 0
+
+    def get_data_for_sketch(self):
+        self.calls += 1
+        return self.data
+
+
+class SketchDataTestCase(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email='testuser@example.com', password='testpassword')
+        product_family = ProductFamily.objects.create(
+            product_class=ProductClass.objects.create(name='ProductClass'),
+            name='ProductFamily',
+            selection_type='product_selection',
+        )
+        project = Project.objects.create(
+            number='12345',
+            owner=user,
+            status=ProjectStatus.DRAFT,
+            load_unit=LoadUnit.KN,
+            move_unit=MoveUnit.MM,
+            temperature_unit=TemperatureUnit.CELSIUS,
+        )
+        self.project_item = ProjectItem.objects.create(
+            project=project,
+            position_number=1,
+            product_family=product_family,
+            selection_params={'pipe_params': {'temp1': 130}},
+        )
+
+    def test_saved_data_reused(self):
+        selection = StubSelection({'pipe': {'dn_text': 'DN 100'}})
+        save_sketch_data(self.project_item, selection)
+
+        project_item = ProjectItem.objects.get(pk=self.project_item.pk)
+
+        self.assertEqual(get_sketch_data(project_item), {'pipe': {'dn_text': 'DN 100'}})
+        self.assertEqual(selection.calls, 1)
+
+    def test_fingerprint_follows_selection_params(self):
+        fingerprint = get_sketch_data_fingerprint(self.project_item)
+
+        self.project_item.selection_params = {'pipe_params': {'temp1': 130}}
+        self.assertEqual(get_sketch_data_fingerprint(self.project_item), fingerprint)
+
+        self.project_item.selection_params['pipe_params']['temp1'] = 150
+        self.assertNotEqual(get_sketch_data_fingerprint(self.project_item), fingerprint)
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from django.test import SimpleTestCase
+from fpdf import FPDF
+
+from ops.sketch.fonts import add_pdf_font, get_pdf_font_path
+
+
+def build_pdf(add_font) -> bytes:
+    pdf = FPDF()
+    pdf.set_creation_date(datetime(2026, 1, 1, tzinfo=timezone.utc))
+    pdf.alias_nb_pages()
+    add_font(pdf)
+    pdf.add_page()
+    pdf.set_font('arialnarrow', size=12)
+    pdf.cell(text='Эскиз позиции 12, лист {nb}')
+    pdf.ln()
+    pdf.multi_cell(w=60, text='Опора скользящая ОСП-108 ГОСТ 14911-82')
+    return bytes(pdf.output())
+
+
+class PdfFontTestCase(SimpleTestCase):
+    def test_same_document_as_add_font(self):
+        expected = build_pdf(lambda pdf: pdf.add_font('arialnarrow', '', get_pdf_font_path()))
+
+        self.assertEqual(build_pdf(lambda pdf: add_pdf_font(pdf, 'arialnarrow')), expected)
+        # определение шрифта уже разобрано: следующий документ не должен зависеть от предыдущего
+        self.assertEqual(build_pdf(lambda pdf: add_pdf_font(pdf, 'arialnarrow')), expected)
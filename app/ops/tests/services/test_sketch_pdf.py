@@ -0,0 +1,21 @@
+from django.test import SimpleTestCase
+from PIL import Image
+
+from ops.sketch.pdf import get_witzenmann_logo
+from ops.utils import work_with_image
+
+
+class SketchPdfTestCase(SimpleTestCase):
+    def test_logo_decoded_once(self):
+        logo = get_witzenmann_logo()
+
+        self.assertTrue(logo.startswith(b'\x89PNG'))
+        self.assertIs(get_witzenmann_logo(), logo)
+
+    def test_work_with_image_without_encoding(self):
+        image = Image.new('RGB', (200, 100), 'white')
+
+        image_data = work_with_image(image, None, encode=False)
+
+        self.assertIsInstance(image_data['sketch'], Image.Image)
+        self.assertEqual(image_data['sketch'].size, (200, 100))
@@ -0,0 +1,91 @@
+import hashlib
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import InMemoryStorage
+from django.test import SimpleTestCase
+from PIL import Image
+
+from ops.sketch.renditions import (
+    build_rendition, delete_rendition, get_rendition_content_type, get_rendition_extension, get_rendition_url,
+)
+
+
+class FakeFieldFile:
+    def __init__(self, storage, name):
+        self.storage = storage
+        self.name = name
+
+    def open(self, mode='rb'):
+        self.file = self.storage.open(self.name, mode)
+        return self
+
+    def read(self, *args):
+        return self.file.read(*args)
+
+    def seek(self, *args):
+        return self.file.seek(*args)
+
+    def tell(self):
+        return self.file.tell()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.file.close()
+
+
+class SketchRenditionTestCase(SimpleTestCase):
+    def setUp(self):
+        self.storage = InMemoryStorage()
+
+    def save_image(self, name, size, format='PNG'):
+        buffer = BytesIO()
+        Image.new('RGB', size, 'white').save(buffer, format=format)
+        return FakeFieldFile(self.storage, self.storage.save(name, ContentFile(buffer.getvalue())))
+
+    def test_small_image_is_used_as_is(self):
+        field = self.save_image('sketches/small.png', (800, 600))
+
+        rendition = build_rendition(field)
+
+        self.assertEqual(rendition['name'], 'sketches/small.png')
+        self.assertEqual(rendition['scale'], 1.0)
+        with self.storage.open('sketches/small.png') as file:
+            self.assertEqual(rendition['hash'], hashlib.sha256(file.read()).hexdigest())
+
+    def test_large_image_is_scaled(self):
+        field = self.save_image('sketches/large.png', (4912, 1000))
+
+        rendition = build_rendition(field)
+
+        self.assertEqual(rendition['name'], 'sketches/large_render.png')
+        self.assertAlmostEqual(rendition['scale'], 0.5, places=3)
+        with self.storage.open(rendition['name']) as file:
+            content = file.read()
+        self.assertEqual(Image.open(BytesIO(content)).size, tuple(rendition['size']))
+        self.assertEqual(rendition['hash'], hashlib.sha256(content).hexdigest())
+
+        delete_rendition(rendition, self.storage)
+        self.assertFalse(self.storage.exists(rendition['name']))
+        self.assertTrue(self.storage.exists('sketches/large.png'))
+
+    def test_small_jpeg_keeps_its_type(self):
+        field = self.save_image('sketches/small.jpg', (800, 600), format='JPEG')
+
+        rendition = build_rendition(field)
+
+        self.assertEqual(rendition['name'], 'sketches/small.jpg')
+        self.assertEqual(get_rendition_extension(rendition), 'jpg')
+        self.assertEqual(get_rendition_content_type(rendition), 'image/jpeg')
+        self.assertTrue(get_rendition_url(1, 'sketch', rendition).endswith(f"/{rendition['hash']}.jpg"))
+
+    def test_scaled_rendition_is_png(self):
+        field = self.save_image('sketches/large.jpg', (4912, 1000), format='JPEG')
+
+        rendition = build_rendition(field)
+
+        self.assertEqual(rendition['name'], 'sketches/large_render.png')
+        self.assertEqual(get_rendition_content_type(rendition), 'image/png')
+        self.assertTrue(get_rendition_url(1, 'sketch', rendition).endswith(f"/{rendition['hash']}.png"))
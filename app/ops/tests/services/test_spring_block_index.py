@@ -0,0 +1,213 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from catalog.choices import ComponentGroupType, SeriesNameChoices
+from catalog.models import ComponentGroup, ProductClass, ProductFamily, SpringBlockFamilyBinding
+
+from ops.cache import (
+    build_spring_block_index,
+    get_cached_spring_block_index,
+    invalidate_spring_block_index,
+    normalize_spring_block_value,
+)
+from ops.choices import AttributeType, AttributeUsageChoices, LoadUnit, MoveUnit, ProjectStatus, TemperatureUnit
+from ops.models import Attribute, DetailType, FieldSet, Item, Project, ProjectItem, Variant
+from ops.services.product_selection import ProductSelectionAvailableOptions
+
+
+User = get_user_model()
+
+
+class SpringBlockIndexTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpassword')
+        self.fieldset = FieldSet.objects.create(name='Main')
+
+        product_class = ProductClass.objects.create(name='ProductClass')
+        self.product_family = ProductFamily.objects.create(product_class=product_class, name='ProductFamily')
+
+        self.detail_type = DetailType.objects.create(
+            name='Пружинный блок',
+            designation='FED',
+            category=DetailType.ASSEMBLY_UNIT,
+        )
+        Attribute.objects.create(
+            detail_type=self.detail_type,
+            type=AttributeType.INTEGER,
+            usage=AttributeUsageChoices.SIZE,
+            name='size',
+            fieldset=self.fieldset,
+            position=1,
+        )
+        Attribute.objects.create(
+            detail_type=self.detail_type,
+            type=AttributeType.INTEGER,
+            usage=AttributeUsageChoices.RATED_STROKE,
+            name='stroke',
+            fieldset=self.fieldset,
+            position=2,
+        )
+
+        group = ComponentGroup.objects.create(group_type=ComponentGroupType.SERIES_SELECTABLE)
+        group.detail_types.add(self.detail_type)
+
+        binding = SpringBlockFamilyBinding.objects.create(family=self.product_family)
+        binding.spring_block_types.add(self.detail_type)
+
+        self.variant = Variant.objects.create(
+            detail_type=self.detail_type,
+            name='1',
+            series=SeriesNameChoices.STANDARD_SERIES,
+        )
+
+        project = Project.objects.create(
+            number='12345',
+            owner=self.user,
+            status=ProjectStatus.DRAFT,
+            load_unit=LoadUnit.KN,
+            move_unit=MoveUnit.MM,
+            temperature_unit=TemperatureUnit.CELSIUS,
+        )
+        self.project_item = ProjectItem.objects.create(
+            project=project,
+            position_number=1,
+            product_family=self.product_family,
+        )
+
+    def create_item(self, size, stroke):
+        return Item.objects.create(
+            type=self.detail_type,
+            variant=self.variant,
+            parameters={'size': size, 'stroke': stroke},
+            author=self.user,
+        )
+
+    def get_selection(self, size, stroke):
+        selection = ProductSelectionAvailableOptions(self.project_item)
+        selection.params['spring_choice']['selected_spring'] = {
+            'name': SeriesNameChoices.STANDARD_SERIES,
+            'size': size,
+            'rated_stroke': stroke,
+        }
+        return selection
+
+    def test_normalize_value(self):
+        self.assertEqual(normalize_spring_block_value(12), normalize_spring_block_value('12'))
+        self.assertEqual(normalize_spring_block_value(12.0), normalize_spring_block_value('12,0'))
+        self.assertIsNone(normalize_spring_block_value(None))
+
+    def test_index_by_series_size_and_stroke(self):
+        item = self.create_item(12, 200)
+
+        index = get_cached_spring_block_index(self.product_family.id)
+
+        key = (SeriesNameChoices.STANDARD_SERIES, normalize_spring_block_value(12), normalize_spring_block_value(200))
+        self.assertEqual(index, {key: [item.id]})
+
+    def test_suitable_spring_block_item(self):
+        self.create_item(12, 200)
+        item = self.create_item(16, 200)
+
+        found = self.get_selection('16', '200').get_suitable_spring_block_item()
+        self.assertEqual(found, item)
+
+        self.assertIsNone(self.get_selection(20, 200).get_suitable_spring_block_item())
+
+    def test_index_rebuilt_on_item_save(self):
+        self.assertIsNone(self.get_selection(20, 200).get_suitable_spring_block_item())
+
+        item = self.create_item(20, 200)
+        self.assertEqual(self.get_selection(20, 200).get_suitable_spring_block_item(), item)
+
+        item.delete()
+        self.assertIsNone(self.get_selection(20, 200).get_suitable_spring_block_item())
+
+    def test_index_rebuilt_after_bulk_save(self):
+        self.assertIsNone(self.get_selection(24, 200).get_suitable_spring_block_item())
+
+        item = Item(
+            type=self.detail_type,
+            variant=self.variant,
+            parameters={'size': 24, 'stroke': 200},
+            author=self.user,
+            inner_id=Item.objects.reserve_inner_ids(1)[0],
+        )
+        Item.objects.bulk_create([item])
+        # Пакетные операции меняют версию индекса явно, как BulkBase и batch_recalculate_items
+        invalidate_spring_block_index()
+        self.assertEqual(self.get_selection(24, 200).get_suitable_spring_block_item(), item)
+
+        item.parameters = {'size': 28, 'stroke': 200}
+        item.modified = timezone.now()
+        Item.objects.bulk_update([item], ['parameters', 'modified'])
+        invalidate_spring_block_index()
+        self.assertIsNone(self.get_selection(24, 200).get_suitable_spring_block_item())
+        self.assertEqual(self.get_selection(28, 200).get_suitable_spring_block_item(), item)
+
+    def test_index_rebuilt_after_series_change(self):
+        item = self.create_item(12, 200)
+        self.assertEqual(self.get_selection(12, 200).get_suitable_spring_block_item(), item)
+
+        self.variant.series = None
+        self.variant.save()
+        self.assertIsNone(self.get_selection(12, 200).get_suitable_spring_block_item())
+
+    def test_cached_index_read_is_single_query(self):
+        self.create_item(12, 200)
+        get_cached_spring_block_index(self.product_family.id)
+
+        with self.assertNumQueries(1):
+            get_cached_spring_block_index(self.product_family.id)
+
+    def test_build_queries_do_not_depend_on_variants(self):
+        self.create_item(12, 200)
+
+        with self.assertNumQueries(3):
+            build_spring_block_index(self.product_family.id)
+
+        variant = Variant.objects.create(
+            detail_type=self.detail_type,
+            name='2',
+            series=SeriesNameChoices.STANDARD_SERIES,
+        )
+        Item.objects.create(
+            type=self.detail_type,
+            variant=variant,
+            parameters={'size': 16, 'stroke': 200},
+            author=self.user,
+        )
+
+        with self.assertNumQueries(3):
+            index = build_spring_block_index(self.product_family.id)
+
+        self.assertEqual(len(index), 2)
+
+    def test_variant_attribute_overrides_detail_type_attribute(self):
+        # Одноименный атрибут исполнения без использования "Типоразмер" перекрывает атрибут типа детали
+        Attribute.objects.create(
+            variant=self.variant,
+            type=AttributeType.INTEGER,
+            name='size',
+            fieldset=self.fieldset,
+            position=1,
+        )
+        Attribute.objects.create(
+            variant=self.variant,
+            type=AttributeType.INTEGER,
+            usage=AttributeUsageChoices.SIZE,
+            name='dn',
+            fieldset=self.fieldset,
+            position=3,
+        )
+        item = Item.objects.create(
+            type=self.detail_type,
+            variant=self.variant,
+            parameters={'size': 12, 'dn': 20, 'stroke': 200},
+            author=self.user,
+        )
+
+        index = build_spring_block_index(self.product_family.id)
+
+        key = (SeriesNameChoices.STANDARD_SERIES, normalize_spring_block_value(20), normalize_spring_block_value(200))
+        self.assertEqual(index, {key: [item.id]})
@@ -99,10 +99,14 @@ class DetailTypeAttributesTestCase(APITestCase):
         process_import_task(task.id)
 
         task = Task.objects.get(id=task_id)
-        self.assertEqual(task.status, TaskStatus.DONE, msg=task.status_details)
+        self.assertEqual(task.status, TaskStatus.ERROR, msg=task.status_details)
+        # dry run проверяет файл без записи: лишние колонки пропускаются, как при импорте,
+        # ошибка только в строке с неизвестным исполнением "asd"
+        self.assertEqual([error['row'] for error in task.status_details], [2])
+        self.assertEqual(Item.objects.count(), 1)
 
         response = self.client.get(f'/api/tasks/{task.id}/')
         self.assertEqual(response.status_code, status.HTTP_200_OK, msg=response.content.decode('utf-8'))
 
         data = response.json()
-        self.assertEqual(data['status'], TaskStatus.DONE)
+        self.assertEqual(data['status'], TaskStatus.ERROR)
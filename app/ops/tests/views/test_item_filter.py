@@ -90,3 +90,17 @@ class TestItemViewSetList(TestCase):
         results = response.data.get("results", response.data)
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]["parameters"]["a"], 10)
+
+    def test_filter_parameters_string_stored_number(self):
+        item = Item.objects.create(
+            name="Item4", type=self.detail_type, variant=self.variant, parameters={"a": "20"}, author=self.user
+        )
+
+        response = self.client.get(self.url, {"parameters.a__gte": 15})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data.get("results", response.data)
+        self.assertEqual({result["id"] for result in results}, {self.item3.id, item.id})
+
+        response = self.client.get(self.url, {"parameters.a": 20})
+        results = response.data.get("results", response.data)
+        self.assertEqual([result["id"] for result in results], [item.id])
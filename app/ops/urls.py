@@ -19,6 +19,10 @@ urlpatterns = [
     path('get_sketch/<pid>', views.get_sketch, name='get_sketch'),
     path('get_sketch_pdf/<int:project_item_id>', views.get_sketch_pdf, name='get_sketch_pdf'),
     path('download_sketch_pdf/<int:project_item_id>', views.download_sketch_pdf, name='download_sketch_pdf'),
+    path(
+        'sketch_rendition/<int:variant_id>/<str:field_name>/<str:digest>.<str:extension>',
+        views.sketch_rendition, name='sketch_rendition',
+    ),
     path('product_type_autocomplete/', views.DetailTypeAutocomplete.as_view(), name='product_type_autocomplete'),
     path('copy_pji/<pji_id>/', views.copy_pji, name='copy_pji'),
     path('delete_pji/<pji_id>/', views.delete_pji, name='delete_pji'),
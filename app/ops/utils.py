@@ -4,16 +4,16 @@ from datetime import date, datetime
 from io import BytesIO
 from collections import defaultdict, deque
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
 from constance import config
 from django.shortcuts import render
 from django.utils import timezone
 
 from ops.exceptions import TopologicalSortException
-from ops.models import DetailType, TemporaryComposition
+from ops.sketch.fonts import get_text_length
+from ops.sketch.renditions import PX_TO_MM, SKETCH_MAX_MM, get_rendition_url
+from ops.models import DetailType, TemporaryComposition, Variant
 
-# Отношение пикселя к мм
-PX_TO_MM = 0.26458333
 # запасик, чтобы поднять размер над размерной линией
 UP_OF_SIZE_LINE = 3
 
@@ -82,20 +82,15 @@ def calculate_image_position(image_width, image_height, center_x, center_y):
     return image_x, image_y
 
 
-# Подгоняет размер эскиза, сохраненного в Variant, для корректного отображения в требуемой области эскиза
-def work_with_image(sketch_path, pji, double=False, coords=None):
-    if isinstance(sketch_path, str):
-        sketch = Image.open(sketch_path)
-    else:
-        sketch = sketch_path
-
-    width_px, height_px = sketch.width, sketch.height
+def get_image_geometry(width_px, height_px, double=False, coords=None):
+    """
+    Положение и размер эскиза на листе SVG для изображения width_px x height_px.
+    """
     image_width_mm = width_px * PX_TO_MM
     image_height_mm = height_px * PX_TO_MM
 
-    # Ограничения по размеру
-    max_mm = 650
-    scale_factor = min(max_mm / image_width_mm, max_mm / image_height_mm, 1.0)
+    # Ограничения по размеру (эскизы исполнений уже уменьшены до него при загрузке, см. ops.sketch.renditions)
+    scale_factor = min(SKETCH_MAX_MM / image_width_mm, SKETCH_MAX_MM / image_height_mm, 1.0)
 
     # Применим масштабирование
     scaled_width_mm = image_width_mm * scale_factor
@@ -106,21 +101,9 @@ def work_with_image(sketch_path, pji, double=False, coords=None):
     image_x = 80
     image_y = 50
 
-    # Масштабированное изображение в пикселях (если хочешь реально уменьшить)
-    if scale_factor < 1.0:
-        new_width_px = int(width_px * scale_factor)
-        new_height_px = int(height_px * scale_factor)
-        sketch = sketch.resize((new_width_px, new_height_px), Image.Resampling.LANCZOS)
-
     # Подпись для двойных изделий
     horizontal_size_y = center_y + scaled_height_mm / 2 - UP_OF_SIZE_LINE if double else None
 
-    # Преобразуем в base64
-    buffer = BytesIO()
-    sketch.save(buffer, format="PNG")
-    buffer.seek(0)
-    new_image = base64.b64encode(buffer.read()).decode("utf-8")
-
     return {
         'image_x': "{:.2f}".format(image_x),
         'image_y': "{:.2f}".format(image_y),
@@ -128,10 +111,80 @@ def work_with_image(sketch_path, pji, double=False, coords=None):
         'image_height': "{:.2f}".format(scaled_height_mm),
         'center_x': center_x,
         'center_y': center_y,
-        'sketch': new_image,
-        'horizontal_size_y': "{:.2f}".format(horizontal_size_y) if horizontal_size_y else None
+        'horizontal_size_y': "{:.2f}".format(horizontal_size_y) if horizontal_size_y else None,
+        'scale_factor': scale_factor,
     }
 
+
+# Подгоняет размер эскиза, сохраненного в Variant, для корректного отображения в требуемой области эскиза.
+# При encode=False в 'sketch' возвращается само изображение PIL (для PDF), иначе PNG в base64 (для SVG).
+def work_with_image(sketch_path, pji, double=False, coords=None, encode=True):
+    if isinstance(sketch_path, str):
+        sketch = Image.open(sketch_path)
+    else:
+        sketch = sketch_path
+
+    width_px, height_px = sketch.width, sketch.height
+    image_data = get_image_geometry(width_px, height_px, double, coords)
+    scale_factor = image_data.pop('scale_factor')
+
+    # Масштабированное изображение в пикселях (если хочешь реально уменьшить)
+    if scale_factor < 1.0:
+        new_width_px = int(width_px * scale_factor)
+        new_height_px = int(height_px * scale_factor)
+        sketch = sketch.resize((new_width_px, new_height_px), Image.Resampling.LANCZOS)
+
+    if encode:
+        # Преобразуем в base64
+        buffer = BytesIO()
+        sketch.save(buffer, format="PNG")
+        buffer.seek(0)
+        new_image = base64.b64encode(buffer.read()).decode("utf-8")
+    else:
+        new_image = sketch
+
+    image_data['sketch'] = new_image
+    return image_data
+
+
+def get_vector_image_data(request, project_item, double=False, field_name='sketch', coords_field_name='sketch_coords'):
+    """
+    Данные эскиза для векторного SVG: вместо встроенного PNG - адрес подготовленной копии эскиза
+    (ops.sketch.renditions), подписи размеров выводятся текстом SVG.
+    Возвращает None, если копии эскиза нет.
+    """
+    variant = project_item.original_item.variant
+    rendition = variant.get_sketch_rendition(field_name)
+
+    if not rendition:
+        return None
+
+    width_px, height_px = rendition['size']
+    image_data = get_image_geometry(width_px, height_px, double)
+
+    url = get_rendition_url(variant.id, field_name, rendition)
+    image_data['url'] = request.build_absolute_uri(url) if request is not None else url
+
+    # Пиксель исходного эскиза в единицах SVG: копия уменьшена в scale раз и выводится с масштабом листа
+    unit = rendition['scale'] * PX_TO_MM * image_data.pop('scale_factor')
+    image_x = float(image_data['image_x'])
+    image_y = float(image_data['image_y'])
+    font_size = Variant.get_sketch_font_size(rendition['original_size'][1]) * unit
+
+    image_data['labels'] = [
+        {
+            'text': label['text'],
+            'x': "{:.2f}".format(image_x + label['x'] * unit),
+            'y': "{:.2f}".format(image_y + label['y'] * unit),
+            'rotation': label['rotation'],
+            'font_size': "{:.2f}".format(font_size),
+        }
+        for label in variant.get_sketch_labels(project_item.original_item, coords_field_name)
+    ]
+
+    return image_data
+
+
 def wrap_words(comment):
     if comment is None:
         return
@@ -142,36 +195,33 @@ def wrap_words(comment):
     font_path = config.SVG_TEXT_FONT_PATH
     font_size_pt = 8
     mm_per_pt = 0.3527
-    font_size_mm = font_size_pt * mm_per_pt
-
-    # Создаем шрифт с нужным размером
-    font = ImageFont.truetype(font_path, font_size_pt)
 
     # Максимальная ширина в пикселях (размер SVG и пикселей зависит от контекста рендера)
     max_width_px = max_width_mm / mm_per_pt * dpi / 72  # mm -> pt -> px
 
-    # Создаём временное изображение, чтобы иметь контекст для текста
-    img = Image.new('RGB', (1000, 1000))
-    draw = ImageDraw.Draw(img)
+    # Ширина строки накапливается по словам, ширины символов шрифта кэшируются
+    space_width = get_text_length(font_path, font_size_pt, ' ')
 
     final_lines = []
 
     for line in comment:
         words = line.split(' ')
         current_line = ''
+        current_width = 0
 
         for word in words:
+            word_width = get_text_length(font_path, font_size_pt, word)
             # Рассчитываем длину текущей линии с новым словом
-            test_line = current_line + ('' if current_line == '' else ' ') + word
-            bbox = draw.textbbox((0, 0), test_line, font=font)  # Используем getbbox для получения размеров
-            width = bbox[2] - bbox[0]  # Ширина строки
+            width = word_width if current_line == '' else current_width + space_width + word_width
 
             if width <= max_width_px:
-                current_line = test_line
+                current_line = current_line + ('' if current_line == '' else ' ') + word
+                current_width = width
             else:
                 # Добавляем текущую строку в финальные и начинаем новую строку
                 final_lines.append(current_line)
                 current_line = word
+                current_width = word_width
 
         if current_line:
             final_lines.append(current_line)
@@ -185,34 +235,44 @@ def render_sketch(
     composition_type="temporary_composition",
     field_name="sketch",
     coords_field_name="sketch_coords",
+    created_by=None,
+    vector=False,
     ):
     """
-    Формирование эскиза
+    Формирование эскиза.
+
+    Вне запроса (фоновые задачи) передаются request=None и пользователь created_by.
+    При vector=True эскиз исполнения не встраивается в SVG, а подключается по адресу (см. get_vector_image_data).
     """
     # Соберем инфу для отображения на эскизе
     if not project_item.original_item.variant.sketch:
         # Если нет эскиза в админке, то и эскиз с параметрами не дадим сделать
         raise Exception('У выбранного типа продукта не заведен эскиз.')
 
-    sketch_path = project_item.original_item.variant.generate_sketch(
-        project_item.original_item,
-        field_name=field_name,
-        coords_field_name=coords_field_name
-        )
-
     if composition_type == "temporary_composition":
         composition_objects = TemporaryComposition.objects.filter(tmp_parent=project_item.original_item)
     else:
         composition_objects = project_item.original_item.children.all()
 
     today = date.today().strftime('%d.%m.%y')
-    last_name = request.user.last_name
+    last_name = (created_by or request.user).last_name
     double = project_item.original_item.type.branch_qty == DetailType.BranchQty.TWO
 
     # Для подгона вывода комментариев построчно
     comment = project_item.comment.split('\n') if project_item.comment else None
     comment = wrap_words(comment)
-    image_data = work_with_image(sketch_path, project_item, double)
+
+    image_data = None
+    if vector:
+        image_data = get_vector_image_data(request, project_item, double, field_name, coords_field_name)
+
+    if image_data is None:
+        sketch_path = project_item.original_item.variant.generate_sketch(
+            project_item.original_item,
+            field_name=field_name,
+            coords_field_name=coords_field_name
+            )
+        image_data = work_with_image(sketch_path, project_item, double)
 
     # Сформируем эскиз и раскодируем
     context = {
@@ -226,10 +286,13 @@ def render_sketch(
     }
     response = render(request, 'ops/preview_svg.html', context=context)
 
-    # Информация для имени файла
-    tz = timezone.get_current_timezone()
-    aware_datetime = timezone.make_aware(datetime.now(), tz)
-    when_formed = aware_datetime.strftime('%d.%m.%y_%H.%M.%S')
-    filename = f'{project_item.position_number}_{project_item.project.number}_{when_formed}.svg'
+    return response.content, get_sketch_filename(project_item)
 
-    return response.content, filename
+
+def get_sketch_filename(project_item, extension='svg', tz=None):
+    """
+    Имя файла эскиза: позиция, номер проекта и время формирования.
+    """
+    tz = tz or timezone.get_current_timezone()
+    when_formed = datetime.now(tz).strftime('%d.%m.%y_%H.%M.%S')
+    return f'{project_item.position_number}_{project_item.project.number}_{when_formed}.{extension}'
@@ -11,7 +11,9 @@ from django.forms.models import inlineformset_factory
 from django.shortcuts import render, redirect, get_object_or_404
 from django.http import (
     HttpResponseNotFound, HttpResponse, HttpResponseBadRequest, HttpResponseRedirect, JsonResponse, HttpRequest,
+    FileResponse,
 )
+from django.utils.cache import patch_cache_control
 from django.views.generic import ListView
 from django.urls import reverse
 
@@ -27,8 +29,8 @@ from ops.forms import (
 from ops.import_project import import_project_from_file
 from ops.models import Project, ProjectItem, Item, Variant, DetailType, TemporaryComposition
 from ops.loads.utils import get_suitable_loads
-from ops.sketch.pdf import render_sketch_pdf
-from ops.utils import render_sketch
+from ops.sketch.cache import render_sketch_cached, render_sketch_pdf_cached
+from ops.sketch.renditions import RENDITION_CACHE_MAX_AGE, get_rendition_content_type, get_rendition_extension
 
 logger = logging.getLogger(__name__)
 
@@ -380,7 +382,7 @@ def get_sketch(request, pid):
     pji = ProjectItem.objects.get(pk=int(pid))
 
     try:
-        string_svg, filename = render_sketch(request, pji)
+        string_svg, filename = render_sketch_cached(request, pji)
         string_svg = string_svg.decode()
     except Exception as exc:
         raise exc
@@ -392,7 +394,7 @@ def get_sketch_pdf(request, project_item_id):
     project_item = ProjectItem.objects.get(pk=project_item_id)
 
     try:
-        output, filename = render_sketch_pdf(project_item, request.user)
+        output, filename = render_sketch_pdf_cached(project_item, request.user)
     except Exception as exc:
         raise exc
 
@@ -403,7 +405,7 @@ def download_sketch_pdf(request, project_item_id):
     project_item = ProjectItem.objects.get(pk=project_item_id)
 
     try:
-        output, filename = render_sketch_pdf(project_item, request.user)
+        output, filename = render_sketch_pdf_cached(project_item, request.user)
     except Exception as exc:
         raise exc
 
@@ -413,6 +415,28 @@ def download_sketch_pdf(request, project_item_id):
     return response
 
 
+def sketch_rendition(request, variant_id, field_name, digest, extension):
+    """
+    Подготовленная копия эскиза исполнения для векторных SVG эскизов.
+    Адрес содержит хеш содержимого, поэтому ответ кэшируется клиентом без повторных проверок.
+    Тип содержимого определяется по имени файла копии (оригинал, если он не уменьшался, может быть не PNG).
+    """
+    if field_name not in Variant.SKETCH_FIELDS:
+        return HttpResponseNotFound()
+
+    variant = get_object_or_404(Variant, pk=variant_id)
+    rendition = variant.get_sketch_rendition(field_name)
+
+    if not rendition or rendition.get('hash') != digest or get_rendition_extension(rendition) != extension:
+        return HttpResponseNotFound()
+
+    storage = getattr(variant, field_name).storage
+    response = FileResponse(storage.open(rendition['name'], 'rb'), content_type=get_rendition_content_type(rendition))
+    patch_cache_control(response, public=True, max_age=RENDITION_CACHE_MAX_AGE, immutable=True)
+
+    return response
+
+
 def copy_pji(request, pji_id):
     try:
         pji = ProjectItem.objects.get(pk=int(pji_id))
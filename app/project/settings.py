@@ -138,6 +138,11 @@ CONSTANCE_CONFIG = {
     'ERP_BASE_URL': ('', 'API-точка к ERP'),
     'ERP_LOGIN': ('', 'Логин ERP'),
     'ERP_PASSWORD': ('', 'Пароль ERP'),
+    'ERP_SYNC_WORKERS': (4, 'Количество параллельных запросов к ERP при синхронизации'),
+    'ERP_SYNC_LOG_VERBOSITY': (
+        1, 'Подробность лога ERP синхронизации: 0 - только ошибки, 1 - ход синхронизации, '
+           '2 - все запросы и ответы (иначе они сохраняются только при ошибке)',
+    ),
     'TECHNICAL_REQUIREMENTS': (
         "",
         'Технические требования проектов',
@@ -148,12 +153,13 @@ CONSTANCE_CONFIG = {
     'SSB_EXTRA_MARGIN_PERCENT': (0.1, 'Дополнительный запас для типа 1 в процентах (по умолчанию 10%)'),
     "SVG_TEXT_FONT_PATH": ("Arial.ttf", "Шрифт текста в svg скетче"),
     "SKETCH_IMAGE_TEXT_FONT_PATH": ("arial.ttf", "Шрифт текста в изображении скетча"),
+    "SKETCH_BOOK_WORKERS": (4, "Количество процессов для пакетной выгрузки эскизов проекта"),
 }
 
 CONSTANCE_CONFIG_FIELDSETS = {
     'CRM': ('CRM_API_URL',),
     'COMMENTS': ('COMMON_COMMENT',),
-    'ERP': ('ERP_BASE_URL', 'ERP_LOGIN', 'ERP_PASSWORD'),
+    'ERP': ('ERP_BASE_URL', 'ERP_LOGIN', 'ERP_PASSWORD', 'ERP_SYNC_WORKERS', 'ERP_SYNC_LOG_VERBOSITY'),
     'Tехнические требования': ('TECHNICAL_REQUIREMENTS',),
     'TEMPERATURE_WITH_INSULATION': ('TEMPERATURE_WITH_INSULATION',),
     'SSB_SHOCK_CALC': (
@@ -161,7 +167,7 @@ CONSTANCE_CONFIG_FIELDSETS = {
         'SSB_SN_MARGIN_COEF',
         'SSB_EXTRA_MARGIN_PERCENT',
     ),
-    "SKETCHES": ("SVG_TEXT_FONT_PATH", "SKETCH_IMAGE_TEXT_FONT_PATH"),
+    "SKETCHES": ("SVG_TEXT_FONT_PATH", "SKETCH_IMAGE_TEXT_FONT_PATH", "SKETCH_BOOK_WORKERS"),
 }
 
 CRISPY_ALLOWED_TEMPLATE_PACKS = 'bootstrap5'
@@ -265,6 +271,14 @@ else:
 STATIC_URL = "static/"
 MEDIA_URL = "media/"
 
+# Кэш готовых эскизов (SVG/PDF), при превышении размера удаляются давно не запрошенные файлы.
+# Вне MEDIA_ROOT: файлы кэша отдаются только через проверку доступа к позиции
+if IS_PRODUCTION:
+    SKETCH_CACHE_ROOT = Path(f"/var/cache/{APP_SYSNAME}/sketch")
+else:
+    SKETCH_CACHE_ROOT = BASE_PRJ_DIR / "var" / "cache" / "sketch"
+SKETCH_CACHE_MAX_SIZE = 512 * 1024 * 1024
+
 STATICFILES_DIRS = [BASE_APP_DIR / "static-common"]
 
 if IS_PRODUCTION:
@@ -286,6 +300,8 @@ DATA_UPLOAD_MAX_NUMBER_FIELDS = 10000
 # APP_REDIS_CONNECTION = 'redis://localhost:6379/2'
 #
 # # Кеширование
+# # Общий кэш обязателен при нескольких процессах: через него прореживаются события websocket
+# # (kernel.events), с LocMemCache каждый процесс прореживает только свои события
 # CACHES = {
 #     'default': {
 #         'BACKEND': 'django_redis.cache.RedisCache',
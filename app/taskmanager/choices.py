@@ -7,6 +7,7 @@ from kernel.mixins import MaxLengthMixin
 class TaskType(MaxLengthMixin, TextChoices):
     IMPORT = 'import', _('Импорт')
     EXPORT = 'export', _('Экспорт')
+    SKETCHES = 'sketches', _('Выгрузка эскизов')
 
 
 class TaskStatus(MaxLengthMixin, TextChoices):
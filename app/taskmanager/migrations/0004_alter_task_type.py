@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-19 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taskmanager', '0003_alter_task_options_task_created_task_modified_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='type',
+            field=models.CharField(choices=[('import', 'Импорт'), ('export', 'Экспорт'), ('sketches', 'Выгрузка эскизов')], max_length=8, verbose_name='Тип'),
+        ),
+    ]
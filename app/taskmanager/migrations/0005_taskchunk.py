@@ -0,0 +1,27 @@
+# Generated by Django 5.1.4 on 2026-10-19 18:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taskmanager', '0004_alter_task_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField(verbose_name='Номер части')),
+                ('rows', models.PositiveIntegerField(default=0, verbose_name='Количество строк')),
+                ('result', models.JSONField(blank=True, null=True, verbose_name='Результат')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='taskmanager.task')),
+            ],
+            options={
+                'unique_together': {('task', 'number')},
+            },
+        ),
+    ]
@@ -23,6 +23,23 @@ class Task(TimeStampedModel):
         return f'Task {self.id} ({self.get_type_display()})'
 
 
+class TaskChunk(models.Model):
+    """
+    Часть задачи, выполняемая отдельной celery-задачей (например, часть файла импорта).
+    Результаты частей хранятся в БД, чтобы их видели все процессы воркеров.
+    """
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='chunks')
+    number = models.PositiveIntegerField(verbose_name=_('Номер части'))
+    rows = models.PositiveIntegerField(default=0, verbose_name=_('Количество строк'))
+    result = models.JSONField(null=True, blank=True, verbose_name=_('Результат'))
+
+    class Meta:
+        unique_together = ['task', 'number']
+
+    def __str__(self):
+        return f'Chunk {self.number} of Task {self.task_id}'
+
+
 class TaskAttachment(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='attachments')
     slug = models.SlugField()